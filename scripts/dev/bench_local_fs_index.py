@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark LocalFileSystemAdapter listing with and without the file index.
+
+Builds a synthetic workspace (200k files by default), then times:
+
+  1. walk        -- the pre-index ``rglob`` + ``stat`` + ``resolve`` listing
+  2. cold index  -- first listing against an empty index file
+  3. warm index  -- listing again with no changes (new process-equivalent:
+                    a fresh LocalFileIndex over the existing SQLite file)
+  4. warm+edits  -- listing after creating a handful of files in a few dirs
+  5. glob        -- ``*.csv`` over the warm index
+  6. changed     -- ``changed_since`` over the warm index
+
+Usage:
+    python3 scripts/dev/bench_local_fs_index.py
+    python3 scripts/dev/bench_local_fs_index.py --files 50000 --dirs 500
+    python3 scripts/dev/bench_local_fs_index.py --workdir /mnt/fast --keep
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from unify.file_manager.filesystem_adapters.local_adapter import LocalFileSystemAdapter
+from unify.file_manager.filesystem_adapters.local_index import LocalFileIndex
+
+
+def build_tree(root: Path, files: int, dirs: int) -> None:
+    per_dir = max(1, files // dirs)
+    written = 0
+    for d in range(dirs):
+        sub = root / f"d{d // 50:03d}" / f"s{d:05d}"
+        sub.mkdir(parents=True, exist_ok=True)
+        for f in range(per_dir):
+            if written >= files:
+                return
+            ext = "csv" if f % 10 == 0 else "txt"
+            (sub / f"f{f:05d}.{ext}").write_bytes(b"x")
+            written += 1
+
+
+def timed(label: str, fn) -> float:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    count = len(result) if hasattr(result, "__len__") else result
+    print(f"  {label:<12} {elapsed * 1000:>10.1f} ms   ({count} files)")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=200_000)
+    parser.add_argument("--dirs", type=int, default=2_000)
+    parser.add_argument("--workdir", type=str, default=None)
+    parser.add_argument("--keep", action="store_true", help="Keep the tree")
+    args = parser.parse_args()
+
+    base = Path(tempfile.mkdtemp(prefix="fs_index_bench_", dir=args.workdir))
+    root = base / "root"
+    db = base / "index.sqlite"
+    try:
+        print(f"Building {args.files} files in {args.dirs} dirs under {root} ...")
+        t0 = time.perf_counter()
+        build_tree(root, args.files, args.dirs)
+        print(f"  built in {time.perf_counter() - t0:.1f}s\n")
+
+        walked = LocalFileSystemAdapter(str(root), use_index=False)
+        timed("walk", walked.list)
+
+        LocalFileIndex._instances.clear()
+        indexed = LocalFileSystemAdapter(str(root), index_path=str(db))
+        timed("cold index", indexed.list)
+
+        # Back-date directories so the settle window does not force re-lists,
+        # matching a workspace that was not written in the last two seconds.
+        past = time.time() - 60
+        for d in [root, *root.rglob("*")]:
+            if d.is_dir():
+                os.utime(d, (past, past))
+        timed("settle", indexed.list)
+
+        LocalFileIndex._instances.clear()
+        warm = LocalFileSystemAdapter(str(root), index_path=str(db))
+        timed("warm index", warm.list)
+        timed("warm again", warm.list)
+
+        since = time.time()
+        for i, sub in enumerate(sorted(root.glob("d000/s*"))[:5]):
+            (sub / f"new{i}.txt").write_bytes(b"new")
+        timed("warm+edits", warm.list)
+        timed("glob", lambda: warm.glob("*.csv"))
+        timed("changed", lambda: warm.changed_since(since))
+    finally:
+        if args.keep:
+            print(f"\nKept {base}")
+        else:
+            shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+Verifier pass scheduling: a run's passes share the model's time and budget.
+
+A plan that calls many stored functions used to send one request per pass.
+Identical passes in flight together now share one request; passes on the
+same call site with different arguments go out as one multi-item request;
+and each run is held to a cap on concurrent requests and on tokens spent.
+Every test here runs against a local fake client, never a model.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from unify.actor.verification_runtime import BUDGET_EXHAUSTED, VerifierPasses
+from unify.function_manager.settings import VerificationSettings
+
+pytestmark = pytest.mark.asyncio
+
+_ROW = {
+    "function_id": 7,
+    "name": "post_summary",
+    "implementation": "async def post_summary(channel, text): ...",
+}
+
+
+class _FakeModel:
+    """Answers every request with PASS; counts requests and concurrency."""
+
+    def __init__(self, *, delay: float = 0.01, batch_short_by: int = 0) -> None:
+        self.delay = delay
+        self.batch_short_by = batch_short_by
+        self.requests: List[Dict[str, Any]] = []
+        self.active = 0
+        self.peak = 0
+
+    def client(self, origin: str) -> "_FakeClient":
+        return _FakeClient(self, origin)
+
+
+class _FakeClient:
+    def __init__(self, model: _FakeModel, origin: str) -> None:
+        self.model = model
+        self.origin = origin
+        self.system = None
+
+    def set_system_message(self, message: str) -> None:
+        self.system = message
+
+    async def generate(self, *, messages, response_format, **_):
+        model = self.model
+        batched = "verdicts" in json.dumps(response_format)
+        model.requests.append({"origin": self.origin, "batched": batched})
+        model.active += 1
+        model.peak = max(model.peak, model.active)
+        try:
+            await asyncio.sleep(model.delay)
+        finally:
+            model.active -= 1
+        verdict = {"verdict": "PASS", "reason": "ok", "fault": None}
+        if batched:
+            count = messages[-1]["content"].count("# Call ")
+            reply = {"verdicts": [verdict] * (count - model.batch_short_by)}
+        else:
+            reply = verdict
+        return SimpleNamespace(
+            choices=[
+                SimpleNamespace(message=SimpleNamespace(content=json.dumps(reply)))
+            ],
+            usage={"prompt_tokens": 90, "completion_tokens": 10, "cost": 0.01},
+        )
+
+
+class _FakeFunctionManager:
+    def __init__(self, settings: VerificationSettings) -> None:
+        self.verification_settings = settings
+        self.recorded: List[Any] = []
+
+    def function_trust_hash(self, row):
+        return f"hash-{row['function_id']}"
+
+    def record_verification_nowait(self, entry) -> None:
+        self.recorded.append(entry)
+
+    def persist_static_review_nowait(self, row, record) -> None:
+        pass
+
+
+def _passes(model: _FakeModel, **settings: Any) -> VerifierPasses:
+    fm = _FakeFunctionManager(VerificationSettings(enabled=True, **settings))
+    return VerifierPasses(function_manager=fm, goal="g", client_factory=model.client)
+
+
+async def _review(passes: VerifierPasses, channel: str):
+    return await passes.args_review(
+        dict(_ROW),
+        kwargs={"channel": channel, "text": "hi"},
+        stable_block="## Frames\n\nsame for every call",
+    )
+
+
+class TestIdenticalPassesShareOneRequest:
+    async def test_concurrent_identical_reviews_make_one_request(self):
+        model = _FakeModel()
+        passes = _passes(model)
+
+        verdicts = await asyncio.gather(
+            *(_review(passes, "#finance") for _ in range(4)),
+        )
+
+        assert [v.verdict for v in verdicts] == ["PASS"] * 4
+        assert len(model.requests) == 1
+        # Every caller still leaves its own ledger row; only the leader paid.
+        rows = passes.fm.recorded
+        assert len(rows) == 4
+        assert sorted(r.prompt_tokens for r in rows) == [0, 0, 0, 90]
+
+    async def test_a_finished_pass_is_not_reused(self):
+        model = _FakeModel()
+        passes = _passes(model)
+
+        await _review(passes, "#finance")
+        await _review(passes, "#finance")
+
+        assert len(model.requests) == 2
+
+
+class TestSameCallSiteIsCoalesced:
+    async def test_different_arguments_go_out_as_one_request(self):
+        model = _FakeModel()
+        passes = _passes(model)
+
+        verdicts = await asyncio.gather(
+            *(_review(passes, f"#c{i}") for i in range(3)),
+        )
+
+        assert [v.verdict for v in verdicts] == ["PASS"] * 3
+        assert model.requests == [
+            {"origin": "Verifier.args(post_summary)", "batched": True},
+        ]
+        assert sorted(r.prompt_tokens for r in passes.fm.recorded) == [30, 30, 30]
+
+    async def test_batches_are_capped_in_size(self):
+        model = _FakeModel()
+        passes = _passes(model, max_coalesced_items=2)
+
+        await asyncio.gather(*(_review(passes, f"#c{i}") for i in range(5)))
+
+        assert [r["batched"] for r in model.requests].count(True) == 2
+        assert len(model.requests) == 3
+
+    async def test_a_reply_that_does_not_line_up_falls_back_to_one_each(self):
+        model = _FakeModel(batch_short_by=1)
+        passes = _passes(model)
+
+        verdicts = await asyncio.gather(
+            *(_review(passes, f"#c{i}") for i in range(3)),
+        )
+
+        assert [v.verdict for v in verdicts] == ["PASS"] * 3
+        assert [r["batched"] for r in model.requests] == [True, False, False, False]
+
+
+class TestPerRunLimits:
+    async def test_concurrent_requests_are_capped(self):
+        model = _FakeModel(delay=0.02)
+        passes = _passes(model, max_concurrent_passes=2, max_coalesced_items=1)
+
+        await asyncio.gather(*(_review(passes, f"#c{i}") for i in range(6)))
+
+        assert len(model.requests) == 6
+        assert model.peak == 2
+
+    async def test_an_exhausted_budget_answers_unsure_without_a_request(self):
+        model = _FakeModel()
+        passes = _passes(model, max_pass_tokens_per_run=100)
+
+        first = await _review(passes, "#a")
+        second = await _review(passes, "#b")
+
+        assert first.verdict == "PASS"
+        assert (second.verdict, second.reason) == ("UNSURE", BUDGET_EXHAUSTED)
+        assert len(model.requests) == 1
+        assert passes.scheduler.tokens_spent == 100
@@ -7,6 +7,9 @@ wrong in the other. Each case below is a way that has previously been possible
 to get colour or an unresolvable import past a naive check.
 """
 
+import os
+import shutil
+
 import pytest
 
 from unify.canvas_manager.ops.build_ops import (
@@ -146,3 +149,166 @@ class TestBundleCeiling:
         # than just stating the limit.
         assert code == ""
         assert any("binding" in problem for problem in report.diagnostics)
+
+
+# --------------------------------------------------------------------- #
+# Cache and warm worker                                                 #
+# --------------------------------------------------------------------- #
+@pytest.fixture()
+def toolchain(tmp_path, monkeypatch):
+    """A toolchain root the gates accept, with a fresh build cache."""
+    from unify.canvas_manager.ops import build_ops
+
+    root = tmp_path / "toolchain"
+    (root / "node_modules" / ".bin").mkdir(parents=True)
+    (root / "node_modules" / ".bin" / "esbuild").write_text("")
+    (root / "package.json").write_text('{"version": "0.1.0"}')
+    monkeypatch.setattr(build_ops, "_toolchain_root", lambda: root)
+    monkeypatch.setattr(build_ops, "_build_cache", build_ops._BuildCache())
+    yield root
+    build_ops._stop_worker()
+
+
+@pytest.fixture()
+def compiles(toolchain, monkeypatch):
+    """Replaces the compile itself; records each source it is asked for."""
+    from unify.canvas_manager.ops import build_ops
+
+    seen = []
+
+    def compile_(tsx, root):
+        seen.append(tsx)
+        return build_ops._Compiled(failed_stage=None, code=f"// {len(seen)}\n")
+
+    monkeypatch.setattr(build_ops, "_compile", compile_)
+    return seen
+
+
+class TestBuildCache:
+    """Typecheck and bundle are pure in the source, kit and toolchain, so a
+    source already built against them is answered without compiling."""
+
+    def test_an_unchanged_source_compiles_once(self, compiles):
+        first, code = build_canvas(CLEAN, kit_version="0.1.0")
+        again, code_again = build_canvas(CLEAN, kit_version="0.1.0")
+
+        assert len(compiles) == 1
+        assert first.ok and again.ok
+        assert again.bundle_sha == first.bundle_sha
+        assert code_again == code
+
+    def test_the_kit_and_toolchain_are_part_of_the_key(self, compiles, toolchain):
+        build_canvas(CLEAN, kit_version="0.1.0")
+        build_canvas(CLEAN, kit_version="0.2.0")
+        assert len(compiles) == 2
+
+        # Seen by this process without a restart.
+        manifest = toolchain / "package.json"
+        manifest.write_text('{"version": "0.2.0"}')
+        mtime = manifest.stat().st_mtime_ns + 1_000_000_000
+        os.utime(manifest, ns=(mtime, mtime))
+        build_canvas(CLEAN, kit_version="0.2.0")
+        assert len(compiles) == 3
+
+    def test_the_disk_copy_outlives_the_process(self, compiles, monkeypatch):
+        from unify.canvas_manager.ops import build_ops
+
+        first, _ = build_canvas(CLEAN)
+        monkeypatch.setattr(build_ops, "_build_cache", build_ops._BuildCache())
+        again, _ = build_canvas(CLEAN)
+
+        assert len(compiles) == 1
+        assert again.bundle_sha == first.bundle_sha
+
+    def test_the_size_ceiling_is_checked_on_every_build(self, compiles, monkeypatch):
+        monkeypatch.setenv("UNIFY_CANVAS_MAX_BUNDLE_BYTES", "3")
+        refused, _ = build_canvas(CLEAN)
+        monkeypatch.setenv("UNIFY_CANVAS_MAX_BUNDLE_BYTES", "512000")
+        allowed, _ = build_canvas(CLEAN)
+
+        assert not refused.ok and allowed.ok
+        assert len(compiles) == 1
+
+    def test_a_compile_that_raises_stores_nothing(self, toolchain, monkeypatch):
+        from unify.canvas_manager.ops import build_ops
+
+        def timed_out(tsx, root):
+            raise TimeoutError("slow disk")
+
+        monkeypatch.setattr(build_ops, "_compile", timed_out)
+        with pytest.raises(TimeoutError):
+            build_canvas(CLEAN)
+        assert (
+            build_ops._build_cache.get(
+                build_ops._cache_key(CLEAN, "", toolchain),
+                toolchain,
+            )
+            is None
+        )
+
+
+# Stands in for esbuild's JS API: "bundles" by echoing the entry file, and
+# fails the way esbuild does on a source containing FAIL.
+_FAKE_ESBUILD = """
+const fs = require("node:fs");
+const path = require("node:path");
+exports.context = async (options) => ({
+  rebuild: async () => {
+    const entry = path.join(options.absWorkingDir, options.entryPoints[0]);
+    const text = fs.readFileSync(entry, "utf8");
+    if (text.includes("FAIL")) {
+      const error = new Error("Build failed");
+      error.errors = [{ text: "unexpected FAIL" }];
+      throw error;
+    }
+    return { outputFiles: [{ text: `// pid ${process.pid}\\n${text}` }] };
+  },
+  dispose: async () => {},
+});
+exports.formatMessages = async (messages) =>
+  messages.map((message) => `X [ERROR] ${message.text}\\n`);
+"""
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="needs node")
+class TestBuildWorker:
+    """A cache miss is compiled by one long-lived node process, not a fresh
+    tsc and esbuild per canvas."""
+
+    @pytest.fixture()
+    def worker_toolchain(self, toolchain):
+        package = toolchain / "node_modules" / "esbuild"
+        package.mkdir()
+        (package / "package.json").write_text('{"name": "esbuild", "main": "index.js"}')
+        (package / "index.js").write_text(_FAKE_ESBUILD)
+        return toolchain
+
+    def test_successive_builds_share_one_process(self, worker_toolchain):
+        outputs = []
+        for n in range(3):
+            source = CLEAN + f"// revision {n}\n"
+            report, code = build_canvas(source)
+            assert report.ok
+            assert code.endswith(source)
+            outputs.append(code.splitlines()[0])
+
+        assert len(set(outputs)) == 1
+
+    def test_a_bundle_failure_reaches_the_report(self, worker_toolchain):
+        report, code = build_canvas(CLEAN + "// FAIL\n")
+
+        assert not report.ok
+        assert report.failed_stage == "bundle"
+        assert report.diagnostics == ["X [ERROR] unexpected FAIL"]
+        assert code == ""
+
+    def test_a_dead_worker_is_replaced(self, worker_toolchain):
+        from unify.canvas_manager.ops import build_ops
+
+        _, before = build_canvas(CLEAN + "// one\n")
+        build_ops._worker._process.kill()
+        build_ops._worker._process.wait()
+        report, after = build_canvas(CLEAN + "// two\n")
+
+        assert report.ok
+        assert after.splitlines()[0] != before.splitlines()[0]
@@ -19,6 +19,8 @@ load-bearing in a way that is easy to get backwards:
 
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -274,3 +276,219 @@ class TestCritique:
 
         assert report.rendered is False
         assert report.error == "threw on mount"
+
+
+@pytest.fixture()
+def host(tmp_path) -> Path:
+    root = tmp_path / "canvas-host"
+    (root / "host" / "v1").mkdir(parents=True)
+    (root / "host" / "v1" / "index.html").write_text("<!doctype html>")
+    return root
+
+
+class TestOrigins:
+    """Both origins live for the process; only the harness page changes."""
+
+    def test_each_review_is_served_at_a_path_of_its_own(self, host):
+        from urllib.error import HTTPError
+        from urllib.request import urlopen
+
+        origins = review_ops._Origins(host)
+        try:
+            first = origins.publish("a", "<p>first</p>")
+            second = origins.publish("b", "<p>second</p>")
+            with urlopen(origins.parent_origin + first) as response:
+                assert response.read() == b"<p>first</p>"
+            with urlopen(origins.parent_origin + second) as response:
+                assert response.read() == b"<p>second</p>"
+
+            origins.withdraw(first)
+            with pytest.raises(HTTPError):
+                urlopen(origins.parent_origin + first)
+            with urlopen(origins.host_origin + "/host/v1/index.html") as response:
+                assert response.read() == b"<!doctype html>"
+        finally:
+            origins.close()
+
+
+class _Browser:
+    def __init__(self, launches: list) -> None:
+        launches.append(self)
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self) -> bool:
+        return self.connected and not self.closed
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _Playwright:
+    def stop(self) -> None:
+        pass
+
+
+class TestRuntime:
+    """Browsers are launched once per worker and reused, within bounds."""
+
+    @pytest.fixture()
+    def fakes(self, monkeypatch):
+        state = {"launches": [], "active": 0, "peak": 0, "fail_launch": False}
+        lock = threading.Lock()
+
+        def launch(playwright):
+            if state["fail_launch"]:
+                from playwright.sync_api import Error
+
+                raise Error("Executable doesn't exist")
+            return _Browser(state["launches"])
+
+        def render_page(browser, origins, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            return ReviewReport(rendered=True, verdict=f"by {id(browser)}")
+
+        monkeypatch.setattr(review_ops, "_start_playwright", _Playwright)
+        monkeypatch.setattr(review_ops, "_launch_browser", launch)
+        monkeypatch.setattr(review_ops, "_render_page", render_page)
+        return state
+
+    def _runtime(self, host, **kwargs) -> "review_ops._ReviewRuntime":
+        return review_ops._ReviewRuntime(host, **kwargs)
+
+    def test_renders_never_exceed_the_concurrency_limit(self, host, fakes):
+        from concurrent.futures import ThreadPoolExecutor
+
+        runtime = self._runtime(host, concurrency=2, recycle_after=100)
+        try:
+            with ThreadPoolExecutor(max_workers=6) as callers:
+                reports = list(
+                    callers.map(lambda n: runtime.render(token=str(n)), range(6)),
+                )
+        finally:
+            runtime.close()
+
+        assert all(report.rendered for report in reports)
+        assert fakes["peak"] == 2
+        # One browser per worker, not one per review.
+        assert len(fakes["launches"]) == 2
+
+    def test_a_browser_is_recycled_after_its_quota(self, host, fakes):
+        runtime = self._runtime(host, concurrency=1, recycle_after=3)
+        try:
+            for n in range(7):
+                runtime.render(token=str(n))
+        finally:
+            runtime.close()
+
+        assert len(fakes["launches"]) == 3
+        assert all(browser.closed for browser in fakes["launches"])
+
+    def test_a_disconnected_browser_is_replaced(self, host, fakes):
+        runtime = self._runtime(host, concurrency=1, recycle_after=100)
+        try:
+            runtime.render(token="a")
+            fakes["launches"][0].connected = False
+            runtime.render(token="b")
+        finally:
+            runtime.close()
+
+        assert len(fakes["launches"]) == 2
+
+    def test_a_browser_that_will_not_start_skips_rather_than_fails(
+        self,
+        host,
+        fakes,
+    ):
+        fakes["fail_launch"] = True
+        runtime = self._runtime(host, concurrency=1, recycle_after=100)
+        try:
+            skipped = runtime.render(token="a")
+            fakes["fail_launch"] = False
+            rendered = runtime.render(token="b")
+        finally:
+            runtime.close()
+
+        assert skipped.rendered and skipped.verdict.startswith("skipped")
+        assert rendered.verdict.startswith("by ")
+
+    def test_reviews_queued_on_a_closed_runtime_are_handed_back(
+        self,
+        host,
+        fakes,
+        monkeypatch,
+    ):
+        from concurrent.futures import ThreadPoolExecutor
+
+        release = threading.Event()
+        started = threading.Event()
+
+        def render_page(browser, origins, **kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return ReviewReport(rendered=True, verdict="rendered")
+
+        monkeypatch.setattr(review_ops, "_render_page", render_page)
+        runtime = self._runtime(host, concurrency=1, recycle_after=100)
+        with ThreadPoolExecutor(max_workers=3) as callers:
+            first = callers.submit(runtime.render, token="a")
+            started.wait(timeout=5)
+            queued = callers.submit(runtime.render, token="b")
+            while runtime._jobs.empty():
+                time.sleep(0.01)
+            closing = callers.submit(runtime.close)
+            with pytest.raises(review_ops._RuntimeClosed):
+                queued.result(timeout=5)
+            release.set()
+            closing.result(timeout=5)
+
+        assert first.result().rendered
+        with pytest.raises(review_ops._RuntimeClosed):
+            runtime.render(token="c")
+
+    def test_a_review_the_runtime_never_answers_times_out(
+        self,
+        host,
+        fakes,
+        monkeypatch,
+    ):
+        release = threading.Event()
+        monkeypatch.setattr(review_ops, "_REVIEW_WAIT_TIMEOUT_S", 0.1)
+        monkeypatch.setattr(
+            review_ops,
+            "_render_page",
+            lambda browser, origins, **kwargs: release.wait(timeout=5),
+        )
+        runtime = self._runtime(host, concurrency=1, recycle_after=100)
+        try:
+            report = runtime.render(token="a")
+        finally:
+            release.set()
+            runtime.close()
+
+        assert report.rendered is False
+        assert "did not complete" in report.error
+
+
+def test_origins_that_fail_to_start_close_what_they_started(host, monkeypatch):
+    started = []
+    serve = review_ops._serve
+
+    def serve_once(**kwargs):
+        if started:
+            raise OSError("no port")
+        server, port = serve(**kwargs)
+        started.append(server)
+        return server, port
+
+    monkeypatch.setattr(review_ops, "_serve", serve_once)
+    with pytest.raises(OSError):
+        review_ops._Origins(host)
+
+    (server,) = started
+    assert server.socket.fileno() == -1
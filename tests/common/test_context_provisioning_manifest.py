@@ -0,0 +1,200 @@
+"""
+Boot-time context provisioning skips contexts that have not changed.
+
+``ContextRegistry.setup`` used to send ``create_context`` and
+``create_fields`` for every required table of every manager on every boot.
+Each context is now digested as it would be provisioned, and the digests
+last applied under a base context are recorded locally. A warm boot lists
+each root once and sends nothing for a context that exists unchanged. Calls
+here go to an in-memory stand-in for the backend.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+import pytest
+from unisdk.logs import CONTEXT_READ, CONTEXT_WRITE
+
+from unify.common import context_registry as cr
+from unify.common.context_manifest import ProvisioningRecord
+from unify.common.context_registry import ContextRegistry, TableContext
+from unify.session_details import SESSION_DETAILS
+
+_BASE = "user123/42"
+
+
+class _ContactsLike:
+    class Config:
+        required_contexts = [
+            TableContext(
+                name="Contacts",
+                description="People the assistant knows.",
+                fields={"first_name": "str", "phone_number": "str"},
+                unique_keys={"contact_id": "int"},
+            ),
+            TableContext(name="Contacts/Meta", description="Contact metadata."),
+        ]
+
+
+class _TasksLike:
+    class Config:
+        required_contexts = [
+            TableContext(
+                name="Tasks",
+                description="Scheduled work items.",
+                fields={"name": "str"},
+            ),
+            TableContext(name="Tasks/Meta", description="Task metadata."),
+            TableContext(name="SearchCache", description="Runtime cache."),
+        ]
+
+
+_MANAGERS = [_ContactsLike, _TasksLike]
+_TABLES = 5
+#: Shared-scoped tables carry authoring fields; only SearchCache has none.
+_TABLES_WITH_FIELDS = 4
+
+
+class _Backend:
+    """Contexts and fields, counting calls by kind."""
+
+    def __init__(self) -> None:
+        self.contexts: Dict[str, Dict] = {}
+        self.calls: List[str] = []
+
+    def create_context(self, name, **_):
+        self.calls.append("create_context")
+        self.contexts.setdefault(name, {})
+
+    def create_fields(self, fields, *, context):
+        self.calls.append("create_fields")
+        self.contexts[context].update(fields)
+
+    def get_contexts(self, *, prefix):
+        self.calls.append("get_contexts")
+        return {n: "" for n in self.contexts if n.startswith(prefix)}
+
+    def count(self, kind: str) -> int:
+        return self.calls.count(kind)
+
+
+@pytest.fixture(autouse=True)
+def backend(monkeypatch, tmp_path):
+    ContextRegistry.clear()
+    SESSION_DETAILS.reset()
+    CONTEXT_READ.set(_BASE)
+    CONTEXT_WRITE.set(_BASE)
+    backend = _Backend()
+    monkeypatch.setattr(cr, "_create_context_with_retry", backend.create_context)
+    monkeypatch.setattr(cr, "create_fields", backend.create_fields)
+    monkeypatch.setattr(cr.unisdk, "get_contexts", backend.get_contexts)
+    monkeypatch.setattr(
+        ContextRegistry,
+        "_provisioning_record",
+        ProvisioningRecord(tmp_path / "manifests.json"),
+    )
+    monkeypatch.setattr(ContextRegistry, "_provisioning_scope", lambda: "test")
+    yield backend
+    ContextRegistry.clear()
+    SESSION_DETAILS.reset()
+
+
+def _boot(backend: _Backend) -> None:
+    """Provision as a fresh process would, then reset the call counts."""
+    ContextRegistry.clear()
+    backend.calls.clear()
+    ContextRegistry.setup_for_managers(_MANAGERS, base_context=_BASE)
+
+
+class TestColdAndWarmBoots:
+    def test_a_cold_boot_creates_everything_without_listing(self, backend):
+        _boot(backend)
+
+        assert backend.count("create_context") == _TABLES
+        assert backend.count("create_fields") == _TABLES_WITH_FIELDS
+        assert backend.count("get_contexts") == 0
+
+    def test_a_warm_boot_lists_once_and_creates_nothing(self, backend):
+        _boot(backend)
+        _boot(backend)
+
+        assert backend.calls == ["get_contexts"]
+        assert ContextRegistry.get_context(_TasksLike, "Tasks") == f"{_BASE}/Tasks"
+        assert backend.calls == ["get_contexts"]
+
+    def test_the_record_is_shared_across_processes(self, backend, tmp_path):
+        _boot(backend)
+        ContextRegistry._provisioning_record = ProvisioningRecord(
+            tmp_path / "manifests.json",
+        )
+
+        _boot(backend)
+
+        assert backend.calls == ["get_contexts"]
+
+
+class TestChangesAreProvisioned:
+    def test_a_changed_schema_only_resends_its_fields(self, backend, monkeypatch):
+        _boot(backend)
+        tasks, *rest = _TasksLike.Config.required_contexts
+        monkeypatch.setattr(
+            _TasksLike.Config,
+            "required_contexts",
+            [tasks.model_copy(update={"fields": {"name": "str", "due": "datetime"}})]
+            + rest,
+        )
+
+        _boot(backend)
+
+        assert backend.calls == ["get_contexts", "create_fields"]
+        assert "due" in backend.contexts[f"{_BASE}/Tasks"]
+        _boot(backend)
+        assert backend.calls == ["get_contexts"]
+
+    def test_a_deleted_context_is_recreated(self, backend):
+        _boot(backend)
+        del backend.contexts[f"{_BASE}/Contacts"]
+
+        _boot(backend)
+
+        assert backend.count("create_context") == 1
+        assert backend.count("create_fields") == 1
+
+    def test_a_failed_context_is_retried_on_the_next_boot(self, backend, monkeypatch):
+        create_context = backend.create_context
+
+        def flaky(name, **kwargs):
+            if name.endswith("/SearchCache"):
+                raise ConnectionError("transient network failure")
+            create_context(name, **kwargs)
+
+        monkeypatch.setattr(cr, "_create_context_with_retry", flaky)
+        _boot(backend)
+        monkeypatch.setattr(cr, "_create_context_with_retry", create_context)
+
+        _boot(backend)
+
+        assert backend.calls == ["get_contexts", "create_context"]
+
+    def test_fields_that_failed_are_resent_on_the_next_boot(
+        self,
+        backend,
+        monkeypatch,
+    ):
+        create_fields = backend.create_fields
+
+        def failing(fields, *, context):
+            if context.endswith("/Tasks"):
+                raise RuntimeError("fields already exist")
+            create_fields(fields, context=context)
+
+        monkeypatch.setattr(cr, "create_fields", failing)
+        _boot(backend)
+        monkeypatch.setattr(cr, "create_fields", create_fields)
+
+        # Whatever the error said, only a send that succeeded is recorded.
+        _boot(backend)
+        assert backend.calls == ["get_contexts", "create_fields"]
+        _boot(backend)
+        assert backend.calls == ["get_contexts"]
@@ -252,3 +252,65 @@ def test_require_consumed_raises_on_leftovers():
     require_consumed({}, kind="probe", custom_key="k")
     with pytest.raises(CustomSyncFieldDrift, match="tags"):
         require_consumed({"tags": ["gtm"]}, kind="probe", custom_key="k")
+
+
+class _BulkAdapter(_RecordingAdapter):
+    bulk_chunk_size = 2
+
+    def insert_many(self, items):
+        self.calls.append(("insert_many", [key for key, _ in items]))
+
+    def delete_many(self, items):
+        self.calls.append(("delete_many", [key for key, _ in items]))
+
+
+def test_bulk_hooks_receive_the_planned_writes_in_chunks():
+    adapter = _BulkAdapter(
+        live=[_row("stale1", "x"), _row("stale2", "x"), _row("changed", "old")],
+    )
+    result = reconcile_custom_rows(
+        source={
+            **{key: _row(key, "n") for key in ("a", "b", "c")},
+            "changed": _row("changed", "new"),
+        },
+        adapter=adapter,
+    )
+    assert adapter.calls == [
+        ("insert_many", ["a", "b"]),
+        ("insert_many", ["c"]),
+        # No update_many: updates fall back to one row per call.
+        ("update", "changed"),
+        ("delete_many", ["stale1", "stale2"]),
+    ]
+    assert (result.inserted, result.updated, result.deleted) == (3, 1, 2)
+    assert {"index", "plan", "insert", "update", "delete"} <= set(result.timings)
+
+
+def test_a_failed_bulk_chunk_fails_only_its_keys():
+    class _FlakyBulk(_BulkAdapter):
+        def insert_many(self, items):
+            if any(key == "bad" for key, _ in items):
+                raise RuntimeError("boom")
+            super().insert_many(items)
+
+    adapter = _FlakyBulk()
+    with pytest.raises(CustomSyncPartialFailure) as exc_info:
+        reconcile_custom_rows(
+            source={key: _row(key, "h") for key in ("ok1", "ok2", "bad", "ok3")},
+            adapter=adapter,
+        )
+    assert set(exc_info.value.failures) == {"bad", "ok3"}
+    assert adapter.calls == [("insert_many", ["ok1", "ok2"])]
+
+
+def test_writes_wait_for_the_whole_plan():
+    adapter = _BulkAdapter(adoptable={"adopt": {"name": "adopt"}})
+    adapter.bulk_chunk_size = 100
+    reconcile_custom_rows(
+        source={key: _row(key, "h") for key in ("new1", "adopt", "new2")},
+        adapter=adapter,
+    )
+    assert adapter.calls == [
+        ("adopt", "adopt"),
+        ("insert_many", ["new1", "new2"]),
+    ]
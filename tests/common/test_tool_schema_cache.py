@@ -0,0 +1,226 @@
+"""
+Tool schemas compiled once, and a tools payload reused while nothing changes.
+
+The async tool loop used to run ``method_to_schema`` for every visible tool
+on every turn. ``compiled_tool_schema`` compiles each tool variant once and
+hands out the same frozen schema after that; ``ToolsPayload`` hands the loop
+last turn's tools list again while the schemas behind it are unchanged, so
+what the provider receives is byte-identical turn to turn. These are
+symbolic tests — no loop, no LLM.
+"""
+
+from __future__ import annotations
+
+import copy
+import gc
+import json
+from typing import Annotated, Dict, List, Optional
+
+import pytest
+
+from unify.common._async_tool import tool_schemas as ts
+from unify.common._async_tool.dynamic_tools_factory import DynamicToolFactory
+from unify.common._async_tool.tool_schemas import (
+    FrozenSchema,
+    ToolsPayload,
+    compiled_tool_schema,
+    schema_cache_info,
+)
+from unify.common._async_tool.tools_data import ToolsData
+from unify.common.llm_helpers import method_to_schema
+
+
+class _Contacts:
+    async def search(
+        self,
+        query: Annotated[str, "What to look for."],
+        limit: int = 10,
+        fields: Optional[List[str]] = None,
+        _parent_chat_context: Optional[list] = None,
+    ) -> Dict[str, list]:
+        """Search contacts.
+
+        Parameters
+        ----------
+        query : str
+            What to look for.
+        limit : int
+            How many to return.
+        """
+        return {}
+
+
+class _Vip(_Contacts):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    ts.clear_schema_cache()
+    yield
+    ts.clear_schema_cache()
+
+
+class TestCompiledSchemas:
+    def test_a_tool_is_compiled_once_and_matches_method_to_schema(self):
+        contacts = _Contacts()
+
+        first = compiled_tool_schema(contacts.search, "search")
+        second = compiled_tool_schema(_Contacts().search, "search")
+
+        assert first is second
+        assert json.dumps(first) == json.dumps(
+            method_to_schema(contacts.search, "search"),
+        )
+        assert schema_cache_info()["misses"] == 1
+        assert schema_cache_info()["hits"] == 1
+
+    def test_every_schema_input_selects_its_own_variant(self):
+        search = _Contacts().search
+        base = compiled_tool_schema(search)
+
+        variants = [
+            compiled_tool_schema(search, "find"),
+            compiled_tool_schema(search, include_class_name=False),
+            compiled_tool_schema(search, expose_context_control=True),
+            compiled_tool_schema(
+                search,
+                expose_context_control=True,
+                has_parent_context=True,
+            ),
+            compiled_tool_schema(search, strict=True),
+            compiled_tool_schema(_Vip().search),
+        ]
+
+        assert all(v is not base for v in variants)
+        assert base["function"]["name"] == "_Contacts_search"
+        assert variants[-1]["function"]["name"] == "_Vip_search"
+        assert schema_cache_info()["size"] == 7
+
+    def test_a_reassigned_docstring_recompiles(self):
+        async def wait() -> None:
+            """Old."""
+
+        old = compiled_tool_schema(wait)
+        wait.__doc__ = "New."
+
+        assert compiled_tool_schema(wait)["function"]["description"] == "New."
+        assert old["function"]["description"] == "Old."
+
+    def test_entries_die_with_their_function(self):
+        async def ephemeral(x: int) -> int:
+            return x
+
+        compiled_tool_schema(ephemeral)
+        assert schema_cache_info()["size"] == 1
+
+        del ephemeral
+        gc.collect()
+
+        assert schema_cache_info()["size"] == 0
+
+
+class TestFrozenSchemas:
+    def test_a_compiled_schema_cannot_be_mutated(self):
+        schema = compiled_tool_schema(_Contacts().search, "search")
+        params = schema["function"]["parameters"]
+
+        with pytest.raises(TypeError):
+            params["properties"]["thoughts"] = {"type": "string"}
+        with pytest.raises(TypeError):
+            params["required"].append("limit")
+        with pytest.raises(TypeError):
+            schema.update(strict=True)
+
+    def test_copies_are_plain_and_mutable(self):
+        schema = compiled_tool_schema(_Contacts().search, "search")
+
+        mutable = copy.deepcopy(schema)
+        mutable["function"]["parameters"]["required"].append("limit")
+
+        assert type(mutable) is dict
+        assert type(copy.copy(schema)) is dict
+        assert schema["function"]["parameters"]["required"] == ["query"]
+        assert isinstance(schema, FrozenSchema)
+
+
+class TestToolsPayload:
+    def test_an_unchanged_set_returns_the_same_list(self):
+        payload = ToolsPayload()
+        search = compiled_tool_schema(_Contacts().search, "search")
+        inline = {"type": "function", "function": {"name": "final_response"}}
+
+        first = payload.tools([search, inline])
+        again = payload.tools([search, copy.deepcopy(inline)])
+
+        assert again is first
+        assert payload.rebuilds == 1
+        assert json.dumps(first) == payload.json
+
+    def test_a_changed_set_is_rebuilt(self):
+        payload = ToolsPayload()
+        search = compiled_tool_schema(_Contacts().search, "search")
+        find = compiled_tool_schema(_Contacts().search, "find")
+
+        first = payload.tools([search])
+        digest = payload.digest
+        second = payload.tools([search, find])
+
+        assert second is not first
+        assert [t["function"]["name"] for t in second] == ["search", "find"]
+        assert payload.digest != digest
+        assert payload.rebuilds == 2
+
+    def test_the_payload_is_made_of_plain_containers(self):
+        payload = ToolsPayload()
+
+        tools = payload.tools([compiled_tool_schema(_Contacts().search)])
+
+        assert type(tools[0]) is dict
+        assert type(tools[0]["function"]["parameters"]["required"]) is list
+
+
+class TestDynamicTools:
+    def test_the_static_surface_is_compiled_once_across_turns(self):
+        tools_data = ToolsData({}, client=None, logger=None)
+
+        for _ in range(3):
+            factory = DynamicToolFactory(tools_data)
+            factory.generate()
+            schemas = [
+                compiled_tool_schema(fn, include_class_name=False)
+                for fn in factory.dynamic_tools.values()
+            ]
+
+        assert [s["function"]["name"] for s in schemas] == [
+            "wait",
+            "steer",
+            "ask_about_completed_tool",
+        ]
+        assert schema_cache_info()["misses"] == 3
+        assert schema_cache_info()["hits"] == 6
+
+
+class TestPerTurnCost:
+    def test_later_turns_reuse_every_compiled_schema(self):
+        """A 60-tool turn compiles each tool on the first turn only."""
+        owners = [type(f"_Manager{i}", (_Contacts,), {})() for i in range(60)]
+        turns = 20
+
+        def turn(compile_schema) -> list:
+            return [
+                compile_schema(o.search, f"search_{i}") for i, o in enumerate(owners)
+            ]
+
+        payload = ToolsPayload()
+        first = turn(compiled_tool_schema)
+        first_tools = payload.tools(first)
+        for _ in range(turns - 1):
+            schemas = turn(compiled_tool_schema)
+            assert all(s is f for s, f in zip(schemas, first))
+            assert payload.tools(schemas) is first_tools
+
+        assert schema_cache_info()["misses"] == len(owners)
+        assert schema_cache_info()["hits"] == len(owners) * (turns - 1)
+        assert payload.rebuilds == 1
+        assert json.dumps(first_tools) == json.dumps(turn(method_to_schema))
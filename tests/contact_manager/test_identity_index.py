@@ -0,0 +1,166 @@
+"""
+Inbound senders resolve from an in-process identity index.
+
+The index follows ContactManager's DataStore mirrors, so every contact read
+or written through the manager is resolvable by phone, email, WhatsApp,
+Discord or Slack handle without a backend filter. It is filled by one paged
+read per Contacts context; only a miss reaches ``filter_contacts``.
+"""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from unify.common.data_store import DataStore
+from unify.contact_manager import contact_manager as cm_module
+from unify.contact_manager.contact_manager import ContactManager
+from unify.contact_manager.identity_index import (
+    ContactIdentityIndex,
+    normalize_handle,
+)
+from unify.contact_manager.types.contact import Contact
+
+_PERSONAL = "42/7/Contacts"
+_TEAM = "Teams/3/Contacts"
+
+
+def _store(context: str, index: ContactIdentityIndex) -> DataStore:
+    store = DataStore(context, key_fields=("contact_id",), project="p")
+    index.attach(store)
+    return store
+
+
+class TestIndexFollowsTheMirror:
+    def test_put_update_delete_and_clear_are_followed(self):
+        index = ContactIdentityIndex()
+        store = _store(_PERSONAL, index)
+
+        store.put({"contact_id": 5, "email_address": "ann@example.com"})
+        assert index.resolve("email_address", "ann@example.com", [store]) == (
+            store,
+            5,
+        )
+
+        store.update(5, {"email_address": "ann@new.com"})
+        assert index.resolve("email_address", "ann@example.com", [store]) is None
+        assert index.resolve("email_address", "ann@new.com", [store])[1] == 5
+
+        store.delete(5)
+        assert index.resolve("email_address", "ann@new.com", [store]) is None
+
+        store.put({"contact_id": 6, "phone_number": "+15550001"})
+        store.clear()
+        assert index.resolve("phone_number", "+15550001", [store]) is None
+
+    def test_ties_resolve_like_filter_contacts(self):
+        index = ContactIdentityIndex()
+        personal = _store(_PERSONAL, index)
+        team = _store(_TEAM, index)
+        team.put({"contact_id": 2, "slack_user_id": "U1"})
+        personal.put({"contact_id": 9, "slack_user_id": "U1"})
+
+        assert index.resolve("slack_user_id", "U1", [personal, team]) == (team, 2)
+        # A context this assistant cannot read never answers.
+        assert index.resolve("slack_user_id", "U1", [personal]) == (personal, 9)
+
+    def test_handles_match_exactly_like_the_backend_filter(self):
+        assert normalize_handle("phone_number", "+1 (555) 000-1") == "+1 (555) 000-1"
+        assert normalize_handle("email_address", "A@B.COM") == "A@B.COM"
+        assert normalize_handle("discord_id", "") is None
+
+
+class TestContactManagerLookups:
+    @pytest.fixture()
+    def manager(self, monkeypatch):
+        index = ContactIdentityIndex()
+        monkeypatch.setattr(cm_module, "contact_identities", index)
+        store = _store(_PERSONAL, index)
+        backend: List[Dict[str, Any]] = [
+            {"contact_id": i, "first_name": f"C{i}", "phone_number": f"+1555{i}"}
+            for i in range(3)
+        ]
+        calls: List[str] = []
+
+        def get_logs(*, context, offset, limit, from_fields):
+            calls.append("get_logs")
+            if manager.loads_fail:
+                raise RuntimeError("backend unavailable")
+            return [SimpleNamespace(entries=row) for row in backend[offset:][:limit]]
+
+        def filter_contacts(*, filter, limit):
+            calls.append("filter_contacts")
+            rows = [row for row in backend if eval(filter, {}, row)]
+            for row in rows:
+                store.put(row)
+            return {"contacts": [Contact(**row) for row in rows]}
+
+        monkeypatch.setattr(cm_module, "_IDENTITY_PAGE_SIZE", 2)
+        monkeypatch.setattr(cm_module.unisdk, "get_logs", get_logs)
+        manager = object.__new__(ContactManager)
+        manager._ctx = _PERSONAL
+        manager._data_store = store
+        manager._identity_load_lock = threading.Lock()
+        manager._BUILTIN_FIELDS = tuple(Contact.model_fields)
+        monkeypatch.setattr(manager, "_read_contact_contexts", lambda: [_PERSONAL])
+        monkeypatch.setattr(manager, "filter_contacts", filter_contacts)
+        manager.backend, manager.calls = backend, calls
+        manager.loads_fail = False
+        return manager
+
+    def test_known_senders_resolve_after_one_paged_load(self, manager):
+        for _ in range(3):
+            for i in range(3):
+                contact = manager.get_contact_by_handle("phone_number", f"+1555{i}")
+                assert contact["first_name"] == f"C{i}"
+
+        # Two pages of two rows; no filter per message.
+        assert manager.calls == ["get_logs", "get_logs"]
+
+    def test_a_miss_reads_the_backend_once(self, manager):
+        manager.get_contact_by_handle("phone_number", "+15550")
+        manager.backend.append(
+            {"contact_id": 7, "first_name": "New", "phone_number": "+15557"},
+        )
+
+        assert (
+            manager.get_contact_by_handle("phone_number", "+15557")["contact_id"] == 7
+        )
+        assert (
+            manager.get_contact_by_handle("phone_number", "+15557")["contact_id"] == 7
+        )
+        assert manager.get_contact_by_handle("phone_number", "+19999") is None
+        assert manager.calls.count("filter_contacts") == 2
+
+
+    def test_warm_and_cold_lookups_agree(self, manager):
+        handles = ["+15550", "+1 5550", "+1555 0"]
+        warm = [manager.get_contact_by_handle("phone_number", h) for h in handles]
+
+        # Cold: the index cannot load, so only the backend filter answers.
+        cm_module.contact_identities.invalidate()
+        manager.loads_fail = True
+        cold = [manager.get_contact_by_handle("phone_number", h) for h in handles]
+
+        assert warm == cold
+        assert warm[0]["contact_id"] == 0
+        assert warm[1:] == [None, None]
+
+    def test_a_failed_load_is_not_retried_on_every_lookup(self, manager, monkeypatch):
+        manager.loads_fail = True
+        for i in range(3):
+            assert manager.get_contact_by_handle("phone_number", f"+1555{i}")
+
+        assert manager.calls.count("get_logs") == 1
+        assert manager.calls.count("filter_contacts") == 3
+
+        # Once the backoff has passed, the next lookup loads the context.
+        monkeypatch.setattr(cm_module, "_IDENTITY_RETRY_S", 0.0)
+        manager.loads_fail = False
+        manager.calls.clear()
+        for i in range(3):
+            manager.get_contact_by_handle("phone_number", f"+1555{i}")
+        assert manager.calls == ["get_logs", "get_logs"]
@@ -139,8 +139,9 @@ class TestDegradableStepResilience:
 class TestContextRegistryResilience:
     """Individual context creation failures must not crash setup()."""
 
-    def test_partial_context_creation_failure_does_not_raise(self):
+    def test_partial_context_creation_failure_does_not_raise(self, tmp_path):
         """ContextRegistry.setup() tolerates individual context creation errors."""
+        from unify.common.context_manifest import ProvisioningRecord
         from unify.common.context_registry import ContextRegistry
 
         original = ContextRegistry._create_context_wrapper
@@ -157,7 +158,15 @@ class TestContextRegistryResilience:
 
         ContextRegistry._setup_complete = False
         try:
-            with patch.object(ContextRegistry, "_create_context_wrapper", _flaky):
+            # A fresh record, so no context is skipped as already provisioned.
+            with (
+                patch.object(ContextRegistry, "_create_context_wrapper", _flaky),
+                patch.object(
+                    ContextRegistry,
+                    "_provisioning_record",
+                    ProvisioningRecord(tmp_path / "manifests.json"),
+                ),
+            ):
                 ContextRegistry.setup()
         finally:
             ContextRegistry._setup_complete = False
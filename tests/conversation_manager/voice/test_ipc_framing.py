@@ -0,0 +1,195 @@
+"""
+Framing, write coalescing and backpressure on the CallEventSocket bridge.
+
+Events between the voice subprocess and the parent used to travel as
+newline-delimited JSON with the event JSON escaped inside another JSON
+object, one ``sock_sendall`` per event. They now travel as length-prefixed
+frames carrying the event bytes verbatim; the frames of one event-loop tick
+share a write, and a channel whose peer is not keeping up makes only its own
+senders wait.
+"""
+
+import asyncio
+import json
+import socket
+
+import pytest
+
+from unify.conversation_manager.domains.ipc_socket import (
+    CallEventSocketClient,
+    CallEventSocketServer,
+    ChannelMetrics,
+    FrameDecoder,
+    FrameError,
+    _FrameWriter,
+    encode_frame,
+)
+
+
+class TestFraming:
+    def test_the_event_is_carried_verbatim(self):
+        event_json = json.dumps({"content": 'say "hi"\n', "emoji": "👋"})
+        frame = encode_frame("app:comms:phone_utterance", event_json)
+
+        assert frame.endswith(event_json.encode("utf-8"))
+        assert FrameDecoder().feed(frame) == [
+            ("app:comms:phone_utterance", event_json),
+        ]
+
+    def test_frames_are_reassembled_from_any_split(self):
+        events = [("app:call:status", json.dumps({"idx": i})) for i in range(3)]
+        stream = b"".join(encode_frame(ch, ev) for ch, ev in events)
+
+        for cut in range(1, len(stream)):
+            decoder = FrameDecoder()
+            assert decoder.feed(stream[:cut]) + decoder.feed(stream[cut:]) == events
+
+    def test_a_corrupt_header_is_an_error(self):
+        with pytest.raises(FrameError):
+            FrameDecoder().feed(b"not valid json\n")
+
+    def test_frames_before_a_corrupt_header_are_kept(self):
+        events = [("app:call:status", json.dumps({"idx": i})) for i in range(2)]
+        stream = b"".join(encode_frame(ch, ev) for ch, ev in events)
+
+        with pytest.raises(FrameError) as raised:
+            FrameDecoder().feed(stream + b"not valid json\n")
+
+        assert raised.value.events == events
+
+
+@pytest.fixture
+def sock_pair():
+    left, right = socket.socketpair()
+    left.setblocking(False)
+    right.setblocking(False)
+    yield left, right
+    left.close()
+    right.close()
+
+
+class TestWriter:
+    @pytest.mark.asyncio
+    async def test_sends_in_one_tick_share_one_write(self, sock_pair, monkeypatch):
+        loop = asyncio.get_running_loop()
+        writes = []
+        sendall = loop.sock_sendall
+
+        async def counting_sendall(sock, data):
+            writes.append(len(data))
+            await sendall(sock, data)
+
+        monkeypatch.setattr(loop, "sock_sendall", counting_sendall)
+        metrics = ChannelMetrics()
+        writer = _FrameWriter(sock_pair[0], loop, metrics)
+
+        await asyncio.gather(
+            *(
+                writer.send("app:call:status", encode_frame("c", "{}"))
+                for _ in range(50)
+            ),
+        )
+
+        assert len(writes) == 1
+        stats = metrics.snapshot()["app:call:status"]
+        assert stats["frames"] == 50
+        assert stats["mean_latency_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_a_backed_up_channel_only_stalls_its_own_senders(
+        self,
+        sock_pair,
+        monkeypatch,
+    ):
+        loop = asyncio.get_running_loop()
+        peer_reading = asyncio.Event()
+        written = []
+
+        async def slow_sendall(sock, data):
+            await peer_reading.wait()
+            written.append(data)
+
+        monkeypatch.setattr(loop, "sock_sendall", slow_sendall)
+        metrics = ChannelMetrics()
+        writer = _FrameWriter(sock_pair[0], loop, metrics, high_water_bytes=100)
+        big = encode_frame("audio", "x" * 80)
+
+        sends = [asyncio.create_task(writer.send("audio", big)) for _ in range(3)]
+        sends.append(
+            asyncio.create_task(writer.send("status", encode_frame("s", "{}")))
+        )
+        await asyncio.sleep(0.01)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["audio"]["stalls"] == 2
+        assert "status" not in snapshot or snapshot["status"]["stalls"] == 0
+
+        peer_reading.set()
+        await asyncio.gather(*sends)
+        decoded = FrameDecoder().feed(b"".join(written))
+        assert [ch for ch, _ in decoded].count("audio") == 3
+
+
+class TestThroughput:
+    @pytest.mark.asyncio
+    async def test_twenty_thousand_coalesced_events_all_arrive(
+        self,
+        sock_pair,
+    ):
+        loop = asyncio.get_running_loop()
+        writer = _FrameWriter(sock_pair[0], loop, ChannelMetrics())
+        count, burst = 20_000, 50
+        event_json = json.dumps(
+            {"event_name": "InboundPhoneUtterance", "content": "word " * 8},
+        )
+        received = 0
+
+        async def read():
+            nonlocal received
+            decoder = FrameDecoder()
+            while received < count:
+                chunk = await loop.sock_recv(sock_pair[1], 256 * 1024)
+                received += len(decoder.feed(chunk))
+
+        reader = asyncio.create_task(read())
+        for offset in range(0, count, burst):
+            await asyncio.gather(
+                *(
+                    writer.send(
+                        "app:comms:phone_utterance",
+                        encode_frame("app:comms:phone_utterance", event_json),
+                    )
+                    for _ in range(burst)
+                ),
+            )
+        await asyncio.wait_for(reader, timeout=30)
+
+        assert received == count
+
+    @pytest.mark.asyncio
+    async def test_events_reach_the_parent_in_order(self):
+        received = []
+        done = asyncio.Event()
+        count = 2_000
+
+        async def on_event(channel, event_json):
+            received.append(json.loads(event_json)["idx"])
+            if len(received) == count:
+                done.set()
+
+        server = CallEventSocketServer(None, on_event=on_event, forward_channels=[])
+        client = CallEventSocketClient(await server.start())
+        try:
+            for offset in range(0, count, 100):
+                await asyncio.gather(
+                    *(
+                        client.send_event("app:call:status", json.dumps({"idx": i}))
+                        for i in range(offset, offset + 100)
+                    ),
+                )
+            await asyncio.wait_for(done.wait(), timeout=10)
+        finally:
+            await client.close()
+            await server.stop()
+
+        assert received == list(range(count))
@@ -17,6 +17,7 @@ from unify.conversation_manager.domains.ipc_socket import (
     CallEventSocketServer,
     CallEventSocketClient,
     CM_EVENT_SOCKET_ENV,
+    encode_frame,
     get_socket_client,
     send_event_to_parent,
 )
@@ -197,44 +198,88 @@ class TestCallEventSocketServer:
         await server.stop()
 
     @pytest.mark.asyncio
-    async def test_server_handles_malformed_json(self, mock_event_broker):
-        """Server gracefully handles malformed JSON without crashing."""
+    async def test_server_handles_malformed_frame(self, mock_event_broker):
+        """A client sending a frame that cannot be decoded is dropped; the
+        server keeps serving other clients."""
+        import socket as sock
+        import struct
+
         server = CallEventSocketServer(mock_event_broker, forward_channels=[])
         socket_path = await server.start()
 
-        # Connect directly and send malformed data
-        import socket as sock
-
+        # Well-formed header, body that is not UTF-8.
+        body = b"test" + b"\xff\xfe"
         client_socket = sock.socket(sock.AF_UNIX, sock.SOCK_STREAM)
         client_socket.connect(socket_path)
-        client_socket.sendall(b"not valid json\n")
+        client_socket.sendall(struct.pack("!IH", len(body), 4) + body)
+        assert await _wait_for_condition(lambda: not server.has_connected_clients)
         client_socket.close()
 
-        # Wait for processing
-        await asyncio.sleep(0.1)
-
-        # Server should still be running
         assert server._running is True
-
-        # Should not have published anything
         mock_event_broker.publish.assert_not_called()
 
+        # The next client's frames still get through.
+        client_socket = sock.socket(sock.AF_UNIX, sock.SOCK_STREAM)
+        client_socket.connect(socket_path)
+        client_socket.sendall(encode_frame("test", '{"ok": true}'))
+        client_socket.close()
+        assert await _wait_for_condition(
+            lambda: mock_event_broker.publish.await_count == 1,
+        )
+        mock_event_broker.publish.assert_awaited_once_with("test", '{"ok": true}')
+
         await server.stop()
 
     @pytest.mark.asyncio
-    async def test_server_handles_incomplete_message(self, mock_event_broker):
-        """Server handles messages without required fields."""
+    async def test_frames_ahead_of_a_corrupt_one_are_published(
+        self,
+        mock_event_broker,
+    ):
+        """Frames that arrived intact in the same read as a bad one are still
+        published before the client is dropped."""
+        import socket as sock
+
         server = CallEventSocketServer(mock_event_broker, forward_channels=[])
         socket_path = await server.start()
 
-        # Send message missing 'event' field
+        client_socket = sock.socket(sock.AF_UNIX, sock.SOCK_STREAM)
+        client_socket.connect(socket_path)
+        client_socket.sendall(
+            encode_frame("test", '{"idx": 0}')
+            + encode_frame("test", '{"idx": 1}')
+            + b"not a frame header",
+        )
+        assert await _wait_for_condition(lambda: not server.has_connected_clients)
+        client_socket.close()
+
+        assert await _wait_for_condition(
+            lambda: mock_event_broker.publish.await_count == 2,
+        )
+        assert [c.args for c in mock_event_broker.publish.await_args_list] == [
+            ("test", '{"idx": 0}'),
+            ("test", '{"idx": 1}'),
+        ]
+
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_server_handles_incomplete_message(self, mock_event_broker):
+        """A frame with no event, and one cut off by a disconnect, publish
+        nothing."""
         import socket as sock
 
+        server = CallEventSocketServer(mock_event_broker, forward_channels=[])
+        socket_path = await server.start()
+
         client_socket = sock.socket(sock.AF_UNIX, sock.SOCK_STREAM)
         client_socket.connect(socket_path)
-        client_socket.sendall(b'{"channel": "test"}\n')  # Missing 'event'
+        client_socket.sendall(
+            encode_frame("test", "")  # Missing event
+            + encode_frame("test", '{"cut": "short"}')[:-3],
+        )
         client_socket.close()
 
+        assert await _wait_for_condition(lambda: not server.has_connected_clients)
         await asyncio.sleep(0.1)
 
         # Server should still be running and not crash
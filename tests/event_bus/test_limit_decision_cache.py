@@ -0,0 +1,143 @@
+"""The runtime reuses a recent spend read while it is far from every cap.
+
+A tool loop makes hundreds of LLM calls a minute, and each used to cost an
+Orchestra round trip before it could start. With the decision cache installed
+a call well under its caps is allowed from the last read, less whatever this
+process has spent since; a call near a cap, a refusal, or an unreadable
+account always asks again.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from unillm.limit_hooks import LimitCheckRequest
+
+from unify import spending_limits
+from unify.spending_limits import _LimitDecisionCache, check_spending_limits_callback
+
+
+class _FakeSpendClient:
+    """Answers every spend endpoint from ``self.data`` and counts calls."""
+
+    closed = False
+
+    def __init__(self, **data):
+        self.data = {"cumulative_spend": 10.0, "limit": 100.0, **data}
+        self.calls = 0
+
+    async def _answer(self, **kwargs):
+        self.calls += 1
+        return dict(self.data)
+
+    get_assistant_spend = _answer
+    get_user_spend = _answer
+    get_member_spend = _answer
+    get_org_spend = _answer
+
+    async def notify_limit_reached(self, payload):
+        return {"notified": False}
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    """A single-tenant runtime with the decision cache on and local spend faked."""
+    spent = {"total": 0.0}
+    monkeypatch.setattr(spending_limits, "_decision_cache", _LimitDecisionCache())
+    monkeypatch.setattr(spending_limits, "_local_spend_total", lambda: spent["total"])
+    client = _FakeSpendClient(credit_balance=500.0)
+    with (
+        patch("unify.spending_limits._get_api_key", return_value="test-key"),
+        patch("unify.spending_limits._get_spend_client", return_value=client),
+        patch("unify.session_details.SESSION_DETAILS") as session,
+    ):
+        session.assistant.agent_id = 1
+        session.assistant.timezone = "UTC"
+        session.user_id = "user_1"
+        session.org_id = None
+        yield client, spent
+
+
+async def _check():
+    return await check_spending_limits_callback(
+        LimitCheckRequest(model="gpt-4", endpoint="test"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_calls_well_under_the_cap_reuse_one_read(runtime):
+    client, _ = runtime
+    for _ in range(50):
+        assert (await _check()).allowed
+    # One read: the assistant and user endpoints, once each.
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_local_spend_is_deducted_until_the_cap_is_near(runtime):
+    client, spent = runtime
+    assert (await _check()).allowed
+    assert client.calls == 2
+
+    # 90 of headroom was read; 88.5 spent locally leaves 1.5, still clear.
+    spent["total"] = 88.5
+    assert (await _check()).allowed
+    assert client.calls == 2
+
+    # Under a dollar left: the next call asks Orchestra, which now refuses.
+    spent["total"] = 89.5
+    client.data["cumulative_spend"] = 100.0
+    response = await _check()
+    assert not response.allowed
+    assert client.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_a_read_already_near_the_cap_is_not_kept(runtime):
+    client, _ = runtime
+    client.data["cumulative_spend"] = 99.5
+    assert (await _check()).allowed
+    assert (await _check()).allowed
+    assert client.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_refusals_and_failures_are_always_rechecked(runtime):
+    client, _ = runtime
+    client.data["credit_balance"] = 0.0
+    assert not (await _check()).allowed
+    client.data["credit_balance"] = 500.0
+    assert (await _check()).allowed
+    assert client.calls == 4
+
+    spending_limits._decision_cache.clear()
+    failing = {"n": 0}
+
+    async def flaky(**kwargs):
+        failing["n"] += 1
+        raise RuntimeError("orchestra blip")
+
+    client.get_user_spend = flaky
+    assert (await _check()).allowed  # the runtime fails open...
+    assert (await _check()).allowed
+    assert failing["n"] == 2  # ...but never caches a read it could not make
+
+
+@pytest.mark.asyncio
+async def test_the_cache_expires(runtime):
+    client, _ = runtime
+    assert (await _check()).allowed
+    for entry in spending_limits._decision_cache._entries.values():
+        entry.expires_at -= spending_limits.LIMIT_DECISION_TTL
+    assert (await _check()).allowed
+    assert client.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_a_caller_context_never_uses_the_cache(runtime):
+    client, _ = runtime
+    async with spending_limits.caller_context("tenant-key", user_id="u"):
+        for _ in range(3):
+            assert (await _check()).allowed
+    assert client.calls == 3
@@ -0,0 +1,262 @@
+"""Monthly spend is summed in process and flushed to Orchestra in deltas.
+
+The LLM event hook used to send one ``atomic_upsert`` per priced call, all
+contending for the same ``Spending/Monthly`` row. Costs now accumulate per
+(context, user, assistant, month) and go out as one upsert per key on each
+flush. A local journal carries unflushed deltas across crashes -- a flush
+left in doubt is settled against the row, best-effort -- and limit checks
+count what has not been flushed yet.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+from unillm.limit_hooks import LimitCheckRequest
+
+from unify import spending_limits
+from unify.events import llm_event_hook
+from unify.events.spend_accumulator import SpendAccumulator
+
+_ALICE = ("u/a/Spending/Monthly", "alice", "7", "2026-10")
+_BOB = ("u/a/Spending/Monthly", "bob", "7", "2026-10")
+
+
+class _Rows:
+    """Stand-in for the Spending/Monthly rows behind ``atomic_upsert``."""
+
+    def __init__(self) -> None:
+        self.values: dict = {}
+        self.calls: list = []
+        # Apply the next write, then fail as if its response were lost.
+        self.lose_next_response = False
+
+    async def upsert(self, key, amount):
+        self.calls.append((key[1], round(amount, 6)))
+        self.values[key] = self.values.get(key, 0.0) + amount
+        if amount and self.lose_next_response:
+            self.lose_next_response = False
+            raise ConnectionError("response lost")
+        return self.values[key]
+
+
+@pytest.fixture
+def rows():
+    return _Rows()
+
+
+def _accumulator(tmp_path, rows, **kwargs) -> SpendAccumulator:
+    return SpendAccumulator(
+        tmp_path / "spend.jsonl",
+        rows.upsert,
+        flush_interval_s=60.0,
+        **kwargs,
+    )
+
+
+class TestFlushesSumPerKey:
+    @pytest.mark.asyncio
+    async def test_many_calls_cost_one_upsert_per_key(self, tmp_path, rows):
+        acc = _accumulator(tmp_path, rows)
+        for _ in range(100):
+            acc.add(_ALICE, 0.001)
+        acc.add(_BOB, 0.02)
+
+        await acc.flush()
+
+        # One read for each new row's starting value, then one write each.
+        assert rows.calls == [("alice", 0), ("alice", 0.1), ("bob", 0), ("bob", 0.02)]
+        assert acc.unflushed("2026-10") == 0
+
+        acc.add(_ALICE, 0.05)
+        await acc.flush()
+        assert rows.calls[-1] == ("alice", 0.05)
+        assert rows.values[_ALICE] == pytest.approx(0.15)
+
+    def test_a_flush_is_due_past_the_threshold(self, tmp_path, rows):
+        acc = _accumulator(tmp_path, rows, flush_threshold=0.1)
+
+        assert acc.add(_ALICE, 0.06) is False
+        assert acc.add(_ALICE, 0.06) is True
+
+    def test_unflushed_spend_is_scoped(self, tmp_path, rows):
+        acc = _accumulator(tmp_path, rows)
+        acc.add(_ALICE, 0.3)
+        acc.add(_BOB, 0.2)
+
+        assert acc.unflushed("2026-10") == pytest.approx(0.5)
+        assert acc.unflushed("2026-10", user_id="bob") == pytest.approx(0.2)
+        assert acc.unflushed("2026-10", assistant_id="8") == 0
+        assert acc.unflushed("2026-09") == 0
+
+
+class TestCrashRecoveryThroughTheJournal:
+    @pytest.mark.asyncio
+    async def test_unflushed_spend_survives_a_restart(self, tmp_path, rows):
+        acc = _accumulator(tmp_path, rows)
+        acc.add(_ALICE, 0.25)
+        acc.close()
+
+        restarted = _accumulator(tmp_path, rows)
+        assert restarted.unflushed("2026-10") == pytest.approx(0.25)
+        await restarted.flush()
+
+        assert rows.values[_ALICE] == pytest.approx(0.25)
+
+    @pytest.mark.asyncio
+    async def test_a_flush_that_landed_is_not_sent_again(self, tmp_path, rows):
+        acc = _accumulator(tmp_path, rows)
+        acc.add(_ALICE, 0.4)
+        rows.lose_next_response = True
+        await acc.flush()
+        acc.close()
+
+        restarted = _accumulator(tmp_path, rows)
+        assert restarted.unflushed("2026-10") == pytest.approx(0.4)
+        await restarted.flush()
+
+        assert rows.values[_ALICE] == pytest.approx(0.4)
+        assert restarted.unflushed("2026-10") == 0
+
+    @pytest.mark.asyncio
+    async def test_a_flush_that_never_landed_is_sent(self, tmp_path, rows):
+        acc = _accumulator(tmp_path, rows)
+        acc.add(_ALICE, 0.1)
+        await acc.flush()
+        acc.add(_ALICE, 0.4)
+        acc.close()
+        # The process dies after journaling the flush, before sending it.
+        with open(acc.journal_path, "a") as out:
+            out.write(
+                json.dumps(
+                    {
+                        "op": "flush",
+                        "key": list(_ALICE),
+                        "batch": "b1",
+                        "amount": 0.4,
+                        "base": 0.1,
+                    },
+                )
+                + "\n",
+            )
+
+        restarted = _accumulator(tmp_path, rows)
+        await restarted.flush()
+
+        assert rows.values[_ALICE] == pytest.approx(0.5)
+        assert restarted.unflushed("2026-10") == 0
+
+    @pytest.mark.asyncio
+    async def test_other_writers_growth_never_doubles_a_flush(self, tmp_path, rows):
+        acc = _accumulator(tmp_path, rows)
+        acc.add(_ALICE, 0.4)
+        rows.lose_next_response = True
+        await acc.flush()
+        acc.close()
+        # Another process of the assistant adds to the same row meanwhile.
+        rows.values[_ALICE] += 0.3
+
+        restarted = _accumulator(tmp_path, rows)
+        await restarted.flush()
+
+        assert rows.values[_ALICE] == pytest.approx(0.7)
+        assert restarted.unflushed("2026-10") == 0
+
+    @pytest.mark.asyncio
+    async def test_the_journal_is_compacted_after_a_flush(self, tmp_path, rows):
+        acc = _accumulator(tmp_path, rows)
+        for _ in range(50):
+            acc.add(_ALICE, 0.001)
+        await acc.flush()
+
+        lines = acc.journal_path.read_text().splitlines()
+        assert [json.loads(line)["op"] for line in lines] == ["base"]
+
+
+class TestOneJournalPerProcess:
+    def test_a_live_process_journal_is_left_alone(self, tmp_path, rows):
+        # pid 1 is always running: a sibling process's unflushed spend.
+        live = tmp_path / "spend.1.jsonl"
+        live.write_text(
+            json.dumps({"op": "add", "key": list(_ALICE), "amount": 0.3}) + "\n",
+        )
+
+        acc = _accumulator(tmp_path, rows)
+
+        assert acc.unflushed("2026-10") == 0
+        assert live.exists()
+
+    @pytest.mark.asyncio
+    async def test_a_dead_process_journal_is_adopted_once(
+        self,
+        tmp_path,
+        rows,
+        monkeypatch,
+    ):
+        dead = tmp_path / "spend.999999.jsonl"
+        dead.write_text(
+            json.dumps({"op": "add", "key": list(_ALICE), "amount": 0.3}) + "\n",
+        )
+        monkeypatch.setattr(
+            "unify.events.spend_accumulator._pid_alive",
+            lambda pid: pid != 999999,
+        )
+
+        acc = _accumulator(tmp_path, rows)
+        assert not dead.exists()
+        assert acc.unflushed("2026-10") == pytest.approx(0.3)
+        # The adopted spend is this process's now; it survives a restart.
+        acc.close()
+        acc = _accumulator(tmp_path, rows)
+        await acc.flush()
+
+        assert rows.values[_ALICE] == pytest.approx(0.3)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [acc.journal_path.name]
+
+
+class TestLimitChecksCountUnflushedSpend:
+    @pytest.mark.asyncio
+    async def test_a_cap_is_enforced_before_the_spend_is_flushed(
+        self,
+        tmp_path,
+        rows,
+        monkeypatch,
+    ):
+        acc = _accumulator(tmp_path, rows)
+        monkeypatch.setattr(llm_event_hook, "_ACCUMULATOR", acc)
+        monkeypatch.setattr(spending_limits, "_decision_cache", None)
+
+        class _Client:
+            async def get_assistant_spend(self, **_):
+                return {"cumulative_spend": 9.0, "limit": 10.0}
+
+            get_user_spend = get_assistant_spend
+
+            async def notify_limit_reached(self, payload):
+                return {"notified": False}
+
+        with (
+            patch("unify.spending_limits._get_api_key", return_value="test-key"),
+            patch("unify.spending_limits._get_spend_client", return_value=_Client()),
+            patch(
+                "unify.spending_limits._get_current_month",
+                return_value="2026-10",
+            ),
+            patch("unify.session_details.SESSION_DETAILS") as session,
+        ):
+            session.assistant.agent_id = 7
+            session.assistant.timezone = "UTC"
+            session.user_id = "alice"
+            session.org_id = None
+            request = LimitCheckRequest(model="gpt-4", endpoint="test")
+
+            assert (
+                await spending_limits.check_spending_limits_callback(request)
+            ).allowed
+            acc.add(_ALICE, 1.5)
+            refused = await spending_limits.check_spending_limits_callback(request)
+
+        assert not refused.allowed
+        assert refused.current_spend == pytest.approx(10.5)
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+
+import pytest
+
+from unify.file_manager.filesystem_adapters.local_adapter import LocalFileSystemAdapter
+from unify.file_manager.filesystem_adapters.local_index import LocalFileIndex
+
+
+def _tree(root):
+    (root / "Docs" / "q1").mkdir(parents=True)
+    (root / "Docs" / "a.txt").write_text("a", encoding="utf-8")
+    (root / "Docs" / "q1" / "b.csv").write_text("b,c\n", encoding="utf-8")
+    (root / "top.csv").write_text("top", encoding="utf-8")
+
+
+def _backdate(path, seconds=60):
+    """Age a directory past the mtime-settle window so it is trusted as clean."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def _paths(index, prefix=""):
+    return [f.path for f in index.files(prefix)]
+
+
+def test_index_lists_the_tree_and_scopes_by_prefix(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    _tree(root)
+    index = LocalFileIndex(root, index_path=tmp_path / "idx.sqlite")
+    index.refresh()
+
+    assert _paths(index) == ["Docs/a.txt", "Docs/q1/b.csv", "top.csv"]
+    assert _paths(index, "Docs") == ["Docs/a.txt", "Docs/q1/b.csv"]
+    assert _paths(index, "/Docs/q1") == ["Docs/q1/b.csv"]
+    # A sibling sharing the prefix string is not part of the subtree.
+    (root / "Docs2").mkdir()
+    (root / "Docs2" / "c.txt").write_text("c", encoding="utf-8")
+    index.refresh()
+    assert _paths(index, "Docs") == ["Docs/a.txt", "Docs/q1/b.csv"]
+
+
+def test_mtime_walk_picks_up_creates_deletes_and_removed_subtrees(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    _tree(root)
+    index = LocalFileIndex(
+        root,
+        index_path=tmp_path / "idx.sqlite",
+        use_inotify=False,
+    )
+    index.refresh()
+
+    (root / "Docs" / "new.txt").write_text("n", encoding="utf-8")
+    (root / "top.csv").unlink()
+    for p in (root / "Docs" / "q1").iterdir():
+        p.unlink()
+    (root / "Docs" / "q1").rmdir()
+    index.refresh()
+
+    assert _paths(index) == ["Docs/a.txt", "Docs/new.txt"]
+
+
+def test_unchanged_directories_are_not_relisted(tmp_path, monkeypatch):
+    """A warm refresh stats directories only; settled, unchanged ones are skipped."""
+    root = tmp_path / "root"
+    root.mkdir()
+    _tree(root)
+    for d in (root / "Docs" / "q1", root / "Docs", root):
+        _backdate(d)
+    index = LocalFileIndex(
+        root,
+        index_path=tmp_path / "idx.sqlite",
+        use_inotify=False,
+    )
+    index.refresh()
+
+    scanned = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        scanned.append(str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    index.refresh()
+    assert scanned == []
+
+    (root / "Docs" / "q1" / "c.csv").write_text("c", encoding="utf-8")
+    index.refresh()
+    assert scanned == [str(root / "Docs" / "q1")]
+    assert "Docs/q1/c.csv" in _paths(index)
+
+
+def test_index_persists_across_instances(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    _tree(root)
+    db = tmp_path / "idx.sqlite"
+    first = LocalFileIndex(root, index_path=db)
+    first.refresh()
+    first.close()
+
+    (root / "later.txt").write_text("l", encoding="utf-8")
+    second = LocalFileIndex(root, index_path=db)
+    second.refresh()
+    assert _paths(second) == [
+        "Docs/a.txt",
+        "Docs/q1/b.csv",
+        "later.txt",
+        "top.csv",
+    ]
+
+
+def test_record_captures_in_place_rewrites(tmp_path):
+    """Rewriting a file in place leaves its directory's mtime untouched."""
+    root = tmp_path / "root"
+    root.mkdir()
+    _tree(root)
+    index = LocalFileIndex(
+        root,
+        index_path=tmp_path / "idx.sqlite",
+        use_inotify=False,
+    )
+    index.refresh()
+
+    (root / "top.csv").write_text("much longer content", encoding="utf-8")
+    index.record("/top.csv")
+    sizes = {f.path: f.size for f in index.files()}
+    assert sizes["top.csv"] == len("much longer content")
+
+
+def test_inotify_catches_in_place_rewrites_without_record(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    _tree(root)
+    index = LocalFileIndex(root, index_path=tmp_path / "idx.sqlite")
+    index.refresh()
+    if index._watcher is None:
+        pytest.skip("inotify unavailable on this host")
+
+    (root / "Docs" / "q1" / "b.csv").write_text("rewritten", encoding="utf-8")
+    (root / "Docs" / "q1" / "deep").mkdir()
+    (root / "Docs" / "q1" / "deep" / "d.txt").write_text("d", encoding="utf-8")
+    index.refresh()
+
+    sizes = {f.path: f.size for f in index.files()}
+    assert sizes["Docs/q1/b.csv"] == len("rewritten")
+    assert "Docs/q1/deep/d.txt" in sizes
+
+
+def test_glob_and_changed_since(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    _tree(root)
+    old = time.time() - 3600
+    for p in (root / "Docs" / "a.txt", root / "Docs" / "q1" / "b.csv"):
+        os.utime(p, (old, old))
+    index = LocalFileIndex(root, index_path=tmp_path / "idx.sqlite")
+    index.refresh()
+
+    assert [f.path for f in index.glob("*.csv")] == ["Docs/q1/b.csv", "top.csv"]
+    assert [f.path for f in index.glob("*.csv", "Docs")] == ["Docs/q1/b.csv"]
+    assert [f.path for f in index.changed_since(time.time() - 60)] == ["top.csv"]
+
+
+def test_adapter_listing_matches_the_tree_walk(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    _tree(root)
+    (root / "link.csv").symlink_to(root / "top.csv")
+    indexed = LocalFileSystemAdapter(
+        root.as_posix(),
+        index_path=str(tmp_path / "idx.sqlite"),
+    )
+    walked = LocalFileSystemAdapter(root.as_posix(), use_index=False)
+
+    def key(refs):
+        return sorted((r.path, r.name, r.uri, r.size_bytes) for r in refs)
+
+    assert key(indexed.iter_files()) == key(walked.iter_files())
+    assert key(indexed.iter_files("Docs")) == key(walked.iter_files("Docs"))
+    assert sorted(indexed.list()) == sorted(walked.list())
+    assert [r.path for r in indexed.glob("q1/*", root="Docs")] == ["/Docs/q1/b.csv"]
+    for pattern in ("*.csv", "[!t]*", "[^t]*", "docs/*", "Docs/?.txt"):
+        assert key(indexed.glob(pattern)) == key(walked.glob(pattern)), pattern
+
+
+def test_adapter_write_file_updates_the_index(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    src = tmp_path / "src.txt"
+    src.write_text("v1", encoding="utf-8")
+    ad = LocalFileSystemAdapter(
+        root.as_posix(),
+        index_path=str(tmp_path / "idx.sqlite"),
+    )
+    ad.write_file("out.txt", src)
+    assert [r.size_bytes for r in ad.iter_files()] == [2]
+
+    src.write_text("version two", encoding="utf-8")
+    ad.write_file("out.txt", src)
+    assert [r.size_bytes for r in ad.iter_files()] == [len("version two")]
+
+
+def test_a_failed_record_makes_the_next_refresh_full(tmp_path, monkeypatch):
+    root = tmp_path / "root"
+    root.mkdir()
+    src = tmp_path / "src.txt"
+    src.write_text("v1", encoding="utf-8")
+    ad = LocalFileSystemAdapter(
+        root.as_posix(),
+        index_path=str(tmp_path / "idx.sqlite"),
+    )
+    ad.write_file("out.txt", src)
+    _backdate(root)
+    assert [r.size_bytes for r in ad.iter_files()] == [2]
+    # Leave only the mtime walk, which cannot see an in-place rewrite.
+    index = LocalFileIndex.for_root(root, index_path=tmp_path / "idx.sqlite")
+    monkeypatch.setattr(index, "_watcher", None)
+
+    def locked(rel):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(index, "record", locked)
+    src.write_text("version two", encoding="utf-8")
+    ad.write_file("out.txt", src)
+
+    assert [r.size_bytes for r in ad.iter_files()] == [len("version two")]
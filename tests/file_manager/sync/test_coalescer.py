@@ -0,0 +1,277 @@
+"""Tests for SyncCoalescer and the idle-poll skip in SyncManager."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+from unittest.mock import MagicMock
+
+import pytest
+
+from unify.file_manager.sync.coalescer import DELETE, WRITE, SyncCoalescer
+from unify.file_manager.sync.config import SyncConfig
+from unify.file_manager.sync.manager import SyncManager
+from unify.file_manager.sync.rclone import RcloneSync, SyncResult
+
+
+@pytest.fixture
+def sync_config(tmp_path):
+    """Create a test SyncConfig with a short debounce."""
+    return SyncConfig(
+        enabled=True,
+        ssh_key_path=str(tmp_path / "test_key"),
+        local_root=str(tmp_path / "unity"),
+        remote_root=str(tmp_path / "remote"),
+        write_debounce_seconds=0.05,
+        write_max_delay_seconds=0.5,
+    )
+
+
+class _RecordingRclone:
+    """Stands in for RcloneSync, recording each batched call."""
+
+    def __init__(self):
+        self.copies = []
+        self.deletes = []
+
+    async def copy_files(self, paths):
+        self.copies.append(sorted(paths))
+        return SyncResult(success=True)
+
+    async def delete_remote_files(self, paths):
+        self.deletes.append(sorted(paths))
+        return SyncResult(success=True)
+
+
+class TestSyncCoalescer:
+    """Tests for debouncing and batching."""
+
+    @pytest.mark.asyncio
+    async def test_burst_of_writes_becomes_one_copy(self, sync_config):
+        """Twenty writes in one burst cost one rclone run, not twenty."""
+        rclone = _RecordingRclone()
+        coalescer = SyncCoalescer(rclone, sync_config)
+
+        for i in range(20):
+            coalescer.submit(f"/w/f{i:02d}.txt", WRITE)
+            coalescer.submit(f"/w/f{i:02d}.txt", WRITE)
+        await asyncio.sleep(0.2)
+
+        assert rclone.copies == [[f"/w/f{i:02d}.txt" for i in range(20)]]
+        assert rclone.deletes == []
+
+    @pytest.mark.asyncio
+    async def test_latest_operation_per_path_wins(self, sync_config):
+        rclone = _RecordingRclone()
+        coalescer = SyncCoalescer(rclone, sync_config)
+
+        coalescer.submit("/w/gone.txt", WRITE)
+        coalescer.submit("/w/gone.txt", DELETE)
+        coalescer.submit("/w/back.txt", DELETE)
+        coalescer.submit("/w/back.txt", WRITE)
+        await coalescer.close()
+
+        assert rclone.copies == [["/w/back.txt"]]
+        assert rclone.deletes == [["/w/gone.txt"]]
+
+    @pytest.mark.asyncio
+    async def test_steady_writes_flush_by_max_delay(self, sync_config):
+        """A writer that never pauses still gets pushed within the max delay."""
+        sync_config.write_debounce_seconds = 0.1
+        sync_config.write_max_delay_seconds = 0.2
+        rclone = _RecordingRclone()
+        coalescer = SyncCoalescer(rclone, sync_config)
+
+        for i in range(12):
+            coalescer.submit(f"/w/{i}.txt", WRITE)
+            await asyncio.sleep(0.05)
+        assert len(rclone.copies) >= 2
+        await coalescer.close()
+        pushed = [p for batch in rclone.copies for p in batch]
+        assert sorted(pushed) == sorted(f"/w/{i}.txt" for i in range(12))
+
+    @pytest.mark.asyncio
+    async def test_dirty_until_a_bisync_covers_the_generation(self, sync_config):
+        coalescer = SyncCoalescer(_RecordingRclone(), sync_config)
+        assert coalescer.dirty is False
+
+        coalescer.submit("/w/a.txt", WRITE)
+        await coalescer.flush()
+        generation = coalescer.generation
+        coalescer.submit("/w/b.txt", WRITE)
+        await coalescer.flush()
+        coalescer.mark_clean(generation)
+        assert coalescer.dirty is True
+
+        coalescer.mark_clean(coalescer.generation)
+        assert coalescer.dirty is False
+        await coalescer.close()
+
+
+class TestIdlePollSkip:
+    """Tests for skipping the poll bisync when nothing changed."""
+
+    @pytest.mark.asyncio
+    async def test_poll_skips_bisync_while_both_sides_are_unchanged(
+        self,
+        sync_config,
+        tmp_path,
+        monkeypatch,
+    ):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        local_root = tmp_path / "unity"
+        local_root.mkdir()
+        (local_root / "a.txt").write_text("a")
+
+        manager = SyncManager(config=sync_config)
+        remote_listing = {"fp": "r1"}
+        bisyncs = []
+
+        async def remote_fingerprint():
+            return remote_listing["fp"]
+
+        async def bisync(max_retries=None):
+            bisyncs.append(max_retries)
+            return SyncResult(success=True)
+
+        rclone = MagicMock()
+        rclone.remote_fingerprint = remote_fingerprint
+        rclone.bisync = bisync
+        manager._rclone = rclone
+        manager._coalescer = SyncCoalescer(_RecordingRclone(), sync_config)
+
+        assert (await manager._poll_once()).success is True
+        assert await manager._poll_once() is None
+        assert len(bisyncs) == 1
+
+        remote_listing["fp"] = "r2"
+        assert (await manager._poll_once()).success is True
+        assert await manager._poll_once() is None
+
+        (local_root / "b.txt").write_text("b")
+        assert (await manager._poll_once()).success is True
+        assert await manager._poll_once() is None
+
+        manager._coalescer.submit(str(local_root / "a.txt"), WRITE)
+        assert (await manager._poll_once()).success is True
+        assert len(bisyncs) == 4
+
+    @pytest.mark.asyncio
+    async def test_idle_polls_still_force_a_periodic_bisync(
+        self,
+        sync_config,
+        tmp_path,
+        monkeypatch,
+    ):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        (tmp_path / "unity").mkdir()
+        sync_config.force_bisync_every_polls = 3
+        manager = SyncManager(config=sync_config)
+        bisyncs = []
+
+        async def remote_fingerprint():
+            return "same"
+
+        async def bisync(max_retries=None):
+            bisyncs.append(max_retries)
+            return SyncResult(success=True)
+
+        rclone = MagicMock()
+        rclone.remote_fingerprint = remote_fingerprint
+        rclone.bisync = bisync
+        manager._rclone = rclone
+
+        results = [await manager._poll_once() for _ in range(6)]
+        assert [r is not None for r in results] == [
+            True,
+            False,
+            False,
+            True,
+            False,
+            False,
+        ]
+
+
+@pytest.mark.skipif(shutil.which("rclone") is None, reason="rclone not installed")
+class TestRcloneLocalBackend:
+    """Batched operations against rclone's local backend as the remote."""
+
+    @pytest.fixture
+    def local_rclone(self, sync_config, tmp_path):
+        (tmp_path / "unity").mkdir()
+        (tmp_path / "remote").mkdir()
+        conf = tmp_path / "rclone.conf"
+        conf.write_text(f"[{RcloneSync.REMOTE_NAME}]\ntype = local\n")
+        rclone = RcloneSync(sync_config)
+        rclone._config_path = str(conf)
+        return rclone
+
+    @pytest.mark.asyncio
+    async def test_copy_and_delete_files_in_one_run_each(
+        self,
+        local_rclone,
+        tmp_path,
+    ):
+        local = tmp_path / "unity"
+        remote = tmp_path / "remote"
+        (local / "sub").mkdir()
+        paths = []
+        for name in ("a.txt", "sub/b.txt", "#hash.txt", "untouched.txt"):
+            (local / name).write_text(name)
+            if name != "untouched.txt":
+                paths.append(str(local / name))
+
+        result = await local_rclone.copy_files(paths)
+        assert result.success is True
+        assert sorted(
+            p.relative_to(remote).as_posix() for p in remote.rglob("*") if p.is_file()
+        ) == ["#hash.txt", "a.txt", "sub/b.txt"]
+
+        result = await local_rclone.delete_remote_files([str(local / "a.txt")])
+        assert result.success is True
+        assert not (remote / "a.txt").exists()
+        assert (remote / "sub" / "b.txt").exists()
+
+    @pytest.mark.asyncio
+    async def test_remote_fingerprint_tracks_listing_changes(
+        self,
+        local_rclone,
+        tmp_path,
+    ):
+        remote = tmp_path / "remote"
+        (remote / "x.txt").write_text("x")
+        first = await local_rclone.remote_fingerprint()
+        assert first is not None
+        assert await local_rclone.remote_fingerprint() == first
+
+        (remote / "y.txt").write_text("y")
+        assert await local_rclone.remote_fingerprint() != first
+
+    @pytest.mark.asyncio
+    async def test_manager_pushes_a_write_burst_through_the_coalescer(
+        self,
+        sync_config,
+        local_rclone,
+        tmp_path,
+    ):
+        manager = SyncManager(config=sync_config)
+        manager._rclone = local_rclone
+        manager._coalescer = SyncCoalescer(local_rclone, sync_config)
+        manager._started = True
+
+        spawned = []
+        real_run = local_rclone._run_with_retry
+
+        async def counting_run(cmd, operation, **kwargs):
+            spawned.append(operation)
+            return await real_run(cmd, operation, **kwargs)
+
+        local_rclone._run_with_retry = counting_run
+        local = tmp_path / "unity"
+        for i in range(25):
+            (local / f"f{i}.txt").write_text(str(i))
+            await manager.on_file_write(str(local / f"f{i}.txt"))
+        await manager._coalescer.close()
+
+        assert spawned == ["copy 25 file(s)"]
+        assert len(list((tmp_path / "remote").glob("f*.txt"))) == 25
@@ -0,0 +1,197 @@
+"""
+Stored functions compile once per process and resolve their dependencies in
+one batched read.
+
+``_inject_dependencies`` used to look every bare dependency up with its own
+read as the walk reached it, and exec'd freshly compiled source for each on
+every invocation. Compiled code is now kept process-wide under a hash of the
+implementation; the dependency closure is found on the manager's cached
+graph and read in one batch, and the manager forgets what it read whenever
+it writes a compositional row. Reads here go to an in-memory stand-in.
+"""
+
+from __future__ import annotations
+
+import linecache
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from unify.function_manager import function_cache
+from unify.function_manager import function_manager as fm_module
+from unify.function_manager.function_cache import (
+    CompiledCodeCache,
+    DependencyRowCache,
+)
+from unify.function_manager.function_manager import FunctionManager
+from unify.function_manager.verification.source_labels import (
+    function_source_filename,
+)
+
+_CTX = "Functions/Compositional"
+_DEPTH = 20
+
+
+def _chain(depth: int) -> List[Dict[str, Any]]:
+    """``f0`` calls ``f1`` ... calls ``f{depth}``, which returns its depth."""
+    rows = []
+    for i in range(depth + 1):
+        if i < depth:
+            body = f"def f{i}(x):\n    return f{i + 1}(x) + 1\n"
+            deps = [f"f{i + 1}"]
+        else:
+            body = f"def f{i}(x):\n    return x\n"
+            deps = []
+        rows.append(
+            {
+                "function_id": i,
+                "name": f"f{i}",
+                "implementation": body,
+                "depends_on": deps,
+                "verify": False,
+                "side_effect_class": "safe_noop",
+            },
+        )
+    return rows
+
+
+class _Backend:
+    """Compositional rows; counts reads by kind."""
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        self.rows = {row["name"]: row for row in rows}
+        self.reads: List[str] = []
+
+    def get_logs(self, *, context, filter=None, from_fields=None, **_):
+        assert context == _CTX
+        if from_fields is not None:
+            self.reads.append("graph")
+            rows = [{k: r.get(k) for k in from_fields} for r in self.rows.values()]
+        elif filter.startswith("name in "):
+            self.reads.append("rows")
+            names = eval(filter[len("name in ") :])
+            rows = [dict(self.rows[n]) for n in names if n in self.rows]
+        else:
+            # The custom-function delete path's lookup by name.
+            name = filter.split("'")[1]
+            rows = [self.rows[name]] if name in self.rows else []
+        return [SimpleNamespace(id=r.get("function_id"), entries=r) for r in rows]
+
+    def delete_logs(self, *, context, logs):
+        for row in list(self.rows.values()):
+            if row["function_id"] in logs:
+                del self.rows[row["name"]]
+
+
+@pytest.fixture()
+def backend(monkeypatch):
+    backend = _Backend(_chain(_DEPTH))
+    monkeypatch.setattr(fm_module.unisdk, "get_logs", backend.get_logs)
+    monkeypatch.setattr(fm_module.unisdk, "delete_logs", backend.delete_logs)
+    monkeypatch.setattr(function_cache, "compiled_functions", CompiledCodeCache())
+    monkeypatch.setattr(
+        fm_module,
+        "compiled_functions",
+        function_cache.compiled_functions,
+    )
+    return backend
+
+
+@pytest.fixture()
+def fm():
+    fm = object.__new__(FunctionManager)
+    fm._compositional_ctx = _CTX
+    fm._primitive_scope = object()
+    fm._dependency_rows = DependencyRowCache()
+    fm._read_compositional_contexts = lambda: [_CTX]
+    fm._hydrate_verification_fields = lambda rows, **_: rows
+    fm._boundary = lambda raw, _row: raw
+    return fm
+
+
+def _invoke(fm: FunctionManager, backend: _Backend) -> int:
+    namespace: Dict[str, Any] = {}
+    fm._inject_dependencies(backend.rows["f0"], namespace=namespace, visited={"f0"})
+    fm._create_in_process_callable(backend.rows["f0"], namespace=namespace)
+    return namespace["f0"](0)
+
+
+class TestDependencyClosure:
+    def test_a_deep_chain_is_read_in_one_batch_then_not_at_all(self, fm, backend):
+        assert _invoke(fm, backend) == _DEPTH
+        assert backend.reads == ["graph", "rows"]
+
+        assert _invoke(fm, backend) == _DEPTH
+        assert backend.reads == ["graph", "rows"]
+
+    def test_a_delete_is_seen_on_the_next_invocation(self, fm, backend):
+        _invoke(fm, backend)
+        backend.rows["f4"]["implementation"] = "def f4(x):\n    return -100\n"
+        backend.rows["f4"]["depends_on"] = []
+        # Written by someone else: this manager keeps serving what it read.
+        assert _invoke(fm, backend) == _DEPTH
+
+        assert fm._delete_custom_function_by_name("f20")
+        backend.reads.clear()
+
+        assert _invoke(fm, backend) == 4 - 100
+        assert backend.reads == ["graph", "rows"]
+
+    def test_a_dependency_newer_than_the_graph_is_still_found(self, fm, backend):
+        fm._dependency_graph()
+        backend.rows["f20"]["implementation"] = "def f20(x):\n    return helper()\n"
+        backend.rows["f20"]["depends_on"] = ["helper"]
+        backend.rows["helper"] = {
+            "function_id": 99,
+            "name": "helper",
+            "implementation": "def helper():\n    return 7\n",
+            "depends_on": [],
+        }
+
+        assert _invoke(fm, backend) == _DEPTH + 7
+
+
+class TestCompiledCode:
+    def test_an_implementation_compiles_once(self, fm, backend):
+        for _ in range(3):
+            _invoke(fm, backend)
+
+        cache = fm_module.compiled_functions
+        assert cache.misses == _DEPTH + 1
+        assert cache.hits == 2 * (_DEPTH + 1)
+
+    def test_an_edit_compiles_the_new_source(self, fm, backend):
+        row = {"name": "g", "implementation": "def g():\n    return 1\n"}
+        namespace: Dict[str, Any] = {}
+        fm._create_in_process_callable(row, namespace=namespace)
+        row["implementation"] = "def g():\n    return 2  # edited\n"
+        fm._create_in_process_callable(row, namespace=namespace)
+        assert namespace["g"]() == 2
+
+        # The first source runs again from cache; tracebacks show its text.
+        row["implementation"] = "def g():\n    return 1\n"
+        fm._create_in_process_callable(row, namespace=namespace)
+        assert namespace["g"]() == 1
+        assert fm_module.compiled_functions.misses == 2
+        assert "# edited" not in "".join(
+            linecache.getlines(function_source_filename("g")),
+        )
+
+
+class TestInvocationLatency:
+    def test_warm_invocations_of_a_deep_chain_skip_reads_and_compiles(
+        self,
+        fm,
+        backend,
+    ):
+        warm_runs = 20
+        for _ in range(1 + warm_runs):
+            assert _invoke(fm, backend) == _DEPTH
+
+        # The cold invocation read the graph and the rows once, and compiled
+        # each function once; every warm one ran from memory.
+        assert len(backend.reads) == 2
+        cache = fm_module.compiled_functions
+        assert cache.misses == _DEPTH + 1
+        assert cache.hits == warm_runs * (_DEPTH + 1)
@@ -20,32 +20,6 @@ class FakeCredentials:
         return f"credential:{name}"
 
 
-class FakeStorage:
-    async def write_bytes(
-        self,
-        key: str,
-        data: bytes,
-        *,
-        content_type: str = "application/octet-stream",
-    ):
-        return SimpleNamespace(
-            key=key,
-            size_bytes=len(data),
-            content_type=content_type,
-            metadata={},
-        )
-
-    async def read_bytes(self, key: str) -> bytes:
-        return key.encode()
-
-    async def signed_url(self, key: str, *, expires_in: int = 3600) -> str:
-        del expires_in
-        return f"local://{key}"
-
-    async def delete(self, key: str) -> None:
-        del key
-
-
 @dataclass
 class FakeEnvelopeSink:
     published: list[tuple[str, dict[str, Any], str]] = field(default_factory=list)
@@ -62,10 +36,10 @@ class FakeEnvelopeSink:
 
 
 @pytest.fixture
-def gateway_context() -> GatewayContext:
+def gateway_context(fake_storage) -> GatewayContext:
     return GatewayContext(
         credentials=FakeCredentials(),
-        storage=FakeStorage(),
+        storage=fake_storage,
         envelope_sink=FakeEnvelopeSink(),
         runtime_activator=LocalRuntimeActivator(),
         public_url_provider=StaticPublicUrlProvider(
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from unify.gateway.adapters.storage import parse_range, router
+from unify.gateway.app import create_app
+from unify.gateway.context import GatewayContext
+from unify.gateway.public_url import StaticPublicUrlProvider
+from unify.gateway.runtime import LocalRuntimeActivator
+from unify.gateway.scheduler import LocalScheduler
+from unify.gateway.storage import LocalDiskStorage
+
+_DATA = bytes(range(256)) * 16
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> LocalDiskStorage:
+    return LocalDiskStorage(
+        base_dir=tmp_path,
+        serve_base_url="http://testserver/storage/local",
+        signing_key="test-signing-key",
+    )
+
+
+@pytest.fixture
+def gateway_context(storage: LocalDiskStorage) -> GatewayContext:
+    return GatewayContext(
+        credentials=None,
+        storage=storage,
+        envelope_sink=None,
+        runtime_activator=LocalRuntimeActivator(),
+        public_url_provider=StaticPublicUrlProvider(
+            comms_base_url="http://testserver",
+        ),
+        scheduler=LocalScheduler(),
+    )
+
+
+@pytest.fixture
+def client(gateway_context: GatewayContext) -> TestClient:
+    app = FastAPI()
+    app.state.gateway_context = gateway_context
+    app.include_router(router)
+    return TestClient(app)
+
+
+async def _signed_path(storage: LocalDiskStorage, key: str, **kwargs) -> str:
+    await storage.write_bytes(key, _DATA)
+    url = urlsplit(await storage.signed_url(key, **kwargs))
+    return f"{url.path}?{url.query}"
+
+
+@pytest.mark.asyncio
+async def test_signed_url_serves_the_whole_object(
+    client: TestClient,
+    storage: LocalDiskStorage,
+) -> None:
+    path = await _signed_path(storage, "recordings/call.mp3")
+
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.content == _DATA
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-length"] == str(len(_DATA))
+    assert response.headers["content-type"] == "audio/mpeg"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("header", "start", "end"),
+    [
+        ("bytes=0-99", 0, 100),
+        ("bytes=4000-", 4000, 4096),
+        ("bytes=-10", 4086, 4096),
+        ("bytes=4090-99999", 4090, 4096),
+    ],
+)
+async def test_a_range_is_served_as_partial_content(
+    client: TestClient,
+    storage: LocalDiskStorage,
+    header: str,
+    start: int,
+    end: int,
+) -> None:
+    path = await _signed_path(storage, "video.mp4")
+
+    response = client.get(path, headers={"Range": header})
+
+    assert response.status_code == 206
+    assert response.content == _DATA[start:end]
+    assert response.headers["content-range"] == f"bytes {start}-{end - 1}/4096"
+    assert response.headers["content-length"] == str(end - start)
+
+
+@pytest.mark.asyncio
+async def test_an_unsatisfiable_range_is_rejected(
+    client: TestClient,
+    storage: LocalDiskStorage,
+) -> None:
+    path = await _signed_path(storage, "video.mp4")
+
+    response = client.get(path, headers={"Range": "bytes=5000-"})
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */4096"
+
+
+@pytest.mark.asyncio
+async def test_head_reports_the_range_without_a_body(
+    client: TestClient,
+    storage: LocalDiskStorage,
+) -> None:
+    path = await _signed_path(storage, "video.mp4")
+
+    response = client.head(path, headers={"Range": "bytes=10-19"})
+
+    assert response.status_code == 206
+    assert response.content == b""
+    assert response.headers["content-length"] == "10"
+
+
+@pytest.mark.asyncio
+async def test_a_tampered_or_expired_signature_is_forbidden(
+    client: TestClient,
+    storage: LocalDiskStorage,
+) -> None:
+    path = await _signed_path(storage, "a.txt")
+    await storage.write_bytes("b.txt", b"secret")
+    expired = await _signed_path(storage, "a.txt", expires_seconds=-1)
+
+    assert client.get(path.replace("a.txt", "b.txt", 1)).status_code == 403
+    assert client.get(expired).status_code == 403
+    assert client.get("/storage/local/a.txt").status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_an_extensionless_key_is_served_with_its_stored_type(
+    client: TestClient,
+    storage: LocalDiskStorage,
+) -> None:
+    key = "attachments/a1/whatsapp/MM123_0"
+    await storage.write_bytes(key, _DATA, content_type="image/jpeg")
+    url = urlsplit(await storage.signed_url(key))
+
+    response = client.get(f"{url.path}?{url.query}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/jpeg"
+
+
+@pytest.mark.asyncio
+async def test_a_deleted_object_is_not_found(
+    client: TestClient,
+    storage: LocalDiskStorage,
+) -> None:
+    path = await _signed_path(storage, "a.txt")
+    (storage.base_dir / "a.txt").unlink()
+
+    assert client.get(path).status_code == 404
+
+
+def test_malformed_and_multi_ranges_serve_the_whole_object() -> None:
+    assert parse_range(None, 10) is None
+    assert parse_range("items=0-1", 10) is None
+    assert parse_range("bytes=0-1,4-5", 10) is None
+    assert parse_range("bytes=-", 10) is None
+    with pytest.raises(ValueError):
+        parse_range("bytes=5-4", 10)
+    with pytest.raises(ValueError):
+        parse_range("bytes=-0", 10)
+
+
+@pytest.mark.asyncio
+async def test_the_gateway_app_serves_it_without_bearer_auth(
+    gateway_context: GatewayContext,
+    storage: LocalDiskStorage,
+) -> None:
+    client = TestClient(create_app(gateway_context=gateway_context))
+    path = await _signed_path(storage, "a.txt")
+
+    assert client.get(path).content == _DATA
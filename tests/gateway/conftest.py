@@ -0,0 +1,70 @@
+"""Shared fixtures for gateway tests."""
+
+from __future__ import annotations
+
+import hashlib
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeStorage:
+    """In-memory stand-in for the gateway ``Storage`` protocol.
+
+    Reads echo the key back; writes report what a real store would return
+    without keeping the bytes.
+    """
+
+    async def write_bytes(
+        self,
+        key: str,
+        data: bytes,
+        *,
+        content_type: str = "application/octet-stream",
+    ):
+        return SimpleNamespace(
+            key=key,
+            size_bytes=len(data),
+            content_type=content_type,
+            metadata={},
+        )
+
+    @asynccontextmanager
+    async def open_write(
+        self,
+        key: str,
+        *,
+        content_type: str = "application/octet-stream",
+        sha256: bool = False,
+        chunk_size: int = 0,
+    ):
+        chunks: list[bytes] = []
+
+        async def write(data: bytes) -> None:
+            chunks.append(data)
+
+        writer = SimpleNamespace(key=key, write=write, result=None)
+        yield writer
+        data = b"".join(chunks)
+        writer.result = SimpleNamespace(
+            key=key,
+            size_bytes=len(data),
+            content_type=content_type,
+            sha256=hashlib.sha256(data).hexdigest() if sha256 else None,
+        )
+
+    async def read_bytes(self, key: str) -> bytes:
+        return key.encode()
+
+    async def signed_url(self, key: str, *, expires_in: int = 3600) -> str:
+        del expires_in
+        return f"https://signed.local/{key}"
+
+    async def delete(self, key: str) -> None:
+        del key
+
+
+@pytest.fixture
+def fake_storage() -> FakeStorage:
+    return FakeStorage()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from types import SimpleNamespace
@@ -29,32 +30,6 @@ class FakeCredentials:
         return default
 
 
-class FakeStorage:
-    async def write_bytes(
-        self,
-        key: str,
-        data: bytes,
-        *,
-        content_type: str = "application/octet-stream",
-    ):
-        return SimpleNamespace(
-            key=key,
-            size_bytes=len(data),
-            content_type=content_type,
-            metadata={},
-        )
-
-    async def read_bytes(self, key: str) -> bytes:
-        return key.encode()
-
-    async def signed_url(self, key: str, *, expires_in: int = 3600) -> str:
-        del expires_in
-        return f"https://signed.local/{key}"
-
-    async def delete(self, key: str) -> None:
-        del key
-
-
 @dataclass
 class FakeEnvelopeSink:
     published: list[tuple[str, dict[str, Any], str]] = field(default_factory=list)
@@ -71,10 +46,10 @@ class FakeEnvelopeSink:
 
 
 @pytest.fixture
-def gateway_context() -> GatewayContext:
+def gateway_context(fake_storage) -> GatewayContext:
     return GatewayContext(
         credentials=FakeCredentials(),
-        storage=FakeStorage(),
+        storage=fake_storage,
         envelope_sink=FakeEnvelopeSink(),
         runtime_activator=LocalRuntimeActivator(),
         public_url_provider=StaticPublicUrlProvider(
@@ -525,6 +500,7 @@ def test_console_attachment_upload_response_has_expected_aliases(
     assert body["signed_url"].startswith("https://signed.local/")
     assert body["content_type"] == "text/plain"
     assert body["size_bytes"] == 5
+    assert body["sha256"] == hashlib.sha256(b"hello").hexdigest()
 
 
 def test_console_message_dispatch_publishes_runtime_event(
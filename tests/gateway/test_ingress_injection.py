@@ -112,6 +112,35 @@ async def test_start_inbound_subscription_routes_through_injected_transport() ->
     assert received[0]["channel"].startswith("app:comms:")
 
 
+@pytest.mark.asyncio
+async def test_ingress_max_concurrency_routes_through_keyed_dispatcher() -> None:
+    broker = create_in_memory_event_broker()
+    transport = InMemoryIngressTransport()
+    cm = CommsManager(
+        event_broker=broker,
+        ingress_transport=transport,
+        ingress_max_concurrency=4,
+    )
+    dispatched: list[str] = []
+
+    async def dispatch(payload: dict, **_kwargs: Any) -> None:
+        await asyncio.sleep(0.01)
+        dispatched.append(payload["event"]["body"])
+
+    cm.dispatch_envelope_payload = dispatch  # type: ignore[method-assign]
+    await cm._start_inbound_subscription()
+    assert cm.keyed_dispatcher is not None
+
+    for body in ("first", "second"):
+        await transport.deliver(
+            {"thread": "msg", "event": {"from_number": "+1", "body": body}},
+        )
+    # Delivery returns once queued; stopping drains what was accepted.
+    assert dispatched == []
+    await cm._stop_inbound_subscription()
+    assert dispatched == ["first", "second"]
+
+
 @pytest.mark.asyncio
 async def test_stop_inbound_subscription_stops_injected_transport() -> None:
     broker = create_in_memory_event_broker()
@@ -0,0 +1,218 @@
+"""Behavioural tests for ``KeyedEnvelopeDispatcher``.
+
+Driven through ``InMemoryIngressTransport`` the way a runtime would wire
+it, under synthetic bursts across many conversations.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections import defaultdict
+from typing import Any
+
+import pytest
+
+from unify.gateway.ingress_inmemory import InMemoryIngressTransport
+from unify.gateway.ingress_keyed import (
+    VOICE_ORDERING_KEY,
+    KeyedEnvelopeDispatcher,
+    envelope_ordering_key,
+)
+
+
+def _envelope(conversation: str, seq: int, thread: str = "msg") -> dict:
+    return {
+        "thread": thread,
+        "publish_timestamp": float(seq),
+        "event": {"from_number": conversation, "seq": seq},
+    }
+
+
+class _Recorder:
+    """Wrapped dispatcher that records order and concurrency."""
+
+    def __init__(self, delay: float = 0.0, jitter: float = 0.0) -> None:
+        self.delay = delay
+        self.jitter = jitter
+        self.order: dict[str, list[int]] = defaultdict(list)
+        self.running: set[str] = set()
+        self.in_flight = 0
+        self.peak = 0
+        self.overlapped_keys: list[str] = []
+
+    async def __call__(self, payload: dict, **_kwargs: Any) -> None:
+        key = envelope_ordering_key(payload)
+        if key in self.running:
+            self.overlapped_keys.append(key)
+        self.running.add(key)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay + random.random() * self.jitter)
+            self.order[key].append(payload["event"]["seq"])
+        finally:
+            self.in_flight -= 1
+            self.running.discard(key)
+
+
+async def _start(
+    dispatcher: Any,
+    **kwargs: Any,
+) -> tuple[InMemoryIngressTransport, KeyedEnvelopeDispatcher]:
+    keyed = KeyedEnvelopeDispatcher(dispatcher, **kwargs)
+    transport = InMemoryIngressTransport()
+    await transport.start(keyed)
+    return transport, keyed
+
+
+def test_ordering_keys() -> None:
+    assert envelope_ordering_key(_envelope("+1", 0)) == "msg:+1"
+    assert envelope_ordering_key(
+        {"thread": "unify_message", "event": {"thread_id": 7, "contact_id": 3}},
+    ) == ("unify_message:7")
+    assert envelope_ordering_key({"thread": "ping", "event": {}}) == "ping"
+    for thread in ("call", "call_answered", "whatsapp_call_sent", "unify_meet"):
+        assert envelope_ordering_key({"thread": thread, "event": {}}) == (
+            VOICE_ORDERING_KEY
+        )
+
+
+@pytest.mark.asyncio
+async def test_burst_is_ordered_per_key_and_concurrent_across_keys() -> None:
+    recorder = _Recorder(jitter=0.002)
+    transport, keyed = await _start(recorder, max_concurrency=8)
+    conversations = [f"+1555000{i:04d}" for i in range(40)]
+    burst = [
+        _envelope(conversation, seq)
+        for seq in range(25)
+        for conversation in conversations
+    ]
+
+    await asyncio.gather(*(transport.deliver(env) for env in burst))
+    await keyed.drain()
+
+    assert transport.delivered_count == len(burst)
+    assert keyed.dispatched == len(burst)
+    for conversation in conversations:
+        assert recorder.order[f"msg:{conversation}"] == list(range(25))
+    assert recorder.overlapped_keys == []
+    assert 1 < recorder.peak <= 8
+    assert keyed.pending == 0
+    assert keyed.active_keys == 0
+    await transport.stop()
+    await keyed.close()
+
+
+@pytest.mark.asyncio
+async def test_a_slow_conversation_does_not_block_others() -> None:
+    release = asyncio.Event()
+    finished: list[str] = []
+
+    async def dispatcher(payload: dict, **_kwargs: Any) -> None:
+        if payload["event"]["from_number"] == "slow":
+            await release.wait()
+        finished.append(payload["event"]["from_number"])
+
+    transport, keyed = await _start(dispatcher, max_concurrency=4)
+    await transport.deliver(_envelope("slow", 0))
+    await transport.deliver(_envelope("slow", 1))
+    for i in range(10):
+        await transport.deliver(_envelope(f"fast-{i}", i))
+
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert sorted(finished) == sorted(f"fast-{i}" for i in range(10))
+    assert keyed.pending == 2
+
+    release.set()
+    await keyed.drain()
+    assert finished[-2:] == ["slow", "slow"]
+    await transport.stop()
+    await keyed.close()
+
+
+@pytest.mark.asyncio
+async def test_settles_each_envelope_once_when_it_finishes() -> None:
+    settled: list[tuple[int, str]] = []
+
+    async def dispatcher(payload: dict, *, ack: Any, nack: Any, **_: Any) -> None:
+        seq = payload["event"]["seq"]
+        if seq == 1:
+            raise RuntimeError("simulated dispatcher failure")
+        if seq == 2:
+            # Settles itself, as CommsManager does; must not be re-acked.
+            nack()
+
+    transport, keyed = await _start(dispatcher)
+    for seq in range(3):
+        await transport.deliver(
+            _envelope("+1", seq),
+            ack=lambda seq=seq: settled.append((seq, "ack")),
+            nack=lambda seq=seq: settled.append((seq, "nack")),
+        )
+    await keyed.drain()
+
+    assert settled == [(0, "ack"), (1, "nack"), (2, "nack")]
+    assert (keyed.dispatched, keyed.failed) == (2, 1)
+    await transport.stop()
+    await keyed.close()
+
+
+@pytest.mark.asyncio
+async def test_max_pending_applies_backpressure_to_the_transport() -> None:
+    release = asyncio.Event()
+
+    async def dispatcher(payload: dict, **_kwargs: Any) -> None:
+        await release.wait()
+
+    transport, keyed = await _start(dispatcher, max_pending=3)
+    for seq in range(3):
+        await transport.deliver(_envelope(f"+{seq}", seq))
+
+    blocked = asyncio.create_task(transport.deliver(_envelope("+9", 9)))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+    assert keyed.pending == 3
+
+    release.set()
+    await blocked
+    await keyed.drain()
+    assert keyed.dispatched == 4
+    await transport.stop()
+    await keyed.close()
+
+
+@pytest.mark.asyncio
+async def test_close_without_drain_nacks_what_is_left() -> None:
+    nacked: list[int] = []
+
+    async def dispatcher(payload: dict, **_kwargs: Any) -> None:
+        await asyncio.Event().wait()
+
+    transport, keyed = await _start(dispatcher)
+    for seq in range(3):
+        await transport.deliver(
+            _envelope("+1", seq),
+            nack=lambda seq=seq: nacked.append(seq),
+        )
+    await asyncio.sleep(0)
+
+    await transport.stop()
+    await keyed.close(drain=False)
+
+    assert nacked == [0, 1, 2]
+    assert keyed.pending == 0
+    assert keyed.active_keys == 0
+    with pytest.raises(RuntimeError, match="closed"):
+        await keyed(_envelope("+1", 3))
+
+
+def test_rejects_non_positive_limits() -> None:
+    async def dispatcher(payload: dict, **_kwargs: Any) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        KeyedEnvelopeDispatcher(dispatcher, max_concurrency=0)
+    with pytest.raises(ValueError, match="max_pending"):
+        KeyedEnvelopeDispatcher(dispatcher, max_pending=0)
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import hashlib
+import time
+import tracemalloc
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
 
-from unify.gateway.storage import LocalDiskStorage, Storage, StorageError
+from unify.gateway.storage import (
+    DEFAULT_CHUNK_SIZE,
+    LocalDiskStorage,
+    Storage,
+    StorageError,
+    write_stream,
+)
 
 
 def test_local_disk_storage_satisfies_storage_protocol(tmp_path: Path) -> None:
@@ -124,3 +134,197 @@ def test_default_base_dir_honors_environment_override(
     storage = LocalDiskStorage()
     assert storage.base_dir == target
     assert target.exists()
+
+
+async def _chunks(total: int, size: int = 64 * 1024):
+    block = bytes(range(256)) * (size // 256)
+    sent = 0
+    while sent < total:
+        piece = block[: min(size, total - sent)]
+        sent += len(piece)
+        yield piece
+
+
+@pytest.mark.asyncio
+async def test_streamed_write_reports_size_and_sha256(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path)
+    total = 3 * 1024 * 1024 + 17
+    expected = b"".join([chunk async for chunk in _chunks(total)])
+
+    obj = await write_stream(
+        storage,
+        "recordings/call.wav",
+        _chunks(total),
+        content_type="audio/wav",
+        sha256=True,
+    )
+
+    assert obj.size_bytes == total
+    assert obj.content_type == "audio/wav"
+    assert obj.sha256 == hashlib.sha256(expected).hexdigest()
+    assert await storage.read_bytes("recordings/call.wav") == expected
+
+
+@pytest.mark.asyncio
+async def test_sha256_is_only_computed_on_request(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path)
+    obj = await write_stream(storage, "a.bin", _chunks(10))
+    assert obj.sha256 is None
+
+
+@pytest.mark.asyncio
+async def test_a_failed_stream_leaves_nothing_behind(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path)
+    await storage.write_bytes("video.mp4", b"previous")
+
+    with pytest.raises(RuntimeError):
+        async with storage.open_write("video.mp4", chunk_size=4) as writer:
+            await writer.write(b"partial upload")
+            raise RuntimeError("client went away")
+
+    assert await storage.read_bytes("video.mp4") == b"previous"
+    assert await storage.list_keys() == ["video.mp4"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["video.mp4"]
+
+
+@pytest.mark.asyncio
+async def test_in_progress_writes_are_not_listed(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path)
+    async with storage.open_write("upload.bin", chunk_size=1) as writer:
+        await writer.write(b"x")
+        assert await storage.list_keys() == []
+        assert not await storage.exists("upload.bin")
+    assert await storage.list_keys() == ["upload.bin"]
+
+
+@pytest.mark.asyncio
+async def test_open_read_streams_a_byte_range(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path)
+    data = bytes(range(256)) * 40
+    await storage.write_bytes("doc.pdf", data)
+
+    async with storage.open_read("doc.pdf", start=100, end=5000, chunk_size=1024) as r:
+        chunks = [chunk async for chunk in r]
+
+    assert r.size_bytes == len(data)
+    assert (r.start, r.end) == (100, 5000)
+    assert [len(c) for c in chunks] == [1024, 1024, 1024, 1024, 804]
+    assert b"".join(chunks) == data[100:5000]
+
+
+@pytest.mark.asyncio
+async def test_open_read_clamps_the_end_and_reads_by_size(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path)
+    await storage.write_bytes("a.txt", b"hello world")
+
+    async with storage.open_read("a.txt", start=6, end=1_000) as reader:
+        assert await reader.read(2) == b"wo"
+        assert await reader.read() == b"rld"
+        assert await reader.read() == b""
+
+
+@pytest.mark.asyncio
+async def test_open_read_rejects_missing_objects_and_bad_ranges(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path)
+    await storage.write_bytes("a.txt", b"abc")
+
+    with pytest.raises(StorageError):
+        async with storage.open_read("missing.txt"):
+            pass
+    with pytest.raises(StorageError):
+        async with storage.open_read("a.txt", start=4):
+            pass
+    with pytest.raises(StorageError):
+        async with storage.open_read("a.txt", start=2, end=1):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_stat_describes_without_reading(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path)
+    await storage.write_bytes("clips/intro.mp4", b"1234")
+
+    obj = await storage.stat("clips/intro.mp4")
+
+    assert (obj.key, obj.size_bytes, obj.content_type) == (
+        "clips/intro.mp4",
+        4,
+        "video/mp4",
+    )
+    with pytest.raises(StorageError):
+        await storage.stat("clips/missing.mp4")
+
+
+@pytest.mark.asyncio
+async def test_stat_returns_the_stored_content_type(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path)
+    key = "attachments/a1/whatsapp/MM123_0"
+
+    await write_stream(storage, key, _chunks(10), content_type="image/jpeg")
+    await storage.write_bytes("notes.txt", b"x", content_type="text/markdown")
+
+    assert (await storage.stat(key)).content_type == "image/jpeg"
+    assert (await storage.stat("notes.txt")).content_type == "text/markdown"
+    assert await storage.list_keys() == [key, "notes.txt"]
+
+
+@pytest.mark.asyncio
+async def test_an_overwrite_replaces_the_stored_content_type(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path)
+    await storage.write_bytes("photo", b"x", content_type="image/png")
+    await storage.write_bytes("photo", b"y")
+
+    assert (await storage.stat("photo")).content_type == "application/octet-stream"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["photo"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_a_large_object_holds_a_few_chunks(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path)
+    total = 64 * 1024 * 1024
+
+    tracemalloc.start()
+    try:
+        obj = await write_stream(storage, "big.bin", _chunks(total), sha256=True)
+        read = 0
+        async with storage.open_read("big.bin") as reader:
+            async for chunk in reader:
+                read += len(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert obj.size_bytes == read == total
+    assert peak < 8 * DEFAULT_CHUNK_SIZE
+
+
+@pytest.mark.asyncio
+async def test_signed_url_served_by_the_gateway_verifies(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(
+        base_dir=tmp_path,
+        serve_base_url="http://gateway.local/storage/local/",
+        signing_key="secret",
+    )
+    await storage.write_bytes("attachments/1/my file.txt", b"x")
+
+    url = urlsplit(await storage.signed_url("attachments/1/my file.txt"))
+    query = parse_qs(url.query)
+    expires, signature = int(query["expires"][0]), query["signature"][0]
+
+    assert url.path == "/storage/local/attachments/1/my%20file.txt"
+    assert storage.verify_signed_url("attachments/1/my file.txt", expires, signature)
+    assert not storage.verify_signed_url("attachments/1/other.txt", expires, signature)
+    assert not storage.verify_signed_url(
+        "attachments/1/my file.txt",
+        expires + 1,
+        signature,
+    )
+    other = LocalDiskStorage(base_dir=tmp_path, signing_key="other")
+    assert not other.verify_signed_url("attachments/1/my file.txt", expires, signature)
+
+
+def test_expired_signatures_are_rejected(tmp_path: Path) -> None:
+    storage = LocalDiskStorage(base_dir=tmp_path, signing_key="secret")
+    expires = int(time.time()) - 1
+    signature = storage._signature("a.txt", expires)
+    assert not storage.verify_signed_url("a.txt", expires, signature)
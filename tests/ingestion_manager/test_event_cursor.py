@@ -0,0 +1,215 @@
+"""Status reads cost what a run recorded since the last read, not its history.
+
+A run records a progress event per committed chunk, so a long one carries
+thousands of events -- and `wait` used to page through all of them on every
+poll, then `get_logs` did it again to slice a window. Each run now keeps a
+cursor into its events log: a read asks only for events past the last id seen
+and folds them into stage state kept from the previous read.
+
+`wait` on a run this process is executing no longer polls at all. Every event
+and row write notifies, and the wait wakes on that; only runs whose progress
+is written elsewhere -- on the fleet -- are still polled.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+import pytest
+
+from unify.ingestion_manager.ingestion_manager import IngestionManager
+from unify.ingestion_manager.policy import stages_from_events
+from unify.ingestion_manager.settings import IngestionSettings
+
+_AFTER = re.compile(r"run_key == '([^']+)' and event_id > (-?\d+)")
+
+
+class _EventsLog:
+    """One events context; counts how many rows each read hands back."""
+
+    def __init__(self) -> None:
+        self.rows: List[Dict[str, Any]] = []
+        self.rows_read = 0
+        self.row_state: Dict[str, Any] = {"state": "running"}
+
+    def append(self, run_key: str, **fields: Any) -> None:
+        self.rows.append(
+            {
+                "event_id": len(self.rows),
+                "run_key": run_key,
+                "at": f"2026-01-01T00:00:{len(self.rows):06d}",
+                **fields,
+            },
+        )
+
+    def filter(self, context, *, filter, limit, order_by=None, **_: Any):
+        run_key, after = _AFTER.fullmatch(filter).groups()
+        matched = [
+            row
+            for row in self.rows
+            if row["run_key"] == run_key and row["event_id"] > int(after)
+        ]
+        assert order_by == "event_id"
+        batch = [dict(row) for row in matched[:limit]]
+        self.rows_read += len(batch)
+        return batch
+
+    def insert_rows(self, context, rows):
+        for row in rows:
+            self.append(**row)
+
+    def update_rows(self, context, updates, *, filter):
+        self.row_state.update(updates)
+
+
+@pytest.fixture()
+def log() -> _EventsLog:
+    return _EventsLog()
+
+
+@pytest.fixture()
+def manager(monkeypatch, log) -> IngestionManager:
+    instance = IngestionManager.__new__(IngestionManager)
+    instance._lock = threading.RLock()
+    instance._dispatching = set()
+    instance._inline_control = {}
+    instance._settings = IngestionSettings(EVENTS_PAGE_SIZE=50)
+    instance._cursors = OrderedDict()
+    instance._changed = threading.Condition(instance._lock)
+    instance._generation = {}
+
+    monkeypatch.setattr(IngestionManager, "_get_dm", lambda self: log)
+    monkeypatch.setattr(
+        IngestionManager,
+        "_read_tables",
+        lambda self, table: ["Ingestion/Events"],
+    )
+    monkeypatch.setattr(
+        IngestionManager,
+        "_write_table",
+        lambda self, table, destination: "Ingestion/Events",
+    )
+    monkeypatch.setattr(
+        IngestionManager,
+        "_find_run",
+        lambda self, run_id: (
+            {"run_key": "k", "executed_as": "inline", **log.row_state},
+            "Ingestion/Runs",
+        ),
+    )
+    monkeypatch.setattr(
+        IngestionManager,
+        "_fold_fleet_status",
+        lambda self, row, runs_context: row,
+    )
+    return instance
+
+
+def _progress(log: _EventsLog, count: int, *, total: int = 10_000) -> None:
+    start = sum(1 for row in log.rows if row.get("stage") == "ingest")
+    for done in range(start, start + count):
+        log.append("k", stage="ingest", state="running", done=done + 1, total=total)
+
+
+class TestIncrementalReads:
+    def test_a_second_read_fetches_only_what_is_new(self, manager, log):
+        _progress(log, 230)
+        first = manager.get_status("k")
+        assert log.rows_read == 230
+        assert first.stages[0].done == 230
+
+        _progress(log, 3)
+        second = manager.get_status("k")
+        assert log.rows_read == 233
+        assert second.stages[0].done == 233
+
+        manager.get_status("k")
+        assert log.rows_read == 233
+
+    def test_other_runs_events_are_never_read(self, manager, log):
+        for _ in range(40):
+            log.append("other", stage="ingest", state="running", done=1)
+        _progress(log, 2)
+        manager.get_status("k")
+        assert log.rows_read == 2
+
+    def test_logs_are_served_from_the_same_cursor(self, manager, log):
+        _progress(log, 120)
+        manager.get_status("k")
+        window = manager.get_logs("k", limit=5, offset=100)
+        assert log.rows_read == 120
+        assert len(window) == 5
+        assert window[0].at == log.rows[100]["at"]
+
+    def test_folding_in_steps_matches_folding_everything(self, manager, log):
+        log.append("k", stage="parse", state="running", done=1, total=2)
+        manager.get_status("k")
+        log.append("k", stage="parse", state="running", done=2, total=2)
+        log.append("k", stage="ingest", level="error", state="failed", message="x")
+        log.row_state["state"] = "failed"
+        stepped = manager.get_status("k").stages
+        assert stepped == stages_from_events(log.rows, run_state="failed")
+
+    def test_closing_a_terminal_run_does_not_leak_into_the_next_attempt(
+        self,
+        manager,
+        log,
+    ):
+        log.append("k", stage="ingest", state="running", done=5, total=10)
+        log.row_state["state"] = "failed"
+        assert manager.get_status("k").stages[0].state == "failed"
+        log.row_state["state"] = "running"
+        assert manager.get_status("k").stages[0].state == "running"
+
+    def test_an_event_stamped_before_the_folded_ones_is_placed_in_order(
+        self,
+        manager,
+        log,
+    ):
+        log.append("k", stage="ingest", state="running", done=1, at="t2")
+        manager.get_status("k")
+        log.append("k", stage="ingest", state="running", done=9, at="t1")
+        # The late-arriving event belongs before the one already folded, so
+        # the newer progress still wins.
+        assert manager.get_status("k").stages[0].done == 1
+        assert [entry.at for entry in manager.get_logs("k")] == ["t1", "t2"]
+
+
+class TestWaitOnALocalRun:
+    def test_it_wakes_on_the_write_that_finishes_the_run(self, manager, log):
+        manager._inline_control["k"] = {"cancel": False, "pause": False}
+
+        def finish():
+            time.sleep(0.2)
+            manager._update_run("k", "Ingestion/Runs", {"state": "succeeded"})
+
+        reads: List[float] = []
+        original = IngestionManager.get_status
+
+        def counting(self, run_id):
+            reads.append(time.monotonic())
+            return original(self, run_id)
+
+        IngestionManager.get_status = counting  # type: ignore[method-assign]
+        try:
+            threading.Thread(target=finish).start()
+            started = time.monotonic()
+            status = manager.wait("k", timeout_s=10)
+        finally:
+            IngestionManager.get_status = original  # type: ignore[method-assign]
+
+        assert status.state == "succeeded"
+        assert time.monotonic() - started < 2
+        # Once to see it running, once after the write woke the wait.
+        assert len(reads) == 2
+
+    def test_it_honours_its_timeout(self, manager, log):
+        manager._inline_control["k"] = {"cancel": False, "pause": False}
+        started = time.monotonic()
+        status = manager.wait("k", timeout_s=0.3)
+        assert status.state == "running"
+        assert 0.25 <= time.monotonic() - started < 2
@@ -17,6 +17,8 @@ verify the durable checkpoint against.
 from __future__ import annotations
 
 import csv
+import threading
+import time
 from pathlib import Path
 from typing import Any, List
 
@@ -27,6 +29,7 @@ from unify.common.pipeline.row_streaming import iter_table_input_rows
 from unify.common.pipeline.types import CsvFileHandle
 from unify.file_manager.file_parsers.settings import FILE_PARSER_SETTINGS
 from unify.ingestion_manager.ingestion_manager import IngestionManager
+from unify.ingestion_manager.settings import IngestionSettings
 from unify.ingestion_manager.types import FilesSource, IngestionRequest, TableTarget
 
 INLINE_LIMIT = int(FILE_PARSER_SETTINGS.TABULAR_INLINE_ROW_LIMIT)
@@ -39,7 +42,8 @@ class CapturedEngine:
         self.work: List[TableWork] = []
 
     def __call__(self, run_key, work, *, request, control) -> Any:
-        self.work = list(work)
+        # Called once per parsed file, as each finishes.
+        self.work.extend(work)
 
         class Outcome:
             rows_committed = sum(item.declared_rows for item in work)
@@ -51,6 +55,9 @@ class CapturedEngine:
 @pytest.fixture
 def manager(monkeypatch) -> IngestionManager:
     instance = IngestionManager.__new__(IngestionManager)
+    # In process: what is under test is the work handed to the engine, and a
+    # child per parse would only make that slower to observe.
+    instance._settings = IngestionSettings(INLINE_PARSE_ISOLATED=False)
     monkeypatch.setattr(
         IngestionManager,
         "_record_event",
@@ -295,3 +302,116 @@ class TestTheTargetsIntent:
         run(manager, [path])
 
         assert engine.work[0].context == "Data/Repairs"
+
+
+class TestParsingOverlapsWriting:
+    """Files parse on a bounded pool and each is written as soon as it parses.
+
+    A folder of spreadsheets used to parse serially, and nothing was written
+    until the last parse finished. Only the files in flight are held now.
+    """
+
+    @pytest.fixture
+    def slow_parser(self, monkeypatch):
+        from unify.file_manager.file_parsers.file_parser import FileParser
+
+        original = FileParser.parse_isolated
+        state = {"active": 0, "peak": 0, "finished": 0}
+        guard = threading.Lock()
+
+        def parse_isolated(self, request, *, parse_config=None):
+            with guard:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            try:
+                time.sleep(0.05)
+                return original(self, request, parse_config=parse_config)
+            finally:
+                with guard:
+                    state["active"] -= 1
+                    state["finished"] += 1
+
+        monkeypatch.setattr(FileParser, "parse_isolated", parse_isolated)
+        return state
+
+    def test_parses_run_concurrently_up_to_the_bound(
+        self,
+        manager,
+        engine,
+        slow_parser,
+        tmp_path,
+    ):
+        manager._settings = IngestionSettings(
+            INLINE_PARSE_WORKERS=3,
+            INLINE_PARSE_ISOLATED=False,
+        )
+        paths = [tmp_path / f"f{index}.csv" for index in range(9)]
+        for path in paths:
+            write_csv(path, 5)
+
+        rows, _, parsed = run(manager, paths)
+
+        assert parsed == 9
+        assert rows == 45
+        assert slow_parser["peak"] == 3
+
+    def test_the_first_file_is_written_before_the_last_is_parsed(
+        self,
+        manager,
+        slow_parser,
+        monkeypatch,
+        tmp_path,
+    ):
+        manager._settings = IngestionSettings(
+            INLINE_PARSE_WORKERS=2,
+            INLINE_PARSE_ISOLATED=False,
+        )
+        finished_at_each_write: List[int] = []
+
+        def engine(self, run_key, work, *, request, control):
+            finished_at_each_write.append(slow_parser["finished"])
+
+            class Outcome:
+                rows_committed = sum(item.declared_rows for item in work)
+                contexts = [request.target.context]
+
+            return Outcome()
+
+        monkeypatch.setattr(IngestionManager, "_run_engine", engine, raising=False)
+        paths = [tmp_path / f"f{index}.csv" for index in range(6)]
+        for path in paths:
+            write_csv(path, 5)
+
+        run(manager, paths)
+
+        assert len(finished_at_each_write) == 6
+        assert finished_at_each_write[0] < 6
+
+    def test_isolation_parses_each_file_in_its_own_process(
+        self,
+        manager,
+        engine,
+        monkeypatch,
+        tmp_path,
+    ):
+        from unify.file_manager.file_parsers import file_parser
+
+        isolated: List[str] = []
+
+        def run_isolated(request, parse_config, timeout):
+            isolated.append(request.logical_path)
+            return file_parser.FileParser()._parse_single(
+                request,
+                registry=file_parser.BackendRegistry.from_config(),
+            )
+
+        monkeypatch.setattr(file_parser, "run_isolated", run_isolated)
+        manager._settings = IngestionSettings()
+        paths = [tmp_path / "a.csv", tmp_path / "b.csv"]
+        for path in paths:
+            write_csv(path, 5)
+
+        run(manager, paths)
+
+        assert sorted(isolated) == sorted(str(path) for path in paths)
+        assert len(engine.work) == 2
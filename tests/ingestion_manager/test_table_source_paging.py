@@ -0,0 +1,161 @@
+"""A table source is streamed a keyed page at a time, never held whole.
+
+Copying a stored table used to read every row into an ``InlineRowsHandle``
+before the first write, paging by offset -- so the whole table had to fit in
+process memory, and each page cost more to read than the one before. The
+handle is now lazy: the engine pulls pages as it writes, each asking for rows
+past the last key it saw, and a resume seeks once to the last committed row.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from unify.common.pipeline import ContextRowsHandle
+from unify.common.pipeline.row_streaming import iter_table_input_rows
+from unify.ingestion_manager.ingestion_manager import IngestionManager
+from unify.ingestion_manager.settings import IngestionSettings
+from unify.ingestion_manager.types import TableSource
+
+
+class _StoredTable:
+    """One context; evaluates filter expressions against its rows."""
+
+    def __init__(self, rows: int) -> None:
+        self.rows = [
+            {"row_id": index, "region": "north" if index % 2 else "south", "n": index}
+            for index in range(rows)
+        ]
+        self.unique_keys: Any = {"row_id": "int"}
+        self.auto_counting: Any = {"row_id": None}
+        self.reads: List[Dict[str, Any]] = []
+
+    def get_table(self, context: str) -> Dict[str, Any]:
+        return {"unique_keys": self.unique_keys, "auto_counting": self.auto_counting}
+
+    def filter(
+        self,
+        context: str,
+        *,
+        filter: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        self.reads.append({"filter": filter, "offset": offset, "order_by": order_by})
+        matched = [row for row in self.rows if not filter or eval(filter, {}, row)]
+        if order_by:
+            matched.sort(key=lambda row: row[order_by])
+        window = matched[offset : offset + limit]
+        if columns:
+            return [{name: row[name] for name in columns} for row in window]
+        return [dict(row) for row in window]
+
+
+@pytest.fixture()
+def table() -> _StoredTable:
+    return _StoredTable(2_500)
+
+
+@pytest.fixture()
+def manager(monkeypatch, table) -> IngestionManager:
+    instance = IngestionManager.__new__(IngestionManager)
+    instance._settings = IngestionSettings()
+    monkeypatch.setattr(IngestionManager, "_get_dm", lambda self: table)
+    return instance
+
+
+def _handle(manager, table, **source) -> ContextRowsHandle:
+    return manager._handle_for_table(
+        TableSource(context="Data/Deals", **source),
+        declared=len(table.rows),
+    )
+
+
+def _read(handle, table, **kwargs) -> List[Dict[str, Any]]:
+    return list(iter_table_input_rows(handle, data_manager=table, **kwargs))
+
+
+class TestTheHandleIsLazy:
+    def test_building_it_reads_no_rows(self, manager, table):
+        handle = _handle(manager, table)
+        assert table.reads == []
+        assert handle.key_column == "row_id"
+
+    def test_it_is_read_through_the_data_manager_it_is_given(self, manager, table):
+        with pytest.raises(ValueError, match="data_manager"):
+            list(iter_table_input_rows(_handle(manager, table)))
+        assert table.reads == []
+
+    def test_pages_are_keyed_and_never_offset(self, manager, table):
+        rows = _read(_handle(manager, table), table)
+
+        assert [row["row_id"] for row in rows] == list(range(2_500))
+        assert len(table.reads) == 3
+        assert all(read["offset"] == 0 for read in table.reads)
+        assert table.reads[0]["filter"] is None
+        assert table.reads[1]["filter"] == "row_id > 999"
+
+    def test_the_source_filter_is_kept_on_every_page(self, manager, table):
+        handle = manager._handle_for_table(
+            TableSource(context="Data/Deals", filter="region == 'north'"),
+            declared=1_250,
+        )
+        rows = _read(handle, table)
+
+        assert len(rows) == 1_250
+        assert all(row["region"] == "north" for row in rows)
+        assert table.reads[1]["filter"] == "(region == 'north') and row_id > 1999"
+
+    def test_a_key_the_caller_did_not_ask_for_is_not_copied(self, manager, table):
+        rows = _read(_handle(manager, table, columns=["n"]), table)
+        assert rows[0] == {"n": 0}
+        assert len(rows) == 2_500
+
+
+class TestResume:
+    def test_a_resume_seeks_once_then_pages_by_key(self, manager, table):
+        rows = _read(_handle(manager, table), table, skip_rows=1_500)
+
+        assert [row["row_id"] for row in rows] == list(range(1_500, 2_500))
+        seek, *pages = table.reads
+        assert seek["offset"] == 1_499
+        assert [read["filter"] for read in pages] == ["row_id > 1499"]
+
+
+class TestTheKeyComesFromTheSchema:
+    def test_a_single_declared_key_is_paged_along(self, manager, table):
+        table.unique_keys, table.auto_counting = ["n"], None
+        handle = _handle(manager, table)
+        assert handle.key_column == "n"
+
+        _read(handle, table)
+
+        assert table.reads[1] == {
+            "filter": "n > 999",
+            "offset": 0,
+            "order_by": "n",
+        }
+
+    def test_an_auto_counted_column_stands_in_for_a_key(self, manager, table):
+        table.unique_keys, table.auto_counting = None, {"n": None}
+        assert _handle(manager, table).key_column == "n"
+
+
+class TestAContextWithoutASingleKey:
+    def test_a_composite_key_falls_back_to_offset_pages(self, manager, table):
+        table.unique_keys = {"region": "str", "n": "int"}
+        handle = _handle(manager, table)
+        assert handle.key_column is None
+
+        rows = _read(handle, table)
+
+        assert len(rows) == 2_500
+        assert [read["offset"] for read in table.reads] == [0, 1_000, 2_000]
+
+    def test_a_context_with_no_keys_falls_back_to_offset_pages(self, manager, table):
+        table.unique_keys = table.auto_counting = None
+        assert _handle(manager, table).key_column is None
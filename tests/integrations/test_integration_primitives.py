@@ -9,9 +9,18 @@ from types import SimpleNamespace
 import pytest
 
 from unify.integrations import ops as ops_module
+from unify.integrations.catalog_cache import invalidate_integration_catalog
 from unify.integrations.primitives import IntegrationPrimitives
 
 
+@pytest.fixture(autouse=True)
+def fresh_integration_catalog():
+    # The tool catalogue is cached process-wide; no test may see another's.
+    invalidate_integration_catalog()
+    yield
+    invalidate_integration_catalog()
+
+
 class FakeIntegrationClient:
     def __init__(self) -> None:
         self.calls: list[tuple[str, tuple, dict]] = []
@@ -1350,3 +1359,144 @@ async def test_execute_tool_overlaps_concurrent_async_run_tool_calls(
     assert len(results) == 5
     assert max_in_flight >= 4
     assert elapsed < 0.45
+
+
+def _catalog_row(app_slug: str, tool: str, *, backend_id: str = "composio"):
+    return SimpleNamespace(
+        entries={
+            "name": f"primitives.integrations.{app_slug}.{tool}",
+            "primitive_method": f"primitives__integrations__{app_slug}__{tool}",
+            "docstring": f"Execute {tool}.",
+            "metadata": {
+                "source": "provider_backed",
+                "integration": {
+                    "tool_id": f"{backend_id}:{app_slug}:{tool}",
+                    "backend_id": backend_id,
+                    "app_slug": app_slug,
+                    "input_schema": {"type": "object"},
+                    "action_class": "read",
+                },
+            },
+        },
+    )
+
+
+@pytest.fixture
+def primitives_context(monkeypatch):
+    """A primitives context holding two HubSpot tools; counts every read."""
+    reads: list[dict] = []
+    rows = [
+        _catalog_row("hubspot", "search_contacts"),
+        _catalog_row("hubspot", "get_deal"),
+    ]
+
+    def fake_get_logs(**kwargs):
+        reads.append(kwargs)
+        return rows if " in " in kwargs.get("filter", "") else []
+
+    monkeypatch.setattr("unisdk.get_active_context", lambda: {"read": "user-1/42"})
+    monkeypatch.setattr("unisdk.get_logs", fake_get_logs)
+    return reads
+
+
+@pytest.mark.anyio
+async def test_sessions_share_one_catalogue_read(
+    monkeypatch,
+    primitives_context,
+) -> None:
+    client = FakeIntegrationClient()
+    patch_ops_from_client(monkeypatch, client)
+
+    for _session in range(3):
+        primitives = IntegrationPrimitives(owner_scope={"assistant_id": 42})
+        assert await primitives.resolve_tool_id("hubspot", "search_contacts") == (
+            "composio:hubspot:search_contacts"
+        )
+        assert primitives.callable_for_app_tool("hubspot", "get_deal") is not None
+        schema = await primitives.get_tool_schema("composio:hubspot:get_deal")
+        assert schema["canonical_name"] == "primitives.integrations.hubspot.get_deal"
+
+    assert [name for name, *_ in client.calls] == ["list_connections"]
+    assert len(primitives_context) == 1
+    assert primitives_context[0]["filter"].endswith(
+        'metadata["integration"]["app_slug"] in ["hubspot"]',
+    )
+
+
+@pytest.mark.anyio
+async def test_a_tool_sync_drops_the_shared_catalogue(
+    monkeypatch,
+    primitives_context,
+) -> None:
+    client = FakeIntegrationClient()
+    patch_ops_from_client(monkeypatch, client)
+    primitives = IntegrationPrimitives(owner_scope={"assistant_id": 42})
+    await primitives.resolve_tool_id("hubspot", "search_contacts")
+
+    invalidate_integration_catalog()
+    await IntegrationPrimitives(owner_scope={"assistant_id": 42}).resolve_tool_id(
+        "hubspot",
+        "get_deal",
+    )
+
+    assert [name for name, *_ in client.calls] == ["list_connections"] * 2
+    assert len(primitives_context) == 2
+
+
+def test_concurrent_misses_share_one_catalogue_load(
+    monkeypatch,
+    primitives_context,
+) -> None:
+    import threading
+
+    client = FakeIntegrationClient()
+    release = threading.Event()
+    listed = client.list_connections
+
+    def slow_list_connections(**scope):
+        release.wait(5)
+        return listed(**scope)
+
+    patch_ops_from_client(monkeypatch, client)
+    monkeypatch.setattr(ops_module, "list_connections", slow_list_connections)
+
+    rows: list = []
+    workers = [
+        threading.Thread(
+            target=lambda: rows.append(
+                IntegrationPrimitives(
+                    owner_scope={"assistant_id": 42},
+                )._materialized_tool_row("hubspot", "get_deal"),
+            ),
+        )
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    time.sleep(0.1)
+    release.set()
+    for worker in workers:
+        worker.join(5)
+
+    assert len(rows) == 4
+    assert len(client.calls) == 1
+    assert len(primitives_context) == 1
+
+
+@pytest.mark.anyio
+async def test_an_unlisted_tool_falls_back_to_a_direct_read(
+    monkeypatch,
+    primitives_context,
+) -> None:
+    client = FakeIntegrationClient()
+    patch_ops_from_client(monkeypatch, client)
+    primitives = IntegrationPrimitives(owner_scope={"assistant_id": 42})
+
+    with pytest.raises(AttributeError):
+        await primitives.resolve_tool_id("hubspot", "not_materialized")
+
+    # The fallback reuses the snapshot's connections instead of listing again.
+    assert [name for name, *_ in client.calls] == ["list_connections"]
+    assert 'name == "primitives.integrations.hubspot.not_materialized"' in (
+        primitives_context[-1]["filter"]
+    )
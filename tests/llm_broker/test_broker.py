@@ -8,7 +8,9 @@ shape of any one function.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import dataclasses
 import json
 
 import httpx
@@ -17,6 +19,8 @@ from fastapi import Request
 from fastapi.testclient import TestClient
 
 from unify.llm_broker.app import (
+    Broker,
+    _AuthorizationCache,
     _assistant_id,
     _billing_label,
     _billing_source,
@@ -39,6 +43,8 @@ _SETTINGS = BrokerSettings(
     anthropic_api_base="https://anthropic.test",
     # Every call re-asks, so a test never passes because of a cached verdict.
     auth_ttl_s=0.0,
+    # Settle inline, so what was reported is visible as soon as a call returns.
+    usage_flush_interval_s=0.0,
 )
 
 _AUTH = {"Authorization": "Bearer caller-key"}
@@ -128,6 +134,87 @@ class TestAuthorizationPrecedesSpending:
         assert recorder.authorize_calls == []
 
 
+class TestAuthorizationIsAskedOncePerBurst:
+    def test_concurrent_calls_for_one_key_share_one_check(self):
+        """A burst arriving before the first verdict does not each ask."""
+        gate = asyncio.Event()
+        asked: list[dict] = []
+
+        async def orchestra(request: httpx.Request) -> httpx.Response:
+            asked.append(json.loads(request.content))
+            await gate.wait()
+            return httpx.Response(200, json={"allowed": True})
+
+        async def burst():
+            broker = Broker(dataclasses.replace(_SETTINGS, auth_ttl_s=5.0))
+            broker._control = httpx.AsyncClient(
+                transport=httpx.MockTransport(orchestra),
+            )
+            calls = [
+                broker.authorize(caller_key="k", model="m", assistant_id=1)
+                for _ in range(20)
+            ]
+            waiting = asyncio.gather(*calls)
+            await asyncio.sleep(0.01)
+            gate.set()
+            verdicts = await waiting
+            # Remembered now, so a later call does not ask either.
+            verdicts.append(
+                await broker.authorize(caller_key="k", model="m", assistant_id=1),
+            )
+            await broker.aclose()
+            return verdicts
+
+        assert asyncio.run(burst()) == [None] * 21
+        assert len(asked) == 1
+
+    def test_a_shared_refusal_reaches_every_waiter(self):
+        async def orchestra(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"allowed": False, "reason": "Dry."})
+
+        async def burst():
+            broker = Broker(_SETTINGS)
+            broker._control = httpx.AsyncClient(
+                transport=httpx.MockTransport(orchestra),
+            )
+            refusals = await asyncio.gather(
+                *(
+                    broker.authorize(caller_key="k", model="m", assistant_id=None)
+                    for _ in range(3)
+                ),
+            )
+            await broker.aclose()
+            return refusals
+
+        refusals = asyncio.run(burst())
+        assert [r.status_code for r in refusals] == [402, 402, 402]
+        assert len({id(r) for r in refusals}) == 3
+
+    def test_the_cache_is_bounded_and_forgets_the_least_recent(self):
+        cache = _AuthorizationCache(ttl_s=60.0, max_entries=2)
+        cache.remember("a", "m")
+        cache.remember("b", "m")
+        assert cache.is_fresh("a", "m")
+        cache.remember("c", "m")
+
+        assert len(cache) == 2
+        assert cache.is_fresh("a", "m")
+        assert not cache.is_fresh("b", "m")
+        assert cache.is_fresh("c", "m")
+
+    def test_an_expired_verdict_is_dropped_on_read(self, monkeypatch):
+        from unify.llm_broker import app as app_module
+
+        now = [100.0]
+        monkeypatch.setattr(app_module.time, "monotonic", lambda: now[0])
+        cache = _AuthorizationCache(ttl_s=5.0)
+        cache.remember("a", "m")
+        now[0] += 6
+        assert not cache.is_fresh("a", "m")
+        assert len(cache) == 0
+
+
 class TestTheCallerNeverSeesTheProviderKey:
     def test_the_caller_s_key_is_replaced_not_forwarded(self):
         """The whole point of the sidecar: the credential is substituted here."""
@@ -580,6 +667,7 @@ class TestHealthz:
             anthropic_api_key=None,
             anthropic_api_base="https://anthropic.test",
             auth_ttl_s=0.0,
+            usage_flush_interval_s=0.0,
         )
         with TestClient(build_app(keyless)) as client:
             response = client.get("/healthz")
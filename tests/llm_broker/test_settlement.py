@@ -0,0 +1,250 @@
+"""Usage reports: delivered in batches, off the caller's path, at least once.
+
+The properties that matter are the ones a ledger notices: every report is
+eventually delivered even across an Orchestra outage or a broker restart, a
+report Orchestra rejects outright is not retried forever, and a busy broker
+spends one flush on many reports rather than one round trip per completion.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+
+import httpx
+
+from unify.llm_broker.app import Broker
+from unify.llm_broker.settings import BrokerSettings
+from unify.llm_broker.settlement import SettlementBatcher
+
+
+def _report(n: int) -> dict:
+    return {"model": "m@openrouter", "usage": {"cost": n}, "generation_id": f"g{n}"}
+
+
+class _Ledger:
+    """Records delivered reports; can be told to be down."""
+
+    def __init__(self) -> None:
+        self.delivered: list[tuple[str, dict]] = []
+        self.down = False
+
+    async def send(self, caller_key: str, payload: dict) -> bool:
+        if self.down:
+            return False
+        self.delivered.append((caller_key, payload))
+        return True
+
+
+class TestBatching:
+    def test_reports_wait_for_the_interval_then_go_together(self):
+        ledger = _Ledger()
+
+        async def run():
+            batcher = SettlementBatcher(ledger.send, batch_size=100, interval_s=0.1)
+            for n in range(5):
+                batcher.submit("k", _report(n))
+            await asyncio.sleep(0)
+            assert ledger.delivered == []
+            await asyncio.sleep(0.2)
+            assert len(ledger.delivered) == 5
+            await batcher.aclose()
+
+        asyncio.run(run())
+
+    def test_a_full_batch_flushes_without_waiting_for_the_interval(self):
+        ledger = _Ledger()
+
+        async def run():
+            batcher = SettlementBatcher(ledger.send, batch_size=3, interval_s=60)
+            for n in range(3):
+                batcher.submit("k", _report(n))
+            await asyncio.sleep(0.05)
+            assert [p["generation_id"] for _, p in ledger.delivered] == [
+                "g0",
+                "g1",
+                "g2",
+            ]
+            await batcher.aclose()
+
+        asyncio.run(run())
+
+    def test_undelivered_reports_are_retried_on_the_next_flush(self):
+        ledger = _Ledger()
+        ledger.down = True
+
+        async def run():
+            batcher = SettlementBatcher(ledger.send, batch_size=100, interval_s=60)
+            batcher.submit("k", _report(1))
+            await batcher.flush()
+            assert batcher.pending == 1
+            ledger.down = False
+            await batcher.flush()
+            assert batcher.pending == 0
+            await batcher.aclose()
+
+        asyncio.run(run())
+        assert len(ledger.delivered) == 1
+
+
+def _own_spool(tmp_path):
+    return tmp_path / f"usage.{os.getpid()}.jsonl"
+
+
+class TestSpool:
+    def test_a_restart_redelivers_what_was_not_acknowledged(self, tmp_path):
+        spool = tmp_path / "usage.jsonl"
+        ledger = _Ledger()
+        ledger.down = True
+
+        async def first_life():
+            batcher = SettlementBatcher(
+                ledger.send,
+                batch_size=100,
+                interval_s=60,
+                spool_path=str(spool),
+            )
+            batcher.submit("k1", _report(1))
+            batcher.submit("k2", _report(2))
+            # Killed before Orchestra ever answered: no aclose.
+
+        asyncio.run(first_life())
+        assert len(_own_spool(tmp_path).read_text().splitlines()) == 2
+
+        ledger.down = False
+
+        async def second_life():
+            batcher = SettlementBatcher(
+                ledger.send,
+                batch_size=100,
+                interval_s=60,
+                spool_path=str(spool),
+            )
+            assert batcher.pending == 2
+            await batcher.aclose()
+
+        asyncio.run(second_life())
+        assert [(k, p["generation_id"]) for k, p in ledger.delivered] == [
+            ("k1", "g1"),
+            ("k2", "g2"),
+        ]
+        assert _own_spool(tmp_path).read_text() == ""
+
+    def test_replayed_reports_go_out_without_new_traffic(self, tmp_path):
+        spool = tmp_path / "usage.jsonl"
+        spool.write_text(json.dumps({"key": "k", "payload": _report(1)}) + "\n")
+        ledger = _Ledger()
+
+        async def restarted():
+            batcher = SettlementBatcher(
+                ledger.send,
+                batch_size=100,
+                interval_s=60,
+                spool_path=str(spool),
+            )
+            batcher.start()
+            for _ in range(100):
+                if ledger.delivered:
+                    break
+                await asyncio.sleep(0.01)
+            await batcher.aclose()
+
+        asyncio.run(restarted())
+        assert [k for k, _ in ledger.delivered] == ["k"]
+
+    def test_a_running_brokers_spool_is_not_adopted(self, tmp_path):
+        # pid 1 is always running: another broker on the same host.
+        other = tmp_path / "usage.1.jsonl"
+        other.write_text(json.dumps({"key": "k", "payload": _report(1)}) + "\n")
+
+        batcher = SettlementBatcher(
+            _Ledger().send,
+            batch_size=100,
+            interval_s=60,
+            spool_path=str(tmp_path / "usage.jsonl"),
+        )
+
+        assert batcher.pending == 0
+        assert other.read_text().count("\n") == 1
+
+    def test_a_torn_final_line_is_skipped(self, tmp_path):
+        spool = tmp_path / "usage.jsonl"
+        spool.write_text(
+            json.dumps({"key": "k", "payload": _report(1)}) + "\n" + '{"key": "k", "pa',
+        )
+        batcher = SettlementBatcher(
+            _Ledger().send,
+            batch_size=100,
+            interval_s=60,
+            spool_path=str(spool),
+        )
+        assert batcher.pending == 1
+
+
+class TestBrokerDelivery:
+    def _broker(self, handler) -> Broker:
+        broker = Broker(
+            BrokerSettings(
+                host="127.0.0.1",
+                port=0,
+                orchestra_url="https://orchestra.test/v0",
+                openrouter_api_key=None,
+                openrouter_api_base="https://openrouter.test/api/v1",
+                anthropic_api_key=None,
+                anthropic_api_base="https://anthropic.test",
+                auth_ttl_s=0.0,
+                usage_flush_interval_s=60.0,
+            ),
+        )
+        broker._control = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return broker
+
+    def test_settle_returns_before_orchestra_is_asked(self):
+        posted: list[dict] = []
+
+        async def orchestra(request: httpx.Request) -> httpx.Response:
+            posted.append(json.loads(request.content))
+            return httpx.Response(200, json={})
+
+        async def run():
+            broker = self._broker(orchestra)
+            for n in range(10):
+                await broker.settle(
+                    caller_key="k",
+                    model="m@openrouter",
+                    usage={"cost": n},
+                    assistant_id=None,
+                )
+            assert posted == []
+            await broker.aclose()
+
+        asyncio.run(run())
+        assert len(posted) == 10
+
+    def test_a_rejected_report_is_dropped_and_a_server_error_retried(self):
+        statuses = {"g-bad": [400], "g-flaky": [503, 200]}
+        seen: list[str] = []
+
+        async def orchestra(request: httpx.Request) -> httpx.Response:
+            gen = json.loads(request.content)["generation_id"]
+            seen.append(gen)
+            return httpx.Response(statuses[gen].pop(0), json={})
+
+        async def run():
+            broker = self._broker(orchestra)
+            for gen in ("g-bad", "g-flaky"):
+                await broker.settle(
+                    caller_key="k",
+                    model="m@openrouter",
+                    usage={"cost": 1},
+                    assistant_id=None,
+                    generation_id=gen,
+                )
+            await broker._settlements.flush()
+            assert broker._settlements.pending == 1
+            await broker.aclose()
+            return broker._settlements.pending
+
+        assert asyncio.run(run()) == 0
+        assert sorted(seen) == ["g-bad", "g-flaky", "g-flaky"]
@@ -0,0 +1,274 @@
+"""Credential lookups are served from a per-vault snapshot, not the backend.
+
+``get_credential``, ``_get_secret_value`` and ``_list_secret_keys`` each used
+to read the Secrets context on every call. A vault is now read whole once and
+kept until its TTL runs out; the manager's own writes are applied to it as they
+land, and a read that raced one of those writes is not installed. The
+assistant-secret sync diffs Orchestra's payload against the same snapshot and
+writes only what changed, in one batch per kind of change.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from unify.secret_manager import secret_manager as sm_module
+from unify.secret_manager.secret_manager import SecretManager
+from unify.secret_manager.vault_cache import CachedSecret, SecretVaultCache
+
+_PERSONAL = "42/7/Secrets"
+
+
+class _Backend:
+    """Secrets contexts in memory; records every call the manager makes."""
+
+    def __init__(self) -> None:
+        self.contexts: Dict[str, Dict[int, Dict[str, Any]]] = {_PERSONAL: {}}
+        self.calls: List[str] = []
+        self._next_id = 1
+
+    def add(self, context: str, **entries: Any) -> int:
+        log_id = self._next_id
+        self._next_id += 1
+        self.contexts.setdefault(context, {})[log_id] = dict(entries)
+        return log_id
+
+    def get_logs(self, *, context, filter=None, return_ids_only=False, **_):
+        self.calls.append("get_logs")
+        rows = [
+            (log_id, entries)
+            for log_id, entries in self.contexts.get(context, {}).items()
+            if not filter or eval(filter, {}, entries)
+        ]
+        if return_ids_only:
+            return [log_id for log_id, _ in rows]
+        return [SimpleNamespace(id=i, entries=dict(e)) for i, e in rows]
+
+    def update_logs(self, *, logs, context, entries, overwrite):
+        self.calls.append("update_logs")
+        if isinstance(entries, dict):
+            entries = [entries] * len(logs)
+        for log_id, update in zip(logs, entries):
+            self.contexts[context][log_id].update(update)
+
+    def delete_logs(self, *, context, logs):
+        self.calls.append("delete_logs")
+        for log_id in logs if isinstance(logs, list) else [logs]:
+            del self.contexts[context][log_id]
+
+    def log(self, *, context, **entries):
+        self.calls.append("log")
+        for flag in ("new", "mutable", "stamp_authoring"):
+            entries.pop(flag, None)
+        return SimpleNamespace(id=self.add(context, **entries))
+
+    def create_logs(self, *, context, entries, **_):
+        self.calls.append("create_logs")
+        return {"log_event_ids": [self.add(context, **e) for e in entries]}
+
+
+@pytest.fixture()
+def backend(monkeypatch) -> _Backend:
+    fake = _Backend()
+    for name in ("get_logs", "update_logs", "delete_logs"):
+        monkeypatch.setattr(sm_module.unisdk, name, getattr(fake, name))
+    monkeypatch.setattr(sm_module, "unity_log", fake.log)
+    monkeypatch.setattr(sm_module, "unity_create_logs", fake.create_logs)
+    return fake
+
+
+@pytest.fixture()
+def manager(monkeypatch, backend) -> SecretManager:
+    sm = object.__new__(SecretManager)
+    sm._ctx = _PERSONAL
+    sm._assistant_secret_sync_lock = Lock()
+    sm._oauth_tokens = {}
+    sm._vaults = SecretVaultCache(ttl_seconds=60.0)
+    sm.env_writes = []
+    monkeypatch.setattr(
+        sm,
+        "_secret_context_for_destination",
+        lambda destination: _PERSONAL,
+    )
+    monkeypatch.setattr(sm, "_read_secret_contexts", lambda: [_PERSONAL])
+    monkeypatch.setattr(
+        sm,
+        "_env_merge_and_write",
+        lambda add_or_update, remove_keys: sm.env_writes.append(
+            (add_or_update, remove_keys),
+        ),
+    )
+    monkeypatch.setattr(sm, "_invalidate_credential_processes", lambda: None)
+    return sm
+
+
+class TestLookupsShareOneRead:
+    def test_repeated_lookups_read_the_vault_once(self, manager, backend):
+        backend.add(_PERSONAL, name="API_KEY", value="k1")
+        backend.add(_PERSONAL, name="OTHER", value="k2")
+
+        for _ in range(5):
+            assert manager.get_credential("API_KEY") == "k1"
+        assert manager._get_secret_value("OTHER") == "k2"
+        assert manager._list_secret_keys() == ["API_KEY", "OTHER"]
+        assert backend.calls == ["get_logs"]
+
+    def test_a_missing_credential_still_raises(self, manager, backend):
+        with pytest.raises(KeyError):
+            manager.get_credential("NOPE")
+
+    def test_an_expired_snapshot_is_read_again(self, manager, backend):
+        backend.add(_PERSONAL, name="API_KEY", value="k1")
+        manager.get_credential("API_KEY")
+        manager._vaults._vaults[_PERSONAL].loaded_at -= 120
+        manager.get_credential("API_KEY")
+        assert backend.calls == ["get_logs", "get_logs"]
+
+
+class TestOwnWritesAreVisibleAtOnce:
+    def test_create_update_and_delete_write_through(self, manager, backend):
+        assert manager._list_secret_keys() == []
+
+        manager._create_secret(name="API_KEY", value="k1")
+        assert manager.get_credential("API_KEY") == "k1"
+
+        manager._update_secret(name="API_KEY", value="k2")
+        assert manager.get_credential("API_KEY") == "k2"
+
+        manager._delete_secret(name="API_KEY")
+        with pytest.raises(KeyError):
+            manager.get_credential("API_KEY")
+        # One vault read; everything else was the writes' own lookups.
+        assert backend.calls.count("get_logs") == 4
+
+    def test_a_read_that_raced_a_write_is_not_installed(self):
+        cache = SecretVaultCache(ttl_seconds=60.0)
+
+        def stale_read():
+            # The write lands while the read is in flight.
+            cache.put(_PERSONAL, "API_KEY", "new")
+            return {"API_KEY": CachedSecret(log_id=1, value="old")}
+
+        cache.rows(_PERSONAL, stale_read)
+        reread = cache.rows(
+            _PERSONAL,
+            lambda: {"API_KEY": CachedSecret(log_id=1, value="new")},
+        )
+        assert reread["API_KEY"].value == "new"
+
+
+class TestAssistantSecretSync:
+    @pytest.fixture()
+    def orchestra(self, monkeypatch, manager):
+        from unify.session_details import SESSION_DETAILS
+
+        payload: Dict[str, Any] = {}
+        monkeypatch.setattr(SESSION_DETAILS.assistant, "agent_id", 7)
+        monkeypatch.setattr(SESSION_DETAILS, "unify_key", "key")
+        monkeypatch.setattr(sm_module.SETTINGS, "ORCHESTRA_URL", "http://orchestra")
+        monkeypatch.setattr(
+            "unisdk.utils.http.get",
+            lambda *a, **k: SimpleNamespace(
+                status_code=200,
+                json=lambda: {"secrets": dict(payload)},
+            ),
+        )
+        return payload
+
+    def test_changes_are_written_in_one_batch_each(
+        self,
+        manager,
+        backend,
+        orchestra,
+    ):
+        backend.add(_PERSONAL, name="GOOGLE_TOKEN_EXPIRES_AT", value="1")
+        backend.add(_PERSONAL, name="GOOGLE_GRANTED_SCOPES", value="same")
+        backend.add(_PERSONAL, name="MICROSOFT_GRANTED_SCOPES", value="gone")
+        backend.add(_PERSONAL, name="HUBSPOT_KEY", value="console")
+        orchestra.update(
+            GOOGLE_TOKEN_EXPIRES_AT="2",
+            GOOGLE_GRANTED_SCOPES="same",
+            MICROSOFT_TOKEN_EXPIRES_AT="9",
+            GOOGLE_ACCESS_TOKEN="raw",
+        )
+
+        manager._sync_assistant_secrets()
+
+        assert backend.calls == [
+            "get_logs",
+            "update_logs",
+            "create_logs",
+            "delete_logs",
+        ]
+        stored = {e["name"]: e["value"] for e in backend.contexts[_PERSONAL].values()}
+        assert stored == {
+            "GOOGLE_TOKEN_EXPIRES_AT": "2",
+            "GOOGLE_GRANTED_SCOPES": "same",
+            "MICROSOFT_TOKEN_EXPIRES_AT": "9",
+            "HUBSPOT_KEY": "console",
+        }
+        assert manager._oauth_tokens == {"GOOGLE_ACCESS_TOKEN": "raw"}
+        assert manager.env_writes == [
+            (
+                {
+                    "GOOGLE_TOKEN_EXPIRES_AT": "2",
+                    "GOOGLE_GRANTED_SCOPES": "same",
+                    "MICROSOFT_TOKEN_EXPIRES_AT": "9",
+                },
+                ["MICROSOFT_GRANTED_SCOPES"],
+            ),
+        ]
+
+    def test_an_unchanged_payload_writes_nothing(self, manager, backend, orchestra):
+        orchestra.update(GOOGLE_TOKEN_EXPIRES_AT="1")
+        manager._sync_assistant_secrets()
+        manager._sync_assistant_secrets()
+
+        assert backend.calls == ["get_logs", "create_logs"]
+        assert manager.get_credential("GOOGLE_TOKEN_EXPIRES_AT") == "1"
+
+    def test_rows_created_here_can_be_updated_next_time(
+        self,
+        manager,
+        backend,
+        orchestra,
+    ):
+        orchestra.update(GOOGLE_TOKEN_EXPIRES_AT="1")
+        manager._sync_assistant_secrets()
+        orchestra.update(GOOGLE_TOKEN_EXPIRES_AT="2")
+        manager._sync_assistant_secrets()
+
+        assert backend.calls == ["get_logs", "create_logs", "update_logs"]
+        (row,) = backend.contexts[_PERSONAL].values()
+        assert row["value"] == "2"
+
+    def test_one_bad_secret_costs_only_its_own_write(
+        self,
+        manager,
+        backend,
+        orchestra,
+        monkeypatch,
+    ):
+        create_logs = backend.create_logs
+
+        def reject_one(*, context, entries, **kwargs):
+            if any(e["name"] == "MICROSOFT_TOKEN_EXPIRES_AT" for e in entries):
+                backend.calls.append("create_logs")
+                raise ValueError("rejected")
+            return create_logs(context=context, entries=entries, **kwargs)
+
+        monkeypatch.setattr(sm_module, "unity_create_logs", reject_one)
+        orchestra.update(GOOGLE_TOKEN_EXPIRES_AT="1", MICROSOFT_TOKEN_EXPIRES_AT="9")
+
+        manager._sync_assistant_secrets()
+
+        # The batch, then each secret on its own.
+        assert backend.calls.count("create_logs") == 3
+        stored = {e["name"]: e["value"] for e in backend.contexts[_PERSONAL].values()}
+        assert stored == {"GOOGLE_TOKEN_EXPIRES_AT": "1"}
+        assert manager.env_writes == [({"GOOGLE_TOKEN_EXPIRES_AT": "1"}, None)]
+
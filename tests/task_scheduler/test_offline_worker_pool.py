@@ -0,0 +1,310 @@
+"""
+Offline runs served by a pool of pre-booted workers.
+
+A cold ``offline_runner`` boots the assistant substrate before its first
+action, once per run. ``OfflineWorkerPool`` keeps workers booted and hands
+each run's env to an idle one, bounds concurrency to its size, and replaces
+workers that die, have served their runs, or have grown too large. The
+workers here are real subprocesses running a stand-in that speaks the worker
+protocol and sleeps in place of the substrate boot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+from unify.task_scheduler.local_scheduler import LocalOfflineDispatcher
+from unify.task_scheduler.local_scheduler import worker_pool as wp
+from unify.task_scheduler.local_scheduler.worker_pool import (
+    OfflineWorkerPool,
+    WorkerBootError,
+    WorkerDiedError,
+)
+from unify.task_scheduler.machine_state import TaskExecutionSnapshot
+from unify.task_scheduler.types.execution import Delivery, Wake
+
+_BOOT_S = 0.5
+
+_FAKE_WORKER = """
+import json, os, sys, time
+
+def send(event, **fields):
+    sys.stdout.write(json.dumps({"event": event, **fields}) + "\\n")
+    sys.stdout.flush()
+
+time.sleep(float(os.environ["FAKE_BOOT_S"]))
+send("ready", pid=os.getpid(), boot_ms=0)
+for line in sys.stdin:
+    request = json.loads(line)
+    env = request["env"]
+    if env.get("FAKE_DIE_BEFORE_START"):
+        os._exit(9)
+    # Like offline_worker: a refused run, or a config it cannot load, is
+    # reported done without ever being started.
+    if env.get("ASSISTANT_ID") != os.environ["ASSISTANT_ID"]:
+        send("done", run=request["run"], code=2)
+        continue
+    if env.get("FAKE_BAD_CONFIG"):
+        send("done", run=request["run"], code=1)
+        continue
+    send("started", run=request["run"])
+    with open(env["FAKE_LOG"], "a") as log:
+        log.write(f"{os.getpid()} start {time.monotonic()}\\n")
+    if env.get("FAKE_DIE"):
+        os._exit(9)
+    time.sleep(float(env.get("FAKE_RUN_S", "0")))
+    with open(env["FAKE_LOG"], "a") as log:
+        log.write(f"{os.getpid()} end {time.monotonic()}\\n")
+    send("done", run=request["run"], code=int(env.get("FAKE_EXIT", "0")))
+"""
+
+
+@pytest.fixture
+def log(tmp_path):
+    return tmp_path / "runs.log"
+
+
+def _pool(*, size=1, max_runs=100, boot_s=_BOOT_S, command=None, **kwargs):
+    return OfflineWorkerPool(
+        "42",
+        size=size,
+        max_runs=max_runs,
+        max_rss_growth_bytes=kwargs.pop("max_rss_growth_bytes", 1 << 40),
+        env={"PATH": os.environ.get("PATH", ""), "FAKE_BOOT_S": str(boot_s)},
+        command=command or (sys.executable, "-c", _FAKE_WORKER),
+        boot_timeout=10.0,
+        **kwargs,
+    )
+
+
+def _env(log, **extra) -> dict:
+    return {"ASSISTANT_ID": "42", "FAKE_LOG": str(log), **extra}
+
+
+def _events(log) -> list[tuple[int, str, float]]:
+    events = []
+    for line in log.read_text().splitlines():
+        pid, kind, at = line.split()
+        events.append((int(pid), kind, float(at)))
+    return events
+
+
+def _pids(log) -> list[int]:
+    return [pid for pid, kind, _ in _events(log) if kind == "start"]
+
+
+class TestWarmReuse:
+    @pytest.mark.asyncio
+    async def test_runs_share_one_booted_worker(self, log):
+        pool = _pool()
+        try:
+            assert await pool.run("a", _env(log)) == 0
+            assert await pool.run("b", _env(log, FAKE_EXIT="3")) == 3
+        finally:
+            await pool.stop()
+
+        assert len(set(_pids(log))) == 1
+        assert pool.workers_booted == 1
+        assert pool.stats()["runs"] == 2
+
+    @pytest.mark.asyncio
+    async def test_a_worker_is_replaced_after_its_last_run(self, log):
+        pool = _pool(max_runs=2)
+        try:
+            for key in "abc":
+                await pool.run(key, _env(log))
+        finally:
+            await pool.stop()
+
+        pids = _pids(log)
+        assert pids[0] == pids[1] != pids[2]
+        assert pool.workers_recycled == 1
+
+    @pytest.mark.asyncio
+    async def test_a_worker_past_its_memory_budget_is_replaced(self, log):
+        pool = _pool(max_rss_growth_bytes=-1)
+        try:
+            await pool.run("a", _env(log))
+            await pool.run("b", _env(log))
+        finally:
+            await pool.stop()
+
+        assert len(set(_pids(log))) == 2
+
+
+class TestAdmission:
+    @pytest.mark.asyncio
+    async def test_no_more_runs_execute_than_there_are_workers(self, log):
+        pool = _pool(size=2, boot_s=0)
+        try:
+            codes = await asyncio.gather(
+                *(pool.run(str(i), _env(log, FAKE_RUN_S="0.2")) for i in range(5)),
+            )
+        finally:
+            await pool.stop()
+
+        assert codes == [0] * 5
+        running = peak = 0
+        for _, kind, _ in sorted(_events(log), key=lambda e: e[2]):
+            running += 1 if kind == "start" else -1
+            peak = max(peak, running)
+        assert peak == 2
+        assert pool.stats()["queued_ms"]["max"] >= 150
+
+
+class TestFailures:
+    @pytest.mark.asyncio
+    async def test_a_worker_dying_mid_run_fails_only_that_run(self, log):
+        pool = _pool(boot_s=0)
+        try:
+            with pytest.raises(WorkerDiedError):
+                await pool.run("a", _env(log, FAKE_DIE="1"))
+            assert await pool.run("b", _env(log)) == 0
+        finally:
+            await pool.stop()
+
+        first, second = _pids(log)
+        assert first != second
+
+    @pytest.mark.asyncio
+    async def test_a_worker_dying_while_idle_is_replaced(self, log):
+        pool = _pool(boot_s=0)
+        try:
+            assert await pool.run("a", _env(log)) == 0
+            (idle,) = _pids(log)
+            os.kill(idle, 9)
+            while pool._idle._queue[0].alive:
+                await asyncio.sleep(0.01)
+
+            assert await pool.run("b", _env(log)) == 0
+        finally:
+            await pool.stop()
+
+        assert _pids(log)[1] != idle
+        assert pool.workers_recycled == 1
+
+    @pytest.mark.asyncio
+    async def test_a_run_its_worker_never_started_can_go_cold(self, log):
+        pool = _pool(boot_s=0)
+        try:
+            with pytest.raises(WorkerBootError):
+                await pool.run("a", _env(log, FAKE_DIE_BEFORE_START="1"))
+            assert await pool.run("b", _env(log)) == 0
+        finally:
+            await pool.stop()
+
+        assert pool.workers_recycled == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "env",
+        [{"ASSISTANT_ID": "43"}, {"FAKE_BAD_CONFIG": "1"}],
+        ids=["refused", "config-error"],
+    )
+    async def test_a_run_ended_without_starting_goes_cold(self, log, env):
+        pool = _pool(boot_s=0)
+        try:
+            with pytest.raises(WorkerBootError):
+                await asyncio.wait_for(pool.run("a", _env(log, **env)), 5)
+            assert await asyncio.wait_for(pool.run("b", _env(log)), 5) == 0
+        finally:
+            await pool.stop()
+
+        # The worker that declined the run goes on serving.
+        assert pool.workers_booted == 1
+        assert pool.workers_recycled == 0
+
+    @pytest.mark.asyncio
+    async def test_a_closed_pool_does_not_replace_cancelled_runs(self, log):
+        pool = _pool(boot_s=0)
+        run = asyncio.create_task(pool.run("a", _env(log, FAKE_RUN_S="0.5")))
+        while not log.exists():
+            await asyncio.sleep(0.01)
+
+        pool.close()
+        run.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+        await asyncio.wait_for(pool.stop(), timeout=5)
+
+        assert pool.workers_booted == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_boot_failures_break_the_pool(self, monkeypatch):
+        pool = _pool(command=(sys.executable, "-c", "raise SystemExit(1)"))
+        monkeypatch.setattr(wp, "MAX_CONSECUTIVE_BOOT_FAILURES", 2)
+        try:
+            for _ in range(2):
+                with pytest.raises(WorkerBootError):
+                    await pool.run("a", {})
+        finally:
+            await pool.stop()
+
+        assert pool.broken
+
+    @pytest.mark.asyncio
+    async def test_the_dispatcher_falls_back_to_a_cold_runner(self, monkeypatch):
+        dispatcher = LocalOfflineDispatcher(pool_size=1)
+        dispatcher._pool = _pool(command=(sys.executable, "-c", "pass"))
+        spawned = asyncio.Event()
+
+        async def _spawn(env, snap, wake):
+            assert env["UNIFY_OFFLINE_TASK_WAKE"] == wake
+            spawned.set()
+
+        monkeypatch.setattr(dispatcher, "_spawn", _spawn)
+        snap = TaskExecutionSnapshot(
+            run_key="offline:scheduled:42:7:rev-1:once",
+            assistant_id="42",
+            task_id=7,
+            source_task_log_id=999,
+            wake=Wake.scheduled.value,
+            delivery=Delivery.offline.value,
+            task_name="Run weekly report",
+            scheduled_for="2030-04-10T09:00:00+00:00",
+            revision="rev-1",
+        )
+        try:
+            assert await dispatcher.dispatch(snap, wake=Wake.scheduled.value) is None
+            await asyncio.wait_for(spawned.wait(), timeout=10)
+        finally:
+            await dispatcher.stop()
+
+
+class TestLatency:
+    @pytest.mark.asyncio
+    async def test_a_warm_worker_reaches_its_first_action_without_a_boot(self, log):
+        def submit_to_first_action(timing: wp.RunTiming) -> float:
+            return timing.queued_ms + timing.first_action_ms
+
+        cold = _pool()
+        try:
+            await cold.run("cold", _env(log))
+            # The only run a fresh pool has waits out its worker's boot.
+            assert submit_to_first_action(cold.timings[-1]) >= _BOOT_S * 1000
+        finally:
+            await cold.stop()
+
+        pool = _pool()
+        runs = 5
+        try:
+            pool.start()
+            await pool.run("warm-up", _env(log))
+            for key in range(runs):
+                assert await pool.run(str(key), _env(log)) == 0
+            stats = pool.stats()
+        finally:
+            await pool.stop()
+
+        # Every warm run went to the worker already booted for the warm-up.
+        warm_pids = _pids(log)[1:]
+        assert len(warm_pids) == runs + 1
+        assert len(set(warm_pids)) == 1
+        assert stats["workers_booted"] == 1
+        assert stats["workers_recycled"] == 0
+        assert stats["runs"] == runs + 1
+        assert json.dumps(stats)
@@ -0,0 +1,236 @@
+"""
+Synchronous transcript writes go out as multi-row creates.
+
+``log_messages(synchronous=True)`` used to make one backend request per
+message to learn its id, and started a thread per call to touch orchestra's
+activity clock. A batch is now one create request whose rows map back to
+messages in order, and touches are coalesced on one debounced worker. Every
+test here runs against a local stand-in backend, never the real one.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from unify.transcript_manager import activity_sync
+from unify.transcript_manager import transcript_manager as tm_module
+from unify.transcript_manager.transcript_manager import TranscriptManager
+from unify.transcript_manager.types.message import Message
+
+_CONTEXT = "42/7/Transcripts"
+
+
+class _StandInBackend:
+    """Assigns message ids in arrival order and records each request's size."""
+
+    def __init__(self) -> None:
+        self.requests: List[int] = []
+        self._next_id = 100
+
+    def create_logs(self, *, context, entries, mutable, batched, stamp_authoring):
+        assert (context, mutable, batched) == (_CONTEXT, True, True)
+        self.requests.append(len(entries))
+        logs = []
+        for entry in entries:
+            logs.append(SimpleNamespace(entries={**entry, "message_id": self._next_id}))
+            self._next_id += 1
+        return logs
+
+
+def _entries(count: int) -> List[Dict[str, Any]]:
+    now = datetime.now(timezone.utc)
+    return [
+        Message(
+            medium="email",
+            sender_id=1,
+            receiver_ids=[2],
+            timestamp=now,
+            content=f"message {i}",
+            exchange_id=9,
+        ).to_post_json()
+        for i in range(count)
+    ]
+
+
+@pytest.fixture()
+def backend(monkeypatch):
+    backend = _StandInBackend()
+    monkeypatch.setattr(tm_module, "unity_create_logs", backend.create_logs)
+    return backend
+
+
+@pytest.fixture()
+def manager():
+    return object.__new__(TranscriptManager)
+
+
+class TestOneRequestPerBatch:
+    def test_ids_map_back_to_messages_in_order(self, backend, manager):
+        created = manager._create_messages_batched(_CONTEXT, _entries(5))
+
+        assert backend.requests == [5]
+        assert [m.message_id for m in created] == [100, 101, 102, 103, 104]
+        assert [m.content for m in created] == [f"message {i}" for i in range(5)]
+
+    def test_large_imports_are_chunked(self, backend, manager, monkeypatch):
+        monkeypatch.setattr(tm_module, "_SYNC_CREATE_BATCH_SIZE", 4)
+
+        created = manager._create_messages_batched(_CONTEXT, _entries(10))
+
+        assert backend.requests == [4, 4, 2]
+        assert [m.message_id for m in created] == list(range(100, 110))
+
+    def test_a_response_that_does_not_line_up_is_an_error(
+        self,
+        manager,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(
+            tm_module,
+            "unity_create_logs",
+            lambda **_: {"logs": [SimpleNamespace(entries={"message_id": 1})]},
+        )
+
+        with pytest.raises(RuntimeError, match="1 rows for 3 messages"):
+            manager._create_messages_batched(_CONTEXT, _entries(3))
+
+    def test_a_response_without_ids_is_an_error_not_sentinels(
+        self,
+        manager,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(tm_module, "unity_create_logs", lambda **_: {})
+
+        with pytest.raises(RuntimeError, match="0 rows for 2 messages"):
+            manager._create_messages_batched(_CONTEXT, _entries(2))
+
+    def test_a_response_of_row_ids_is_mapped_back(self, manager, monkeypatch):
+        monkeypatch.setattr(
+            tm_module,
+            "unity_create_logs",
+            lambda **_: {"row_ids": {"message_id": [7, 8, 9]}},
+        )
+
+        created = manager._create_messages_batched(_CONTEXT, _entries(3))
+
+        assert [m.message_id for m in created] == [7, 8, 9]
+        assert [m.content for m in created] == [f"message {i}" for i in range(3)]
+
+    def test_a_response_of_log_event_ids_is_read_back(self, manager, monkeypatch):
+        stored = {
+            log_id: SimpleNamespace(
+                id=log_id,
+                entries={**entries, "message_id": 200 + index},
+            )
+            for index, (log_id, entries) in enumerate(zip([31, 32], _entries(2)))
+        }
+        monkeypatch.setattr(
+            tm_module,
+            "unity_create_logs",
+            lambda **_: {"log_event_ids": [31, 32]},
+        )
+        monkeypatch.setattr(
+            tm_module.unisdk,
+            "get_logs",
+            lambda *, context, from_ids, return_ids_only: [
+                stored[log_id] for log_id in reversed(from_ids)
+            ],
+        )
+
+        created = manager._create_messages_batched(_CONTEXT, _entries(2))
+
+        assert [m.message_id for m in created] == [200, 201]
+
+    def test_short_row_ids_fall_back_to_reading_back(self, manager, monkeypatch):
+        stored = {
+            log_id: SimpleNamespace(
+                id=log_id,
+                entries={**entries, "message_id": 300 + index},
+            )
+            for index, (log_id, entries) in enumerate(zip([41, 42], _entries(2)))
+        }
+        monkeypatch.setattr(
+            tm_module,
+            "unity_create_logs",
+            lambda **_: {"row_ids": {"message_id": [300]}, "log_event_ids": [41, 42]},
+        )
+        monkeypatch.setattr(
+            tm_module.unisdk,
+            "get_logs",
+            lambda *, context, from_ids, return_ids_only: [
+                stored[log_id] for log_id in from_ids
+            ],
+        )
+
+        created = manager._create_messages_batched(_CONTEXT, _entries(2))
+
+        assert [m.message_id for m in created] == [300, 301]
+
+
+class TestActivityTouchesAreCoalesced:
+    @pytest.fixture()
+    def touches(self, monkeypatch):
+        sent: List[tuple] = []
+        lock = threading.Lock()
+
+        def touch(assistant_id, *, thread_id=None):
+            with lock:
+                sent.append((assistant_id, thread_id))
+            return True
+
+        monkeypatch.setattr(activity_sync, "touch_assistant_activity", touch)
+        monkeypatch.setattr(
+            activity_sync,
+            "_toucher",
+            activity_sync._ActivityToucher(debounce_s=60.0),
+        )
+        return sent
+
+    def test_a_burst_costs_one_touch_per_thread(self, touches):
+        for _ in range(50):
+            activity_sync.schedule_activity_touch(7)
+        activity_sync.schedule_activity_touch(7, thread_id="t-1")
+        activity_sync.schedule_activity_touch(None)
+
+        # The worker is mid-window; flushing sends without waiting it out.
+        assert activity_sync.flush_activity_touches(timeout=5)
+        assert set(touches) == {(7, None), (7, "t-1")}
+        assert len(touches) == 2
+
+    def test_nothing_is_sent_before_the_window_closes(self, touches):
+        activity_sync.schedule_activity_touch(7)
+        time.sleep(0.05)
+
+        assert touches == []
+        assert activity_sync.flush_activity_touches(timeout=5)
+        assert touches == [(7, None)]
+
+    def test_touches_pending_at_exit_are_sent(self, touches):
+        activity_sync.schedule_activity_touch(7)
+
+        # What atexit runs when a short-lived process ends mid-window.
+        activity_sync._flush_activity_touches_at_exit()
+
+        assert touches == [(7, None)]
+
+
+class TestImportRequests:
+    def test_an_import_costs_one_request_per_chunk_not_per_message(
+        self,
+        backend,
+        manager,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(tm_module, "_SYNC_CREATE_BATCH_SIZE", 100)
+
+        created = manager._create_messages_batched(_CONTEXT, _entries(300))
+
+        assert len(created) == 300
+        # Three round trips where one per message used to cost 300.
+        assert backend.requests == [100, 100, 100]
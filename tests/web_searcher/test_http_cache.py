@@ -0,0 +1,282 @@
+"""Repeated fetches and provider calls should not repeat the network round trip.
+
+A URL fetched twice is usually the same bytes twice. The response cache keeps
+what the origin allows to be kept (RFC 9111): a fresh copy is served with no
+request at all, a stale one costs a conditional GET whose 304 carries no body,
+and anything marked ``no-store`` is never written. The origin here is a local
+HTTP server that counts what it is asked for, so "no request" is asserted
+directly rather than inferred from timing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from unify.web_searcher import url_fetch
+from unify.web_searcher.http_cache import (
+    HttpResponseCache,
+    ProviderResultCache,
+    current_age,
+    freshness_lifetime,
+    is_fresh,
+    normalize_params,
+    normalize_url,
+)
+from unify.web_searcher.url_fetch import fetch_to_directory
+
+
+class _Origin(BaseHTTPRequestHandler):
+    """Serves ``routes`` and records every request it receives."""
+
+    routes: dict = {}
+    hits: list = []
+
+    def do_GET(self):
+        route = self.routes[self.path]
+        self.hits.append((self.path, self.headers.get("If-None-Match")))
+        etag = route.get("etag")
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Date", formatdate(usegmt=True))
+            for name, value in route.get("headers", {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        body = route["body"]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Date", formatdate(usegmt=True))
+        if etag:
+            self.send_header("ETag", etag)
+        for name, value in route.get("headers", {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def origin(monkeypatch):
+    """A loopback origin the fetch guard is told to treat as public."""
+    _Origin.routes = {}
+    _Origin.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Origin)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(url_fetch, "assert_fetchable", lambda url: None)
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _fetch(url, dest, cache):
+    return asyncio.run(fetch_to_directory(url, dest, cache=cache))
+
+
+class TestResponseCache:
+    def test_a_fresh_response_is_served_without_a_request(self, origin, tmp_path):
+        _Origin.routes["/a.csv"] = {
+            "body": b"x,y\n1,2\n",
+            "headers": {"Cache-Control": "max-age=600"},
+        }
+        cache = HttpResponseCache(tmp_path / "cache")
+
+        first = _fetch(f"{origin}/a.csv", tmp_path / "one", cache)
+        second = _fetch(f"{origin}/a.csv", tmp_path / "two", cache)
+
+        assert len(_Origin.hits) == 1
+        assert first.read_bytes() == second.read_bytes() == b"x,y\n1,2\n"
+        assert second.name == "a.csv"
+
+    def test_a_stale_response_is_revalidated_and_a_304_reuses_the_body(
+        self,
+        origin,
+        tmp_path,
+    ):
+        _Origin.routes["/doc.txt"] = {
+            "body": b"payload",
+            "etag": '"v1"',
+            "headers": {"Cache-Control": "no-cache"},
+        }
+        cache = HttpResponseCache(tmp_path / "cache")
+
+        _fetch(f"{origin}/doc.txt", tmp_path / "one", cache)
+        again = _fetch(f"{origin}/doc.txt", tmp_path / "two", cache)
+
+        assert _Origin.hits == [("/doc.txt", None), ("/doc.txt", '"v1"')]
+        assert again.read_bytes() == b"payload"
+
+    def test_a_changed_resource_replaces_the_stored_body(self, origin, tmp_path):
+        _Origin.routes["/doc.txt"] = {
+            "body": b"old",
+            "etag": '"v1"',
+            "headers": {"Cache-Control": "max-age=0"},
+        }
+        cache = HttpResponseCache(tmp_path / "cache")
+        _fetch(f"{origin}/doc.txt", tmp_path / "one", cache)
+
+        _Origin.routes["/doc.txt"] = {
+            "body": b"new",
+            "etag": '"v2"',
+            "headers": {"Cache-Control": "max-age=600"},
+        }
+        assert _fetch(f"{origin}/doc.txt", tmp_path / "two", cache).read_bytes() == (
+            b"new"
+        )
+        assert _fetch(f"{origin}/doc.txt", tmp_path / "three", cache).read_bytes() == (
+            b"new"
+        )
+        assert len(_Origin.hits) == 2
+        assert list((tmp_path / "cache" / "blobs").iterdir()) == [
+            tmp_path / "cache" / "blobs" / hashlib.sha256(b"new").hexdigest(),
+        ]
+
+    def test_no_store_is_never_written(self, origin, tmp_path):
+        _Origin.routes["/secret"] = {
+            "body": b"s",
+            "headers": {"Cache-Control": "no-store, max-age=600"},
+        }
+        cache = HttpResponseCache(tmp_path / "cache")
+        _fetch(f"{origin}/secret", tmp_path / "one", cache)
+        _fetch(f"{origin}/secret", tmp_path / "two", cache)
+
+        assert len(_Origin.hits) == 2
+        assert cache.total_bytes() == 0
+
+    def test_identical_bodies_share_one_blob(self, origin, tmp_path):
+        for path in ("/mirror-a/f.bin", "/mirror-b/f.bin"):
+            _Origin.routes[path] = {
+                "body": b"same bytes",
+                "headers": {"Cache-Control": "max-age=600"},
+            }
+        cache = HttpResponseCache(tmp_path / "cache")
+        _fetch(f"{origin}/mirror-a/f.bin", tmp_path / "one", cache)
+        _fetch(f"{origin}/mirror-b/f.bin", tmp_path / "two", cache)
+
+        assert len(list((tmp_path / "cache" / "blobs").iterdir())) == 1
+        assert cache.total_bytes() == len(b"same bytes")
+
+    def test_the_byte_budget_evicts_least_recently_used(self, origin, tmp_path):
+        for name in ("a", "b", "c"):
+            _Origin.routes[f"/{name}"] = {
+                "body": name.encode() * 100,
+                "headers": {"Cache-Control": "max-age=600"},
+            }
+        cache = HttpResponseCache(tmp_path / "cache", max_bytes=250)
+        _fetch(f"{origin}/a", tmp_path / "d", cache)
+        _fetch(f"{origin}/b", tmp_path / "d", cache)
+        cache.lookup(f"{origin}/a")
+        _fetch(f"{origin}/c", tmp_path / "d", cache)
+
+        assert cache.total_bytes() <= 250
+        # Touching /a made /b the least recently used, so /b went first.
+        assert cache.lookup(f"{origin}/a") is not None
+        assert cache.lookup(f"{origin}/b") is None
+        assert cache.lookup(f"{origin}/c") is not None
+
+
+class TestFreshness:
+    def test_max_age_wins_over_expires(self):
+        headers = {
+            "Cache-Control": "max-age=60",
+            "Date": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "Expires": "Mon, 01 Jan 2024 01:00:00 GMT",
+        }
+        assert freshness_lifetime(headers) == 60
+
+    def test_expires_is_relative_to_date(self):
+        headers = {
+            "Date": "Mon, 01 Jan 2024 00:00:00 GMT",
+            "Expires": "Mon, 01 Jan 2024 01:00:00 GMT",
+        }
+        assert freshness_lifetime(headers) == 3600
+
+    def test_an_invalid_expires_means_already_expired(self):
+        assert (
+            freshness_lifetime({"Date": formatdate(usegmt=True), "Expires": "0"}) == 0
+        )
+
+    def test_heuristic_is_a_tenth_of_the_last_modified_age(self):
+        headers = {
+            "Date": "Mon, 11 Jan 2024 00:00:00 GMT",
+            "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        assert freshness_lifetime(headers) == 24 * 3600  # capped from 1 day
+        headers["Last-Modified"] = "Wed, 10 Jan 2024 14:00:00 GMT"
+        assert freshness_lifetime(headers) == pytest.approx(3600)
+
+    def test_age_header_and_resident_time_count_against_freshness(self):
+        headers = {"Cache-Control": "max-age=100", "Age": "30"}
+        assert current_age(headers, 1000.0, 1002.0, 1050.0) == pytest.approx(80)
+        assert is_fresh(headers, 1000.0, 1002.0, now=1050.0)
+        assert not is_fresh(headers, 1000.0, 1002.0, now=1080.0)
+
+
+class TestProviderResultCache:
+    def test_equivalent_parameters_share_one_call(self):
+        cache = ProviderResultCache(ttl_seconds=60)
+        calls = []
+
+        def call():
+            calls.append(1)
+            return {"results": [len(calls)]}
+
+        first = cache.get_or_call("search", {"query": "  unify   ai "}, call)
+        second = cache.get_or_call(
+            "search",
+            {"query": "unify ai", "start_date": None},
+            call,
+        )
+        assert first == second == {"results": [1]}
+        assert cache.get_or_call("extract", {"query": "unify ai"}, call) == {
+            "results": [2],
+        }
+
+    def test_url_lists_are_compared_as_sets_of_normalized_urls(self):
+        assert normalize_params(
+            "extract",
+            {"urls": ["https://B.example/x", "HTTPS://a.example:443/y#frag"]},
+        ) == normalize_params(
+            "extract",
+            {"urls": ["https://a.example/y", "https://b.example/x"]},
+        )
+        assert normalize_params(
+            "extract",
+            {"urls": "https://a.example"},
+        ) == normalize_params("extract", {"urls": ["https://a.example/"]})
+        assert normalize_url("http://Host:80") == "http://host/"
+
+    def test_entries_expire_after_the_ttl(self, monkeypatch):
+        from unify.web_searcher import http_cache
+
+        now = [1000.0]
+        monkeypatch.setattr(http_cache.time, "monotonic", lambda: now[0])
+        cache = ProviderResultCache(ttl_seconds=60)
+        calls = []
+        cache.get_or_call("map", {"url": "https://a.example"}, lambda: calls.append(1))
+        now[0] += 59
+        cache.get_or_call("map", {"url": "https://a.example"}, lambda: calls.append(1))
+        now[0] += 2
+        cache.get_or_call("map", {"url": "https://a.example"}, lambda: calls.append(1))
+        assert len(calls) == 2
+
+    def test_failures_are_not_cached(self):
+        cache = ProviderResultCache(ttl_seconds=60)
+
+        def boom():
+            raise RuntimeError("provider down")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_call("search", {"query": "q"}, boom)
+        assert cache.get_or_call("search", {"query": "q"}, lambda: "ok") == "ok"
@@ -7,6 +7,7 @@ settings someone installs it under, and that uninstall clears exactly the
 rows the bundle planted.
 """
 
+import threading
 from typing import Any, Dict, List
 
 import pytest
@@ -80,6 +81,8 @@ def _manager(registry: SurfaceRegistry) -> WorkflowManager:
     manager = object.__new__(WorkflowManager)
     manager._surfaces = registry
     manager._catalogue = {}
+    manager._lock = threading.RLock()
+    manager._listing = None
     return manager
 
 
@@ -701,3 +704,128 @@ class TestDeclaredParamResolution:
         )
 
         assert resolved["lead_minutes"] == "half an hour"
+
+
+# --------------------------------------------------------------------- #
+# Listing                                                               #
+# --------------------------------------------------------------------- #
+class TestAListingSharesItsReads:
+    """A gallery listing used to read every authority twice per bundle and
+    ask the tasks surface once per installed workflow. One listing now
+    shares one resolver and one planted-jobs read per destination, and the
+    next listing reuses both until something changes."""
+
+    SLUGS = ("alpha", "beta", "gamma")
+
+    @pytest.fixture()
+    def counts(self, monkeypatch):
+        from unify.workflow_manager import requirements as req_module
+
+        counts = {"connections": 0, "manifests": 0, "bulk": [], "single": 0}
+
+        def connections():
+            counts["connections"] += 1
+            return ["slack"]
+
+        def manifests():
+            counts["manifests"] += 1
+            return {}
+
+        monkeypatch.setattr(
+            req_module.RequirementResolver,
+            "_read_connected_apps",
+            staticmethod(connections),
+        )
+        monkeypatch.setattr(
+            req_module.RequirementResolver,
+            "_read_native_manifests",
+            staticmethod(manifests),
+        )
+        return counts
+
+    @pytest.fixture()
+    def manager(self, counts, monkeypatch):
+        def bulk(*, managed_by, destination):
+            counts["bulk"].append((sorted(managed_by), destination))
+            return {
+                slug: [{"task_id": n, "enabled": True, "entrypoint": None}]
+                for n, slug in enumerate(managed_by)
+            }
+
+        def single(*, managed_by, destination):
+            counts["single"] += 1
+            return []
+
+        registry = SurfaceRegistry()
+        registry.register(
+            "tasks",
+            RecordingSurface(),
+            source_kwarg="source_tasks",
+            source_scoped=True,
+            lister=single,
+            bulk_lister=bulk,
+        )
+        manager = _manager(registry)
+        for slug in self.SLUGS:
+            manager._catalogue[slug] = _bundle(
+                slug=slug,
+                surfaces={"tasks": {}},
+                requirements=(_requirement("gmail"), _requirement("slack")),
+            )
+        installed = {
+            slug: [{"slug": slug, "status": "active", "destination": "personal"}]
+            for slug in ("alpha", "beta")
+        }
+        monkeypatch.setattr(
+            WorkflowManager,
+            "_installations_by_slug",
+            lambda self: installed,
+        )
+        return manager
+
+    def test_one_listing_reads_each_authority_once(self, manager, counts):
+        listing = manager.list_workflows()
+
+        assert counts["connections"] == 1
+        assert counts["manifests"] == 1
+        assert counts["bulk"] == [(["alpha", "beta"], None)]
+        assert counts["single"] == 0
+        by_slug = {entry["slug"]: entry for entry in listing["workflows"]}
+        assert by_slug["alpha"]["status"] == "needs_connection"
+        assert [job["task_id"] for job in by_slug["beta"]["jobs"]] == [1]
+        assert "jobs" not in by_slug["gamma"]
+
+    def test_the_next_listing_reuses_them_until_a_write(self, manager, counts):
+        manager.list_workflows()
+        manager.list_workflows()
+        manager.get_workflow(slug="alpha")
+        assert counts["connections"] == 1
+        assert len(counts["bulk"]) == 1
+
+        manager._arm_workflow_tasks(
+            manager._catalogue["alpha"],
+            destination=None,
+            enabled=False,
+        )
+        manager.list_workflows()
+        assert counts["connections"] == 2
+        assert len(counts["bulk"]) == 2
+
+    def test_a_connect_event_drops_them(self, manager, counts):
+        manager.list_workflows()
+        manager.invalidate_listing()
+        manager.list_workflows()
+        assert counts["connections"] == 2
+
+    def test_they_expire(self, manager, counts, monkeypatch):
+        from unify.workflow_manager import workflow_manager as wm_module
+
+        manager.list_workflows()
+        manager._listing.taken_at -= wm_module.LISTING_TTL_SECONDS + 1
+        manager.list_workflows()
+        assert counts["connections"] == 2
+
+    def test_arming_never_decides_on_a_listed_read(self, manager, counts):
+        manager.list_workflows()
+        manager._unmet_requirements(manager._catalogue["alpha"])
+        assert counts["connections"] == 2
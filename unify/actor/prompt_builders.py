@@ -1444,3 +1444,29 @@ def build_post_probe_prompt(
         volatile
         + "\n\n## Question\n\nDid this call do what the docstring promises for these arguments?",
     )
+
+
+def build_batched_volatile_block(volatiles: Sequence[str]) -> str:
+    """Several calls' volatile blocks, judged together under one stable block.
+
+    Each call keeps its own question; the reply is one verdict per call, in order.
+    """
+    count = len(volatiles)
+    parts = [
+        textwrap.dedent(f"""
+    # {count} calls to judge
+
+    Everything above is shared by the {count} calls below; they differ only in
+    their own sections. Judge each call on its own, exactly as if it were the
+    only one shown: one call's evidence says nothing about another's.
+
+    Respond with one JSON object and nothing else:
+
+    {{"verdicts": [<one verdict object per call, in the order shown>]}}
+
+    Each verdict object has the form given under Output.
+        """).strip(),
+    ]
+    for index, volatile in enumerate(volatiles, start=1):
+        parts.append(f"# Call {index} of {count}\n\n{volatile}".rstrip())
+    return "\n\n".join(parts)
@@ -17,18 +17,33 @@ from __future__ import annotations
 
 import asyncio
 import contextvars
+import hashlib
 import json
 import logging
 import sys
 import time
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from unify.actor.prompt_builders import (
     build_args_review_prompt,
+    build_batched_volatile_block,
     build_call_stable_block,
     build_post_probe_prompt,
     build_precondition_probe_prompt,
@@ -42,6 +57,7 @@ from unify.common.llm_client import (
 from unify.function_manager.types.verification import (
     StaticReviewRecord,
     Verdict,
+    VerdictBatch,
     VerdictKind,
     VerificationRow,
 )
@@ -207,12 +223,15 @@ def _usage_from_completion(completion: Any) -> PassUsage:
     )
 
 
-def _parse_verdict(text: Any) -> Optional[Verdict]:
-    if isinstance(text, Verdict):
+_Reply = TypeVar("_Reply", bound=BaseModel)
+
+
+def _parse_reply(text: Any, model: type[_Reply]) -> Optional[_Reply]:
+    if isinstance(text, model):
         return text
     if isinstance(text, dict):
         try:
-            return Verdict.model_validate(text)
+            return model.model_validate(text)
         except ValidationError:
             return None
     if not isinstance(text, str):
@@ -233,11 +252,251 @@ def _parse_verdict(text: Any) -> Optional[Verdict]:
         except json.JSONDecodeError:
             return None
     try:
-        return Verdict.model_validate(payload)
+        return model.model_validate(payload)
     except ValidationError:
         return None
 
 
+def _parse_verdict(text: Any) -> Optional[Verdict]:
+    return _parse_reply(text, Verdict)
+
+
+# ---------------------------------------------------------------------------
+# Pass scheduling: in-flight dedupe, coalescing, per-run budget
+# ---------------------------------------------------------------------------
+
+BUDGET_EXHAUSTED = "verifier_budget_exhausted"
+
+Judgment = tuple[Verdict, PassUsage]
+
+
+def _budget_verdict() -> Judgment:
+    return Verdict(verdict="UNSURE", reason=BUDGET_EXHAUSTED, fault=None), PassUsage()
+
+
+def _split_usage(usage: PassUsage, count: int) -> List[PassUsage]:
+    """``usage`` shared across ``count`` items; the first takes any remainder."""
+    prompt, prompt_rest = divmod(usage.prompt_tokens, count)
+    completion, completion_rest = divmod(usage.completion_tokens, count)
+    shares = [
+        PassUsage(
+            prompt_tokens=prompt,
+            completion_tokens=completion,
+            cost=usage.cost / count,
+        )
+        for _ in range(count)
+    ]
+    shares[0].prompt_tokens += prompt_rest
+    shares[0].completion_tokens += completion_rest
+    return shares
+
+
+@dataclass
+class _Pending:
+    volatile: str
+    origin: str
+    future: "asyncio.Future[Judgment]"
+
+
+class PassScheduler:
+    """Runs one run's verifier LLM calls: deduplicated, coalesced and budgeted.
+
+    A plan that calls many stored functions launches dozens of passes at once,
+    and many of them are the same question. Identical passes in flight together
+    (same kind, trust hash, arguments and prompt) share one call; each caller
+    still gets the verdict. Passes on the same call site -- same prefix and
+    stable block, different arguments -- that arrive within the coalescing
+    window go out as one multi-item request, falling back to one call each if
+    the reply does not line up. At most ``max_concurrent`` calls are in flight,
+    and once the run has spent ``max_tokens`` further passes are UNSURE
+    without a call.
+
+    ``judge_one`` and ``judge_many`` make the actual requests; the scheduler
+    never talks to a model itself.
+    """
+
+    def __init__(
+        self,
+        *,
+        judge_one: Callable[..., Awaitable[Judgment]],
+        judge_many: Callable[
+            ...,
+            Awaitable[tuple[Optional[List[Verdict]], PassUsage]],
+        ],
+        max_concurrent: int,
+        max_tokens: Optional[int] = None,
+        coalesce_window_s: float = 0.0,
+        max_items: int = 1,
+    ) -> None:
+        self._judge_one = judge_one
+        self._judge_many = judge_many
+        self._max_concurrent = max(1, max_concurrent)
+        self._max_tokens = max_tokens
+        self._window_s = max(0.0, coalesce_window_s)
+        self._max_items = max(1, max_items)
+        self._in_flight: Dict[Hashable, "asyncio.Future[Judgment]"] = {}
+        self._pending: Dict[tuple[str, str], List[_Pending]] = {}
+        self._flushes: set[asyncio.Task] = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.tokens_spent = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return self._max_tokens is not None and self.tokens_spent >= self._max_tokens
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the run's concurrent-call slots."""
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self._max_concurrent)
+            self._slots_loop = loop
+        async with self._slots:
+            yield
+
+    def charge(self, usage: PassUsage) -> None:
+        self.tokens_spent += usage.prompt_tokens + usage.completion_tokens
+
+    async def judge(
+        self,
+        *,
+        prefix: str,
+        stable: str,
+        volatile: str,
+        origin: str,
+        key: Optional[Hashable] = None,
+    ) -> Judgment:
+        """One verdict for one pass; ``key`` names passes that may share a call."""
+        if key is None:
+            return await self._schedule(prefix, stable, volatile, origin)
+        digest = hashlib.sha256(
+            "\0".join((prefix, stable, volatile)).encode(),
+        ).hexdigest()
+        key = (key, digest)
+        leader = self._in_flight.get(key)
+        if leader is not None:
+            try:
+                verdict, _ = await asyncio.shield(leader)
+                return verdict, PassUsage()
+            except asyncio.CancelledError:
+                if not leader.cancelled():
+                    raise
+            # The pass we were waiting on was cancelled; ask on our own.
+            return await self._schedule(prefix, stable, volatile, origin)
+        future: "asyncio.Future[Judgment]" = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            outcome = await self._schedule(prefix, stable, volatile, origin)
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(outcome)
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+        return outcome
+
+    async def _schedule(
+        self,
+        prefix: str,
+        stable: str,
+        volatile: str,
+        origin: str,
+    ) -> Judgment:
+        if self.exhausted:
+            return _budget_verdict()
+        loop = asyncio.get_running_loop()
+        item = _Pending(volatile=volatile, origin=origin, future=loop.create_future())
+        if self._max_items == 1:
+            await self._dispatch(prefix, stable, [item])
+            return item.future.result()
+        group = (prefix, stable)
+        pending = self._pending.get(group)
+        if pending is None:
+            pending = self._pending[group] = []
+            flush = loop.create_task(self._flush(group))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+        pending.append(item)
+        return await item.future
+
+    async def _flush(self, group: tuple[str, str]) -> None:
+        if self._window_s:
+            await asyncio.sleep(self._window_s)
+        items = self._pending.pop(group, [])
+        chunks = [
+            items[start : start + self._max_items]
+            for start in range(0, len(items), self._max_items)
+        ]
+        await asyncio.gather(
+            *(self._dispatch(group[0], group[1], chunk) for chunk in chunks),
+        )
+
+    async def _dispatch(self, prefix: str, stable: str, items: List[_Pending]) -> None:
+        live = [item for item in items if not item.future.done()]
+        try:
+            outcomes = None
+            if len(live) > 1:
+                outcomes = await self._call_many(prefix, stable, live)
+            if outcomes is None:
+                outcomes = await asyncio.gather(
+                    *(self._call_one(prefix, stable, item) for item in live),
+                )
+        except Exception as exc:
+            for item in live:
+                if not item.future.done():
+                    item.future.set_exception(exc)
+            return
+        for item, outcome in zip(live, outcomes):
+            if not item.future.done():
+                item.future.set_result(outcome)
+
+    async def _call_one(self, prefix: str, stable: str, item: _Pending) -> Judgment:
+        if self.exhausted:
+            return _budget_verdict()
+        async with self.slot():
+            verdict, usage = await self._judge_one(
+                prefix=prefix,
+                stable=stable,
+                volatile=item.volatile,
+                origin=item.origin,
+            )
+        self.charge(usage)
+        return verdict, usage
+
+    async def _call_many(
+        self,
+        prefix: str,
+        stable: str,
+        items: List[_Pending],
+    ) -> Optional[List[Judgment]]:
+        if self.exhausted:
+            return [_budget_verdict() for _ in items]
+        async with self.slot():
+            verdicts, usage = await self._judge_many(
+                prefix=prefix,
+                stable=stable,
+                volatiles=[item.volatile for item in items],
+                origin=items[0].origin,
+            )
+        self.charge(usage)
+        shares = _split_usage(usage, len(items))
+        if verdicts is not None:
+            return list(zip(verdicts, shares))
+        # The combined reply did not line up: ask each item on its own, and
+        # bill the wasted request to them alike.
+        outcomes = await asyncio.gather(
+            *(self._call_one(prefix, stable, item) for item in items),
+        )
+        for (_, usage), share in zip(outcomes, shares):
+            usage.prompt_tokens += share.prompt_tokens
+            usage.completion_tokens += share.completion_tokens
+            usage.cost += share.cost
+        return list(outcomes)
+
+
 class VerifierPasses:
     """The four verifier passes for one run, sharing goal, guidance and settings."""
 
@@ -250,6 +509,7 @@ class VerifierPasses:
         run_key: Optional[str] = None,
         task_id: Optional[int] = None,
         model: Optional[str] = None,
+        client_factory: Optional[Callable[[str], Any]] = None,
     ) -> None:
         self.fm = function_manager
         self.gm = guidance_manager
@@ -261,6 +521,15 @@ class VerifierPasses:
         self._hash_cache: Dict[int, str] = {}
         self._guidance_cache: Dict[int, Optional[Dict[str, Any]]] = {}
         self._row_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._client_factory = client_factory
+        self.scheduler = PassScheduler(
+            judge_one=self._judge_one,
+            judge_many=self._judge_many,
+            max_concurrent=self.settings.max_concurrent_passes,
+            max_tokens=self.settings.max_pass_tokens_per_run,
+            coalesce_window_s=self.settings.coalesce_window_ms / 1000,
+            max_items=self.settings.max_coalesced_items,
+        )
 
     # ---- shared helpers -------------------------------------------------
 
@@ -342,8 +611,22 @@ class VerifierPasses:
         )
 
     def _client(self, origin: str):
+        if self._client_factory is not None:
+            return self._client_factory(origin)
         return new_llm_client(self.model, purpose="verification", origin=origin)
 
+    def _pass_key(
+        self,
+        kind: VerdictKind,
+        row: Mapping[str, Any],
+        kwargs: Optional[Mapping[str, Any]],
+    ) -> Hashable:
+        return (
+            kind.value,
+            self.trust_hash(row),
+            args_signature(kwargs) if kwargs is not None else None,
+        )
+
     async def _judge(
         self,
         *,
@@ -351,6 +634,24 @@ class VerifierPasses:
         stable: str,
         volatile: str,
         origin: str,
+        key: Optional[Hashable] = None,
+    ) -> tuple[Verdict, PassUsage]:
+        """One verdict, scheduled alongside the run's other passes."""
+        return await self.scheduler.judge(
+            prefix=prefix,
+            stable=stable,
+            volatile=volatile,
+            origin=origin,
+            key=key,
+        )
+
+    async def _judge_one(
+        self,
+        *,
+        prefix: str,
+        stable: str,
+        volatile: str,
+        origin: str,
     ) -> tuple[Verdict, PassUsage]:
         """One structured verdict; JSON parse failure retries once, transport failure is UNSURE."""
         client = self._client(origin)
@@ -403,6 +704,41 @@ class VerifierPasses:
             usage,
         )
 
+    async def _judge_many(
+        self,
+        *,
+        prefix: str,
+        stable: str,
+        volatiles: Sequence[str],
+        origin: str,
+    ) -> tuple[Optional[List[Verdict]], PassUsage]:
+        """Verdicts for several calls in one request; ``None`` unless one per call came back."""
+        client = self._client(origin)
+        client.set_system_message(prefix)
+        message = f"{stable}\n\n{build_batched_volatile_block(volatiles)}"
+        try:
+            completion = await client.generate(
+                messages=[{"role": "user", "content": message}],
+                return_full_completion=True,
+                response_format=pydantic_to_json_schema_response_format(VerdictBatch),
+            )
+        except Exception as exc:
+            logger.warning(
+                "Verifier batch %s failed to reach the model: %s",
+                origin,
+                exc,
+            )
+            return None, PassUsage()
+        usage = _usage_from_completion(completion)
+        try:
+            content = completion.choices[0].message.content
+        except (AttributeError, IndexError):
+            content = str(completion)
+        batch = _parse_reply(content, VerdictBatch)
+        if batch is None or len(batch.verdicts) != len(volatiles):
+            return None, usage
+        return batch.verdicts, usage
+
     def _record(
         self,
         row: Mapping[str, Any],
@@ -456,6 +792,7 @@ class VerifierPasses:
             stable=stable,
             volatile="",
             origin=f"Verifier.static({row.get('name')})",
+            key=self._pass_key(VerdictKind.static, row, None),
         )
         if verdict.verdict == "FAIL":
             verdict = Verdict(verdict="FAIL", reason=verdict.reason, fault="leaf")
@@ -503,6 +840,7 @@ class VerifierPasses:
             stable=stable,
             volatile=volatile,
             origin=f"Verifier.args({row.get('name')})",
+            key=self._pass_key(VerdictKind.args, row, kwargs),
         )
         self._record(
             row,
@@ -533,13 +871,44 @@ class VerifierPasses:
             sibling_results=sibling_results,
         )
         started = time.perf_counter()
+        usage = PassUsage()
+        if self.scheduler.exhausted:
+            verdict, usage = _budget_verdict()
+        else:
+            # A tool loop rather than one request, so it is never coalesced,
+            # but it still takes one of the run's concurrent-call slots.
+            async with self.scheduler.slot():
+                verdict = await self._probe_precondition(
+                    row,
+                    prefix=prefix,
+                    message=f"{stable}\n\n{volatile}",
+                    max_steps=max_steps,
+                )
+        self._record(
+            row,
+            kind=VerdictKind.precondition,
+            verdict=verdict,
+            call_site=call_site,
+            kwargs=kwargs,
+            usage=usage,
+            wall_ms=int((time.perf_counter() - started) * 1000),
+        )
+        return verdict
+
+    async def _probe_precondition(
+        self,
+        row: Mapping[str, Any],
+        *,
+        prefix: str,
+        message: str,
+        max_steps: int,
+    ) -> Verdict:
         client = self._client(f"Verifier.precondition({row.get('name')})")
         client.set_system_message(prefix)
-        usage = PassUsage()
         try:
             handle = start_async_tool_loop(
                 client=client,
-                message=f"{stable}\n\n{volatile}",
+                message=message,
                 tools={"run_probe": run_probe},
                 loop_id=f"VerifierPrecondition({row.get('name')})",
                 max_consecutive_failures=1,
@@ -558,15 +927,6 @@ class VerifierPasses:
         except Exception as exc:
             logger.warning("Precondition probe for %s failed: %s", row.get("name"), exc)
             verdict = Verdict(verdict="UNSURE", reason="llm_error", fault=None)
-        self._record(
-            row,
-            kind=VerdictKind.precondition,
-            verdict=verdict,
-            call_site=call_site,
-            kwargs=kwargs,
-            usage=usage,
-            wall_ms=int((time.perf_counter() - started) * 1000),
-        )
         return verdict
 
     async def post_probe(
@@ -598,6 +958,7 @@ class VerifierPasses:
             stable=stable,
             volatile=volatile,
             origin=f"Verifier.post({row.get('name')})",
+            key=self._pass_key(kind, row, kwargs),
         )
         self._record(
             row,
@@ -612,8 +973,10 @@ class VerifierPasses:
 
 
 __all__ = [
+    "BUDGET_EXHAUSTED",
     "CallSite",
     "Frame",
+    "PassScheduler",
     "PassUsage",
     "VerifierPasses",
     "current_verification_frames",
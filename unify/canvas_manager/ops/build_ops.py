@@ -16,23 +16,42 @@ Three gates run in order, cheapest first, and any of them blocks publication:
 The emitted module is content-addressed by SHA-256 of its bytes. Console
 verifies that hash before handing the code to the frame, which is a stronger
 integrity guarantee than subresource integrity because we enforce it ourselves.
+
+What typecheck and bundle made of a source is cached by the source, the kit
+version and the toolchain it was built with, in memory and under the
+toolchain's ``.builds`` directory. Typecheck and bundle are pure functions of
+those three, so an unchanged canvas -- a reinstalled workflow, an update that
+only touched metadata -- never compiles twice. A cache miss goes to one
+long-lived node process (``canvas_build_worker.mjs``) that keeps the kit's
+declarations parsed and esbuild's context open between builds; only when that
+process cannot run does a build spawn ``tsc`` and ``esbuild`` afresh.
 """
 
 from __future__ import annotations
 
+import atexit
 import functools
 import hashlib
 import json
+import logging
+import os
+import queue
 import re
+import shutil
 import subprocess
 import tempfile
+import threading
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from unify.canvas_manager.settings import CanvasSettings
 from unify.canvas_manager.types.view import BuildReport
 
+logger = logging.getLogger(__name__)
+
 # Specifiers every environment can rely on. The full allowlist is the
 # toolchain's canvas-externals.json — emitted from the same specifier list
 # that drives the runtime host's import map, so the authoring gate and the
@@ -261,45 +280,308 @@ def _toolchain_root() -> Optional[Path]:
     return None
 
 
-def build_canvas(tsx: str, *, kit_version: str = "") -> Tuple[BuildReport, str]:
-    """Lint, typecheck and bundle one canvas.
+# Typecheck against the kit's declarations. `noEmit` is the whole point:
+# esbuild will not catch a misused component prop. Shared by the one-shot
+# tsconfig and the build worker, so both check a canvas identically.
+_COMPILER_OPTIONS: Dict[str, object] = {
+    "target": "ES2020",
+    "lib": ["ES2020", "DOM", "DOM.Iterable"],
+    "module": "ESNext",
+    "moduleResolution": "bundler",
+    "jsx": "react-jsx",
+    "strict": True,
+    "skipLibCheck": True,
+    "noEmit": True,
+    "esModuleInterop": True,
+    # Nothing is auto-included as a global; the canvas gets exactly the types
+    # it imports.
+    "types": [],
+}
+
+# Compiler output beyond this many lines is noise the author cannot act on
+# before fixing the first errors.
+_MAX_DIAGNOSTICS = 40
+
+_BUILD_TIMEOUT_S = 120
+
+# Part of every cache key. Bump it when a change here alters what a build of
+# the same source produces, so outcomes cached by the old code are not served.
+_BUILD_FORMAT = "1"
+
+# Files whose bytes define "the toolchain" for the cache: the pinned compiler
+# and bundler, the kit's declarations, and the lint's import and class lists.
+_TOOLCHAIN_FILES = (
+    "package.json",
+    "node_modules/typescript/package.json",
+    "node_modules/esbuild/package.json",
+    "node_modules/@unity/canvas-kit/package.json",
+    "node_modules/@unity/canvas-kit/index.d.ts",
+    "canvas-externals.json",
+    "classes.json",
+)
 
-    Returns the report and the compiled module text, which is empty whenever the
-    report is not ``ok``.
+_WORKER_SCRIPT = Path(__file__).with_name("canvas_build_worker.mjs")
+
+
+@dataclass(frozen=True)
+class _Compiled:
+    """What typecheck and bundle made of one source.
+
+    Either the stage that failed with its diagnostics, or the bundled module.
+    The size ceiling is not part of it: that is a setting, checked on every
+    build, so raising it never serves a stale refusal.
     """
-    started = time.monotonic()
 
-    # Checked before lint: without a toolchain the allowlist and the class
-    # manifest degrade to floors, and a vocabulary import would be rejected
-    # with a misleading lint message instead of the real, actionable problem.
-    root = _toolchain_root()
-    if root is None:
-        return (
-            BuildReport(
-                ok=False,
-                failed_stage="bundle",
-                diagnostics=[
-                    "Canvas toolchain is unavailable in this environment. "
-                    "Expected a node workspace with esbuild, typescript and "
-                    "@unity/canvas-kit installed.",
-                ],
-                duration_ms=int((time.monotonic() - started) * 1000),
-            ),
-            "",
-        )
+    failed_stage: Optional[str]
+    diagnostics: Tuple[str, ...] = ()
+    code: str = ""
 
-    problems = lint_source(tsx)
-    if problems:
-        return (
-            BuildReport(
-                ok=False,
-                failed_stage="lint",
-                diagnostics=problems,
-                duration_ms=int((time.monotonic() - started) * 1000),
-            ),
-            "",
+
+def _toolchain_fingerprint(root: Path) -> str:
+    """Digest of the toolchain files a build's outcome depends on.
+
+    Stats the files on every call and only rereads them when one changed, so
+    a toolchain updated under a running process is seen on its next build.
+    """
+    stats = []
+    for relative in _TOOLCHAIN_FILES:
+        try:
+            stat = (root / relative).stat()
+        except OSError:
+            stats.append(None)
+            continue
+        stats.append((stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns))
+    return _fingerprint_files(root, tuple(stats))
+
+
+@functools.lru_cache(maxsize=4)
+def _fingerprint_files(root: Path, stats: Tuple[Any, ...]) -> str:
+    # Keyed on ``stats`` so a changed file misses; they are not hashed.
+    digest = hashlib.sha256(_BUILD_FORMAT.encode())
+    for relative in _TOOLCHAIN_FILES:
+        path = root / relative
+        digest.update(relative.encode())
+        digest.update(path.read_bytes() if path.is_file() else b"\0")
+    return digest.hexdigest()
+
+
+def _cache_key(tsx: str, kit_version: str, root: Path) -> str:
+    source_sha = hashlib.sha256(tsx.encode("utf8")).hexdigest()
+    material = "\n".join((source_sha, kit_version, _toolchain_fingerprint(root)))
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class _BuildCache:
+    """Compiled outcomes by cache key: an LRU in memory, a file per key on disk.
+
+    The disk copy lives under the toolchain's ``.builds`` directory, so it
+    outlives the process and is shared by every process building against the
+    same toolchain. Each file is written whole and renamed into place; one that
+    cannot be read is a miss, never an error.
+    """
+
+    def __init__(self, *, memory_entries: int = 128, disk_entries: int = 2048):
+        self._memory_entries = memory_entries
+        self._disk_entries = disk_entries
+        self._entries: "OrderedDict[str, _Compiled]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _directory(root: Path) -> Path:
+        return root / ".builds" / "cache"
+
+    def get(self, key: str, root: Path) -> Optional[_Compiled]:
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                return compiled
+        try:
+            stored = json.loads(
+                (self._directory(root) / f"{key}.json").read_text(encoding="utf8"),
+            )
+            compiled = _Compiled(
+                failed_stage=stored["failed_stage"],
+                diagnostics=tuple(stored["diagnostics"]),
+                code=stored["code"],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        self._remember(key, compiled)
+        return compiled
+
+    def put(self, key: str, root: Path, compiled: _Compiled) -> None:
+        self._remember(key, compiled)
+        directory = self._directory(root)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            staging = directory / f".{key}.{os.getpid()}.{threading.get_ident()}"
+            staging.write_text(
+                json.dumps(
+                    {
+                        "failed_stage": compiled.failed_stage,
+                        "diagnostics": list(compiled.diagnostics),
+                        "code": compiled.code,
+                    },
+                ),
+                encoding="utf8",
+            )
+            os.replace(staging, directory / f"{key}.json")
+            self._prune(directory)
+        except OSError:
+            logger.debug("Could not store a canvas build outcome", exc_info=True)
+
+    def _prune(self, directory: Path) -> None:
+        stored = list(directory.glob("*.json"))
+        if len(stored) <= self._disk_entries:
+            return
+        stored.sort(key=lambda path: path.stat().st_mtime)
+        for path in stored[: len(stored) - self._disk_entries]:
+            path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, compiled: _Compiled) -> None:
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._memory_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_build_cache = _BuildCache()
+
+
+class _BuildWorker:
+    """One node process compiling canvases with a warm typechecker and bundler.
+
+    Requests are serialised by the caller, so a reply is always the answer to
+    the request just written. A worker that times out, exits or answers with an
+    error is closed, never reused: its state is unknown.
+    """
+
+    def __init__(self, root: Path, fingerprint: str, node: str) -> None:
+        self.root = root
+        self.fingerprint = fingerprint
+        # A forked child inherits this object but not the pipes' other ends.
+        self.pid = os.getpid()
+        self._work = root / ".builds" / f"worker-{self.pid}"
+        config = {
+            "compilerOptions": _COMPILER_OPTIONS,
+            "externals": sorted(allowed_imports()),
+        }
+        self._process = subprocess.Popen(  # noqa: S603 - fixed argv, no shell
+            [node, str(_WORKER_SCRIPT), str(root), str(self._work), json.dumps(config)],
+            cwd=str(root),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf8",
+        )
+        self._replies: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._next_id = 0
+        threading.Thread(
+            target=self._read,
+            name="canvas-build-worker",
+            daemon=True,
+        ).start()
+
+    def _read(self) -> None:
+        for line in self._process.stdout:
+            self._replies.put(line)
+        self._replies.put(None)
+
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def compile(self, tsx: str, *, timeout: float) -> _Compiled:
+        self._next_id += 1
+        self._process.stdin.write(json.dumps({"id": self._next_id, "tsx": tsx}) + "\n")
+        self._process.stdin.flush()
+        try:
+            line = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"canvas build worker gave no answer in {timeout}s")
+        if line is None:
+            raise RuntimeError("canvas build worker exited")
+        reply = json.loads(line)
+        if reply.get("error") or reply.get("id") != self._next_id:
+            raise RuntimeError(reply.get("error") or "canvas build worker lost a reply")
+        return _Compiled(
+            failed_stage=reply.get("failed_stage"),
+            diagnostics=tuple(reply.get("diagnostics") or ()),
+            code=reply.get("code") or "",
         )
 
+    def close(self) -> None:
+        if self.alive():
+            self._process.kill()
+        self._process.wait()
+        shutil.rmtree(self._work, ignore_errors=True)
+
+
+_worker: Optional[_BuildWorker] = None
+_worker_lock = threading.Lock()
+
+
+def _warm_worker(root: Path, fingerprint: str, node: str) -> _BuildWorker:
+    """The running worker for this toolchain, started if need be.
+
+    Call with ``_worker_lock`` held. A worker built against a toolchain that has
+    since changed is replaced, because its language service caches declarations
+    for the life of the process.
+    """
+    global _worker
+    if _worker is not None and _worker.pid != os.getpid():
+        _worker = None
+    if _worker is not None and (
+        not _worker.alive()
+        or _worker.root != root
+        or _worker.fingerprint != fingerprint
+    ):
+        _worker.close()
+        _worker = None
+    if _worker is None:
+        _worker = _BuildWorker(root, fingerprint, node)
+    return _worker
+
+
+def _stop_worker() -> None:
+    global _worker
+    with _worker_lock:
+        if _worker is not None and _worker.pid == os.getpid():
+            _worker.close()
+        _worker = None
+
+
+atexit.register(_stop_worker)
+
+
+def _compile(tsx: str, root: Path) -> _Compiled:
+    """Typecheck and bundle one source: warm when possible, cold otherwise."""
+    node = shutil.which("node")
+    if CanvasSettings().BUILD_WORKER and node and _WORKER_SCRIPT.is_file():
+        with _worker_lock:
+            try:
+                worker = _warm_worker(root, _toolchain_fingerprint(root), node)
+                return worker.compile(tsx, timeout=_BUILD_TIMEOUT_S)
+            except Exception:
+                logger.warning(
+                    "Canvas build worker failed; compiling this canvas cold",
+                    exc_info=True,
+                )
+                global _worker
+                if _worker is not None:
+                    _worker.close()
+                    _worker = None
+    return _compile_cold(tsx, root)
+
+
+def _compile_cold(tsx: str, root: Path) -> _Compiled:
+    """Typecheck and bundle in a fresh temp directory with one-shot processes."""
     # Built inside the toolchain so ordinary node resolution walks up into its
     # node_modules. Path mapping would also work but silently resolves nothing
     # when the toolchain layout changes, which surfaces as a confusing
@@ -312,23 +594,8 @@ def build_canvas(tsx: str, *, kit_version: str = "") -> Tuple[BuildReport, str]:
         entry = work / "canvas.tsx"
         entry.write_text(tsx, encoding="utf8")
 
-        # Typecheck against the kit's declarations. `--noEmit` is the whole
-        # point: esbuild will not catch a misused component prop.
         tsconfig = {
-            "compilerOptions": {
-                "target": "ES2020",
-                "lib": ["ES2020", "DOM", "DOM.Iterable"],
-                "module": "ESNext",
-                "moduleResolution": "bundler",
-                "jsx": "react-jsx",
-                "strict": True,
-                "skipLibCheck": True,
-                "noEmit": True,
-                "esModuleInterop": True,
-                # Nothing is auto-included as a global; the canvas gets exactly
-                # the types it imports.
-                "types": [],
-            },
+            "compilerOptions": _COMPILER_OPTIONS,
             "include": [str(entry)],
         }
         (work / "tsconfig.json").write_text(json.dumps(tsconfig), encoding="utf8")
@@ -341,33 +608,20 @@ def build_canvas(tsx: str, *, kit_version: str = "") -> Tuple[BuildReport, str]:
         # author cannot act on.
         tsc = root / "node_modules" / ".bin" / "tsc"
         if tsc.exists():
-            code, output = _run([str(tsc), "-p", str(work / "tsconfig.json")], cwd=work)
+            code, output = _run(
+                [str(tsc), "-p", str(work / "tsconfig.json")],
+                cwd=work,
+                timeout=_BUILD_TIMEOUT_S,
+            )
             if code != 0:
-                return (
-                    BuildReport(
-                        ok=False,
-                        failed_stage="typecheck",
-                        kit_version=kit_version,
-                        diagnostics=[
-                            line for line in output.splitlines() if line.strip()
-                        ][:40],
-                        duration_ms=int((time.monotonic() - started) * 1000),
+                return _Compiled(
+                    failed_stage="typecheck",
+                    diagnostics=tuple(
+                        line for line in output.splitlines() if line.strip()
                     ),
-                    "",
                 )
 
         esbuild = root / "node_modules" / ".bin" / "esbuild"
-        if not esbuild.exists():
-            return (
-                BuildReport(
-                    ok=False,
-                    failed_stage="bundle",
-                    diagnostics=["esbuild is not present in the canvas toolchain."],
-                    duration_ms=int((time.monotonic() - started) * 1000),
-                ),
-                "",
-            )
-
         out = work / "canvas.mjs"
         command = [
             str(esbuild),
@@ -381,23 +635,87 @@ def build_canvas(tsx: str, *, kit_version: str = "") -> Tuple[BuildReport, str]:
         ]
         command += [f"--external:{name}" for name in sorted(allowed_imports())]
 
-        code, output = _run(command, cwd=work)
+        code, output = _run(command, cwd=work, timeout=_BUILD_TIMEOUT_S)
         if code != 0:
-            return (
-                BuildReport(
-                    ok=False,
-                    failed_stage="bundle",
-                    kit_version=kit_version,
-                    diagnostics=[line for line in output.splitlines() if line.strip()][
-                        :40
-                    ],
-                    duration_ms=int((time.monotonic() - started) * 1000),
-                ),
-                "",
+            return _Compiled(
+                failed_stage="bundle",
+                diagnostics=tuple(line for line in output.splitlines() if line.strip()),
             )
 
-        code_text = out.read_text(encoding="utf8")
+        return _Compiled(failed_stage=None, code=out.read_text(encoding="utf8"))
+
+
+def build_canvas(tsx: str, *, kit_version: str = "") -> Tuple[BuildReport, str]:
+    """Lint, typecheck and bundle one canvas.
+
+    Returns the report and the compiled module text, which is empty whenever the
+    report is not ``ok``.
+    """
+    started = time.monotonic()
+
+    # Checked before lint: without a toolchain the allowlist and the class
+    # manifest degrade to floors, and a vocabulary import would be rejected
+    # with a misleading lint message instead of the real, actionable problem.
+    root = _toolchain_root()
+    if root is None:
+        return (
+            BuildReport(
+                ok=False,
+                failed_stage="bundle",
+                diagnostics=[
+                    "Canvas toolchain is unavailable in this environment. "
+                    "Expected a node workspace with esbuild, typescript and "
+                    "@unity/canvas-kit installed.",
+                ],
+                duration_ms=int((time.monotonic() - started) * 1000),
+            ),
+            "",
+        )
+
+    problems = lint_source(tsx)
+    if problems:
+        return (
+            BuildReport(
+                ok=False,
+                failed_stage="lint",
+                diagnostics=problems,
+                duration_ms=int((time.monotonic() - started) * 1000),
+            ),
+            "",
+        )
+
+    if not (root / "node_modules" / ".bin" / "esbuild").exists():
+        return (
+            BuildReport(
+                ok=False,
+                failed_stage="bundle",
+                diagnostics=["esbuild is not present in the canvas toolchain."],
+                duration_ms=int((time.monotonic() - started) * 1000),
+            ),
+            "",
+        )
+
+    # Only outcomes of the compile itself are cached; an exception (a timeout,
+    # a toolchain that vanished mid-build) propagates and stores nothing.
+    key = _cache_key(tsx, kit_version, root)
+    compiled = _build_cache.get(key, root)
+    if compiled is None:
+        compiled = _compile(tsx, root)
+        _build_cache.put(key, root, compiled)
+
+    if compiled.failed_stage is not None:
+        return (
+            BuildReport(
+                ok=False,
+                failed_stage=compiled.failed_stage,
+                kit_version=kit_version,
+                diagnostics=list(compiled.diagnostics[:_MAX_DIAGNOSTICS]),
+                duration_ms=int((time.monotonic() - started) * 1000),
+            ),
+            "",
+        )
 
+    code_text = compiled.code
     encoded = code_text.encode("utf8")
     ceiling = CanvasSettings().MAX_BUNDLE_BYTES
     if len(encoded) > ceiling:
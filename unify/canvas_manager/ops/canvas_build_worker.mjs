@@ -0,0 +1,140 @@
+// Long-lived canvas compiler, driven by build_ops over stdin/stdout.
+//
+// A one-shot build pays node startup, a cold read of the kit and React
+// declarations, and esbuild's startup on every canvas. This process pays them
+// once: a TypeScript language service keeps the declarations parsed between
+// builds, and an esbuild context rebuilds the one entry file incrementally.
+//
+// Usage: node canvas_build_worker.mjs <toolchain root> <work dir> <config json>
+//
+// The config carries the same compilerOptions build_ops writes to tsconfig.json
+// for a one-shot build, and the externals list, so both paths compile a canvas
+// identically. Requests are one JSON object per line, `{id, tsx}`; each reply is
+// one line, `{id, failed_stage, diagnostics, code}` or `{id, error}`.
+
+import { mkdirSync, writeFileSync } from "node:fs";
+import { createRequire } from "node:module";
+import path from "node:path";
+import readline from "node:readline";
+
+const [root, workDir, rawConfig] = process.argv.slice(2);
+const config = JSON.parse(rawConfig);
+
+// Resolved from the toolchain, not from this file: the toolchain pins the
+// versions a canvas is checked and bundled with.
+const require = createRequire(path.join(root, "package.json"));
+const esbuild = require("esbuild");
+let ts = null;
+try {
+  ts = require("typescript");
+} catch {
+  // Matches the one-shot path, which skips the typecheck without a tsc.
+}
+
+mkdirSync(workDir, { recursive: true });
+// A fixed entry name in the work dir: esbuild writes the cwd-relative entry
+// path into its output, so this keeps a canvas's bytes -- and its sha -- the
+// same as a one-shot build of the same source.
+const ENTRY_NAME = "canvas.tsx";
+const entry = path.join(workDir, ENTRY_NAME);
+writeFileSync(entry, "");
+
+let source = "";
+let version = 0;
+
+function createService() {
+  const { options, errors } = ts.convertCompilerOptionsFromJson(
+    config.compilerOptions,
+    workDir,
+  );
+  if (errors.length) {
+    throw new Error(ts.flattenDiagnosticMessageText(errors[0].messageText, "\n"));
+  }
+  const host = {
+    getScriptFileNames: () => [entry],
+    // Everything but the canvas is the toolchain's and does not change while
+    // this process lives; build_ops restarts it when the toolchain does.
+    getScriptVersion: (file) => (file === entry ? String(version) : "0"),
+    getScriptSnapshot: (file) => {
+      const text = file === entry ? source : ts.sys.readFile(file);
+      return text === undefined ? undefined : ts.ScriptSnapshot.fromString(text);
+    },
+    getCurrentDirectory: () => workDir,
+    getCompilationSettings: () => options,
+    getDefaultLibFileName: (opts) => ts.getDefaultLibFilePath(opts),
+    fileExists: (file) => file === entry || ts.sys.fileExists(file),
+    readFile: (file) => (file === entry ? source : ts.sys.readFile(file)),
+    readDirectory: ts.sys.readDirectory,
+    directoryExists: ts.sys.directoryExists,
+    getDirectories: ts.sys.getDirectories,
+  };
+  return ts.createLanguageService(host, ts.createDocumentRegistry());
+}
+
+const service = ts ? createService() : null;
+const formatHost = {
+  getCanonicalFileName: (file) => file,
+  getCurrentDirectory: () => workDir,
+  getNewLine: () => "\n",
+};
+
+const context = await esbuild.context({
+  entryPoints: [ENTRY_NAME],
+  absWorkingDir: workDir,
+  bundle: true,
+  format: "esm",
+  target: "es2020",
+  jsx: "automatic",
+  platform: "browser",
+  outfile: path.join(workDir, "canvas.mjs"),
+  external: config.externals,
+  write: false,
+  logLevel: "silent",
+});
+
+function lines(text) {
+  return text.split("\n").filter((line) => line.trim());
+}
+
+async function build(tsx) {
+  source = tsx;
+  version += 1;
+
+  if (service) {
+    const diagnostics = [
+      ...service.getCompilerOptionsDiagnostics(),
+      ...service.getSyntacticDiagnostics(entry),
+      ...service.getSemanticDiagnostics(entry),
+    ];
+    if (diagnostics.length) {
+      return {
+        failed_stage: "typecheck",
+        diagnostics: lines(ts.formatDiagnostics(diagnostics, formatHost)),
+      };
+    }
+  }
+
+  writeFileSync(entry, tsx);
+  try {
+    const result = await context.rebuild();
+    return { failed_stage: null, diagnostics: [], code: result.outputFiles[0].text };
+  } catch (error) {
+    const messages = error.errors?.length
+      ? await esbuild.formatMessages(error.errors, { kind: "error", color: false })
+      : [String(error)];
+    return { failed_stage: "bundle", diagnostics: lines(messages.join("\n")) };
+  }
+}
+
+for await (const line of readline.createInterface({ input: process.stdin })) {
+  if (!line.trim()) continue;
+  const request = JSON.parse(line);
+  let reply;
+  try {
+    reply = await build(request.tsx);
+  } catch (error) {
+    reply = { error: String(error?.stack || error) };
+  }
+  process.stdout.write(JSON.stringify({ id: request.id, ...reply }) + "\n");
+}
+await context.dispose();
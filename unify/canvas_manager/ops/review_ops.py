@@ -24,20 +24,36 @@ The harness plays the parent's role only as far as the render needs: it answers
 binding aliases from the dry-run rows the author-time validation already
 produced, and switches theme. Action dispatch is absent, because that is an
 integration concern with no server here to dispatch to.
+
+## Why the runtime outlives a review
+
+Launching chromium and generating the host headers cost more than rendering a
+canvas, and a workflow install can plant several canvases at once. So the two
+origins are started once per process, and a small pool of threads each keep a
+browser warm between reviews. What varies per review is only the harness page,
+which the parent origin serves under a path of its own -- concurrent reviews
+share both servers without seeing each other. Each render still gets a fresh
+browser context, so nothing one canvas leaves behind is visible to the next,
+and a browser is relaunched after a bounded number of renders or as soon as it
+disconnects.
 """
 
 from __future__ import annotations
 
+import atexit
 import http.server
 import json
 import logging
+import queue
 import shutil
 import socketserver
 import subprocess
 import tempfile
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -66,6 +82,14 @@ _HOST_DOCUMENTS = ("host/v1/index.html",)
 # that a canvas whose effect loops on mount fails rather than hangs.
 _RENDER_TIMEOUT_MS = 30_000
 
+# How long a review waits for its render, queueing behind others included.
+# Each step of a render is bounded by _RENDER_TIMEOUT_MS; this bounds a
+# caller against a runtime that has stopped taking work at all.
+_REVIEW_WAIT_TIMEOUT_S = 600.0
+
+# Times a review is queued again after the runtime it waited on was replaced.
+_REQUEUE_ATTEMPTS = 3
+
 
 def _host_root() -> Optional[Path]:
     """Locate the vendored runtime host, or None when this environment has none."""
@@ -163,9 +187,10 @@ class _OriginConfig:
     """
 
     headers: Dict[str, str] = field(default_factory=dict)
-    # Served for `/` in place of a file on disk, so the parent harness page needs
-    # no temp directory of its own.
-    index_body: Optional[bytes] = None
+    # Served in place of files on disk, by request path, so each review's
+    # harness page needs no temp directory and concurrent reviews sharing one
+    # origin each get their own.
+    pages: Dict[str, bytes] = field(default_factory=dict)
 
 
 def _serve(
@@ -186,12 +211,13 @@ def _serve(
             super().end_headers()
 
         def do_GET(self) -> None:  # noqa: N802 - stdlib naming
-            if config.index_body is not None and self.path in ("/", "/index.html"):
+            body = config.pages.get(self.path)
+            if body is not None:
                 self.send_response(200)
                 self.send_header("Content-Type", "text/html; charset=utf-8")
-                self.send_header("Content-Length", str(len(config.index_body)))
+                self.send_header("Content-Length", str(len(body)))
                 self.end_headers()
-                self.wfile.write(config.index_body)
+                self.wfile.write(body)
                 return
             super().do_GET()
 
@@ -320,9 +346,74 @@ def _wait_for_theme(page: Any, child: Any, *, dark: bool) -> None:
         page.wait_for_timeout(50)
 
 
-def _render(
+class _Origins:
+    """The two static origins every review in this process renders against.
+
+    Two genuinely different origins: different hostname as well as different
+    port, so the frame is cross-origin exactly as it is in production. Started
+    once, because the host headers are generated by a node script naming both
+    origins, and that run costs as much as a render.
+    """
+
+    def __init__(self, host: Path) -> None:
+        self._host_config = _OriginConfig()
+        self._parent_config = _OriginConfig()
+        self._servers: List[socketserver.TCPServer] = []
+        try:
+            self._host_server, host_port = _serve(
+                directory=host,
+                config=self._host_config,
+                bind="127.0.0.1",
+            )
+            self._servers.append(self._host_server)
+            self._parent_server, parent_port = _serve(
+                directory=host,
+                config=self._parent_config,
+                bind="127.0.0.1",
+            )
+            self._servers.append(self._parent_server)
+            self.host_origin = f"http://127.0.0.1:{host_port}"
+            self.parent_origin = f"http://localhost:{parent_port}"
+            self.host_document = _host_document(host)
+            self._host_config.headers = _host_headers(
+                host,
+                host_origin=self.host_origin,
+                parent_origin=self.parent_origin,
+            )
+        except BaseException:
+            # Nothing will hold on to a half-built instance to close it later.
+            self.close()
+            raise
+
+    def publish(self, token: str, page: str) -> str:
+        """Serve one review's harness page; returns the path it is served at."""
+        path = f"/review/{token}-{uuid.uuid4().hex}"
+        self._parent_config.pages[path] = page.encode("utf8")
+        return path
+
+    def withdraw(self, path: str) -> None:
+        self._parent_config.pages.pop(path, None)
+
+    def close(self) -> None:
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+
+
+def _start_playwright() -> Any:
+    from playwright.sync_api import sync_playwright
+
+    return sync_playwright().start()
+
+
+def _launch_browser(playwright: Any) -> Any:
+    return playwright.chromium.launch(args=["--no-sandbox"])
+
+
+def _render_page(
+    browser: Any,
+    origins: _Origins,
     *,
-    host: Path,
     token: str,
     source: str,
     props: Dict[str, Any],
@@ -330,100 +421,67 @@ def _render(
     actions: List[Dict[str, Any]],
     out_dir: Path,
 ) -> ReviewReport:
-    """Serve, frame, render both themes, screenshot. Runs on its own thread."""
+    """Frame, render both themes, screenshot -- in a context of its own."""
     from playwright.sync_api import Error as PlaywrightError
-    from playwright.sync_api import sync_playwright
-
-    # Two genuinely different origins: different hostname as well as different
-    # port, so the frame is cross-origin exactly as it is in production.
-    host_config = _OriginConfig()
-    parent_config = _OriginConfig(index_body=b"")
 
-    host_server, host_port = _serve(
-        directory=host,
-        config=host_config,
-        bind="127.0.0.1",
-    )
-    parent_server, parent_port = _serve(
-        directory=host,
-        config=parent_config,
-        bind="127.0.0.1",
-    )
-    host_origin = f"http://127.0.0.1:{host_port}"
-    parent_origin = f"http://localhost:{parent_port}"
-
-    host_config.headers = _host_headers(
-        host,
-        host_origin=host_origin,
-        parent_origin=parent_origin,
+    path = origins.publish(
+        token,
+        _parent_html(
+            host_origin=origins.host_origin,
+            host_document=origins.host_document,
+            source=source,
+            props=props,
+            rows=rows,
+            actions=actions,
+        ),
     )
-    parent_config.index_body = _parent_html(
-        host_origin=host_origin,
-        host_document=_host_document(host),
-        source=source,
-        props=props,
-        rows=rows,
-        actions=actions,
-    ).encode("utf8")
-
     page_errors: List[str] = []
     shots: List[str] = []
+    context = None
 
     try:
-        with sync_playwright() as playwright:
-            try:
-                browser = playwright.chromium.launch(args=["--no-sandbox"])
-            except PlaywrightError as error:
-                # A browser that will not start is an environment problem, not a
-                # verdict on the canvas -- nothing an authored canvas does can
-                # prevent chromium from launching. Reporting it as a render
-                # failure would block publishing everywhere the browser is
-                # missing, and would also let a genuinely broken canvas look
-                # rejected for the wrong reason.
-                logger.warning("canvas render skipped, browser unavailable: %s", error)
-                return ReviewReport(
-                    rendered=True,
-                    verdict="skipped: no browser available",
-                )
-            try:
-                page = browser.new_page(viewport={"width": 1024, "height": 768})
-                page.on("pageerror", lambda error: page_errors.append(str(error)))
-                page.goto(parent_origin, wait_until="load", timeout=_RENDER_TIMEOUT_MS)
-
-                element = page.wait_for_selector("#f", timeout=_RENDER_TIMEOUT_MS)
-                child = element.content_frame()
-
-                # Content, not merely a mount: the host shows a loading skeleton
-                # until the bundle resolves, so waiting on the root alone would
-                # pass a canvas that never actually rendered.
-                child.wait_for_selector(
-                    "#canvas-content > *",
-                    timeout=_RENDER_TIMEOUT_MS,
-                )
-
-                # Match the frame to its content before capturing, so the
-                # screenshot shows what a viewer sees rather than the harness's
-                # arbitrary viewport.
-                page.evaluate("window.__fit()")
-
-                for theme in ("light", "dark"):
-                    page.evaluate("theme => window.__setTheme(theme)", theme)
-                    # Waiting on the class the child actually applied keeps this
-                    # deterministic; a fixed delay would race a slow message.
-                    _wait_for_theme(page, child, dark=theme == "dark")
-                    shot = out_dir / f"canvas-{token}-{theme}.png"
-                    element.screenshot(path=str(shot))
-                    shots.append(str(shot))
-
-                reported = page.evaluate("window.__log")
-            finally:
-                browser.close()
+        context = browser.new_context(viewport={"width": 1024, "height": 768})
+        page = context.new_page()
+        page.on("pageerror", lambda error: page_errors.append(str(error)))
+        page.goto(
+            f"{origins.parent_origin}{path}",
+            wait_until="load",
+            timeout=_RENDER_TIMEOUT_MS,
+        )
+
+        element = page.wait_for_selector("#f", timeout=_RENDER_TIMEOUT_MS)
+        child = element.content_frame()
+
+        # Content, not merely a mount: the host shows a loading skeleton until
+        # the bundle resolves, so waiting on the root alone would pass a canvas
+        # that never actually rendered.
+        child.wait_for_selector("#canvas-content > *", timeout=_RENDER_TIMEOUT_MS)
+
+        # Match the frame to its content before capturing, so the screenshot
+        # shows what a viewer sees rather than the harness's arbitrary viewport.
+        page.evaluate("window.__fit()")
+
+        for theme in ("light", "dark"):
+            page.evaluate("theme => window.__setTheme(theme)", theme)
+            # Waiting on the class the child actually applied keeps this
+            # deterministic; a fixed delay would race a slow message.
+            _wait_for_theme(page, child, dark=theme == "dark")
+            shot = out_dir / f"canvas-{token}-{theme}.png"
+            element.screenshot(path=str(shot))
+            shots.append(str(shot))
+
+        reported = page.evaluate("window.__log")
     except PlaywrightError as error:
         return ReviewReport(rendered=False, screenshots=shots, error=str(error)[:2000])
     finally:
-        for server in (host_server, parent_server):
-            server.shutdown()
-            server.server_close()
+        origins.withdraw(path)
+        if context is not None:
+            try:
+                context.close()
+            except PlaywrightError:
+                # A browser that died mid-render has no context left to close;
+                # the worker notices the disconnect and relaunches.
+                pass
 
     # An error reported over the port is authored code throwing on mount, which
     # is the failure this whole gate exists to catch.
@@ -447,6 +505,201 @@ def _render(
     return ReviewReport(rendered=True, screenshots=shots, verdict="rendered")
 
 
+class _RuntimeClosed(RuntimeError):
+    """The runtime a review was queued on closed before rendering it."""
+
+
+@dataclass
+class _RenderJob:
+    kwargs: Dict[str, Any]
+    result: "Future[ReviewReport]" = field(default_factory=Future)
+
+
+class _ReviewRuntime:
+    """Warm browsers and long-lived origins shared by every review.
+
+    One thread per concurrent render, each owning its playwright and its
+    browser: the sync API is bound to the thread that started it, so a browser
+    cannot be handed between threads. Reviews queue for the next free thread.
+    """
+
+    def __init__(self, host: Path, *, concurrency: int, recycle_after: int) -> None:
+        self.host = host
+        self._recycle_after = max(1, recycle_after)
+        self._origins = _Origins(host)
+        self._jobs: "queue.Queue[Optional[_RenderJob]]" = queue.Queue()
+        # Held to enqueue, so no job lands behind the workers' stop sentinels.
+        self._accepting = threading.Lock()
+        self._closed = False
+        self._threads = [
+            threading.Thread(
+                target=self._work,
+                name=f"canvas-review-{n}",
+                daemon=True,
+            )
+            for n in range(max(1, concurrency))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def render(self, **kwargs: Any) -> ReviewReport:
+        """Render on the next free worker.
+
+        Raises :class:`_RuntimeClosed` when the runtime closes before the
+        render starts, so the caller can queue it on the runtime replacing
+        this one.
+        """
+        job = _RenderJob(kwargs)
+        with self._accepting:
+            if self._closed:
+                raise _RuntimeClosed("canvas review runtime is closed")
+            self._jobs.put(job)
+        try:
+            return job.result.result(timeout=_REVIEW_WAIT_TIMEOUT_S)
+        except FutureTimeoutError:
+            # Withdrawn if still queued; a render in progress ends on its own.
+            job.result.cancel()
+            return ReviewReport(
+                rendered=False,
+                error=(
+                    f"The canvas review did not complete within "
+                    f"{_REVIEW_WAIT_TIMEOUT_S:.0f}s."
+                ),
+            )
+
+    def _work(self) -> None:
+        from playwright.sync_api import Error as PlaywrightError
+
+        playwright: Any = None
+        browser: Any = None
+        renders = 0
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                if not job.result.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if browser is not None and (
+                        renders >= self._recycle_after or not browser.is_connected()
+                    ):
+                        _close_browser(browser)
+                        browser = None
+                    if browser is None:
+                        if playwright is None:
+                            playwright = _start_playwright()
+                        try:
+                            browser = _launch_browser(playwright)
+                        except PlaywrightError as error:
+                            # A browser that will not start is an environment
+                            # problem, not a verdict on the canvas -- nothing an
+                            # authored canvas does can prevent chromium from
+                            # launching. Reporting it as a render failure would
+                            # block publishing everywhere the browser is missing,
+                            # and would also let a genuinely broken canvas look
+                            # rejected for the wrong reason.
+                            logger.warning(
+                                "canvas render skipped, browser unavailable: %s",
+                                error,
+                            )
+                            job.result.set_result(
+                                ReviewReport(
+                                    rendered=True,
+                                    verdict="skipped: no browser available",
+                                ),
+                            )
+                            continue
+                        renders = 0
+                    renders += 1
+                    job.result.set_result(
+                        _render_page(browser, self._origins, **job.kwargs),
+                    )
+                except BaseException as error:  # noqa: BLE001 - handed to the caller
+                    job.result.set_exception(error)
+        finally:
+            if browser is not None:
+                _close_browser(browser)
+            if playwright is not None:
+                playwright.stop()
+
+    def close(self) -> None:
+        with self._accepting:
+            self._closed = True
+            # Reviews still queued are handed back rather than rendered
+            # against origins that are about to go away.
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is not None and job.result.set_running_or_notify_cancel():
+                    job.result.set_exception(
+                        _RuntimeClosed("canvas review runtime closed"),
+                    )
+            for _ in self._threads:
+                self._jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout=_RENDER_TIMEOUT_MS / 1000)
+        self._origins.close()
+
+
+def _close_browser(browser: Any) -> None:
+    try:
+        browser.close()
+    except Exception:  # noqa: BLE001 - already gone is the same as closed
+        logger.debug("closing a canvas review browser failed", exc_info=True)
+
+
+_runtime: Optional[_ReviewRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def _review_runtime(host: Path) -> _ReviewRuntime:
+    """The process's review runtime for *host*, started on first use."""
+    global _runtime
+    from unify.canvas_manager.settings import CanvasSettings
+
+    with _runtime_lock:
+        if _runtime is not None and _runtime.host != host:
+            _runtime.close()
+            _runtime = None
+        if _runtime is None:
+            settings = CanvasSettings()
+            _runtime = _ReviewRuntime(
+                host,
+                concurrency=settings.REVIEW_CONCURRENCY,
+                recycle_after=settings.REVIEW_RECYCLE_AFTER,
+            )
+        return _runtime
+
+
+def _stop_runtime() -> None:
+    global _runtime
+    with _runtime_lock:
+        if _runtime is not None:
+            _runtime.close()
+            _runtime = None
+
+
+atexit.register(_stop_runtime)
+
+
+def _render(*, host: Path, **kwargs: Any) -> ReviewReport:
+    """Render on the process's warm runtime; blocks until this review's turn."""
+    for _ in range(_REQUEUE_ATTEMPTS):
+        try:
+            return _review_runtime(host).render(**kwargs)
+        except _RuntimeClosed:
+            # Replaced for another host while this review waited; queue it
+            # on the runtime that replaced it.
+            continue
+    return ReviewReport(
+        rendered=False,
+        error="The canvas review runtime was replaced before the review ran.",
+    )
+
+
 def render_and_review(
     *,
     token: str,
@@ -475,10 +728,11 @@ def render_and_review(
     target = out_dir or Path(tempfile.mkdtemp(prefix=f"canvas-review-{token}-"))
     target.mkdir(parents=True, exist_ok=True)
 
-    # Playwright's sync API refuses to run on a thread with a live asyncio loop,
-    # and this is reached from both plain sync code and `asyncio.to_thread`. A
-    # dedicated thread makes the caller's context irrelevant. The critique runs on
-    # the same thread for the same reason.
+    # The render itself runs on the runtime's own threads. The critique drives
+    # its model call with `asyncio.run`, which refuses a thread with a live
+    # loop, and this is reached from both plain sync code and
+    # `asyncio.to_thread` -- so a dedicated thread makes the caller's context
+    # irrelevant.
     with ThreadPoolExecutor(max_workers=1, thread_name_prefix="canvas-review") as pool:
         return pool.submit(
             _render_and_critique,
@@ -29,6 +29,23 @@ class CanvasSettings(BaseSettings):
         ),
     )
 
+    REVIEW_CONCURRENCY: int = Field(
+        default=2,
+        description=(
+            "Renders the review gate runs at once, each on a browser kept warm "
+            "between reviews. Further reviews queue; a bulk install planting "
+            "many canvases waits its turn rather than launching a browser each."
+        ),
+    )
+
+    REVIEW_RECYCLE_AFTER: int = Field(
+        default=50,
+        description=(
+            "Renders a warm browser serves before it is closed and relaunched, "
+            "bounding whatever a long-lived chromium accumulates."
+        ),
+    )
+
     KIT_VERSION: str = Field(
         default="0.1.0",
         description=(
@@ -46,6 +63,15 @@ class CanvasSettings(BaseSettings):
         ),
     )
 
+    BUILD_WORKER: bool = Field(
+        default=True,
+        description=(
+            "Compile canvases in one long-lived node process that keeps the "
+            "typechecker and bundler warm between builds. Off, or where node "
+            "cannot start it, every build spawns tsc and esbuild afresh."
+        ),
+    )
+
     HOST_ROOT: str = Field(
         default="",
         description=(
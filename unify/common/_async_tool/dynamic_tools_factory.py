@@ -94,6 +94,31 @@ question : str
 """
 
 
+# The static surface's stand-ins live at module level, one function object
+# each for the life of the process, so the compiled-schema cache (see
+# tool_schemas.compiled_tool_schema) serves them every turn instead of
+# compiling three fresh closures. Registration renames them and sets their
+# docstrings; doing so again is a no-op.
+
+
+async def _wait() -> Dict[str, str]:
+    return {"status": "waiting"}
+
+
+async def _steer(
+    call_id: str,
+    action: SteerAction,
+    payload: Optional[str] = None,
+    method: Optional[str] = None,
+    include_parent_context: bool = False,
+) -> Dict[str, Any]:
+    return {"status": "unreachable"}
+
+
+async def _ask_about_completed_tool(tool_id: str, question: str) -> Any:
+    return {"status": "unreachable"}
+
+
 class DynamicToolFactory:
 
     @dataclass
@@ -243,7 +268,7 @@ class DynamicToolFactory:
     ) -> None:
         # prefer the function's own docstring if it exists, else fall back
         existing = inspect.getdoc(fn)
-        fn.__doc__ = existing.strip() if existing else fallback_doc
+        fn.__doc__ = (existing or fallback_doc).strip()
         fn.__name__ = func_name[:64]
         fn.__qualname__ = func_name[:64]
         self.dynamic_tools[func_name.lstrip("_")] = fn
@@ -264,9 +289,6 @@ class DynamicToolFactory:
         answer it first via `steer(call_id=<id>, action="clarify", payload=<answer>)`.
         """
 
-        async def _wait() -> Dict[str, str]:
-            return {"status": "waiting"}
-
         self._register_tool(
             func_name="wait",
             fallback_doc=(
@@ -289,19 +311,10 @@ class DynamicToolFactory:
         real, typed Python signature.
         """
 
-        async def steer(
-            call_id: str,
-            action: SteerAction,
-            payload: Optional[str] = None,
-            method: Optional[str] = None,
-            include_parent_context: bool = False,
-        ) -> Dict[str, Any]:
-            return {"status": "unreachable"}
-
         self._register_tool(
             func_name="steer",
             fallback_doc=STEER_DOC,
-            fn=steer,
+            fn=_steer,
         )
 
     def _create_ask_about_completed_tool(self) -> None:
@@ -315,13 +328,10 @@ class DynamicToolFactory:
         completed. Execution is special-cased in loop.py, mirroring `steer`.
         """
 
-        async def ask_about_completed_tool(tool_id: str, question: str) -> Any:
-            return {"status": "unreachable"}
-
         self._register_tool(
             func_name="ask_about_completed_tool",
             fallback_doc=ASK_ABOUT_COMPLETED_TOOL_DOC,
-            fn=ask_about_completed_tool,
+            fn=_ask_about_completed_tool,
         )
 
     def _refresh_task_capabilities(self, task: asyncio.Task) -> None:
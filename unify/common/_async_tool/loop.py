@@ -38,10 +38,10 @@ from .tools_utils import (
 )
 from ..llm_helpers import (
     DEFAULT_TOOL_SCHEMA_STRICT,
-    method_to_schema,
     _dumps,
     short_id,
 )
+from .tool_schemas import ToolsPayload, compiled_tool_schema
 from .loop_config import (
     LoopConfig,
     TOOL_LOOP_LINEAGE,
@@ -659,6 +659,9 @@ async def async_tool_loop_inner(
         message_count_offset=runtime_state.message_count_offset,
     )
     _msg_dispatcher = LoopMessageDispatcher(client, cfg, timer)
+    # The tools list sent last turn, handed out again while the visible set
+    # is unchanged so its serialized bytes never drift (see tool_schemas).
+    _tools_payload = ToolsPayload()
     parent_chat_context_safe = make_messages_safe_for_context_dump(parent_chat_context)
 
     if log_steps:
@@ -2213,7 +2216,7 @@ async def async_tool_loop_inner(
                 f"[setup +{_setup_elapsed()}] building tool schemas ({len(policy_tools_norm)} tools)",
             )
             _compress_schema = (
-                method_to_schema(compress_context, "compress_context")
+                compiled_tool_schema(compress_context, "compress_context")
                 if enable_compression
                 else None
             )
@@ -2245,7 +2248,7 @@ async def async_tool_loop_inner(
                     visible_base_tools_schema = [_compress_schema]
                     if extra_compression_tools:
                         visible_base_tools_schema.extend(
-                            method_to_schema(
+                            compiled_tool_schema(
                                 spec.fn,
                                 name,
                                 expose_context_control=(
@@ -2277,7 +2280,7 @@ async def async_tool_loop_inner(
                 # has_exceeded_concurrent_limit_for_tool / prune_over_quota_tool_calls),
                 # so hitting the cap never changes what the model can see.
                 visible_base_tools_schema = [
-                    method_to_schema(
+                    compiled_tool_schema(
                         spec.fn,
                         name,
                         expose_context_control=(
@@ -2483,7 +2486,7 @@ async def async_tool_loop_inner(
                 propagate_chat_context == ChatContextPropagation.LLM_DECIDES
             )
             tmp_tools = visible_base_tools_schema + [
-                method_to_schema(
+                compiled_tool_schema(
                     fn,
                     include_class_name=include_class_in_dynamic_tool_names,
                     # Expose include_parent_chat_context for dynamic tools that accept
@@ -2503,10 +2506,11 @@ async def async_tool_loop_inner(
                 )
                 for fn in dynamic_tools.values()
             ]
+            tmp_tools = _tools_payload.tools(tmp_tools)
 
             # ── D.  Ask the LLM what to do next  ────────────────────────────
             logger.debug(
-                f"[setup +{_setup_elapsed()}] ready for LLM call (step={runtime_state.step_index}, {len(tmp_tools)} tools)",
+                f"[setup +{_setup_elapsed()}] ready for LLM call (step={runtime_state.step_index}, {len(tmp_tools)} tools, payload {_tools_payload.digest})",
             )
             if log_steps:
                 logger.begin_thinking()
@@ -0,0 +1,236 @@
+"""
+Compiled tool schemas and the per-loop tools payload.
+
+Every turn of the async tool loop hands the provider the schema of every
+visible tool. ``method_to_schema`` derives each one from scratch —
+``inspect.signature``, ``get_type_hints(include_extras=True)``, annotation
+to JSON-schema conversion, docstring resolution and scrubbing — although the
+visible set rarely changes within a loop. With sixty-odd tools on the actor
+and ConversationManager loops that is per-turn CPU spent before every
+request, to reproduce the same bytes.
+
+``compiled_tool_schema`` compiles each (function, owner class, tool name,
+context-control flags, strict) combination once and returns the result
+frozen: the cached schema is shared by every loop in the process, so nothing
+may mutate it. Entries are held weakly by the underlying function and die
+with it; a function whose name or docstring is reassigned compiles again.
+
+``ToolsPayload`` is the loop's memo of the tools list it sends. While the
+schemas it is given are the same objects as last turn (or equal, for the few
+the loop builds inline), it returns the very list it returned last turn,
+serialized once when the visible set last changed. The bytes the provider
+sees therefore stay identical turn to turn, which is what its prefix cache
+keys on.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..llm_helpers import DEFAULT_TOOL_SCHEMA_STRICT, method_to_schema
+
+
+def _frozen(self, *_args, **_kwargs):
+    raise TypeError(
+        "compiled tool schemas are shared and read-only; "
+        "copy.deepcopy() one to get a mutable copy",
+    )
+
+
+class FrozenSchema(dict):
+    """A read-only ``dict``: serializes like one, refuses mutation.
+
+    ``copy.copy`` and ``copy.deepcopy`` return ordinary mutable containers.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _frozen
+    clear = pop = popitem = setdefault = update = _frozen
+    __ior__ = _frozen
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> dict:
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class _FrozenList(list):
+    """A read-only ``list`` nested inside a :class:`FrozenSchema`."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _frozen
+    append = clear = extend = insert = pop = remove = reverse = sort = _frozen
+    __iadd__ = __imul__ = _frozen
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo) -> list:
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze_schema(value: Any) -> Any:
+    """Return a read-only deep copy of a JSON-shaped schema."""
+    if isinstance(value, (FrozenSchema, _FrozenList)):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenSchema((k, freeze_schema(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return _FrozenList(freeze_schema(v) for v in value)
+    return value
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Schema compiler cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+_lock = threading.Lock()
+#: Underlying function → {variant key → compiled schema}.
+_compiled: "weakref.WeakKeyDictionary[Callable, Dict[Tuple, FrozenSchema]]" = (
+    weakref.WeakKeyDictionary()
+)
+_stats = {"hits": 0, "misses": 0, "uncacheable": 0}
+
+
+def compiled_tool_schema(
+    fn: Callable,
+    tool_name: Optional[str] = None,
+    include_class_name: bool = True,
+    expose_context_control: bool = False,
+    has_parent_context: bool = False,
+    expose_context_cont_control: bool = False,
+    strict: bool = DEFAULT_TOOL_SCHEMA_STRICT,
+) -> FrozenSchema:
+    """``method_to_schema`` compiled once per variant and returned frozen.
+
+    Takes the same arguments as :func:`~unify.common.llm_helpers.method_to_schema`.
+    Callables that cannot be held weakly (or hashed) are compiled every call.
+    """
+    kwargs = dict(
+        tool_name=tool_name,
+        include_class_name=include_class_name,
+        expose_context_control=expose_context_control,
+        has_parent_context=has_parent_context,
+        expose_context_cont_control=expose_context_cont_control,
+        strict=strict,
+    )
+    target = getattr(fn, "__func__", fn)
+    owner = type(fn.__self__) if hasattr(fn, "__func__") else None
+    # Name and docstring are routinely reassigned on dynamic helpers, and both
+    # land in the schema, so they are part of the key.
+    variant = (
+        owner,
+        getattr(target, "__name__", None),
+        getattr(target, "__qualname__", None),
+        getattr(target, "__doc__", None),
+        *kwargs.values(),
+    )
+    try:
+        with _lock:
+            schema = _compiled.get(target, {}).get(variant)
+    except TypeError:
+        _stats["uncacheable"] += 1
+        return freeze_schema(method_to_schema(fn, **kwargs))
+    if schema is not None:
+        _stats["hits"] += 1
+        return schema
+
+    _stats["misses"] += 1
+    schema = freeze_schema(method_to_schema(fn, **kwargs))
+    try:
+        with _lock:
+            variants = _compiled.get(target)
+            if variants is None:
+                variants = _compiled[target] = {}
+            schema = variants.setdefault(variant, schema)
+    except TypeError:
+        _stats["uncacheable"] += 1
+    return schema
+
+
+def schema_cache_info() -> Dict[str, int]:
+    """Hit/miss counters and the number of cached schemas."""
+    with _lock:
+        size = sum(len(v) for v in _compiled.values())
+    return {**_stats, "size": size}
+
+
+def clear_schema_cache() -> None:
+    """Drop every compiled schema and reset the counters."""
+    with _lock:
+        _compiled.clear()
+        for key in _stats:
+            _stats[key] = 0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Tools payload
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class ToolsPayload:
+    """The tools list one loop sends, rebuilt only when the visible set changes.
+
+    Schemas are compared by identity first — the compiler returns the same
+    object for the same tool — and by equality otherwise. On a change the
+    schemas are serialized once and the list handed out is decoded from that
+    serialization, so it is made of plain containers the client is free to
+    touch and always encodes to the same bytes.
+    """
+
+    def __init__(self) -> None:
+        self._sources: Tuple[Mapping, ...] = ()
+        self._tools: Optional[List[dict]] = None
+        self._json: Optional[str] = None
+        #: Times the visible set changed and the payload was rebuilt.
+        self.rebuilds = 0
+
+    def _unchanged(self, schemas: Sequence[Mapping]) -> bool:
+        if self._tools is None or len(schemas) != len(self._sources):
+            return False
+        return all(new is old or new == old for new, old in zip(schemas, self._sources))
+
+    def tools(self, schemas: Sequence[Mapping]) -> List[dict]:
+        """The list to send for ``schemas``: last turn's when nothing changed."""
+        if not self._unchanged(schemas):
+            self._sources = tuple(schemas)
+            self._json = json.dumps(list(self._sources))
+            self._tools = json.loads(self._json)
+            self.rebuilds += 1
+        return self._tools
+
+    @property
+    def json(self) -> Optional[str]:
+        """The serialized payload as last built."""
+        return self._json
+
+    @property
+    def digest(self) -> Optional[str]:
+        """Short hash of :attr:`json`, for logs."""
+        if self._json is None:
+            return None
+        return hashlib.sha256(self._json.encode("utf-8")).hexdigest()[:12]
+
+
+__all__ = [
+    "FrozenSchema",
+    "ToolsPayload",
+    "clear_schema_cache",
+    "compiled_tool_schema",
+    "freeze_schema",
+    "schema_cache_info",
+]
@@ -25,7 +25,7 @@ from .messages import (
     loop_user_notice,
 )
 from ..tool_spec import normalise_tools
-from ..llm_helpers import method_to_schema
+from .tool_schemas import compiled_tool_schema
 from .formatting import serialize_tool_content, sanitize_tool_msg_for_logging
 from contextlib import suppress
 from .propagation_mode import ChatContextPropagation
@@ -1004,7 +1004,7 @@ class ToolsData:
             notification_queue=progress_q,
             pause_event=pause_ev,
             # Debug helpers for failure logging
-            tool_schema=method_to_schema(fn, name),
+            tool_schema=compiled_tool_schema(fn, name),
             llm_arguments=allowed_call_args,
             raw_arguments_json=args_json,
             # Track context opt-in for steering method context propagation
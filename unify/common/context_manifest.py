@@ -0,0 +1,148 @@
+"""What ContextRegistry last provisioned, so a boot can skip what has not changed.
+
+Every assistant process, offline runner and ingest worker calls
+``ContextRegistry.setup`` (or ``setup_for_managers``) on boot, and each
+used to create every required table of every manager again: one
+``create_context`` and one ``create_fields`` per table, dozens of round
+trips, nearly always to find the context already there with the same
+fields.
+
+A context's digest covers everything provisioning sends for it: resolved
+name, description, fields, unique keys, auto-counting, foreign keys and
+owner. :class:`ProvisioningRecord` keeps the digests last applied under
+each base context, per backend and project, in a small local file. A boot
+lists what exists under each root once and skips any context that exists
+with the digest it was last provisioned with. A context that exists but
+changed only has its fields sent again; a missing one is created as
+before.
+
+The record is only a hint: existence is always confirmed against the
+backend, so a context deleted since it was recorded is recreated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+_log = logging.getLogger(__name__)
+
+#: Bumped when the digest inputs change, orphaning every older record.
+MANIFEST_VERSION = 1
+
+
+def default_record_path() -> Path:
+    """Return the on-disk location of the provisioning record."""
+    state_root = Path(
+        os.environ.get("XDG_STATE_HOME", Path.home() / ".local" / "state"),
+    )
+    return state_root / "unify" / "context-manifests.json"
+
+
+def context_digest(
+    entry: Mapping[str, Any],
+    *,
+    owner_scope: Optional[str],
+    owner_id: Optional[int],
+) -> str:
+    """Digest of one resolved ``ContextRegistry`` entry as it would be provisioned."""
+    table = entry["table_context"]
+    payload = {
+        "version": MANIFEST_VERSION,
+        "name": entry["resolved_name"],
+        "description": table.description,
+        "fields": table.fields,
+        "unique_keys": table.unique_keys,
+        "auto_counting": table.auto_counting,
+        "foreign_keys": entry.get("resolved_foreign_keys"),
+        "owner": [owner_scope, owner_id],
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ProvisioningRecord:
+    """Context digests last applied under each base context.
+
+    ``scope`` separates backends and projects sharing one machine. Writes
+    replace the file atomically; a record that cannot be read or written
+    only costs the next boot its skips.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._records: Optional[Dict[str, Dict[str, str]]] = None
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = default_record_path()
+        return self._path
+
+    @staticmethod
+    def _key(scope: str, base: str) -> str:
+        return f"{scope}|{base}"
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        if self._records is None:
+            try:
+                raw = json.loads(self.path.read_text(encoding="utf-8"))
+                if raw.get("version") != MANIFEST_VERSION:
+                    raise ValueError(f"manifest version {raw.get('version')}")
+                self._records = dict(raw["bases"])
+            except FileNotFoundError:
+                self._records = {}
+            except Exception as exc:
+                _log.debug("Ignoring unreadable provisioning record: %s", exc)
+                self._records = {}
+        return self._records
+
+    def applied(self, scope: str, base: str) -> Dict[str, str]:
+        """Resolved context name → digest last applied under ``base``."""
+        with self._lock:
+            return dict(self._load().get(self._key(scope, base), {}))
+
+    def record(self, scope: str, base: str, digests: Mapping[str, str]) -> None:
+        """Merge newly applied digests into the record for ``base`` and persist it."""
+        if not digests:
+            return
+        with self._lock:
+            # Re-read so records another process wrote since are kept.
+            self._records = None
+            records = self._load()
+            records.setdefault(self._key(scope, base), {}).update(digests)
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                tmp.write_text(
+                    json.dumps({"version": MANIFEST_VERSION, "bases": records}),
+                    encoding="utf-8",
+                )
+                os.replace(tmp, self.path)
+            except OSError as exc:
+                _log.debug("Could not persist provisioning record: %s", exc)
+
+    def clear(self) -> None:
+        """Forget every record, in memory and on disk."""
+        with self._lock:
+            self._records = {}
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                _log.debug("Could not remove provisioning record: %s", exc)
+
+
+__all__ = [
+    "MANIFEST_VERSION",
+    "ProvisioningRecord",
+    "context_digest",
+    "default_record_path",
+]
@@ -7,6 +7,7 @@ from pydantic import BaseModel
 from unisdk import create_fields
 
 from unify.common.authorship import SHARED_SCOPED_TABLES, fields_with_authoring
+from unify.common.context_manifest import ProvisioningRecord, context_digest
 from unify.common.context_store import _create_context_with_retry
 from unify.common.state_managers import BaseStateManager
 from unify.common.tool_outcome import ToolError, ToolErrorException
@@ -37,6 +38,7 @@ class ContextRegistry:
     _setup_complete = False
     _registry: Dict[tuple[str, str, str], str] = {}
     _base_context: Optional[str] = None
+    _provisioning_record: ProvisioningRecord = ProvisioningRecord()
 
     @staticmethod
     def _get_active_context() -> str:
@@ -357,28 +359,35 @@ class ContextRegistry:
         """Create unify context and ensure fields are created, store in registry.
 
         Idempotent: tolerates pre-existing contexts and concurrent creation.
+        An entry marked ``context_exists`` (seen by provisioning's listing)
+        only has its fields sent. Sets ``fields_applied`` on the entry.
         """
         table = entry["table_context"]
         target_name = entry["resolved_name"]
-        # Use resolved_foreign_keys (with prefixed references) instead of
-        # table.foreign_keys to avoid using mutated class-level config.
-        resolved_foreign_keys = entry.get("resolved_foreign_keys")
-        owner_scope, owner_id = cls._owner_for_root(entry["root_identity"])
-        _create_context_with_retry(
-            target_name,
-            unique_keys=table.unique_keys,
-            auto_counting=table.auto_counting,
-            description=table.description,
-            foreign_keys=resolved_foreign_keys,
-            owner_scope=owner_scope,
-            owner_id=owner_id,
-        )
+        if not entry.get("context_exists"):
+            # Use resolved_foreign_keys (with prefixed references) instead of
+            # table.foreign_keys to avoid using mutated class-level config.
+            resolved_foreign_keys = entry.get("resolved_foreign_keys")
+            owner_scope, owner_id = cls._owner_for_root(entry["root_identity"])
+            _create_context_with_retry(
+                target_name,
+                unique_keys=table.unique_keys,
+                auto_counting=table.auto_counting,
+                description=table.description,
+                foreign_keys=resolved_foreign_keys,
+                owner_scope=owner_scope,
+                owner_id=owner_id,
+            )
         # Idempotent field creation
+        entry["fields_applied"] = True
         if table.fields:
             try:
                 create_fields(table.fields, context=target_name)
-            except Exception:
-                pass  # Fields already exist or transient failure
+            except Exception as e:
+                # Whatever the cause, the fields are not recorded as applied:
+                # sending them again on the next boot is harmless.
+                _log.debug("Field creation for %s failed: %s", target_name, e)
+                entry["fields_applied"] = False
 
         cls._registry[(manager_name, table.name, entry["root_identity"])] = target_name
 
@@ -550,6 +559,28 @@ class ContextRegistry:
             root_context,
         )
 
+    @staticmethod
+    def _provisioning_scope() -> str:
+        """Backend and project a provisioning record applies to."""
+        from unify.settings import SETTINGS
+
+        try:
+            project = unisdk.active_project()
+        except Exception:
+            project = None
+        return f"{SETTINGS.ORCHESTRA_URL}|{project}"
+
+    @staticmethod
+    def _existing_contexts(roots: set[str]) -> set[str]:
+        """Names of the contexts under ``roots``; empty for a root that cannot be listed."""
+        existing: set[str] = set()
+        for root in sorted(roots):
+            try:
+                existing.update(unisdk.get_contexts(prefix=f"{root}/"))
+            except Exception as e:
+                _log.debug("Could not list contexts under %s: %s", root, e)
+        return existing
+
     @classmethod
     def _provision_managers(
         cls,
@@ -559,48 +590,96 @@ class ContextRegistry:
         """Provision contexts for the given managers against *base*.
 
         Shared implementation behind :meth:`setup` and
-        :meth:`setup_for_managers`.  Sets ``_base_context`` and
-        concurrently creates every required context (+ aggregation
-        contexts) via :meth:`_create_context_wrapper`.
+        :meth:`setup_for_managers`.  Sets ``_base_context``, skips every
+        context that exists with the digest it was last provisioned with
+        (see :mod:`unify.common.context_manifest`), and concurrently
+        provisions the rest via :meth:`_create_context_wrapper`.
         """
         cls._base_context = base
         owner_team_id = cls._home_shared_team_id()
 
-        with ThreadPoolExecutor() as executor:
-            futures = []
-            for manager in managers:
-                manager_name = cls._get_manager_name(manager)
-                base_entries = cls._get_contexts_for_manager(
+        entries: List[tuple[str, Dict, str]] = []
+        for manager in managers:
+            manager_name = cls._get_manager_name(manager)
+            base_entries = cls._get_contexts_for_manager(
+                manager,
+                base,
+                PERSONAL_ROOT_IDENTITY,
+            )
+            team_entries: Dict[str, Dict] = {}
+            if owner_team_id is not None:
+                # Team-owned assistants keep shared tables at the owning
+                # team's root, never under the per-assistant base subtree.
+                team_root = cls._team_root_identity(owner_team_id)
+                team_entries = cls._get_contexts_for_manager(
                     manager,
-                    base,
-                    PERSONAL_ROOT_IDENTITY,
+                    team_root,
+                    team_root,
                 )
-                team_entries: Dict[str, Dict] = {}
-                if owner_team_id is not None:
-                    # Team-owned assistants keep shared tables at the owning
-                    # team's root, never under the per-assistant base subtree.
-                    team_root = cls._team_root_identity(owner_team_id)
-                    team_entries = cls._get_contexts_for_manager(
-                        manager,
-                        team_root,
-                        team_root,
-                    )
-                for table_name, entry in base_entries.items():
-                    if owner_team_id is not None and cls._is_shared_scoped(table_name):
-                        entry = team_entries[table_name]
-                    futures.append(
-                        executor.submit(
-                            cls._create_context_wrapper,
-                            manager_name,
-                            entry,
-                        ),
-                    )
+            for table_name, entry in base_entries.items():
+                if owner_team_id is not None and cls._is_shared_scoped(table_name):
+                    entry = team_entries[table_name]
+                owner_scope, owner_id = cls._owner_for_root(entry["root_identity"])
+                digest = context_digest(
+                    entry,
+                    owner_scope=owner_scope,
+                    owner_id=owner_id,
+                )
+                entries.append((manager_name, entry, digest))
+
+        scope = cls._provisioning_scope()
+        applied = cls._provisioning_record.applied(scope, base)
+        unchanged_roots = {
+            entry["root_context"]
+            for _, entry, digest in entries
+            if applied.get(entry["resolved_name"]) == digest
+        }
+        # A cold boot has nothing recorded and skips the listing entirely.
+        existing = cls._existing_contexts(unchanged_roots) if unchanged_roots else set()
+
+        pending = []
+        for manager_name, entry, digest in entries:
+            target_name = entry["resolved_name"]
+            if target_name in existing:
+                if applied.get(target_name) == digest:
+                    table_name = entry["table_context"].name
+                    key = (manager_name, table_name, entry["root_identity"])
+                    cls._registry[key] = target_name
+                    continue
+                entry["context_exists"] = True
+            pending.append((manager_name, entry, digest))
+
+        _log.debug(
+            "Provisioning %d of %d contexts under %s",
+            len(pending),
+            len(entries),
+            base,
+        )
+        if not pending:
+            return
+
+        provisioned: Dict[str, str] = {}
+        with ThreadPoolExecutor() as executor:
+            futures = {
+                executor.submit(
+                    cls._create_context_wrapper,
+                    manager_name,
+                    entry,
+                ): (entry, digest)
+                for manager_name, entry, digest in pending
+            }
 
             for future in as_completed(futures):
                 try:
                     future.result()
                 except Exception as e:
                     _log.warning("Context creation failed (will retry lazily): %s", e)
+                    continue
+                entry, digest = futures[future]
+                if entry.get("fields_applied", True):
+                    provisioned[entry["resolved_name"]] = digest
+
+        cls._provisioning_record.record(scope, base, provisioned)
 
     @classmethod
     def setup(cls):
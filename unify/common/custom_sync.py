@@ -24,15 +24,31 @@ version:
 - A surface may hand one row's ownership to the user by clearing
   ``managed_by`` and keeping ``custom_key``. The pass then reports the key
   as ``released`` and touches nothing — see :func:`released_rows_filter`.
+- A pass plans the whole diff before writing. Inserts, updates and prune
+  deletes then go out in chunks through the adapter's bulk hooks
+  (``insert_many``/``update_many``/``delete_many``) where it has them, and
+  one row per call where it does not.
 """
 
 from __future__ import annotations
 
 import logging
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Iterable, Literal, Mapping, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -167,7 +183,12 @@ def require_consumed(
 
 @dataclass
 class CustomSyncResult:
-    """Counts from one reconcile pass."""
+    """Counts from one reconcile pass.
+
+    ``timings`` holds the wall seconds of each phase that ran: ``index``
+    (reading live rows), ``plan`` (diffing, probes, adoptions), and
+    ``insert``/``update``/``delete`` (the writes).
+    """
 
     inserted: int = 0
     updated: int = 0
@@ -178,6 +199,7 @@ class CustomSyncResult:
     yielded: int = 0
     released: int = 0
     failures: Dict[str, BaseException] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
 
     @property
     def changed(self) -> bool:
@@ -208,9 +230,16 @@ class CustomSyncAdapter:
       unmanaged row occupies its natural slot. ``"replace"`` deletes the
       user-added row and inserts the source row; ``"yield"`` leaves the
       user's row in place and skips the source entry (secrets).
-    - ``max_workers``: parallel per-key upserts. Updates run
-      concurrently; adoption/collision/insert handling is serialized
-      under one lock so key probes cannot race.
+    - ``max_workers``: parallel per-key planning and per-row updates.
+      Adoption/collision probes are serialized under one lock so they
+      cannot race.
+    - ``bulk_chunk_size``: rows handed to one bulk hook call.
+
+    Bulk hooks are optional. An adapter that implements ``insert_many``,
+    ``update_many`` or ``delete_many`` gets the planned writes of that kind
+    in chunks; one that does not gets them one row per call. A chunk whose
+    hook raises fails every key in it, and the next reconcile retries them
+    (rows that did land short-circuit on their per-row hash).
     """
 
     kind: str = "rows"
@@ -218,6 +247,7 @@ class CustomSyncAdapter:
     prune: bool = True
     collision: Literal["replace", "yield"] = "replace"
     max_workers: int = 1
+    bulk_chunk_size: int = 200
 
     def live_rows(self) -> Iterable[Dict[str, Any]]:
         """Yield this source's managed rows, including their ``custom_key``
@@ -250,6 +280,21 @@ class CustomSyncAdapter:
     def delete(self, key: str, live_row: Dict[str, Any]) -> None:
         raise NotImplementedError
 
+    def insert_many(self, items: Sequence[Tuple[str, Dict[str, Any]]]) -> None:
+        """Optional bulk :meth:`insert` of ``(key, fields)`` pairs."""
+        raise NotImplementedError
+
+    def update_many(
+        self,
+        items: Sequence[Tuple[str, Dict[str, Any], Dict[str, Any]]],
+    ) -> None:
+        """Optional bulk :meth:`update` of ``(key, live_row, fields)`` triples."""
+        raise NotImplementedError
+
+    def delete_many(self, items: Sequence[Tuple[str, Dict[str, Any]]]) -> None:
+        """Optional bulk :meth:`delete` of ``(key, live_row)`` pairs."""
+        raise NotImplementedError
+
     def transform(self, key: str, fields: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve source-shaped fields into row-shaped fields
         (e.g. function names to ids). Runs inside per-key isolation."""
@@ -347,14 +392,39 @@ def _index_live_rows(adapter: CustomSyncAdapter) -> Dict[str, Dict[str, Any]]:
     return live
 
 
-def _upsert_one(
+def _bulk_hook(adapter: CustomSyncAdapter, name: str) -> Optional[Callable]:
+    """The adapter's bulk hook ``name``, or None if it kept the base stub."""
+    hook = getattr(adapter, name)
+    if getattr(hook, "__func__", None) is getattr(CustomSyncAdapter, name):
+        return None
+    return hook
+
+
+@dataclass
+class _Plan:
+    """Writes one pass still has to make, decided before any is made."""
+
+    inserts: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    updates: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = field(
+        default_factory=list,
+    )
+    deletes: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+
+
+def _plan_one(
     *,
     adapter: CustomSyncAdapter,
     key: str,
     fields: Dict[str, Any],
     live: Dict[str, Dict[str, Any]],
     insert_lock: threading.Lock,
-) -> str:
+) -> Tuple[str, Dict[str, Any]]:
+    """Decide one source entry's outcome; returns it with the resolved fields.
+
+    ``"insert"`` and ``"update"`` are left for the write phase. Adoptions
+    and collision removals happen here, under the lock, as the probes
+    that find them must not race.
+    """
     fields = adapter.transform(key, dict(fields))
     # Stamped after transform so transforms stay source-agnostic and the
     # collected content hash is identical whoever installs the bundle.
@@ -364,7 +434,7 @@ def _upsert_one(
         if live_row.get("custom_hash") == fields.get("custom_hash"):
             if not adapter.derived_stale(key, live_row, fields):
                 logger.debug("Custom %s unchanged: %s", adapter.kind, key)
-                return "unchanged"
+                return "unchanged", fields
             logger.info(
                 "Custom %s source unchanged but derived fields stale; " "updating: %s",
                 adapter.kind,
@@ -376,10 +446,9 @@ def _upsert_one(
                 adapter.kind,
                 key,
             )
-            return "skipped"
+            return "skipped", fields
         logger.info("Updating custom %s: %s", adapter.kind, key)
-        adapter.update(key, live_row, fields)
-        return "updated"
+        return "update", fields
 
     with insert_lock:
         released = adapter.find_released(key, fields)
@@ -389,12 +458,12 @@ def _upsert_one(
                 adapter.kind,
                 key,
             )
-            return "released"
+            return "released", fields
         adoptable = adapter.find_adoptable(key, fields)
         if adoptable is not None:
             logger.info("Adopting unmanaged %s row: %s", adapter.kind, key)
             adapter.adopt(key, adoptable, fields)
-            return "adopted"
+            return "adopted", fields
         collision = adapter.find_collision(key, fields)
         if collision is not None:
             if adapter.collision == "yield":
@@ -403,7 +472,7 @@ def _upsert_one(
                     adapter.kind,
                     key,
                 )
-                return "yielded"
+                return "yielded", fields
             logger.info(
                 "Overwriting user-added %s with custom definition: %s",
                 adapter.kind,
@@ -411,8 +480,63 @@ def _upsert_one(
             )
             adapter.remove_collision(key, collision)
         logger.info("Inserting custom %s: %s", adapter.kind, key)
-        adapter.insert(key, fields)
-        return "inserted"
+        return "insert", fields
+
+
+def _apply(
+    *,
+    adapter: CustomSyncAdapter,
+    op: str,
+    items: Sequence[Tuple[Any, ...]],
+    per_row: Callable[..., None],
+    result: CustomSyncResult,
+    workers: int = 1,
+) -> int:
+    """Write planned ``items`` in bulk chunks or one per call; returns the count written."""
+    if not items:
+        return 0
+    started = time.perf_counter()
+    written = 0
+    hook = _bulk_hook(adapter, f"{op}_many")
+    if hook is not None:
+        size = max(1, adapter.bulk_chunk_size)
+        for offset in range(0, len(items), size):
+            chunk = items[offset : offset + size]
+            try:
+                hook(chunk)
+                written += len(chunk)
+            except Exception as exc:
+                for item in chunk:
+                    result.failures[item[0]] = exc
+                logger.exception(
+                    "Failed to %s a chunk of %d custom %s; continuing",
+                    op,
+                    len(chunk),
+                    adapter.kind,
+                )
+    else:
+
+        def run(item: Tuple[Any, ...]) -> bool:
+            try:
+                per_row(*item)
+                return True
+            except Exception as exc:
+                result.failures[item[0]] = exc
+                logger.exception(
+                    "Failed to %s custom %s %r; continuing with remaining entries",
+                    op,
+                    adapter.kind,
+                    item[0],
+                )
+                return False
+
+        if workers == 1:
+            written = sum(run(item) for item in items)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                written = sum(executor.map(run, items))
+    result.timings[op] = time.perf_counter() - started
+    return written
 
 
 def reconcile_custom_rows(
@@ -425,6 +549,10 @@ def reconcile_custom_rows(
     Scoped to ``adapter.managed_by`` throughout: the live index, the
     collision probes, and the prune all see only that source's rows.
 
+    Plans every entry first, then writes inserts, updates and prune
+    deletes, in that order, through the adapter's bulk hooks where it
+    has them.
+
     Raises :class:`CustomSyncDuplicateKeyError` before touching anything
     if the live rows are ambiguous, and :class:`CustomSyncPartialFailure`
     after the pass if any entry failed. Skipped updates
@@ -432,21 +560,26 @@ def reconcile_custom_rows(
     but carry no exception.
     """
 
-    live = _index_live_rows(adapter)
     result = CustomSyncResult()
+    started = time.perf_counter()
+    live = _index_live_rows(adapter)
+    result.timings["index"] = time.perf_counter() - started
 
+    started = time.perf_counter()
     workers = max(1, min(adapter.max_workers, len(source) or 1))
     insert_lock = threading.Lock()
+    plan = _Plan()
 
-    def run(key: str, fields: Dict[str, Any]) -> str:
+    def plan_entry(key: str, fields: Dict[str, Any]) -> Tuple[str, str, Any]:
         try:
-            return _upsert_one(
+            outcome, resolved = _plan_one(
                 adapter=adapter,
                 key=key,
                 fields=fields,
                 live=live,
                 insert_lock=insert_lock,
             )
+            return key, outcome, resolved
         except Exception as exc:
             result.failures[key] = exc
             logger.exception(
@@ -454,21 +587,24 @@ def reconcile_custom_rows(
                 adapter.kind,
                 key,
             )
-            return "failed"
+            return key, "failed", None
 
     if workers == 1:
-        outcomes = [run(key, fields) for key, fields in source.items()]
+        planned = [plan_entry(key, fields) for key, fields in source.items()]
     else:
         with ThreadPoolExecutor(max_workers=workers) as executor:
             futures = [
-                executor.submit(run, key, fields) for key, fields in source.items()
+                executor.submit(plan_entry, key, fields)
+                for key, fields in source.items()
             ]
-            outcomes = [future.result() for future in as_completed(futures)]
-
-    for outcome in outcomes:
-        if outcome in (
-            "inserted",
-            "updated",
+            planned = [future.result() for future in as_completed(futures)]
+
+    for key, outcome, resolved in planned:
+        if outcome == "insert":
+            plan.inserts.append((key, resolved))
+        elif outcome == "update":
+            plan.updates.append((key, live[key], resolved))
+        elif outcome in (
             "adopted",
             "unchanged",
             "skipped",
@@ -476,22 +612,41 @@ def reconcile_custom_rows(
             "released",
         ):
             setattr(result, outcome, getattr(result, outcome) + 1)
-
     if adapter.prune:
-        for key, live_row in live.items():
-            if key in source:
-                continue
-            try:
-                logger.info("Deleting removed custom %s: %s", adapter.kind, key)
-                adapter.delete(key, live_row)
-                result.deleted += 1
-            except Exception as exc:
-                result.failures[key] = exc
-                logger.exception(
-                    "Failed to delete removed custom %s %r; continuing",
-                    adapter.kind,
-                    key,
-                )
+        plan.deletes = [
+            (key, live_row) for key, live_row in live.items() if key not in source
+        ]
+    result.timings["plan"] = time.perf_counter() - started
+
+    result.inserted = _apply(
+        adapter=adapter,
+        op="insert",
+        items=plan.inserts,
+        per_row=adapter.insert,
+        result=result,
+    )
+    result.updated = _apply(
+        adapter=adapter,
+        op="update",
+        items=plan.updates,
+        per_row=adapter.update,
+        result=result,
+        workers=workers,
+    )
+    for key, _ in plan.deletes:
+        logger.info("Deleting removed custom %s: %s", adapter.kind, key)
+    result.deleted = _apply(
+        adapter=adapter,
+        op="delete",
+        items=plan.deletes,
+        per_row=adapter.delete,
+        result=result,
+    )
+    logger.debug(
+        "Custom %s reconcile timings: %s",
+        adapter.kind,
+        ", ".join(f"{phase}={secs:.3f}s" for phase, secs in result.timings.items()),
+    )
 
     if result.failures:
         raise CustomSyncPartialFailure(adapter.kind, result.failures)
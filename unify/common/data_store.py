@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple, Union, Iterable
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import copy
 import threading
@@ -8,6 +8,11 @@ import threading
 import unisdk
 
 KeyInput = Union[str, int, Tuple[Any, ...], Iterable[Any]]
+# (store, key, row): row is None for a delete; key and row are None for a clear.
+Listener = Callable[
+    ["DataStore", Optional[Tuple[Any, ...]], Optional[Dict[str, Any]]],
+    None,
+]
 
 
 class DataStore:
@@ -42,6 +47,8 @@ class DataStore:
     - On cache miss, lookups raise KeyError.
     - Updates replace nested structures wholesale (no deep merge).
     - Instances are singletons per (project, context) via for_context().
+    - Listeners registered with add_listener() see every write after it
+      lands, so secondary indexes can follow the mirror without polling it.
     """
 
     # Registry of singleton instances per (project, context)
@@ -62,6 +69,7 @@ class DataStore:
         self._lock = threading.RLock()
         # Internal storage: normalized key tuple -> sanitized row dict
         self._rows: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        self._listeners: List[Listener] = []
 
     # ------------------------------------------------------------------ #
     #  Construction / accessors                                          #
@@ -135,6 +143,17 @@ class DataStore:
     # ------------------------------------------------------------------ #
     #  Public API – writes                                               #
     # ------------------------------------------------------------------ #
+    def add_listener(self, listener: Listener) -> None:
+        """
+        Call *listener* after every put, update, delete and clear.
+
+        Listeners receive the stored row and must not mutate it. Registering
+        the same listener twice is a no-op.
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
     def put(self, row: Dict[str, Any]) -> None:
         """
         Insert or replace a row in the store.
@@ -146,6 +165,7 @@ class DataStore:
         clean = self._sanitize_row(row)
         with self._lock:
             self._rows[key] = clean
+        self._notify(key, clean)
 
     def update(self, key: KeyInput, updates: Dict[str, Any]) -> None:
         """
@@ -163,6 +183,7 @@ class DataStore:
             merged = dict(self._rows[norm])
             merged.update(clean_updates)
             self._rows[norm] = merged
+        self._notify(norm, merged)
 
     def delete(self, key: KeyInput) -> None:
         """Remove the row with *key*. Raises KeyError when not present."""
@@ -171,15 +192,27 @@ class DataStore:
             if norm not in self._rows:
                 raise KeyError(self._stringify_key_tuple(norm))
             del self._rows[norm]
+        self._notify(norm, None)
 
     def clear(self) -> None:
         """Remove all cached rows for this context."""
         with self._lock:
             self._rows.clear()
+        self._notify(None, None)
 
     # ------------------------------------------------------------------ #
     #  Helpers                                                           #
     # ------------------------------------------------------------------ #
+    def _notify(
+        self,
+        key: Optional[Tuple[Any, ...]],
+        row: Optional[Dict[str, Any]],
+    ) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(self, key, row)
+
     def _sanitize_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """
         Return a copy of *row* containing only public columns.
@@ -75,6 +75,18 @@ current_run_meter: contextvars.ContextVar[Optional[RunMeter]] = contextvars.Cont
 _listener: Optional[Any] = None
 _install_lock = threading.Lock()
 
+# Provider cost of every call this process has made, metered or not. The
+# spending-limit decision cache deducts the growth of this total from the
+# headroom it last read from Orchestra.
+_local_spend = 0.0
+_local_spend_lock = threading.Lock()
+
+
+def local_spend_total() -> float:
+    """Cumulative provider cost observed by the listener in this process."""
+    with _local_spend_lock:
+        return _local_spend
+
 
 def _usage_from_event(event: Any) -> tuple[int, int]:
     response = getattr(event, "response", None)
@@ -89,6 +101,11 @@ def _usage_from_event(event: Any) -> tuple[int, int]:
 
 
 def _on_llm_event(event: Any) -> None:
+    global _local_spend
+    cost = getattr(event, "provider_cost", None)
+    if cost:
+        with _local_spend_lock:
+            _local_spend += float(cost)
     meter = current_run_meter.get()
     if meter is None:
         return
@@ -98,7 +115,7 @@ def _on_llm_event(event: Any) -> None:
         purpose,
         prompt_tokens=prompt_tokens,
         completion_tokens=completion_tokens,
-        cost=getattr(event, "provider_cost", None),
+        cost=cost,
     )
 
 
@@ -136,5 +153,6 @@ __all__ = [
     "current_run_meter",
     "handle_run_stats",
     "install_run_metering",
+    "local_spend_total",
     "new_run_meter",
 ]
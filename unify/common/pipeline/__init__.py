@@ -77,6 +77,7 @@ from .transport import build_table_handles, detect_csv_dialect
 from .types import (
     CONTENT_CHECKPOINT_ID,
     AttachmentCallback,
+    ContextRowsHandle,
     CsvFileHandle,
     DmBinding,
     FmBinding,
@@ -122,6 +123,7 @@ __all__ = [
     "CONTENT_ROWS_TABLE_ID",
     "CancellationCheck",
     "CheckpointedIngest",
+    "ContextRowsHandle",
     "CsvFileHandle",
     "DeadLetterWorkItem",
     "DeploymentBundle",
@@ -17,10 +17,11 @@ import json
 import logging
 from collections.abc import Iterator
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from urllib.parse import unquote, urlparse
 
 from .types import (
+    ContextRowsHandle,
     CsvFileHandle,
     InlineRowsHandle,
     ObjectStoreArtifactHandle,
@@ -40,6 +41,7 @@ def iter_table_input_rows(
     *,
     storage_client: Any = None,
     skip_rows: int = 0,
+    data_manager: Any = None,
 ) -> Iterator[JsonObject]:
     """Yield table rows from any supported transport handle.
 
@@ -52,6 +54,9 @@ def iter_table_input_rows(
     skip_rows:
         Number of leading data rows to consume and discard before
         yielding.  Used by crash-recovery to resume after a checkpoint.
+    data_manager:
+        The DataManager a ``ContextRowsHandle`` is read through, so reads
+        route as the ingesting manager's do.  Required for that handle.
     """
 
     if isinstance(handle, InlineRowsHandle):
@@ -111,6 +116,19 @@ def iter_table_input_rows(
         )
         return
 
+    if isinstance(handle, ContextRowsHandle):
+        if data_manager is None:
+            raise ValueError(
+                f"Reading context {handle.context!r} needs the data_manager "
+                "to read it through",
+            )
+        yield from _iter_context_rows(
+            handle,
+            data_manager=data_manager,
+            skip_rows=skip_rows,
+        )
+        return
+
     raise TypeError(f"Unsupported table input handle: {type(handle)!r}")
 
 
@@ -120,6 +138,7 @@ def iter_table_input_row_batches(
     *,
     storage_client: Any = None,
     skip_rows: int = 0,
+    data_manager: Any = None,
 ) -> Iterator[list[JsonObject]]:
     """Yield bounded row batches from a table input handle."""
 
@@ -129,6 +148,7 @@ def iter_table_input_row_batches(
         handle,
         storage_client=storage_client,
         skip_rows=skip_rows,
+        data_manager=data_manager,
     ):
         batch.append(row)
         if len(batch) >= size:
@@ -161,6 +181,103 @@ def _apply_skip(
         logger.info("[row_streaming] Skipped %d rows (checkpoint resume)", skipped)
 
 
+# ---------------------------------------------------------------------------
+# Context rows handle
+# ---------------------------------------------------------------------------
+
+
+def _iter_context_rows(
+    handle: ContextRowsHandle,
+    *,
+    data_manager: Any,
+    skip_rows: int = 0,
+) -> Iterator[JsonObject]:
+    """Read a stored context page by page, past the last key seen.
+
+    Reads go through *data_manager* so destination routing is the caller's.
+    Resuming at *skip_rows* costs one positioned read to find the key of the
+    last committed row; every page after it is keyed, so no read re-walks
+    the rows before it.
+    """
+    dm = data_manager
+    key = handle.key_column
+    page = max(1, min(int(handle.page_size), 1000))
+    remaining = None if handle.row_count is None else handle.row_count - skip_rows
+    columns = list(handle.columns) or None
+    # The key is read to advance the mark even when the caller did not ask
+    # for it, and dropped again before the row is yielded.
+    drop_key = bool(key and columns and key not in columns)
+    if drop_key:
+        columns = [*columns, key]
+
+    def bounded(expression: Optional[str]) -> Optional[str]:
+        if handle.filter and expression:
+            return f"({handle.filter}) and {expression}"
+        return handle.filter or expression
+
+    if key is None:
+        offset = skip_rows
+        while remaining is None or remaining > 0:
+            limit = page if remaining is None else min(page, remaining)
+            batch = dm.filter(
+                handle.context,
+                filter=handle.filter,
+                columns=columns,
+                limit=limit,
+                offset=offset,
+            )
+            if not batch:
+                return
+            yield from batch
+            offset += len(batch)
+            if remaining is not None:
+                remaining -= len(batch)
+            if len(batch) < limit:
+                return
+        return
+
+    mark: Any = None
+    if skip_rows > 0:
+        seek = dm.filter(
+            handle.context,
+            filter=handle.filter,
+            columns=[key],
+            limit=1,
+            offset=skip_rows - 1,
+            order_by=key,
+        )
+        if not seek:
+            return
+        mark = seek[0][key]
+        logger.info(
+            "[row_streaming] Resuming %s after %s=%r (checkpoint resume)",
+            handle.context,
+            key,
+            mark,
+        )
+
+    while remaining is None or remaining > 0:
+        limit = page if remaining is None else min(page, remaining)
+        batch = dm.filter(
+            handle.context,
+            filter=bounded(None if mark is None else f"{key} > {mark!r}"),
+            columns=columns,
+            limit=limit,
+            order_by=key,
+        )
+        if not batch:
+            return
+        mark = batch[-1][key]
+        for row in batch:
+            if drop_key:
+                row = {name: value for name, value in row.items() if name != key}
+            yield row
+        if remaining is not None:
+            remaining -= len(batch)
+        if len(batch) < limit:
+            return
+
+
 # ---------------------------------------------------------------------------
 # JSONL artifact handle
 # ---------------------------------------------------------------------------
@@ -75,8 +75,37 @@ class ObjectStoreArtifactHandle(BaseModel):
     row_count: Optional[int] = None
 
 
+class ContextRowsHandle(BaseModel):
+    """Rows already stored in a Unify context, read a page at a time on demand.
+
+    Pages are keyed on ``key_column`` -- each read asks for rows past the last
+    key seen -- rather than taken by offset, so every page costs the same
+    however deep into the table it is, and only one page is held at a time.
+    ``key_column`` must be unique and sortable; the caller takes it from the
+    context's schema. ``None`` falls back to offset paging for a context with
+    no such key.
+
+    Rows are read through the DataManager passed to
+    :func:`~unify.common.pipeline.row_streaming.iter_table_input_rows`.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    kind: Literal["context_rows"] = "context_rows"
+    context: str
+    filter: Optional[str] = None
+    columns: list[str] = Field(default_factory=list)
+    key_column: Optional[str] = None
+    page_size: int = 1000
+    row_count: Optional[int] = None
+
+
 TableInputHandle: TypeAlias = (
-    InlineRowsHandle | CsvFileHandle | XlsxSheetHandle | ObjectStoreArtifactHandle
+    InlineRowsHandle
+    | CsvFileHandle
+    | XlsxSheetHandle
+    | ObjectStoreArtifactHandle
+    | ContextRowsHandle
 )
 
 
@@ -447,16 +447,25 @@ class CommsPrimitives:
             if len(contacts) >= limit:
                 return contacts
 
-        escaped = value.replace("\\", "\\\\").replace("'", "\\'")
         try:
-            result = self._contact_manager().filter_contacts(
-                filter=f"{field_name} == '{escaped}'",
-                limit=limit,
-            )
+            if limit == 1:
+                # One sender to resolve: the identity index answers from memory.
+                found = self._contact_manager().get_contact_by_handle(
+                    field_name,
+                    value,
+                )
+                matches = [found] if found is not None else []
+            else:
+                escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+                result = self._contact_manager().filter_contacts(
+                    filter=f"{field_name} == '{escaped}'",
+                    limit=limit,
+                )
+                matches = result.get("contacts", [])
         except Exception:
             return contacts
 
-        for contact in result.get("contacts", []):
+        for contact in matches:
             contact_dict = self._as_contact_dict(contact)
             if contact_dict is None:
                 continue
@@ -252,6 +252,27 @@ class BaseContactManager(BaseStateManager, metaclass=SingletonABCMeta):
         """
         raise NotImplementedError
 
+    def get_contact_by_handle(
+        self,
+        field: str,
+        value: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the contact whose identity *field* (``phone_number``,
+        ``email_address``, ``whatsapp_number``, ``discord_id`` or
+        ``slack_user_id``) equals *value*, as a plain dict, or ``None``.
+
+        This default asks :pyfunc:`filter_contacts`; implementations with a
+        local identity index answer from memory and fall back to it on a miss.
+        """
+        escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+        result = self.filter_contacts(filter=f"{field} == '{escaped}'", limit=1)
+        contacts = result.get("contacts", []) if isinstance(result, dict) else result
+        if not contacts:
+            return None
+        contact = contacts[0]
+        return contact.model_dump() if hasattr(contact, "model_dump") else contact
+
 
 if TYPE_CHECKING:
     # Avoid a runtime import to prevent circular dependencies
@@ -12,6 +12,10 @@ logger = _log
 
 CONTACTS_TABLE = "Contacts"
 CONTACTS_META_TABLE = "Contacts/Meta"
+# Rows per backend read when loading the contact identity index.
+_IDENTITY_PAGE_SIZE = 1000
+# Seconds before a Contacts context whose identity load failed is read again.
+_IDENTITY_RETRY_S = 60.0
 from .prompt_builders import build_ask_prompt, build_update_prompt
 from ..common.embed_utils import ensure_vector_column
 from ..common.tool_outcome import ToolErrorException, ToolOutcome
@@ -32,6 +36,7 @@ from ..common.context_registry import (
     TableContext,
 )
 from ..common.data_store import DataStore
+from .identity_index import contact_identities
 from ..common.llm_helpers import (
     methods_to_tool_dict,
     make_request_clarification_tool,
@@ -148,8 +153,11 @@ class ContactManager(BaseContactManager):
         self._destination_context_lock = threading.RLock()
         self._destination_write_scoped = False
 
-        # Local DataStore mirror (write-through only; never read from it)
+        # Local DataStore mirror: written through on every read and write, and
+        # read back by sender lookups through the identity index that follows it
         self._data_store = DataStore.for_context(self._ctx, key_fields=("contact_id",))
+        contact_identities.attach(self._data_store)
+        self._identity_load_lock = threading.Lock()
 
         # ── immutable built-in columns ───────────────────────────────────
         # Derive the required/built-in columns directly from the Contact model so
@@ -242,7 +250,9 @@ class ContactManager(BaseContactManager):
 
         if context == self._ctx:
             return self._data_store
-        return DataStore.for_context(context, key_fields=("contact_id",))
+        store = DataStore.for_context(context, key_fields=("contact_id",))
+        contact_identities.attach(store)
+        return store
 
     def _membership_target_for_destination(
         self,
@@ -651,6 +661,78 @@ class ContactManager(BaseContactManager):
 
         return results
 
+    def get_contact_by_handle(
+        self,
+        field: str,
+        value: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve an inbound sender by one identity field, from memory when known.
+
+        The in-process identity index answers for every contact read by the
+        startup load or written through this manager; only a miss reaches the
+        backend, and that read's write-through teaches the index the handle.
+        """
+        stores = [
+            self._data_store_for_context(context)
+            for context in self._read_contact_contexts()
+        ]
+        self.warm_identity_index(stores)
+        hit = contact_identities.resolve(field, value, stores)
+        if hit is not None:
+            store, contact_id = hit
+            row = store.get(contact_id)
+            if row is not None:
+                return Contact(
+                    **{k: row[k] for k in self._BUILTIN_FIELDS if k in row},
+                ).model_dump()
+        return super().get_contact_by_handle(field, value)
+
+    def warm_identity_index(self, stores: Optional[List[DataStore]] = None) -> None:
+        """Read each readable Contacts context once, in pages, into its mirror.
+
+        The identity index follows the mirrors, so this is what lets sender
+        resolution run from memory. Contexts already read are skipped, and one
+        whose load failed is not retried for ``_IDENTITY_RETRY_S`` seconds.
+        """
+        if stores is None:
+            stores = [
+                self._data_store_for_context(context)
+                for context in self._read_contact_contexts()
+            ]
+        with self._identity_load_lock:
+            for store in stores:
+                if not contact_identities.load_due(
+                    store,
+                    retry_after=_IDENTITY_RETRY_S,
+                ):
+                    continue
+                try:
+                    offset = 0
+                    while True:
+                        rows = unisdk.get_logs(
+                            context=store.context,
+                            offset=offset,
+                            limit=_IDENTITY_PAGE_SIZE,
+                            from_fields=list(self._BUILTIN_FIELDS),
+                        )
+                        for lg in rows:
+                            if lg.entries.get("contact_id") is not None:
+                                store.put(lg.entries)
+                        if len(rows) < _IDENTITY_PAGE_SIZE:
+                            break
+                        offset += _IDENTITY_PAGE_SIZE
+                except Exception:
+                    _log.warning(
+                        "Contact identity load failed for %s; lookups fall back "
+                        "to the backend",
+                        store.context,
+                        exc_info=True,
+                    )
+                    contact_identities.mark_failed(store)
+                    continue
+                contact_identities.mark_loaded(store)
+
     # ──────────────────────────────────────────────────────────────────────
     #  Private tools (LLM-exposed to tool loops)
     #    – these are the underscore-prefixed methods you pass into add_tools
@@ -0,0 +1,213 @@
+"""
+In-process index from contact handles to contact ids.
+
+Every inbound message resolves its sender by a handle -- a phone number, an
+email address, a WhatsApp number, a Discord or Slack id -- and each of those
+lookups used to be a backend ``filter_contacts`` round trip before any
+routing could happen. The index maps every handle to the contacts that carry
+it, so a known sender resolves from memory. Handles match exactly, as the
+``filter_contacts`` fallback does, so a lookup answers the same whether the
+index is warm or not.
+
+It is filled from one paged read per Contacts context and kept current by the
+write-through ContactManager already does into its ``DataStore`` mirrors: the
+index listens to those stores, so every put, update, delete and clear lands
+here as well. Writes made elsewhere (the Console, another assistant) are seen
+once a miss reads them from the backend, or after
+``invalidate_contact_identities`` drops what the index holds for a context.
+A context whose load failed is not read again until ``retry_after`` seconds
+have passed; lookups go to the backend meanwhile.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
+
+from ..common.data_store import DataStore
+
+#: Contact columns that identify a sender on some medium.
+IDENTITY_FIELDS: Tuple[str, ...] = (
+    "phone_number",
+    "email_address",
+    "whatsapp_number",
+    "discord_id",
+    "slack_user_id",
+)
+
+# (project, context) of one DataStore mirror.
+Source = Tuple[str, str]
+
+
+def normalize_handle(field: str, value: Any) -> Optional[str]:
+    """The form a handle is indexed under, or None for an empty value.
+
+    The value itself: the backend fallback filters on ``field == value``, so
+    folding case or punctuation here would make a warm lookup match handles
+    a cold one does not.
+    """
+    if value is None:
+        return None
+    text = str(value)
+    return text or None
+
+
+def _source(store: DataStore) -> Source:
+    return (store.project, store.context)
+
+
+class ContactIdentityIndex:
+    """Handle → the (source, contact_id) pairs that carry it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._owners: Dict[Tuple[str, str], Set[Tuple[Source, int]]] = {}
+        self._handles: Dict[Tuple[Source, int], Dict[str, str]] = {}
+        self._loaded: Set[Source] = set()
+        self._failed_at: Dict[Source, float] = {}
+
+    # ---- following the DataStore mirrors -------------------------------
+
+    def attach(self, store: DataStore) -> None:
+        """Follow every write to ``store``; attaching twice is a no-op."""
+        store.add_listener(self._on_write)
+
+    def _on_write(
+        self,
+        store: DataStore,
+        key: Optional[Tuple[Any, ...]],
+        row: Optional[Dict[str, Any]],
+    ) -> None:
+        source = _source(store)
+        if key is None:
+            self.invalidate(store.context, project=store.project)
+        elif row is None:
+            self._forget(source, key[0])
+        else:
+            self._observe(source, key[0], row)
+
+    def _observe(self, source: Source, contact_id: Any, row: Dict[str, Any]) -> None:
+        if not isinstance(contact_id, int):
+            return
+        owner = (source, contact_id)
+        with self._lock:
+            handles = self._handles.setdefault(owner, {})
+            for field in IDENTITY_FIELDS:
+                if field not in row:
+                    continue
+                handle = normalize_handle(field, row[field])
+                previous = handles.get(field)
+                if previous == handle:
+                    continue
+                if previous is not None:
+                    self._unlink(field, previous, owner)
+                if handle is None:
+                    handles.pop(field, None)
+                else:
+                    handles[field] = handle
+                    self._owners.setdefault((field, handle), set()).add(owner)
+
+    def _forget(self, source: Source, contact_id: Any) -> None:
+        owner = (source, contact_id)
+        with self._lock:
+            for field, handle in self._handles.pop(owner, {}).items():
+                self._unlink(field, handle, owner)
+
+    def _unlink(self, field: str, handle: str, owner: Tuple[Source, int]) -> None:
+        owners = self._owners.get((field, handle))
+        if owners is not None:
+            owners.discard(owner)
+            if not owners:
+                del self._owners[(field, handle)]
+
+    # ---- lookups ---------------------------------------------------------
+
+    def resolve(
+        self,
+        field: str,
+        value: Any,
+        stores: Sequence[DataStore],
+    ) -> Optional[Tuple[DataStore, int]]:
+        """The store and contact_id carrying ``value``, among ``stores``.
+
+        Several matches resolve as ``filter_contacts`` would: the lowest
+        contact_id, then the earliest store.
+        """
+        handle = normalize_handle(field, value)
+        if handle is None:
+            return None
+        rank = {_source(store): (index, store) for index, store in enumerate(stores)}
+        with self._lock:
+            owners = [
+                (contact_id, rank[source][0], rank[source][1])
+                for source, contact_id in self._owners.get((field, handle), ())
+                if source in rank
+            ]
+        if not owners:
+            return None
+        contact_id, _, store = min(owners, key=lambda owner: owner[:2])
+        return store, contact_id
+
+    # ---- loading and invalidation ---------------------------------------
+
+    def load_due(self, store: DataStore, *, retry_after: float) -> bool:
+        """Whether ``store`` still needs its load, and any failed one has cooled off."""
+        source = _source(store)
+        with self._lock:
+            if source in self._loaded:
+                return False
+            failed_at = self._failed_at.get(source)
+        return failed_at is None or time.monotonic() - failed_at >= retry_after
+
+    def mark_loaded(self, store: DataStore) -> None:
+        with self._lock:
+            self._loaded.add(_source(store))
+            self._failed_at.pop(_source(store), None)
+
+    def mark_failed(self, store: DataStore) -> None:
+        with self._lock:
+            self._failed_at[_source(store)] = time.monotonic()
+
+    def invalidate(
+        self,
+        context: Optional[str] = None,
+        *,
+        project: Optional[str] = None,
+    ) -> None:
+        """Forget the handles of one context (or all) so the next lookup reloads it."""
+
+        def matches(source: Source) -> bool:
+            return (project is None or source[0] == project) and (
+                context is None or source[1] == context
+            )
+
+        with self._lock:
+            for owner in [owner for owner in self._handles if matches(owner[0])]:
+                for field, handle in self._handles.pop(owner).items():
+                    self._unlink(field, handle, owner)
+            self._loaded = {source for source in self._loaded if not matches(source)}
+            for source in [source for source in self._failed_at if matches(source)]:
+                del self._failed_at[source]
+
+
+#: The process-wide index; every ContactManager attaches its mirrors to it.
+contact_identities = ContactIdentityIndex()
+
+
+def invalidate_contact_identities(context: Optional[str] = None) -> None:
+    """Drop what the index holds for one Contacts context, or for all of them.
+
+    For changes made outside this process; the next lookup reads the context
+    again.
+    """
+    contact_identities.invalidate(context)
+
+
+__all__ = [
+    "IDENTITY_FIELDS",
+    "ContactIdentityIndex",
+    "contact_identities",
+    "invalidate_contact_identities",
+    "normalize_handle",
+]
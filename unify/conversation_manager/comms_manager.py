@@ -173,6 +173,7 @@ def _already_seen_ms_teams_bot(message_key: str) -> bool:
 if TYPE_CHECKING:
     from unify.conversation_manager.in_memory_event_broker import InMemoryEventBroker
     from unify.gateway.ingress import IngressTransport
+    from unify.gateway.ingress_keyed import KeyedEnvelopeDispatcher
 
     EventBroker = InMemoryEventBroker
     _ = IngressTransport  # silence unused-import on the TYPE_CHECKING branch
@@ -464,16 +465,9 @@ def _get_or_create_unknown_contact(
                 return None
 
             # Check if contact already exists
-            result = cm.filter_contacts(
-                filter=f"{field_name} == '{contact_detail}'",
-                limit=1,
-            )
-            existing = result.get("contacts", [])
-            if existing:
-                contact = existing[0]
-                return (
-                    contact.model_dump() if hasattr(contact, "model_dump") else contact
-                )
+            existing = cm.get_contact_by_handle(field_name, contact_detail)
+            if existing is not None:
+                return existing
 
             # Create new unknown contact
             create_kwargs = {
@@ -600,14 +594,7 @@ def _lookup_known_contact(medium: str, contact_detail: str) -> dict | None:
         cm = ManagerRegistry.get_contact_manager()
         if cm is None:
             return None
-        result = cm.filter_contacts(
-            filter=f"{field_name} == '{contact_detail}'",
-            limit=1,
-        )
-        contacts = result.get("contacts", [])
-        if contacts:
-            contact = contacts[0]
-            return contact.model_dump() if hasattr(contact, "model_dump") else contact
+        return cm.get_contact_by_handle(field_name, contact_detail)
     except Exception as e:
         LOGGER.error(f"{DEFAULT_ICON} Error in _lookup_known_contact: {e}")
     return None
@@ -820,6 +807,7 @@ class CommsManager:
         event_broker: "EventBroker",
         ingress_transport: "IngressTransport | None" = None,
         ingress_transport_factory: "Callable[[], IngressTransport | None] | None" = None,
+        ingress_max_concurrency: int | None = None,
     ):
         self.subscribers: dict = {}
         self.call_proc = None
@@ -845,6 +833,12 @@ class CommsManager:
         self.ingress_transport_factory: (
             "Callable[[], IngressTransport | None] | None"
         ) = ingress_transport_factory
+        # When set, the injected transport delivers through a
+        # KeyedEnvelopeDispatcher: FIFO per conversation, concurrent across
+        # conversations, at most this many dispatching at once. None keeps
+        # the transport calling dispatch_envelope_payload directly.
+        self.ingress_max_concurrency = ingress_max_concurrency
+        self.keyed_dispatcher: "KeyedEnvelopeDispatcher | None" = None
 
     def _publish_from_callback(self, channel: str, message: str) -> None:
         """
@@ -2573,7 +2567,10 @@ class CommsManager:
            via ``subscribe_to_topic``.
 
         All three paths produce the same observable behaviour against
-        ``event_broker``.
+        ``event_broker``. With ``ingress_max_concurrency`` set, a
+        transport from (1) or (2) delivers through a
+        ``KeyedEnvelopeDispatcher`` instead of calling
+        ``dispatch_envelope_payload`` directly.
         """
         transport = self.ingress_transport
         if self.ingress_transport_factory is not None:
@@ -2581,14 +2578,24 @@ class CommsManager:
             # Cache the factory-materialized transport so _stop can reach it.
             self.ingress_transport = transport
         if transport is not None:
-            await transport.start(self.dispatch_envelope_payload)
+            dispatcher = self.dispatch_envelope_payload
+            if self.ingress_max_concurrency:
+                from unify.gateway.ingress_keyed import KeyedEnvelopeDispatcher
+
+                self.keyed_dispatcher = KeyedEnvelopeDispatcher(
+                    dispatcher,
+                    max_concurrency=self.ingress_max_concurrency,
+                )
+                dispatcher = self.keyed_dispatcher
+            await transport.start(dispatcher)
             return
         self.subscribe_to_topic(_get_subscription_id(), max_messages=10)
 
     async def _stop_inbound_subscription(self) -> None:
         """Tear down inbound envelope delivery on shutdown.
 
-        Stops the injected transport (if present) and cancels any
+        Stops the injected transport (if present), lets its keyed
+        dispatcher finish what it already accepted, and cancels any
         streaming-pull futures created by the legacy inline path.
         Idempotent against both paths.
         """
@@ -2599,6 +2606,8 @@ class CommsManager:
                 LOGGER.warning(
                     f"{ICONS['lifecycle']} ingress_transport.stop raised: {exc}",
                 )
+        if self.keyed_dispatcher is not None:
+            await self.keyed_dispatcher.close()
         for future in self.subscribers.values():
             try:
                 future.cancel()
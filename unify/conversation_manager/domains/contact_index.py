@@ -468,51 +468,18 @@ class ContactIndex:
                 if contact_id is not None:
                     result = self._contact_manager.get_contact_info(contact_id)
                     return result.get(contact_id)
-                elif phone_number is not None:
-                    result = self._contact_manager.filter_contacts(
-                        filter=f"phone_number == '{phone_number}'",
-                        limit=1,
-                    )
-                    contacts = result.get("contacts", [])
-                    if contacts:
-                        c = contacts[0]
-                        return c.model_dump() if hasattr(c, "model_dump") else c
-                elif email is not None:
-                    result = self._contact_manager.filter_contacts(
-                        filter=f"email_address == '{email}'",
-                        limit=1,
-                    )
-                    contacts = result.get("contacts", [])
-                    if contacts:
-                        c = contacts[0]
-                        return c.model_dump() if hasattr(c, "model_dump") else c
-                elif whatsapp_number is not None:
-                    result = self._contact_manager.filter_contacts(
-                        filter=f"whatsapp_number == '{whatsapp_number}'",
-                        limit=1,
-                    )
-                    contacts = result.get("contacts", [])
-                    if contacts:
-                        c = contacts[0]
-                        return c.model_dump() if hasattr(c, "model_dump") else c
-                elif discord_id is not None:
-                    result = self._contact_manager.filter_contacts(
-                        filter=f"discord_id == '{discord_id}'",
-                        limit=1,
-                    )
-                    contacts = result.get("contacts", [])
-                    if contacts:
-                        c = contacts[0]
-                        return c.model_dump() if hasattr(c, "model_dump") else c
-                elif slack_user_id is not None:
-                    result = self._contact_manager.filter_contacts(
-                        filter=f"slack_user_id == '{slack_user_id}'",
-                        limit=1,
-                    )
-                    contacts = result.get("contacts", [])
-                    if contacts:
-                        c = contacts[0]
-                        return c.model_dump() if hasattr(c, "model_dump") else c
+                for field, value in (
+                    ("phone_number", phone_number),
+                    ("email_address", email),
+                    ("whatsapp_number", whatsapp_number),
+                    ("discord_id", discord_id),
+                    ("slack_user_id", slack_user_id),
+                ):
+                    if value is not None:
+                        return self._contact_manager.get_contact_by_handle(
+                            field,
+                            value,
+                        )
             except Exception:
                 return None
         return None
@@ -9,6 +9,7 @@ import traceback
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Union
 
+from unify.contact_manager.identity_index import invalidate_contact_identities
 from unify.contact_manager.types.contact import UNASSIGNED
 from unify.common.context_registry import ContextRegistry
 from unify.common.hierarchical_logger import DEFAULT_ICON
@@ -3891,6 +3892,9 @@ async def _(
     )
 
     async def _sync_contacts():
+        # Contacts changed upstream: sender lookups re-read them rather than
+        # trust handles indexed before the change.
+        invalidate_contact_identities()
         try:
             await asyncio.to_thread(cm.contact_manager._sync_required_contacts)
             cm._session_logger.info("state_update", "Contacts synced successfully")
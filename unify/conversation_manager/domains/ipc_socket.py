@@ -23,18 +23,30 @@ Architecture:
 
     The server runs all socket I/O in a dedicated thread with its own event
     loop, so reads/writes are never blocked by work on the main loop.
+
+Wire format:
+    Each event is one length-prefixed frame: a 4-byte big-endian body length,
+    a 2-byte channel length, the UTF-8 channel, then the event JSON exactly as
+    the caller produced it. The event is never wrapped in another JSON
+    document, so it is encoded once by its producer and decoded once by its
+    consumer. Frames queued in the same event-loop tick go out in one write,
+    and each channel may only have ``CHANNEL_HIGH_WATER_BYTES`` queued and
+    unwritten at a time; past that its senders wait, other channels do not.
 """
 
 from __future__ import annotations
 
 import asyncio
 import concurrent.futures
-import json
 import logging
 import os
 import socket
+import struct
 import tempfile
 import threading
+import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Awaitable
 from uuid import uuid4
@@ -55,6 +67,249 @@ if TYPE_CHECKING:
 
 CM_EVENT_SOCKET_ENV = "CM_EVENT_SOCKET"
 
+# ----------------------------------------------------------------------
+# Framing
+# ----------------------------------------------------------------------
+
+# Body length (channel + event bytes), then channel length.
+_FRAME_HEADER = struct.Struct("!IH")
+
+#: A frame claiming a larger body is treated as a corrupt stream.
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+#: Queued-but-unwritten bytes one channel may hold per connection before its
+#: senders wait for the peer to read.
+CHANNEL_HIGH_WATER_BYTES = 4 * 1024 * 1024
+
+_RECV_BYTES = 256 * 1024
+
+
+class FrameError(ValueError):
+    """The byte stream does not hold a valid frame; the connection is dropped.
+
+    ``events`` holds the frames the same ``feed`` decoded before the bad one.
+    They arrived intact, so receivers deliver them before dropping.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        events: list[tuple[str, str]] | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.events = events or []
+
+
+def encode_frame(channel: str, event_json: str) -> bytes:
+    """One event as a length-prefixed frame."""
+    channel_bytes = channel.encode("utf-8")
+    event_bytes = event_json.encode("utf-8")
+    body_len = len(channel_bytes) + len(event_bytes)
+    if len(channel_bytes) > 0xFFFF or body_len > MAX_FRAME_BYTES:
+        raise FrameError(f"frame too large for channel {channel!r}: {body_len} bytes")
+    return (
+        _FRAME_HEADER.pack(body_len, len(channel_bytes)) + channel_bytes + event_bytes
+    )
+
+
+class FrameDecoder:
+    """Reassembles frames from arbitrary ``recv`` chunks."""
+
+    def __init__(self, max_frame_bytes: int = MAX_FRAME_BYTES) -> None:
+        self._max_frame_bytes = max_frame_bytes
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> list[tuple[str, str]]:
+        """Every complete (channel, event_json) in the stream so far."""
+        buffer = self._buffer
+        buffer += data
+        events: list[tuple[str, str]] = []
+        offset = 0
+        header_size = _FRAME_HEADER.size
+        while len(buffer) - offset >= header_size:
+            body_len, channel_len = _FRAME_HEADER.unpack_from(buffer, offset)
+            if body_len > self._max_frame_bytes or channel_len > body_len:
+                raise FrameError(
+                    f"invalid frame header (body={body_len}, channel={channel_len})",
+                    events,
+                )
+            start = offset + header_size
+            end = start + body_len
+            if len(buffer) < end:
+                break
+            view = memoryview(buffer)
+            try:
+                channel = str(view[start : start + channel_len], "utf-8")
+                event_json = str(view[start + channel_len : end], "utf-8")
+            except UnicodeDecodeError as e:
+                raise FrameError(f"frame is not UTF-8: {e}", events) from e
+            finally:
+                view.release()
+            events.append((channel, event_json))
+            offset = end
+        if offset:
+            del buffer[:offset]
+        return events
+
+
+@dataclass
+class ChannelStats:
+    """Send-side counters for one channel."""
+
+    frames: int = 0
+    bytes: int = 0
+    #: Sends that had to wait for the channel's queue to drain.
+    stalls: int = 0
+    #: Time from a frame being queued to its bytes reaching the socket.
+    latency_ms_total: float = 0.0
+    latency_ms_max: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "stalls": self.stalls,
+            "mean_latency_ms": (
+                self.latency_ms_total / self.frames if self.frames else 0.0
+            ),
+            "max_latency_ms": self.latency_ms_max,
+        }
+
+
+class ChannelMetrics:
+    """Per-channel send counters, readable from any thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._channels: dict[str, ChannelStats] = {}
+
+    def record(self, channel: str, size: int, latency_s: float) -> None:
+        latency_ms = latency_s * 1000.0
+        with self._lock:
+            stats = self._channels.setdefault(channel, ChannelStats())
+            stats.frames += 1
+            stats.bytes += size
+            stats.latency_ms_total += latency_ms
+            stats.latency_ms_max = max(stats.latency_ms_max, latency_ms)
+
+    def stall(self, channel: str) -> None:
+        with self._lock:
+            self._channels.setdefault(channel, ChannelStats()).stalls += 1
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {ch: stats.as_dict() for ch, stats in self._channels.items()}
+
+
+class _FrameWriter:
+    """The one writer of a connected socket.
+
+    Frames queued while a write is pending, or within the same event-loop
+    tick, are joined into a single ``sock_sendall``; a frame is never split
+    across writers, so concurrent senders cannot interleave bytes. ``send``
+    resolves once its frame is on the socket and raises if the write failed.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        loop: asyncio.AbstractEventLoop,
+        metrics: ChannelMetrics,
+        *,
+        high_water_bytes: int = CHANNEL_HIGH_WATER_BYTES,
+    ) -> None:
+        self._sock = sock
+        self._loop = loop
+        self._metrics = metrics
+        self._high_water = high_water_bytes
+        self._queue: list[tuple[str, bytes, float, asyncio.Future]] = []
+        self._queued_bytes: dict[str, int] = {}
+        self._waiters: dict[str, deque[tuple[int, asyncio.Future]]] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._error: BaseException | None = None
+
+    async def send(self, channel: str, frame: bytes) -> None:
+        if self._error is not None:
+            raise self._error
+        await self._reserve(channel, len(frame))
+        done = self._loop.create_future()
+        self._queue.append((channel, frame, time.monotonic(), done))
+        if self._flush_task is None:
+            # Runs on the next tick, after every send queued in this one.
+            self._flush_task = self._loop.create_task(self._flush())
+        await done
+
+    async def _reserve(self, channel: str, size: int) -> None:
+        queued = self._queued_bytes.get(channel, 0)
+        if not self._waiters.get(channel) and (
+            queued == 0 or queued + size <= self._high_water
+        ):
+            self._queued_bytes[channel] = queued + size
+            return
+        granted = self._loop.create_future()
+        self._waiters.setdefault(channel, deque()).append((size, granted))
+        self._metrics.stall(channel)
+        await granted
+
+    def _release(self, channel: str, size: int) -> None:
+        queued = self._queued_bytes.get(channel, 0) - size
+        waiters = self._waiters.get(channel)
+        while waiters:
+            need, granted = waiters[0]
+            if granted.done():
+                waiters.popleft()
+                continue
+            if queued and queued + need > self._high_water:
+                break
+            waiters.popleft()
+            queued += need
+            granted.set_result(None)
+        self._queued_bytes[channel] = queued
+
+    async def _flush(self) -> None:
+        try:
+            while self._queue:
+                batch, self._queue = self._queue, []
+                try:
+                    await self._loop.sock_sendall(
+                        self._sock,
+                        b"".join(frame for _, frame, _, _ in batch),
+                    )
+                except (Exception, asyncio.CancelledError) as e:
+                    error = (
+                        e
+                        if isinstance(e, Exception)
+                        else ConnectionError("writer closed")
+                    )
+                    for _, _, _, done in batch:
+                        if not done.done():
+                            done.set_exception(error)
+                    self.fail(error)
+                    if isinstance(e, asyncio.CancelledError):
+                        raise
+                    return
+                written_at = time.monotonic()
+                for channel, frame, queued_at, done in batch:
+                    self._release(channel, len(frame))
+                    self._metrics.record(channel, len(frame), written_at - queued_at)
+                    if not done.done():
+                        done.set_result(None)
+        finally:
+            self._flush_task = None
+
+    def fail(self, error: BaseException) -> None:
+        """Fail every queued and waiting send; later sends raise ``error``."""
+        self._error = error
+        queue, self._queue = self._queue, []
+        for _, _, _, done in queue:
+            if not done.done():
+                done.set_exception(error)
+        for waiters in self._waiters.values():
+            for _, granted in waiters:
+                if not granted.done():
+                    granted.set_exception(error)
+        self._waiters.clear()
+
 
 class CallEventSocketServer:
     """
@@ -101,12 +356,12 @@ class CallEventSocketServer:
         self._connected_clients: list[socket.socket] = []
         self._pending_messages: list[tuple[str, str]] = []
 
-        # Serializes every ``sock_sendall`` on the I/O loop. A message larger
-        # than the socket send buffer makes ``sock_sendall`` yield mid-write;
-        # without this lock a concurrently-dispatched forward would interleave
-        # its bytes into the same fd, corrupting the newline-framed stream.
-        # Created on the I/O loop in ``_run_io_loop`` so it binds to that loop.
-        self._send_lock: asyncio.Lock | None = None
+        # One writer per client owns every ``sock_sendall`` to it. A message
+        # larger than the socket send buffer makes ``sock_sendall`` yield
+        # mid-write; a second writer on the same fd would interleave its bytes
+        # and corrupt the framing. Managed from the I/O loop.
+        self._writers: dict[socket.socket, _FrameWriter] = {}
+        self._metrics = ChannelMetrics()
 
         # Forward subscription (runs in main loop)
         self._forward_task: asyncio.Task | None = None
@@ -125,6 +380,10 @@ class CallEventSocketServer:
         """Return the socket path, or None if not started."""
         return self._socket_path
 
+    def channel_stats(self) -> dict[str, dict]:
+        """Per-channel frames, bytes, stalls and write latency sent to clients."""
+        return self._metrics.snapshot()
+
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
@@ -276,7 +535,6 @@ class CallEventSocketServer:
         try:
             self._io_loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self._io_loop)
-            self._send_lock = asyncio.Lock()
             self._io_ready.set()
             self._io_loop.run_forever()
         except Exception as e:
@@ -300,48 +558,46 @@ class CallEventSocketServer:
                 LOGGER.debug(f"{ICONS['ipc']} [CallEventSocketServer] Client connected")
 
                 self._connected_clients.append(client_socket)
+                writer = _FrameWriter(client_socket, loop, self._metrics)
+                self._writers[client_socket] = writer
 
-                # Flush any messages buffered before a client connected
+                # Flush any messages buffered before a client connected; queued
+                # together, they go out in one write.
                 if self._pending_messages:
                     LOGGER.debug(
                         f"{ICONS['ipc']} [CallEventSocketServer] Flushing "
                         f"{len(self._pending_messages)} buffered message(s)",
                     )
-                    for channel, event_json in self._pending_messages:
-                        message_id = payload_trace_id(
-                            "ipc",
-                            str(channel),
-                            str(event_json),
-                        )
-                        try:
-                            msg = (
-                                json.dumps(
-                                    {"channel": channel, "event": event_json},
-                                )
-                                + "\n"
-                            )
-                            async with self._send_lock:
-                                await loop.sock_sendall(
-                                    client_socket,
-                                    msg.encode("utf-8"),
-                                )
-                            LOGGER.debug(
-                                f"{ICONS['ipc']} {
-                                    trace_kv(
-                                        'IPC_SERVER_FLUSH_BUFFERED',
-                                        channel=channel,
-                                        message_id=message_id,
-                                        ts_utc=now_utc_iso(),
-                                        monotonic_ms=monotonic_ms(),
-                                    )
-                                }",
-                            )
-                        except Exception as e:
+                    pending, self._pending_messages = self._pending_messages, []
+                    results = await asyncio.gather(
+                        *(
+                            writer.send(channel, encode_frame(channel, event_json))
+                            for channel, event_json in pending
+                        ),
+                        return_exceptions=True,
+                    )
+                    for (channel, event_json), result in zip(pending, results):
+                        if isinstance(result, BaseException):
                             LOGGER.debug(
                                 f"{ICONS['ipc']} [CallEventSocketServer] Failed to flush "
-                                f"buffered message: {e}",
+                                f"buffered message: {result}",
                             )
-                    self._pending_messages.clear()
+                            continue
+                        LOGGER.debug(
+                            f"{ICONS['ipc']} {
+                                trace_kv(
+                                    'IPC_SERVER_FLUSH_BUFFERED',
+                                    channel=channel,
+                                    message_id=payload_trace_id(
+                                        'ipc',
+                                        str(channel),
+                                        str(event_json),
+                                    ),
+                                    ts_utc=now_utc_iso(),
+                                    monotonic_ms=monotonic_ms(),
+                                )
+                            }",
+                        )
 
                 task = asyncio.create_task(self._handle_client(client_socket))
                 self._client_tasks.append(task)
@@ -367,22 +623,29 @@ class CallEventSocketServer:
         which causes ``sock_recv`` to return empty bytes or raise ``OSError``.
         """
         loop = asyncio.get_running_loop()
-        buffer = b""
+        decoder = FrameDecoder()
 
         try:
             while self._running:
                 try:
-                    chunk = await loop.sock_recv(client_socket, 4096)
+                    chunk = await loop.sock_recv(client_socket, _RECV_BYTES)
                     if not chunk:
                         break
 
-                    buffer += chunk
-
-                    while b"\n" in buffer:
-                        line, buffer = buffer.split(b"\n", 1)
-                        if line:
-                            self._dispatch_to_main_loop(line.decode("utf-8"))
-
+                    try:
+                        events = decoder.feed(chunk)
+                    except FrameError as e:
+                        if e.events:
+                            self._dispatch_to_main_loop(e.events)
+                        raise
+                    if events:
+                        self._dispatch_to_main_loop(events)
+
+                except FrameError as e:
+                    LOGGER.error(
+                        f"{ICONS['ipc']} [CallEventSocketServer] Dropping client: {e}",
+                    )
+                    break
                 except (OSError, ConnectionError):
                     break
                 except asyncio.CancelledError:
@@ -395,6 +658,9 @@ class CallEventSocketServer:
         finally:
             if client_socket in self._connected_clients:
                 self._connected_clients.remove(client_socket)
+            writer = self._writers.pop(client_socket, None)
+            if writer is not None:
+                writer.fail(ConnectionError("client disconnected"))
             no_clients_left = len(self._connected_clients) == 0
             try:
                 client_socket.close()
@@ -421,11 +687,15 @@ class CallEventSocketServer:
                         f"dispatch error: {e}",
                     )
 
-    def _dispatch_to_main_loop(self, message: str) -> None:
-        """Schedule message processing on the main event loop (thread-safe)."""
+    def _dispatch_to_main_loop(self, events: list[tuple[str, str]]) -> None:
+        """Schedule processing of one read's events on the main loop (thread-safe).
+
+        The events of one ``recv`` cross threads together and are processed in
+        order, rather than costing a cross-thread hop each.
+        """
         if self._main_loop and self._main_loop.is_running():
             future = asyncio.run_coroutine_threadsafe(
-                self._process_message(message),
+                self._process_messages(events),
                 self._main_loop,
             )
             with self._main_loop_future_lock:
@@ -460,10 +730,6 @@ class CallEventSocketServer:
         If no clients are connected, the message is buffered.
         """
         message_id = payload_trace_id("ipc", str(channel), str(event_json))
-        message = json.dumps({"channel": channel, "event": event_json}) + "\n"
-        message_bytes = message.encode("utf-8")
-
-        loop = asyncio.get_running_loop()
 
         if not self._connected_clients:
             self._pending_messages.append((channel, event_json))
@@ -488,19 +754,25 @@ class CallEventSocketServer:
             )
             return
 
-        async with self._send_lock:
-            for client in self._connected_clients:
-                try:
-                    await loop.sock_sendall(client, message_bytes)
-                except Exception as e:
-                    _log.warning(
-                        "[CallEventSocketServer] sock_sendall failed "
-                        "(client kept): %s",
-                        e,
-                    )
-                    LOGGER.debug(
-                        f"{ICONS['ipc']} [CallEventSocketServer] Failed to send to client: {e}",
-                    )
+        frame = encode_frame(channel, event_json)
+        writers = [
+            self._writers[client]
+            for client in self._connected_clients
+            if client in self._writers
+        ]
+        results = await asyncio.gather(
+            *(writer.send(channel, frame) for writer in writers),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _log.warning(
+                    "[CallEventSocketServer] sock_sendall failed (client kept): %s",
+                    result,
+                )
+                LOGGER.debug(
+                    f"{ICONS['ipc']} [CallEventSocketServer] Failed to send to client: {result}",
+                )
 
         if self._connected_clients:
             _log.debug(
@@ -532,6 +804,10 @@ class CallEventSocketServer:
         ``call_soon(loop.stop)`` fires before the task-completion callback),
         causing the main-loop ``wait_for`` to time out.
         """
+        for writer in self._writers.values():
+            writer.fail(ConnectionError("server stopped"))
+        self._writers.clear()
+
         # Close client sockets (interrupts any pending sock_recv)
         for client in list(self._connected_clients):
             try:
@@ -558,16 +834,18 @@ class CallEventSocketServer:
     # Main loop
     # ------------------------------------------------------------------
 
-    async def _process_message(self, message: str) -> None:
+    async def _process_messages(self, events: list[tuple[str, str]]) -> None:
+        """Runs in main loop. Processes one read's events in arrival order."""
+        for channel, event_json in events:
+            await self._process_message(channel, event_json)
+
+    async def _process_message(self, channel: str, event_json: str) -> None:
         """Runs in main loop. Processes a message received from a client."""
         try:
-            data = json.loads(message)
-            channel = data.get("channel", "")
-            event_json = data.get("event", "")
-
             if not channel or not event_json:
                 LOGGER.debug(
-                    f"{ICONS['ipc']} [CallEventSocketServer] Invalid message format: {message[:100]}",
+                    f"{ICONS['ipc']} [CallEventSocketServer] Invalid message format: "
+                    f"channel={channel!r} event={event_json[:100]!r}",
                 )
                 return
 
@@ -589,10 +867,6 @@ class CallEventSocketServer:
             else:
                 await self._event_broker.publish(channel, event_json)
 
-        except json.JSONDecodeError as e:
-            LOGGER.error(
-                f"{ICONS['ipc']} [CallEventSocketServer] JSON decode error: {e}",
-            )
         except Exception as e:
             LOGGER.error(
                 f"{ICONS['ipc']} [CallEventSocketServer] Error processing message: {e}",
@@ -699,7 +973,11 @@ class CallEventSocketClient:
         self._socket_path = socket_path
         self._socket: socket.socket | None = None
         self._connected = False
+        # Serializes connecting; sends go through ``_writer`` concurrently so
+        # the events of one tick share a write.
         self._lock = asyncio.Lock()
+        self._writer: _FrameWriter | None = None
+        self._metrics = ChannelMetrics()
         self._receive_task: asyncio.Task | None = None
         self._on_event: Callable[[str, str], Awaitable[None]] | None = None
         self._running = False
@@ -716,6 +994,10 @@ class CallEventSocketClient:
             return cls(socket_path)
         return None
 
+    def channel_stats(self) -> dict[str, dict]:
+        """Per-channel frames, bytes, stalls and write latency sent to the parent."""
+        return self._metrics.snapshot()
+
     async def connect(self) -> bool:
         """Connect to the socket server. Returns True on success."""
         if self._connected:
@@ -728,6 +1010,7 @@ class CallEventSocketClient:
             loop = asyncio.get_event_loop()
             await loop.sock_connect(self._socket, self._socket_path)
 
+            self._writer = _FrameWriter(self._socket, loop, self._metrics)
             self._connected = True
             LOGGER.debug(
                 f"{ICONS['ipc']} [CallEventSocketClient] Connected to {self._socket_path}",
@@ -779,7 +1062,7 @@ class CallEventSocketClient:
         to return empty bytes or raise ``OSError``.
         """
         loop = asyncio.get_event_loop()
-        buffer = b""
+        decoder = FrameDecoder()
         reconnect_attempts = 0
         max_reconnect_attempts = 3
         iteration = 0
@@ -810,14 +1093,14 @@ class CallEventSocketClient:
                     await asyncio.sleep(0.5)
                     if not await self.connect():
                         continue
-                    buffer = b""
+                    decoder = FrameDecoder()
                     LOGGER.debug(
                         f"{ICONS['ipc']} [CallEventSocketClient] Reconnected successfully",
                     )
                     reconnect_attempts = 0
 
                 try:
-                    chunk = await loop.sock_recv(self._socket, 4096)
+                    chunk = await loop.sock_recv(self._socket, _RECV_BYTES)
                     if not chunk:
                         LOGGER.debug(
                             f"{ICONS['ipc']} [CallEventSocketClient] Server disconnected",
@@ -832,26 +1115,22 @@ class CallEventSocketClient:
                         f"total_recv={recv_count}",
                     )
 
-                    buffer += chunk
-
-                    while b"\n" in buffer:
-                        line, buffer = buffer.split(b"\n", 1)
-                        if line:
-                            await self._process_received_message(line.decode("utf-8"))
-
-                except (OSError, ConnectionError):
+                    try:
+                        events = decoder.feed(chunk)
+                    except FrameError as e:
+                        for channel, event_json in e.events:
+                            await self._process_received_message(channel, event_json)
+                        raise
+                    for channel, event_json in events:
+                        await self._process_received_message(channel, event_json)
+
+                except (OSError, ConnectionError, FrameError):
                     if self._running:
                         LOGGER.debug(
                             f"{ICONS['ipc']} [CallEventSocketClient] Socket closed/error, "
                             f"iteration={iteration}",
                         )
-                        self._connected = False
-                        if self._socket:
-                            try:
-                                self._socket.close()
-                            except Exception:
-                                pass
-                            self._socket = None
+                        self._drop_connection(ConnectionError("receive failed"))
                     continue
                 except asyncio.CancelledError:
                     break
@@ -861,13 +1140,7 @@ class CallEventSocketClient:
                             f"{ICONS['ipc']} [CallEventSocketClient] Receive error: {e} "
                             f"iteration={iteration}",
                         )
-                        self._connected = False
-                        if self._socket:
-                            try:
-                                self._socket.close()
-                            except Exception:
-                                pass
-                            self._socket = None
+                        self._drop_connection(ConnectionError("receive failed"))
                     continue
 
         except Exception as e:
@@ -881,16 +1154,13 @@ class CallEventSocketClient:
                 f"iterations={iteration} recv={recv_count}",
             )
 
-    async def _process_received_message(self, message: str) -> None:
+    async def _process_received_message(self, channel: str, event_json: str) -> None:
         """Process a message received from the server."""
         try:
-            data = json.loads(message)
-            channel = data.get("channel", "")
-            event_json = data.get("event", "")
-
             if not channel or not event_json:
                 LOGGER.debug(
-                    f"{ICONS['ipc']} [CallEventSocketClient] Invalid message format: {message[:100]}",
+                    f"{ICONS['ipc']} [CallEventSocketClient] Invalid message format: "
+                    f"channel={channel!r} event={event_json[:100]!r}",
                 )
                 return
 
@@ -910,10 +1180,6 @@ class CallEventSocketClient:
             if self._on_event:
                 await self._on_event(channel, event_json)
 
-        except json.JSONDecodeError as e:
-            LOGGER.error(
-                f"{ICONS['ipc']} [CallEventSocketClient] JSON decode error: {e}",
-            )
         except Exception as e:
             LOGGER.error(
                 f"{ICONS['ipc']} [CallEventSocketClient] Error processing message: {e}",
@@ -930,8 +1196,7 @@ class CallEventSocketClient:
         Returns:
             True if sent successfully, False otherwise.
         """
-        async with self._lock:
-            return await self._send_event_impl(channel, event_json, retry=True)
+        return await self._send_event_impl(channel, event_json, retry=True)
 
     async def _send_event_impl(
         self,
@@ -941,23 +1206,14 @@ class CallEventSocketClient:
     ) -> bool:
         """Internal send implementation with optional retry."""
         if not self._connected:
-            if not await self.connect():
-                return False
+            async with self._lock:
+                if not self._connected and not await self.connect():
+                    return False
 
         try:
             message_id = payload_trace_id("ipc", channel, event_json)
-            message = (
-                json.dumps(
-                    {
-                        "channel": channel,
-                        "event": event_json,
-                    },
-                )
-                + "\n"
-            )
-
-            loop = asyncio.get_event_loop()
-            await loop.sock_sendall(self._socket, message.encode("utf-8"))
+            writer = self._writer
+            await writer.send(channel, encode_frame(channel, event_json))
             LOGGER.debug(
                 f"{ICONS['ipc']} {
                     trace_kv(
@@ -974,17 +1230,21 @@ class CallEventSocketClient:
 
         except Exception as e:
             LOGGER.error(f"{ICONS['ipc']} [CallEventSocketClient] Send failed: {e}")
-            self._connected = False
-            if self._socket:
-                self._socket.close()
-                self._socket = None
+            if isinstance(e, FrameError):
+                return False
+            # Every send queued on a failed writer lands here; only the first
+            # tears down the connection it was written to.
+            if self._writer is writer:
+                self._drop_connection(e)
 
             # Try to reconnect and retry once
             if retry:
                 LOGGER.debug(
                     f"{ICONS['ipc']} [CallEventSocketClient] Attempting reconnect...",
                 )
-                if await self.connect():
+                async with self._lock:
+                    connected = self._connected or await self.connect()
+                if connected:
                     # Restart receive loop if it was running
                     if self._on_event and (
                         self._receive_task is None or self._receive_task.done()
@@ -998,6 +1258,15 @@ class CallEventSocketClient:
 
             return False
 
+    def _drop_connection(self, error: BaseException) -> None:
+        self._connected = False
+        if self._writer is not None:
+            self._writer.fail(error)
+            self._writer = None
+        if self._socket:
+            self._socket.close()
+            self._socket = None
+
     async def stop(self) -> None:
         """Stop the receive loop."""
         self._running = False
@@ -1012,10 +1281,7 @@ class CallEventSocketClient:
     async def close(self) -> None:
         """Close the connection."""
         await self.stop()
-        if self._socket:
-            self._socket.close()
-            self._socket = None
-        self._connected = False
+        self._drop_connection(ConnectionError("client closed"))
 
 
 # Singleton client for use in call scripts
@@ -2329,6 +2329,16 @@ def _init_managers(
         asyncio.to_thread(_sync_manual_voice_enrollment),
         loop,
     )
+
+    # Load the contact identity index in the background so inbound senders
+    # resolve from memory; a lookup that arrives first waits for this load
+    # rather than starting its own.
+    warm_identity_index = getattr(cm.contact_manager, "warm_identity_index", None)
+    if warm_identity_index is not None:
+        asyncio.run_coroutine_threadsafe(
+            asyncio.to_thread(warm_identity_index),
+            loop,
+        )
     _contact_dur = perf_counter() - local_start_time
     LOGGER.info(
         f"{ICONS['managers_worker']} [ManagersWorker] ContactManager ({type(cm.contact_manager).__name__}) initialized in "
@@ -118,6 +118,8 @@ async def arm_workflows_for_connected_app(app_slug: str) -> Dict[str, Any]:
     if manager is None:
         return {}
 
+    # The connection changed, so what listings last read about it is stale.
+    manager.invalidate_listing()
     report = await asyncio.to_thread(manager.reconcile_installed)
     armed = {
         slug: result["tasks_newly_armed"]
@@ -341,6 +341,9 @@ async def run_conversation_manager(
         comms_manager = CommsManager(
             event_broker=event_broker,
             ingress_transport_factory=ingress_transport_factory,
+            ingress_max_concurrency=(
+                SETTINGS.conversation.INGRESS_MAX_CONCURRENCY or None
+            ),
         )
         cm.comms_manager = comms_manager
         local_comms_enabled = (
@@ -450,6 +453,28 @@ async def main(project_name: str = "Assistants"):
         LOGGER.info(f"{ICONS['lifecycle']} Final EventBus flush...")
         EVENT_BUS.flush()
 
+    # Write the spend deltas still held in process before exit.
+    from unify.events.llm_event_hook import flush_spend
+
+    LOGGER.info(f"{ICONS['lifecycle']} Final spend flush...")
+    try:
+        await flush_spend()
+    except Exception as e:
+        LOGGER.warning(f"{ICONS['lifecycle']} Spend flush failed (journaled): {e}")
+
+    # Send the activity touches still waiting out their debounce window.
+    from unify.transcript_manager.activity_sync import (
+        TOUCH_EXIT_FLUSH_TIMEOUT_SECONDS,
+        flush_activity_touches,
+    )
+
+    LOGGER.info(f"{ICONS['lifecycle']} Final activity touch flush...")
+    if not await asyncio.to_thread(
+        flush_activity_touches,
+        TOUCH_EXIT_FLUSH_TIMEOUT_SECONDS,
+    ):
+        LOGGER.warning(f"{ICONS['lifecycle']} Activity touch flush timed out")
+
     # Shut down the metrics exporter (flushes remaining data internally).
     LOGGER.info(f"{ICONS['lifecycle']} Shutting down metrics...")
     await shutdown_metrics()
@@ -57,6 +57,13 @@ class ConversationSettings(BaseSettings):
             Unity). ``"pubsub"`` selects ``PubSubIngressTransport`` and is
             the value the hosted deployment will set once Phase C cuts
             over. Override via ``UNITY_CONVERSATION_INGRESS_TRANSPORT``.
+        INGRESS_MAX_CONCURRENCY: When positive, envelopes from the injected
+            ingress transport go through
+            ``unify.gateway.KeyedEnvelopeDispatcher``: ordered per
+            conversation, concurrent across conversations, with at most
+            this many dispatching at once. ``0`` (default) keeps direct
+            dispatch. Has no effect on the legacy inline subscriber.
+            Override via ``UNITY_CONVERSATION_INGRESS_MAX_CONCURRENCY``.
         OUTBOUND_TRANSPORT: Selector for the outbound transport
             (``unify.gateway.OutboundTransport`` implementation) that
             the comms_utils publish helpers use. Same value semantics
@@ -95,6 +102,10 @@ class ConversationSettings(BaseSettings):
         default="",
         validation_alias="UNITY_CONVERSATION_INGRESS_TRANSPORT",
     )
+    INGRESS_MAX_CONCURRENCY: int = Field(
+        default=0,
+        validation_alias="UNITY_CONVERSATION_INGRESS_MAX_CONCURRENCY",
+    )
     OUTBOUND_TRANSPORT: str = Field(
         default="",
         validation_alias="UNITY_CONVERSATION_OUTBOUND_TRANSPORT",
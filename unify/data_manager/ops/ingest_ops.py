@@ -872,6 +872,7 @@ def _run_ingest_streaming(
         handle,
         storage_client=storage_client,
         skip_rows=skip_rows,
+        data_manager=dm,
     )
 
     # Phase 1: drain sample for type inference
@@ -1189,6 +1189,7 @@ class SimulatedDataManager(BaseDataManager):
                     table_input_handle,
                     storage_client=storage_client,
                     skip_rows=skip_rows,
+                    data_manager=self,
                 ),
             )
         if rows is None:
@@ -8,8 +8,10 @@ The hook is installed once during unify.init() and remains active for the
 lifetime of the process.
 
 Additionally, this module logs cumulative spending to the Assistants project
-for monthly spending limit tracking. After each LLM call, its cost is
-atomically added to the cumulative_spend for the current month.
+for monthly spending limit tracking. Each LLM call's cost is added to an
+in-process :class:`~unify.events.spend_accumulator.SpendAccumulator`, which
+atomically adds the summed deltas to the cumulative_spend for the current
+month every few seconds, once a threshold is crossed, and at shutdown.
 
 Note: credit_transaction ledger rows are also written (via deduct_credits in
 UniLLM) so both systems receive cost data in parallel.  Once the ledger is
@@ -19,9 +21,15 @@ validated in production, the cumulative-spend upserts here can be removed.
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
+import os
+import threading
 import zoneinfo
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .spend_accumulator import SpendAccumulator, SpendKey
 
 if TYPE_CHECKING:
     from unillm import LLMEvent
@@ -35,8 +43,14 @@ _HOOK_INSTALLED = False
 _LISTENER = None
 
 
-async def _update_cumulative_spend(cost: float) -> None:
-    """Update cumulative monthly spend after each LLM call.
+# The process's spend accumulator, created on the first priced call.
+_ACCUMULATOR: Optional[SpendAccumulator] = None
+_ACCUMULATOR_LOCK = threading.Lock()
+_ACCUMULATOR_FAILED = False
+
+
+def _attributed_spend(cost: float) -> List[Tuple[SpendKey, float]]:
+    """The Spending/Monthly rows a call's cost lands on, with each one's share.
 
     Costs are attributed to the user(s) specified by the COST_ATTRIBUTION
     ContextVar (set by ConversationManager / act tool).  When unset, falls
@@ -45,21 +59,15 @@ async def _update_cumulative_spend(cost: float) -> None:
     Each attributed user gets their own spending row keyed by
     (_user_id, _assistant_id, month).  For multi-user attribution the cost
     is split evenly.
-
-    Parameters
-    ----------
-    cost : float
-        The cost of the LLM call to add to cumulative spend
     """
     from datetime import datetime
 
-    from ..common.log_utils import atomic_upsert
     from ..session_details import SESSION_DETAILS
     from .cost_attribution import COST_ATTRIBUTION
 
     # Skip if the call was free
     if not cost or cost <= 0:
-        return
+        return []
 
     # Get billing timezone from user's settings (fallback to UTC)
     user_tz_str = SESSION_DETAILS.assistant.timezone or "UTC"
@@ -76,35 +84,134 @@ async def _update_cumulative_spend(cost: float) -> None:
     assistant_id = SESSION_DETAILS.assistant.agent_id
 
     if not user_ctx or not assistant_ctx or not assistant_id:
-        return
+        return []
 
     context = f"{user_ctx}/{assistant_ctx}/Spending/Monthly"
 
     # Resolve attribution: per-user user_ids or fall back to supervisor
     user_ids = COST_ATTRIBUTION.get() or [SESSION_DETAILS.user.id]
     per_user_cost = cost / len(user_ids)
+    return [
+        ((context, uid, str(assistant_id), month), per_user_cost) for uid in user_ids
+    ]
+
+
+async def _upsert_spend(key: SpendKey, amount: float) -> float:
+    """Atomically add ``amount`` to one row's cumulative_spend; its new value."""
+    from ..common.log_utils import atomic_upsert
+
+    context, uid, assistant_id, month = key
+    cost_str = f"{amount:.10f}".rstrip("0").rstrip(".")
+    result = await atomic_upsert(
+        context=context,
+        unique_keys={
+            "_user_id": "str",
+            "_assistant_id": "str",
+            "month": "str",
+        },
+        field="cumulative_spend",
+        operation=f"+{cost_str}",
+        initial_data={
+            "_assistant_id": assistant_id,
+            "month": month,
+        },
+        data_overrides={"_user_id": uid},
+        project="Assistants",
+    )
+    return float(result.new_value)
+
+
+async def _update_cumulative_spend(cost: float) -> None:
+    """Add one call's cost to cumulative monthly spend straight away.
 
-    for uid in user_ids:
+    The unbuffered write path, used when no spend journal can be kept.
+
+    Parameters
+    ----------
+    cost : float
+        The cost of the LLM call to add to cumulative spend
+    """
+    for key, amount in _attributed_spend(cost):
         try:
-            cost_str = f"{per_user_cost:.10f}".rstrip("0").rstrip(".")
-            await atomic_upsert(
-                context=context,
-                unique_keys={
-                    "_user_id": "str",
-                    "_assistant_id": "str",
-                    "month": "str",
-                },
-                field="cumulative_spend",
-                operation=f"+{cost_str}",
-                initial_data={
-                    "_assistant_id": str(assistant_id),
-                    "month": month,
-                },
-                data_overrides={"_user_id": uid},
-                project="Assistants",
-            )
+            await _upsert_spend(key, amount)
         except Exception as e:
-            logger.debug(f"Failed to update cumulative spend for {uid}: {e}")
+            logger.debug(f"Failed to update cumulative spend for {key[1]}: {e}")
+
+
+def _spend_journal_path(assistant_id: str) -> Path:
+    # The accumulator keeps one journal per process beside this path.
+    state_root = Path(
+        os.environ.get("XDG_STATE_HOME", Path.home() / ".local" / "state"),
+    )
+    return state_root / "unify" / f"spend-{assistant_id}.jsonl"
+
+
+def _spend_accumulator(assistant_id: str) -> Optional[SpendAccumulator]:
+    """The process's accumulator; None if its journal cannot be kept."""
+    global _ACCUMULATOR, _ACCUMULATOR_FAILED
+    if _ACCUMULATOR is not None or _ACCUMULATOR_FAILED:
+        return _ACCUMULATOR
+    with _ACCUMULATOR_LOCK:
+        if _ACCUMULATOR is None and not _ACCUMULATOR_FAILED:
+            try:
+                _ACCUMULATOR = SpendAccumulator(
+                    _spend_journal_path(assistant_id),
+                    _upsert_spend,
+                )
+                atexit.register(_flush_spend_at_exit)
+            except Exception as e:
+                logger.warning(f"Spend journal unavailable, writing per call: {e}")
+                _ACCUMULATOR_FAILED = True
+    return _ACCUMULATOR
+
+
+def _record_spend(loop: asyncio.AbstractEventLoop, cost: float) -> None:
+    """Count a call's cost; schedule a flush when one is due."""
+    shares = _attributed_spend(cost)
+    if not shares:
+        return
+    accumulator = _spend_accumulator(shares[0][0][2])
+    if accumulator is None:
+        loop.create_task(_update_cumulative_spend(cost))
+        return
+    due = False
+    for key, amount in shares:
+        due = accumulator.add(key, amount) or due
+    if due:
+        loop.create_task(accumulator.flush())
+    elif accumulator.claim_timer():
+        loop.call_later(
+            accumulator.flush_interval_s,
+            lambda: loop.create_task(accumulator.flush()),
+        )
+
+
+def unflushed_spend(
+    month: str,
+    *,
+    assistant_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+) -> float:
+    """Spend this process has counted for ``month`` but not yet flushed."""
+    if _ACCUMULATOR is None:
+        return 0.0
+    return _ACCUMULATOR.unflushed(month, assistant_id=assistant_id, user_id=user_id)
+
+
+async def flush_spend() -> None:
+    """Write every unflushed delta now; called on graceful shutdown."""
+    if _ACCUMULATOR is not None:
+        await _ACCUMULATOR.flush()
+
+
+def _flush_spend_at_exit() -> None:
+    # Whatever this misses stays in the journal for the next start.
+    try:
+        asyncio.run(flush_spend())
+    except Exception:
+        pass
+    if _ACCUMULATOR is not None:
+        _ACCUMULATOR.close()
 
 
 def _llm_event_to_eventbus(event: "LLMEvent") -> None:
@@ -169,7 +276,7 @@ def _llm_event_to_eventbus(event: "LLMEvent") -> None:
 
             # Update cumulative spending for spending limit tracking
             if event.provider_cost and event.provider_cost > 0:
-                loop.create_task(_update_cumulative_spend(event.provider_cost))
+                _record_spend(loop, event.provider_cost)
         except RuntimeError:
             # No event loop running - skip publishing
             # This can happen during synchronous test teardown
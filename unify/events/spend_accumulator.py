@@ -0,0 +1,384 @@
+"""Monthly spend summed in process and written to Orchestra in deltas.
+
+Every priced LLM call used to add its cost to ``Spending/Monthly`` with its
+own ``atomic_upsert``, so a tool loop making hundreds of calls a minute sent
+as many contended upserts, all for the same row. Costs now accumulate here,
+keyed by (context, user, assistant, month), and each key's sum goes out as
+one upsert when the flush interval passes, when a key's sum crosses the
+flush threshold, or at shutdown.
+
+Delivery across a crash is best-effort. Every cost is journaled, and so is
+every flush, with the row's value before it, and every acknowledgement.
+Journal records are appended and fsynced in batches by a writer thread, so
+a priced call never waits on the disk; a crash can lose the records of the
+last few milliseconds. A process that dies with costs unflushed leaves them
+in its journal for the next start to replay, and those are sent once.
+
+A flush that was sent but never acknowledged is settled by reading the row:
+if it has grown by at least the flushed amount since, the flush is taken to
+have landed and is not sent again. The upsert carries no idempotency key,
+and every process of an assistant adds to the same row, so that growth may
+be another writer's. An in-doubt flush can therefore be dropped when it
+never landed -- the row only grows within a month, so it is never applied
+twice -- and the row can under-count by at most the flushes in doubt at a
+crash.
+
+Each process keeps its own journal, ``<stem>.<pid><suffix>`` beside the
+path it is given, because every process of an assistant -- offline runners
+and pooled workers included -- installs the hook. A starting process adopts
+only the journals of processes that are no longer running, claiming each by
+renaming it, so no two processes replay the same records.
+
+Spending-limit checks read :meth:`SpendAccumulator.unflushed`, so a cap is
+enforced against what has been spent, not only what has been flushed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+#: (Spending/Monthly context, user id, assistant id, month)
+SpendKey = Tuple[str, str, str, str]
+
+#: Adds ``amount`` (0 reads) to a key's row; returns the row's new value.
+SpendUpsert = Callable[[SpendKey, float], Awaitable[float]]
+
+SPEND_FLUSH_INTERVAL_S = 5.0
+#: Unflushed USD on one key that triggers a flush without waiting.
+SPEND_FLUSH_THRESHOLD = 0.25
+
+# Cumulative spend is written with ten decimal places.
+_TOLERANCE = 1e-7
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+@dataclass(frozen=True)
+class _Flush:
+    batch: str
+    key: SpendKey
+    amount: float
+    base: float
+
+
+class SpendAccumulator:
+    """Unflushed spend per key, made durable by an append-only journal."""
+
+    def __init__(
+        self,
+        journal_path: Path,
+        upsert: SpendUpsert,
+        *,
+        flush_interval_s: float = SPEND_FLUSH_INTERVAL_S,
+        flush_threshold: float = SPEND_FLUSH_THRESHOLD,
+    ) -> None:
+        self.flush_interval_s = flush_interval_s
+        self.flush_threshold = flush_threshold
+        self._upsert = upsert
+        self._base_path = journal_path
+        self._path = journal_path.with_name(
+            f"{journal_path.stem}.{os.getpid()}{journal_path.suffix}",
+        )
+        self._lock = threading.Lock()
+        self._pending: Dict[SpendKey, float] = {}
+        # Journaled flushes not yet acknowledged; after a crash, in doubt.
+        self._unacked: Dict[str, _Flush] = {}
+        self._bases: Dict[SpendKey, float] = {}
+        self._flushing = False
+        self._timer_armed = False
+        self._last_flush = time.monotonic()
+        # Records waiting for the writer thread, in the order they were made.
+        self._queue: List[str] = []
+        self._queue_ready = threading.Condition()
+        # Held while lines reach the file, so a compaction sees none in flight.
+        self._io_lock = threading.Lock()
+        self._closed = False
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._replay(self._path)
+        adopted = self._adopt_orphans()
+        self._journal = open(self._path, "a", encoding="utf-8")
+        if adopted:
+            # Their records live on in this journal before theirs go away.
+            self._compact()
+            for orphan in adopted:
+                orphan.unlink(missing_ok=True)
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            name="spend-journal",
+            daemon=True,
+        )
+        self._writer.start()
+
+    @property
+    def journal_path(self) -> Path:
+        """This process's journal."""
+        return self._path
+
+    # ---- journal ---------------------------------------------------------
+
+    def _write(self, record: dict) -> None:
+        with self._queue_ready:
+            self._queue.append(json.dumps(record) + "\n")
+            self._queue_ready.notify()
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._queue_ready:
+                while not self._queue and not self._closed:
+                    self._queue_ready.wait()
+                if not self._queue:
+                    return
+            with self._io_lock:
+                with self._queue_ready:
+                    lines, self._queue = self._queue, []
+                if not lines:
+                    continue
+                try:
+                    self._journal.writelines(lines)
+                    self._journal.flush()
+                    os.fsync(self._journal.fileno())
+                except (OSError, ValueError) as exc:
+                    logger.warning(f"Failed to write the spend journal: {exc}")
+
+    def _adopt_orphans(self) -> List[Path]:
+        """Claim and replay the journals of processes no longer running."""
+        claimed: List[Path] = []
+        prefix, suffix = f"{self._base_path.stem}.", self._base_path.suffix
+        candidates = [self._base_path]  # written before journals were per process
+        for path in self._path.parent.glob(f"{prefix}*{suffix}"):
+            pid = path.name[len(prefix) : len(path.name) - len(suffix)]
+            if pid.isdigit() and int(pid) != os.getpid() and not _pid_alive(int(pid)):
+                candidates.append(path)
+        for orphan in candidates:
+            claim = self._path.with_name(f"{self._path.name}.adopt-{orphan.name}")
+            try:
+                # Only one starting process wins the rename.
+                os.rename(orphan, claim)
+            except FileNotFoundError:
+                continue
+            except OSError as exc:
+                logger.debug(f"Failed to claim spend journal {orphan}: {exc}")
+                continue
+            self._replay(claim, adopted=True)
+            claimed.append(claim)
+        return claimed
+
+    def _replay(self, path: Path, *, adopted: bool = False) -> None:
+        if not path.exists():
+            return
+        with open(path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                    op, key = record["op"], tuple(record["key"])
+                except (ValueError, KeyError, TypeError):
+                    # A torn final line from a crash mid-write.
+                    continue
+                if op == "add":
+                    self._pending[key] = self._pending.get(key, 0.0) + record["amount"]
+                elif op == "flush":
+                    self._pending[key] = self._pending.get(key, 0.0) - record["amount"]
+                    self._unacked[record["batch"]] = _Flush(
+                        record["batch"],
+                        key,
+                        record["amount"],
+                        record["base"],
+                    )
+                elif op == "ack":
+                    self._unacked.pop(record["batch"], None)
+                    if not adopted:
+                        self._bases[key] = record["value"]
+                elif op == "base" and not adopted:
+                    # Another process's view of a row is re-read, not trusted.
+                    self._bases[key] = record["value"]
+        self._pending = {k: v for k, v in self._pending.items() if v > _TOLERANCE}
+
+    def _compact(self) -> None:
+        """Rewrite the journal as a snapshot of what is still owed."""
+        records = [{"op": "base", "key": k, "value": v} for k, v in self._bases.items()]
+        records += [
+            {
+                "op": "flush",
+                "key": f.key,
+                "batch": f.batch,
+                "amount": f.amount,
+                "base": f.base,
+            }
+            for f in self._unacked.values()
+        ]
+        # A replayed flush is subtracted from its key's adds, so an unacked
+        # flush is re-added alongside it.
+        owed: Dict[SpendKey, float] = dict(self._pending)
+        for f in self._unacked.values():
+            owed[f.key] = owed.get(f.key, 0.0) + f.amount
+        records += [{"op": "add", "key": k, "amount": v} for k, v in owed.items()]
+        tmp = self._path.with_suffix(".tmp")
+        with self._io_lock:
+            # Called under ``_lock``: queued records are already in the
+            # snapshot, so they are dropped rather than appended after it.
+            with self._queue_ready:
+                self._queue.clear()
+            with open(tmp, "w", encoding="utf-8") as out:
+                out.writelines(json.dumps(r) + "\n" for r in records)
+                out.flush()
+                os.fsync(out.fileno())
+            self._journal.close()
+            os.replace(tmp, self._path)
+            self._journal = open(self._path, "a", encoding="utf-8")
+
+    # ---- accumulating ----------------------------------------------------
+
+    def add(self, key: SpendKey, amount: float) -> bool:
+        """Count ``amount`` against ``key``; True when a flush is due now."""
+        with self._lock:
+            self._write({"op": "add", "key": key, "amount": amount})
+            total = self._pending.get(key, 0.0) + amount
+            self._pending[key] = total
+            return (
+                total >= self.flush_threshold
+                or time.monotonic() - self._last_flush >= self.flush_interval_s
+            )
+
+    def claim_timer(self) -> bool:
+        """True for the one caller that should schedule the next timed flush."""
+        with self._lock:
+            if self._timer_armed or not self._pending:
+                return False
+            self._timer_armed = True
+            return True
+
+    def unflushed(
+        self,
+        month: str,
+        *,
+        assistant_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> float:
+        """Spend for ``month`` that Orchestra may not have seen yet."""
+
+        def matches(key: SpendKey) -> bool:
+            _, key_user, key_assistant, key_month = key
+            return (
+                key_month == month
+                and (assistant_id is None or key_assistant == str(assistant_id))
+                and (user_id is None or key_user == str(user_id))
+            )
+
+        with self._lock:
+            owed = [v for k, v in self._pending.items() if matches(k)]
+            owed += [f.amount for f in self._unacked.values() if matches(f.key)]
+        return sum(owed)
+
+    # ---- flushing --------------------------------------------------------
+
+    async def flush(self) -> None:
+        """Send every key's sum as one upsert; settle any flush left in doubt."""
+        with self._lock:
+            if self._flushing:
+                return
+            self._flushing = True
+            self._timer_armed = False
+        try:
+            for unacked in list(self._unacked.values()):
+                await self._settle(unacked)
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            for key, amount in batch.items():
+                await self._send(key, amount)
+            with self._lock:
+                self._compact()
+        finally:
+            with self._lock:
+                self._flushing = False
+                self._last_flush = time.monotonic()
+
+    async def _send(self, key: SpendKey, amount: float) -> None:
+        base = self._bases.get(key)
+        if base is None:
+            try:
+                base = self._bases[key] = await self._upsert(key, 0.0)
+            except Exception as exc:
+                logger.debug(f"Failed to read cumulative spend for {key}: {exc}")
+                self._restore(key, amount)
+                return
+        flush = _Flush(uuid.uuid4().hex, key, amount, base)
+        with self._lock:
+            self._write(
+                {
+                    "op": "flush",
+                    "key": key,
+                    "batch": flush.batch,
+                    "amount": amount,
+                    "base": base,
+                },
+            )
+            self._unacked[flush.batch] = flush
+        try:
+            value = await self._upsert(key, amount)
+        except Exception as exc:
+            # It may have landed; the next flush reads the row to find out.
+            logger.debug(f"Failed to flush cumulative spend for {key}: {exc}")
+            return
+        self._ack(flush, value)
+
+    async def _settle(self, flush: _Flush) -> None:
+        # Growth since ``base`` may be other writers' deltas, so a flush that
+        # never landed can look landed here; the error is an under-count,
+        # never a double count (see the module docstring).
+        try:
+            value = await self._upsert(flush.key, 0.0)
+            if value < flush.base + flush.amount - _TOLERANCE:
+                value = await self._upsert(flush.key, flush.amount)
+        except Exception as exc:
+            logger.debug(f"Failed to settle spend flush {flush.batch}: {exc}")
+            return
+        self._ack(flush, value)
+
+    def _ack(self, flush: _Flush, value: float) -> None:
+        with self._lock:
+            self._write(
+                {"op": "ack", "key": flush.key, "batch": flush.batch, "value": value},
+            )
+            self._unacked.pop(flush.batch, None)
+            self._bases[flush.key] = value
+
+    def _restore(self, key: SpendKey, amount: float) -> None:
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0.0) + amount
+
+    def close(self) -> None:
+        """Write every queued record and stop the writer thread."""
+        with self._queue_ready:
+            self._closed = True
+            self._queue_ready.notify()
+        self._writer.join()
+        with self._io_lock:
+            self._journal.close()
+
+
+__all__ = [
+    "SPEND_FLUSH_INTERVAL_S",
+    "SPEND_FLUSH_THRESHOLD",
+    "SpendAccumulator",
+    "SpendKey",
+]
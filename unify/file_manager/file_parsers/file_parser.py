@@ -177,6 +177,47 @@ class FileParser:
         )
         return self._parse_and_enrich(request, registry=reg)
 
+    def parse_isolated(
+        self,
+        request: FileParseRequest,
+        *,
+        parse_config: Optional[ParseConfig] = None,
+    ) -> FileParseResult:
+        """Parse a single file in its own process, without enrichment.
+
+        The unit ``_parse_batch_subprocess`` schedules, for callers that run
+        their own pool and want each result as soon as it exists rather than
+        after a whole batch. No summary or metadata is produced: enrichment is
+        an LLM call, and a caller that only wants the tables never reads it.
+
+        Falls back to an in-process parse when isolation is off or backends
+        were injected, exactly as ``parse_batch`` does. Never raises.
+        """
+        config = parse_config or ParseConfig()
+        if config.subprocess_isolation and self._backends is None:
+            return run_isolated(
+                request,
+                parse_config,
+                _adaptive_timeout(request, config),
+            )
+        reg = (
+            BackendRegistry.from_config(
+                backend_class_paths_by_format=config.backend_class_paths_by_format,
+            )
+            if parse_config is not None
+            else self._default_registry
+        )
+        return self._parse_single(request, registry=reg)
+
+    @staticmethod
+    def is_isolation_crash(result: FileParseResult) -> bool:
+        """Whether *result* failed because its child process died or timed out.
+
+        Such a failure may be memory pressure from concurrent parses rather
+        than the file, so it is worth one retry alone.
+        """
+        return result.status == "error" and _is_subprocess_crash(result)
+
     def _parse_single(
         self,
         request: FileParseRequest,
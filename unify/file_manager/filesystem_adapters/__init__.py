@@ -1,7 +1,9 @@
 from unify.file_manager.filesystem_adapters.base import BaseFileSystemAdapter
 from unify.file_manager.filesystem_adapters.local_adapter import LocalFileSystemAdapter
+from unify.file_manager.filesystem_adapters.local_index import LocalFileIndex
 
 __all__ = [
     "BaseFileSystemAdapter",
     "LocalFileSystemAdapter",
+    "LocalFileIndex",
 ]
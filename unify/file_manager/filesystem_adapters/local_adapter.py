@@ -5,9 +5,14 @@ from __future__ import annotations
 import asyncio
 import shutil
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable, List, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
 
 from unify.file_manager.filesystem_adapters.base import BaseFileSystemAdapter
+from unify.file_manager.filesystem_adapters.local_index import (
+    IndexedFile,
+    LocalFileIndex,
+    path_matches,
+)
 from unify.file_manager.types.filesystem import FileSystemCapabilities, FileReference
 from unify.logger import LOGGER
 from unify.common.hierarchical_logger import ICONS
@@ -32,6 +37,11 @@ class LocalFileSystemAdapter(BaseFileSystemAdapter):
     ~/Unity/Remote/<user_id>/ populated by user_desktop.files -- can be
     listed, read, parsed, and ingested via their absolute paths.
 
+    Listing (``iter_files`` / ``list`` / ``glob`` / ``changed_since``) under the
+    workspace root is served from a persistent :class:`LocalFileIndex` that is
+    refreshed incrementally, so repeat listings of a large workspace cost one
+    ``stat`` per directory rather than a full ``rglob`` of every file.
+
     Sync lifecycle:
     - Job start: Bidirectional sync with --resync (start_sync → bisync)
     - File write: Push changed file to VM (notify_file_write)
@@ -44,6 +54,8 @@ class LocalFileSystemAdapter(BaseFileSystemAdapter):
         root: str | None = None,
         *,
         enable_sync: bool = True,
+        use_index: bool = True,
+        index_path: str | None = None,
     ):
         """Initialize LocalFileSystemAdapter.
 
@@ -57,6 +69,12 @@ class LocalFileSystemAdapter(BaseFileSystemAdapter):
         enable_sync : bool, default True
             Whether to enable VM file sync. Actual sync only occurs if
             SESSION_DETAILS.desktop_url is configured.
+        use_index : bool, default True
+            Serve workspace listings from the persistent file index instead
+            of walking the tree on every call.
+        index_path : str | None, default None
+            SQLite file backing the index. Defaults to a per-root file under
+            ``$XDG_CACHE_HOME/unify/fs_index/``.
         """
         # None => follow get_local_root(); otherwise freeze the explicit path.
         self._explicit_root: Path | None = None
@@ -71,6 +89,9 @@ class LocalFileSystemAdapter(BaseFileSystemAdapter):
             can_delete=True,
         )
 
+        self._use_index = use_index
+        self._index_path = index_path
+
         # Sync component (lazy initialization)
         self._enable_sync = enable_sync
         self._sync_manager: Optional["SyncManager"] = None
@@ -178,11 +199,97 @@ class LocalFileSystemAdapter(BaseFileSystemAdapter):
             return p.as_posix()
         return "/" + rel if not rel.startswith("/") else rel
 
-    def iter_files(self, root: Optional[str] = None) -> Iterable[FileReference]:
-        base = self._abspath(root or ".")
-        if not base.exists():
-            return []
+    # ----------------------- File Index ----------------------- #
+
+    def _index(self) -> Optional[LocalFileIndex]:
+        """Refreshed index for the current workspace root, or None if unavailable."""
+        if not self._use_index:
+            return None
+        try:
+            index = LocalFileIndex.for_root(self._root, index_path=self._index_path)
+            index.refresh()
+            return index
+        except Exception as exc:
+            LOGGER.debug(
+                f"{ICONS['file_sync']} [LocalFS] File index unavailable, "
+                f"walking the tree instead: {exc}",
+            )
+            return None
+
+    def _index_prefix(self, base: Path) -> Optional[str]:
+        """Root-relative prefix for ``base``, or None when it is outside the root."""
+        try:
+            rel = base.relative_to(self._root).as_posix()
+        except ValueError:
+            return None
+        return "" if rel == "." else rel
+
+    def _record_in_index(self, p: Path) -> None:
+        """Record an in-place write, which does not move the parent dir's mtime."""
+        if not self._use_index:
+            return
+        rel = self._index_prefix(p.resolve())
+        if not rel:
+            return
+        index = None
+        try:
+            index = LocalFileIndex.for_root(self._root, index_path=self._index_path)
+            index.record(rel)
+        except Exception as exc:
+            LOGGER.warning(
+                f"{ICONS['file_sync']} [LocalFS] Could not record {rel} in the "
+                f"file index; the next listing re-walks the tree: {exc}",
+            )
+            if index is not None:
+                index.mark_stale()
+
+    def _indexed_ref(self, row: IndexedFile) -> Optional[FileReference]:
+        p = self._root / row.path
+        if row.is_link:
+            # Symlinks keep the rglob semantics: follow to the target.
+            if not p.is_file():
+                return None
+            resolved = p.resolve()
+            return FileReference(
+                path=self._relativize(resolved),
+                name=p.name,
+                provider=self.name,
+                uri=f"{self.uri_name}://{resolved.as_posix().lstrip('/')}",
+                size_bytes=resolved.stat().st_size,
+                modified_at=None,
+                mime_type=None,
+            )
+        return FileReference(
+            path="/" + row.path,
+            name=row.path.rpartition("/")[2],
+            provider=self.name,
+            uri=f"{self.uri_name}://{p.as_posix().lstrip('/')}",
+            size_bytes=row.size,
+            modified_at=None,
+            mime_type=None,
+        )
+
+    def _indexed_refs(self, rows: Iterable[IndexedFile]) -> Iterator[FileReference]:
+        for row in rows:
+            try:
+                ref = self._indexed_ref(row)
+            except OSError:
+                continue
+            if ref is not None:
+                yield ref
+
+    def _walk_files(
+        self,
+        base: Path,
+        pattern: Optional[str] = None,
+    ) -> Iterator[FileReference]:
         for p in base.rglob("*"):
+            # Match on the walked path, as the index does, not a link's target.
+            if pattern is not None and not path_matches(
+                p.relative_to(base).as_posix(),
+                pattern,
+            ):
+                continue
             if p.is_file():
                 yield FileReference(
                     path=self._relativize(p),
@@ -194,6 +301,54 @@ class LocalFileSystemAdapter(BaseFileSystemAdapter):
                     mime_type=None,
                 )
 
+    def iter_files(self, root: Optional[str] = None) -> Iterable[FileReference]:
+        base = self._abspath(root or ".")
+        if not base.exists():
+            return []
+        prefix = self._index_prefix(base)
+        index = self._index() if prefix is not None and base.is_dir() else None
+        if index is None:
+            yield from self._walk_files(base)
+            return
+        yield from self._indexed_refs(index.files(prefix))
+
+    def glob(self, pattern: str, root: Optional[str] = None) -> List[FileReference]:
+        """Return files under ``root`` whose root-relative path matches ``pattern``.
+
+        ``pattern`` is matched against the path below ``root`` (``"*.csv"``,
+        ``"reports/**/*.xlsx"``). ``*`` also matches ``/``.
+        """
+        base = self._abspath(root or ".")
+        if not base.is_dir():
+            return []
+        prefix = self._index_prefix(base)
+        index = self._index() if prefix is not None else None
+        if index is not None:
+            return list(self._indexed_refs(index.glob(pattern, prefix)))
+        return list(self._walk_files(base, pattern))
+
+    def changed_since(
+        self,
+        since: float,
+        root: Optional[str] = None,
+    ) -> List[FileReference]:
+        """Return files under ``root`` modified at or after ``since`` (epoch seconds).
+
+        Deleted files are not reported; compare against :meth:`list` for removals.
+        """
+        base = self._abspath(root or ".")
+        if not base.is_dir():
+            return []
+        prefix = self._index_prefix(base)
+        index = self._index() if prefix is not None else None
+        if index is not None:
+            return list(self._indexed_refs(index.changed_since(since, prefix)))
+        return [
+            ref
+            for ref in self._walk_files(base)
+            if self._abspath(ref.path).stat().st_mtime >= since
+        ]
+
     def get_file(self, path: str) -> FileReference:
         p = self._abspath(path)
         if not p.exists() or not p.is_file():
@@ -221,6 +376,21 @@ class LocalFileSystemAdapter(BaseFileSystemAdapter):
     def list(self, root: Optional[str] = None) -> List[str]:
         """List all file paths in the local filesystem."""
         try:
+            base = self._abspath(root or ".")
+            prefix = self._index_prefix(base) if base.is_dir() else None
+            index = self._index() if prefix is not None else None
+            if index is not None:
+                # Plain files need no FileReference round-trip; only symlinks
+                # resolve (and may leave the root) at read time.
+                paths: List[str] = []
+                for row in index.files(prefix):
+                    if not row.is_link:
+                        paths.append(row.path)
+                        continue
+                    ref = self._indexed_ref(row)
+                    if ref is not None:
+                        paths.append(ref.path.lstrip("/"))
+                return paths
             return [ref.path.lstrip("/") for ref in self.iter_files(root)]
         except Exception:
             return []
@@ -409,6 +579,7 @@ class LocalFileSystemAdapter(BaseFileSystemAdapter):
 
         dest.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy2(src, dest)
+        self._record_in_index(dest)
 
         relative_path = self._relativize(dest)
 
@@ -495,6 +666,7 @@ class LocalFileSystemAdapter(BaseFileSystemAdapter):
         target_path = attachments_dir / target_name
         with open(target_path, "wb") as f:
             f.write(contents)
+        self._record_in_index(target_path)
 
         relative_path = f"Attachments/{target_name}"
 
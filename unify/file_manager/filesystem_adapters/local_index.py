@@ -0,0 +1,610 @@
+"""Persistent, incrementally refreshed file index for a local directory tree.
+
+``LocalFileSystemAdapter.iter_files`` used to ``rglob`` the whole workspace and
+``stat``/``resolve`` every file on every call, so listing a large workspace was
+O(tree) each time.  :class:`LocalFileIndex` keeps one small SQLite file per
+root holding ``(path, size, mtime, inode)`` for every file and the last seen
+``mtime`` of every directory.
+
+Refresh is incremental:
+
+- **Directory-mtime walk** (always available): every known directory is
+  ``stat``-ed; only directories whose mtime moved are re-listed.  Creating,
+  deleting or renaming an entry bumps its parent's mtime, so this catches
+  every structural change for the cost of one ``stat`` per directory.  An
+  in-place rewrite of an existing file does *not* bump the directory, so
+  writers that go through the adapter record the file explicitly
+  (:meth:`LocalFileIndex.record`).
+- **inotify** (Linux, best effort): once a full walk has established watches,
+  a refresh only drains the event queue and re-lists the directories it names,
+  which also catches in-place rewrites.  Any watch failure (e.g. exhausted
+  ``max_user_watches``) or queue overflow falls back to the mtime walk.
+
+Paths are stored root-relative in POSIX form without a leading slash
+(``Docs/a.txt``).  Symlinks are recorded as links and never descended into,
+matching ``Path.rglob``; callers resolve them at read time.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import fnmatch
+import hashlib
+import os
+import sqlite3
+import stat as stat_mod
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from unify.logger import LOGGER
+from unify.common.hierarchical_logger import ICONS
+
+_SCHEMA_VERSION = "1"
+
+# A directory modified this recently may still be changing within the same
+# mtime tick; record it as unknown so the next refresh re-lists it.
+_MTIME_SETTLE_NS = 2_000_000_000
+
+
+def default_index_path(root: Path) -> Path:
+    """Return the cache location of the index file for ``root``."""
+    cache_root = Path(
+        os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"),
+    )
+    digest = hashlib.sha1(str(root).encode("utf-8")).hexdigest()[:16]
+    return cache_root / "unify" / "fs_index" / f"{digest}.sqlite"
+
+
+class IndexedFile(NamedTuple):
+    """One file row served from the index."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    inode: int
+    is_link: bool = False
+
+
+def path_matches(rel: str, pattern: str) -> bool:
+    """Whether the relative POSIX path ``rel`` matches the glob ``pattern``.
+
+    :func:`fnmatch.fnmatchcase` semantics: case-sensitive, ``*`` also matches
+    ``/``, and character classes negate with ``!``. Index queries and tree
+    walks both match through here so they agree.
+    """
+    return fnmatch.fnmatchcase(rel, pattern.lstrip("/"))
+
+
+def _subtree_bounds(prefix: str) -> Tuple[str, str]:
+    """Half-open string range covering every path strictly below ``prefix``.
+
+    ``'0'`` sorts immediately after ``'/'``, so ``[prefix/, prefix0)`` selects
+    the subtree without LIKE-escaping user path characters.
+    """
+    return prefix + "/", prefix + "0"
+
+
+# --------------------------------------------------------------------------- #
+# inotify (Linux only, via libc; no third-party dependency)
+# --------------------------------------------------------------------------- #
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_DONT_FOLLOW = 0x02000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+    | _IN_DONT_FOLLOW
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _InotifyWatcher:
+    """Non-blocking inotify handle mapping watch descriptors to index dirs."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._libc = libc
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._wd_to_dir: Dict[int, str] = {}
+        self._dir_to_wd: Dict[str, int] = {}
+
+    def watch(self, rel: str, abspath: Path) -> None:
+        if rel in self._dir_to_wd:
+            return
+        wd = self._libc.inotify_add_watch(
+            self._fd,
+            os.fsencode(abspath),
+            _WATCH_MASK,
+        )
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {rel}")
+        self._wd_to_dir[wd] = rel
+        self._dir_to_wd[rel] = wd
+
+    def forget(self, rel: str) -> None:
+        wd = self._dir_to_wd.pop(rel, None)
+        if wd is not None:
+            self._wd_to_dir.pop(wd, None)
+
+    def drain(self) -> Optional[Set[str]]:
+        """Return directories touched since the last drain (``None`` on overflow)."""
+        dirty: Set[str] = set()
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return dirty
+            if not buf:
+                return dirty
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    return None
+                rel = self._wd_to_dir.get(wd)
+                if rel is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    self.forget(rel)
+                    continue
+                dirty.add(rel)
+
+    def close(self) -> None:
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+        self._wd_to_dir.clear()
+        self._dir_to_wd.clear()
+
+
+# --------------------------------------------------------------------------- #
+# Index
+# --------------------------------------------------------------------------- #
+
+
+class LocalFileIndex:
+    """SQLite-backed ``(path, size, mtime, inode)`` index of one directory tree.
+
+    Use :meth:`for_root` to share one instance per root within a process; the
+    SQLite file itself is shared across processes (WAL mode), so a freshly
+    started process begins warm.
+    """
+
+    _instances: Dict[Tuple[Path, Path], "LocalFileIndex"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        index_path: str | Path | None = None,
+        use_inotify: bool = True,
+    ) -> None:
+        self.root = Path(root).expanduser().resolve()
+        self.index_path = (
+            Path(index_path)
+            if index_path is not None
+            else default_index_path(self.root)
+        )
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.index_path),
+            timeout=30.0,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._init_schema()
+        self._use_inotify = use_inotify
+        self._watcher: Optional[_InotifyWatcher] = None
+        # The first refresh in a process is always a full mtime walk: rows may
+        # have been written by another process and no watches exist yet.
+        self._walked = False
+        # Set when a write could not be recorded; the next refresh re-lists
+        # every directory so the missed in-place rewrite is picked up.
+        self._stale = False
+
+    @classmethod
+    def for_root(
+        cls,
+        root: str | Path,
+        *,
+        index_path: str | Path | None = None,
+    ) -> "LocalFileIndex":
+        """Return the process-wide index for ``root`` (created on first use)."""
+        resolved = Path(root).expanduser().resolve()
+        db = (
+            Path(index_path) if index_path is not None else default_index_path(resolved)
+        )
+        key = (resolved, db)
+        with cls._instances_lock:
+            inst = cls._instances.get(key)
+            if inst is None:
+                inst = cls(resolved, index_path=db)
+                cls._instances[key] = inst
+            return inst
+
+    # ----------------------------- schema ----------------------------- #
+
+    def _init_schema(self) -> None:
+        c = self._conn
+        c.execute("PRAGMA journal_mode=WAL")
+        c.execute("PRAGMA synchronous=NORMAL")
+        c.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = c.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if row is not None and row[0] != _SCHEMA_VERSION:
+            c.execute("DROP TABLE IF EXISTS files")
+            c.execute("DROP TABLE IF EXISTS dirs")
+        c.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY, parent TEXT NOT NULL, size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL, inode INTEGER NOT NULL,"
+            " is_link INTEGER NOT NULL DEFAULT 0) WITHOUT ROWID",
+        )
+        c.execute("CREATE INDEX IF NOT EXISTS files_parent ON files(parent)")
+        c.execute("CREATE INDEX IF NOT EXISTS files_mtime ON files(mtime_ns)")
+        c.execute(
+            "CREATE TABLE IF NOT EXISTS dirs ("
+            " path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER NOT NULL)"
+            " WITHOUT ROWID",
+        )
+        c.execute("CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent)")
+        c.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)",
+            (_SCHEMA_VERSION,),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._watcher is not None:
+                self._watcher.close()
+                self._watcher = None
+            self._conn.close()
+
+    # ----------------------------- refresh ---------------------------- #
+
+    def _abs(self, rel: str) -> Path:
+        return self.root / rel if rel else self.root
+
+    def _ensure_watcher(self) -> None:
+        if self._watcher is not None or not self._use_inotify:
+            return
+        try:
+            self._watcher = _InotifyWatcher()
+        except (OSError, AttributeError):
+            # Not Linux, or inotify unavailable in this sandbox.
+            self._use_inotify = False
+
+    def _watch(self, rel: str) -> None:
+        if self._watcher is None:
+            return
+        try:
+            self._watcher.watch(rel, self._abs(rel))
+        except OSError as exc:
+            LOGGER.debug(
+                f"{ICONS['file_sync']} [LocalIndex] inotify disabled, "
+                f"falling back to directory mtimes: {exc}",
+            )
+            self._watcher.close()
+            self._watcher = None
+            self._use_inotify = False
+
+    def refresh(self, *, full: bool = False) -> None:
+        """Bring the index up to date with the filesystem.
+
+        Parameters
+        ----------
+        full : bool, default False
+            Re-list every directory regardless of mtime or inotify state.
+            Use after out-of-band in-place rewrites on hosts without inotify.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                if full or self._stale or not self._walked:
+                    self._ensure_watcher()
+                    self._walk(force=full or self._stale)
+                    self._walked = True
+                    self._stale = False
+                elif self._watcher is None:
+                    self._walk(force=False)
+                else:
+                    dirty = self._watcher.drain()
+                    if dirty is None:
+                        self._walk(force=True)
+                    else:
+                        # Parents first so a deleted subtree is dropped before
+                        # its own (now stale) events are processed.
+                        for rel in sorted(dirty, key=lambda r: (r.count("/"), r)):
+                            if self._dir_known(rel):
+                                self._visit(rel, force=True, recurse_known=False)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _dir_known(self, rel: str) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM dirs WHERE path = ?",
+            (rel,),
+        ).fetchone()
+        return row is not None or rel == ""
+
+    def _walk(self, *, force: bool) -> None:
+        known = dict(self._conn.execute("SELECT path, mtime_ns FROM dirs"))
+        children: Dict[str, List[str]] = {}
+        for path, parent in self._conn.execute("SELECT path, parent FROM dirs"):
+            if parent is not None:
+                children.setdefault(parent, []).append(path)
+        stack = [""]
+        while stack:
+            rel = stack.pop()
+            stack.extend(
+                self._visit(
+                    rel,
+                    force=force,
+                    recurse_known=True,
+                    known=known,
+                    children=children,
+                ),
+            )
+
+    def _drop_subtree(self, rel: str) -> None:
+        c = self._conn
+        if not rel:
+            c.execute("DELETE FROM files")
+            c.execute("DELETE FROM dirs")
+            if self._watcher is not None:
+                self._watcher.close()
+                self._watcher = None
+            return
+        lo, hi = _subtree_bounds(rel)
+        c.execute("DELETE FROM files WHERE path >= ? AND path < ?", (lo, hi))
+        c.execute("DELETE FROM dirs WHERE path = ?", (rel,))
+        if self._watcher is not None:
+            for (sub,) in c.execute(
+                "SELECT path FROM dirs WHERE path >= ? AND path < ?",
+                (lo, hi),
+            ):
+                self._watcher.forget(sub)
+            self._watcher.forget(rel)
+        c.execute("DELETE FROM dirs WHERE path >= ? AND path < ?", (lo, hi))
+
+    def _visit(
+        self,
+        rel: str,
+        *,
+        force: bool,
+        recurse_known: bool,
+        known: Optional[Dict[str, int]] = None,
+        children: Optional[Dict[str, List[str]]] = None,
+    ) -> List[str]:
+        """Refresh one directory; return sub-directories the caller should visit."""
+        c = self._conn
+        path = self._abs(rel)
+        # Watch before listing so changes made during the scan still queue up.
+        self._watch(rel)
+        try:
+            st = os.stat(path, follow_symlinks=False)
+        except FileNotFoundError:
+            self._drop_subtree(rel)
+            return []
+        if not stat_mod.S_ISDIR(st.st_mode):
+            self._drop_subtree(rel)
+            return []
+
+        if known is None:
+            row = c.execute(
+                "SELECT mtime_ns FROM dirs WHERE path = ?",
+                (rel,),
+            ).fetchone()
+            previous = row[0] if row is not None else None
+        else:
+            previous = known.get(rel)
+
+        if not force and previous == st.st_mtime_ns:
+            if not recurse_known:
+                return []
+            if children is not None:
+                return list(children.get(rel, ()))
+            return [
+                p
+                for (p,) in c.execute("SELECT path FROM dirs WHERE parent = ?", (rel,))
+            ]
+
+        files: Dict[str, Tuple[int, int, int, int]] = {}
+        subdirs: List[str] = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    child = f"{rel}/{entry.name}" if rel else entry.name
+                    try:
+                        if entry.is_symlink():
+                            est = entry.stat(follow_symlinks=False)
+                            files[child] = (est.st_size, est.st_mtime_ns, est.st_ino, 1)
+                        elif entry.is_dir(follow_symlinks=False):
+                            subdirs.append(child)
+                        elif entry.is_file(follow_symlinks=False):
+                            est = entry.stat(follow_symlinks=False)
+                            files[child] = (est.st_size, est.st_mtime_ns, est.st_ino, 0)
+                    except FileNotFoundError:
+                        continue
+        except (FileNotFoundError, NotADirectoryError):
+            self._drop_subtree(rel)
+            return []
+        except PermissionError:
+            return []
+
+        indexed = {
+            p: (s, m, i, l)
+            for p, s, m, i, l in c.execute(
+                "SELECT path, size, mtime_ns, inode, is_link FROM files WHERE parent = ?",
+                (rel,),
+            )
+        }
+        gone = [(p,) for p in indexed.keys() - files.keys()]
+        if gone:
+            c.executemany("DELETE FROM files WHERE path = ?", gone)
+        changed = [
+            (p, rel, *meta) for p, meta in files.items() if indexed.get(p) != meta
+        ]
+        if changed:
+            c.executemany(
+                "INSERT OR REPLACE INTO files"
+                " (path, parent, size, mtime_ns, inode, is_link)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                changed,
+            )
+
+        previous_subdirs = {
+            p for (p,) in c.execute("SELECT path FROM dirs WHERE parent = ?", (rel,))
+        }
+        for stale in previous_subdirs.difference(subdirs):
+            self._drop_subtree(stale)
+
+        settled = time.time_ns() - st.st_mtime_ns >= _MTIME_SETTLE_NS
+        c.execute(
+            "INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)",
+            (
+                rel,
+                None if not rel else (rel.rpartition("/")[0]),
+                st.st_mtime_ns if settled else -1,
+            ),
+        )
+        if recurse_known:
+            return subdirs
+        # Targeted (inotify) refresh: only descend into directories new to us.
+        stack = [d for d in subdirs if d not in previous_subdirs]
+        while stack:
+            stack.extend(self._visit(stack.pop(), force=True, recurse_known=True))
+        return []
+
+    def mark_stale(self) -> None:
+        """Make the next :meth:`refresh` a full one.
+
+        For writers whose :meth:`record` failed: the rewrite it missed may not
+        have moved any directory mtime.
+        """
+        with self._lock:
+            self._stale = True
+
+    def record(self, rel: str) -> None:
+        """Re-stat one file and upsert (or drop) its row.
+
+        Writers that rewrite a file in place call this, since an in-place
+        rewrite does not move the parent directory's mtime.
+        """
+        rel = rel.strip("/")
+        if not rel:
+            return
+        with self._lock:
+            try:
+                st = os.stat(self._abs(rel), follow_symlinks=False)
+            except FileNotFoundError:
+                self._conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                return
+            if stat_mod.S_ISDIR(st.st_mode):
+                return
+            parent = rel.rpartition("/")[0]
+            if not self._dir_known(parent):
+                # The next refresh discovers the new directory on its own.
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files"
+                " (path, parent, size, mtime_ns, inode, is_link) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    rel,
+                    parent,
+                    st.st_size,
+                    st.st_mtime_ns,
+                    st.st_ino,
+                    int(stat_mod.S_ISLNK(st.st_mode)),
+                ),
+            )
+
+    # ----------------------------- queries ---------------------------- #
+
+    def _rows(self, sql: str, params: tuple) -> Iterator[IndexedFile]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return map(IndexedFile._make, rows)
+
+    def files(self, prefix: str = "") -> Iterator[IndexedFile]:
+        """Yield every indexed file under ``prefix`` (root-relative), sorted."""
+        prefix = prefix.strip("/")
+        cols = "SELECT path, size, mtime_ns, inode, is_link FROM files"
+        if not prefix:
+            return self._rows(f"{cols} ORDER BY path", ())
+        lo, hi = _subtree_bounds(prefix)
+        return self._rows(
+            f"{cols} WHERE path >= ? AND path < ? ORDER BY path",
+            (lo, hi),
+        )
+
+    def glob(self, pattern: str, prefix: str = "") -> Iterator[IndexedFile]:
+        """Yield files under ``prefix`` whose path below it matches ``pattern``.
+
+        Matching is :func:`path_matches`, the same the tree-walk fallback uses.
+        """
+        prefix = prefix.strip("/")
+        start = len(prefix) + 1 if prefix else 0
+        return (
+            row for row in self.files(prefix) if path_matches(row.path[start:], pattern)
+        )
+
+    def changed_since(self, since: float, prefix: str = "") -> Iterator[IndexedFile]:
+        """Yield files whose mtime is at or after ``since`` (epoch seconds)."""
+        prefix = prefix.strip("/")
+        cols = "SELECT path, size, mtime_ns, inode, is_link FROM files"
+        threshold = int(since * 1_000_000_000)
+        if not prefix:
+            return self._rows(
+                f"{cols} WHERE mtime_ns >= ? ORDER BY path",
+                (threshold,),
+            )
+        lo, hi = _subtree_bounds(prefix)
+        return self._rows(
+            f"{cols} WHERE mtime_ns >= ? AND path >= ? AND path < ? ORDER BY path",
+            (threshold, lo, hi),
+        )
+
+    def fingerprint(self) -> str:
+        """Digest of every indexed ``(path, size, mtime)``; changes with any file."""
+        digest = hashlib.sha256()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, size, mtime_ns FROM files ORDER BY path",
+            ).fetchall()
+        for path, size, mtime_ns in rows:
+            digest.update(
+                f"{path}\0{size}\0{mtime_ns}\n".encode("utf-8", "surrogateescape"),
+            )
+        return digest.hexdigest()
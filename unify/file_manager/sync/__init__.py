@@ -1,7 +1,8 @@
 """File sync module for managed VM ↔ assistant filesystem synchronization."""
 
+from .coalescer import SyncCoalescer
 from .config import SyncConfig
 from .manager import SyncManager
 from .rclone import RcloneSync, SyncResult
 
-__all__ = ["SyncConfig", "SyncManager", "RcloneSync", "SyncResult"]
+__all__ = ["SyncCoalescer", "SyncConfig", "SyncManager", "RcloneSync", "SyncResult"]
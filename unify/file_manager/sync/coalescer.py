@@ -0,0 +1,130 @@
+"""Debounced, batched push of local writes/deletes to the managed VM."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Optional
+
+from unify.logger import LOGGER
+from unify.common.hierarchical_logger import ICONS
+
+from .config import SyncConfig
+from .rclone import RcloneSync, SyncResult, truncate_for_log
+
+WRITE = "write"
+DELETE = "delete"
+
+
+class SyncCoalescer:
+    """Coalesces per-path write/delete notifications into batched rclone runs.
+
+    Each notification records the latest operation for its path (a write
+    followed by a delete pushes only the delete, and vice versa). The batch is
+    flushed once no notification has arrived for ``write_debounce_seconds``,
+    and never later than ``write_max_delay_seconds`` after the first pending
+    one, as one ``copy_files`` run plus one ``delete_remote_files`` run.
+
+    A failed flush is not re-queued: the rclone layer has already retried,
+    and the coalescer stays dirty so the next poll bisync reconciles it.
+    """
+
+    def __init__(self, rclone: RcloneSync, config: SyncConfig):
+        self._rclone = rclone
+        self._debounce = config.write_debounce_seconds
+        self._max_delay = config.write_max_delay_seconds
+        self._pending: Dict[str, str] = {}
+        self._first_pending_at: Optional[float] = None
+        self._last_submit_at = 0.0
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._closing = False
+        # Bumped on every submission; a bisync that started at generation N
+        # covers every submission up to N.
+        self._generation = 0
+        self._clean_generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def dirty(self) -> bool:
+        """Whether anything was submitted since the last reconciling bisync."""
+        return bool(self._pending) or self._generation != self._clean_generation
+
+    def mark_clean(self, generation: int) -> None:
+        """Record that a successful bisync covered submissions up to ``generation``."""
+        self._clean_generation = max(self._clean_generation, generation)
+
+    def submit(self, path: str, op: str = WRITE) -> None:
+        """Queue ``path`` for push (``op`` is ``"write"`` or ``"delete"``)."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        self._pending[path] = op
+        self._generation += 1
+        self._last_submit_at = now
+        if self._first_pending_at is None:
+            self._first_pending_at = now
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run(), name="filesync-coalesce")
+        else:
+            self._wake.set()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            while not self._closing and self._first_pending_at is not None:
+                deadline = min(
+                    self._last_submit_at + self._debounce,
+                    self._first_pending_at + self._max_delay,
+                )
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+            await self.flush()
+
+    async def flush(self) -> SyncResult:
+        """Push everything pending now, bypassing the debounce."""
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            self._first_pending_at = None
+            if not batch:
+                return SyncResult(success=True)
+
+            writes: List[str] = [p for p, op in batch.items() if op == WRITE]
+            deletes: List[str] = [p for p, op in batch.items() if op == DELETE]
+            LOGGER.debug(
+                f"{ICONS['file_sync']} [FileSync] Flushing {len(writes)} write(s), "
+                f"{len(deletes)} delete(s)",
+            )
+            errors: List[str] = []
+            if writes:
+                result = await self._rclone.copy_files(writes)
+                errors.extend(result.errors)
+            if deletes:
+                result = await self._rclone.delete_remote_files(deletes)
+                errors.extend(result.errors)
+            if errors:
+                LOGGER.error(
+                    f"{ICONS['file_sync']} [FileSync] Batched push failed, "
+                    f"leaving it to the next bisync: {truncate_for_log(str(errors))}",
+                )
+            return SyncResult(success=not errors, errors=errors)
+
+    async def close(self) -> None:
+        """Flush whatever is pending immediately and wait for it to finish."""
+        self._closing = True
+        self._wake.set()
+        if self._task is not None:
+            try:
+                await self._task
+            except Exception as e:
+                LOGGER.error(f"{ICONS['file_sync']} [FileSync] Final flush error: {e}")
+            self._task = None
+        await self.flush()
@@ -70,6 +70,17 @@ class SyncConfig:
     # Polling interval for remote changes (seconds)
     poll_interval_seconds: float = 30.0
 
+    # Write coalescing: a burst of writes is pushed as one batched rclone
+    # run once no new write has arrived for ``write_debounce_seconds``, or
+    # ``write_max_delay_seconds`` after the first pending write at the latest.
+    write_debounce_seconds: float = 0.5
+    write_max_delay_seconds: float = 5.0
+
+    # Skip the poll bisync when neither the local tree nor the remote listing
+    # changed since the last one; still force a bisync every N idle polls.
+    skip_idle_polls: bool = True
+    force_bisync_every_polls: int = 10
+
     @classmethod
     def from_session_details(cls) -> "SyncConfig":
         """Create SyncConfig from SESSION_DETAILS for managed VM mode."""
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from unify.logger import LOGGER
 from unify.common.hierarchical_logger import ICONS
 
+from .coalescer import DELETE, WRITE, SyncCoalescer
 from .config import SyncConfig
 from .rclone import RcloneSync, SyncResult, truncate_for_log
 
@@ -18,9 +19,10 @@ class SyncManager:
 
     Lifecycle:
     1. start() - Called on job start: setup + initial sync from remote
-    2. on_file_write() - Called after file writes: sync file to remote
+    2. on_file_write() - Called after file writes: queue file for a batched push
     3. sync_remote_changes() - Called periodically: bisync for remote changes
-    4. stop() - Called on job end: cleanup
+       (skipped while neither side's listing has changed)
+    4. stop() - Called on job end: flush pending pushes + cleanup
 
     Conflict resolution: Latest wins (by modification time)
     """
@@ -29,7 +31,11 @@ class SyncManager:
         self.config = config or SyncConfig.from_session_details()
         self._rclone: Optional[RcloneSync] = None
         self._poll_task: Optional[asyncio.Task] = None
+        self._coalescer: Optional[SyncCoalescer] = None
         self._started = False
+        # (local, remote) listing digests seen before the last successful bisync.
+        self._last_fingerprints: Optional[Tuple[str, str]] = None
+        self._idle_polls = 0
 
     @property
     def enabled(self) -> bool:
@@ -68,6 +74,8 @@ class SyncManager:
             LOGGER.error(f"{ICONS['file_sync']} [FileSync] Rclone setup failed")
             return False
 
+        self._coalescer = SyncCoalescer(self._rclone, self.config)
+
         # 3. Ensure assistant.txt sentinel exists so bisync has a file to diff
         self._ensure_sentinel()
 
@@ -95,9 +103,19 @@ class SyncManager:
         )
         return True
 
+    def _coalesce(self, path: str, op: str) -> bool:
+        """Queue ``path`` on the coalescer; False when there is none to use."""
+        if self._coalescer is None:
+            return False
+        self._coalescer.submit(str(path), op)
+        return True
+
     async def on_file_write(self, path: str) -> None:
         """Called after file write to sync to remote.
 
+        The write is debounced and pushed together with any others that
+        arrive in the same burst (see :class:`SyncCoalescer`).
+
         Args:
             path: Absolute path to the written file
         """
@@ -118,7 +136,8 @@ class SyncManager:
             # Not under sync root, ignore
             return
 
-        await self._rclone.sync_single_file(path)
+        if not self._coalesce(str(file_path), WRITE):
+            await self._rclone.sync_single_file(path)
 
     async def on_file_delete(self, path: str) -> None:
         """Called after file delete to sync deletion to remote.
@@ -142,7 +161,8 @@ class SyncManager:
         except ValueError:
             return
 
-        await self._rclone.delete_remote_file(path)
+        if not self._coalesce(str(file_path), DELETE):
+            await self._rclone.delete_remote_file(path)
 
     async def sync_remote_changes(self) -> SyncResult:
         """Manually trigger bisync to pull remote changes.
@@ -170,6 +190,10 @@ class SyncManager:
                 pass
             self._poll_task = None
 
+        if self._coalescer:
+            await self._coalescer.close()
+            self._coalescer = None
+
         if self._rclone:
             self._rclone.cleanup()
             self._rclone = None
@@ -275,6 +299,74 @@ class SyncManager:
         )
         return None
 
+    async def _local_fingerprint(self) -> Optional[str]:
+        """Digest of the local sync root listing, or None if it cannot be read."""
+        from unify.file_manager.filesystem_adapters.local_index import (
+            LocalFileIndex,
+        )
+
+        def _compute() -> str:
+            index = LocalFileIndex.for_root(Path(self.config.local_root).expanduser())
+            index.refresh()
+            return index.fingerprint()
+
+        try:
+            return await asyncio.to_thread(_compute)
+        except Exception as e:
+            LOGGER.debug(
+                f"{ICONS['file_sync']} [FileSync] Local fingerprint unavailable: {e}",
+            )
+            return None
+
+    async def _poll_once(self) -> Optional[SyncResult]:
+        """Run one poll cycle; returns None when the bisync was skipped as idle.
+
+        The bisync is skipped only when the coalescer has nothing unreconciled
+        and both the local and remote listing digests match the ones taken
+        before the last successful bisync. Digests are taken *before* the
+        bisync, so its own transfers make the next poll run once more rather
+        than risking a change that landed mid-bisync going unnoticed.
+        """
+        if self._rclone is None:
+            return None
+
+        fingerprints: Optional[Tuple[str, str]] = None
+        if self.config.skip_idle_polls:
+            local_fp = await self._local_fingerprint()
+            remote_fp = await self._rclone.remote_fingerprint()
+            if local_fp is not None and remote_fp is not None:
+                fingerprints = (local_fp, remote_fp)
+
+        dirty = self._coalescer is not None and self._coalescer.dirty
+        if (
+            fingerprints is not None
+            and fingerprints == self._last_fingerprints
+            and not dirty
+            and self._idle_polls + 1 < self.config.force_bisync_every_polls
+        ):
+            self._idle_polls += 1
+            LOGGER.debug(
+                f"{ICONS['file_sync']} [FileSync] Polling: no changes on either side, "
+                "skipping bisync",
+            )
+            return None
+        self._idle_polls = 0
+
+        generation = 0
+        if self._coalescer is not None:
+            await self._coalescer.flush()
+            generation = self._coalescer.generation
+
+        LOGGER.debug(f"{ICONS['file_sync']} [FileSync] Polling: running bisync...")
+        result = await self._rclone.bisync(max_retries=1)
+        if result.success:
+            self._last_fingerprints = fingerprints
+            if self._coalescer is not None:
+                self._coalescer.mark_clean(generation)
+        else:
+            self._last_fingerprints = None
+        return result
+
     async def _poll_remote_changes(self) -> None:
         """Background task to periodically sync remote changes.
 
@@ -292,10 +384,9 @@ class SyncManager:
                 await asyncio.sleep(interval)
 
                 if self._rclone:
-                    LOGGER.debug(
-                        f"{ICONS['file_sync']} [FileSync] Polling: running bisync...",
-                    )
-                    result = await self._rclone.bisync(max_retries=1)
+                    result = await self._poll_once()
+                    if result is None:
+                        continue
                     if result.success:
                         LOGGER.debug(
                             f"{ICONS['file_sync']} [FileSync] Polling: bisync completed successfully",
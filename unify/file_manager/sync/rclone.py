@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import os
 import re
 import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from unify.logger import LOGGER
 from unify.common.hierarchical_logger import ICONS
@@ -25,6 +26,7 @@ class SyncResult:
     files_transferred: int = 0
     bytes_transferred: int = 0
     errors: List[str] = field(default_factory=list)
+    output: str = ""
 
 
 LOG_OUTPUT_MAX_CHARS = 500
@@ -356,6 +358,124 @@ set_modtime = false
             cmd = self._build_cmd(["deletefile", remote_path, "-v"])
             return await self._run_with_retry(cmd, operation=f"delete {rel_path}")
 
+    def _relative_paths(self, local_paths: Iterable[str]) -> List[str]:
+        """Sync-root-relative POSIX paths for ``local_paths`` (outside-root paths dropped)."""
+        local_root = Path(self.config.local_root).expanduser()
+        rels: List[str] = []
+        for path in local_paths:
+            local_file = Path(path)
+            if str(local_file).startswith("~"):
+                local_file = local_file.expanduser()
+            try:
+                rels.append(local_file.relative_to(local_root).as_posix())
+            except ValueError:
+                continue
+        return sorted(set(rels))
+
+    async def _run_with_files_from(
+        self,
+        args: List[str],
+        rel_paths: List[str],
+        operation: str,
+    ) -> SyncResult:
+        """Run an rclone command scoped to ``rel_paths`` via ``--files-from-raw``.
+
+        The raw variant is used so names starting with ``#`` or carrying
+        surrounding whitespace are not treated as comments or trimmed.
+        """
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            suffix=".txt",
+            prefix="rclone_files_",
+            delete=False,
+        ) as list_file:
+            list_file.write("\n".join(rel_paths) + "\n")
+            list_path = list_file.name
+        try:
+            cmd = self._build_cmd([*args, "--files-from-raw", list_path, "-v"])
+            return await self._run_with_retry(cmd, operation=operation)
+        finally:
+            try:
+                os.unlink(list_path)
+            except OSError:
+                pass
+
+    async def copy_files(self, local_paths: Iterable[str]) -> SyncResult:
+        """Push a batch of local files to remote in a single rclone run.
+
+        One ``rclone copy --files-from-raw`` replaces one ``copyto`` process
+        per file, so a burst of writes costs one process spawn and one SFTP
+        session.
+
+        Args:
+            local_paths: Absolute paths of the written local files
+        """
+        async with self._op_lock:
+            rel_paths = self._relative_paths(local_paths)
+            if not rel_paths:
+                return SyncResult(success=True)
+            local = str(Path(self.config.local_root).expanduser())
+            remote = f"{self.REMOTE_NAME}:{self.config.remote_root}"
+            LOGGER.debug(
+                f"{ICONS['file_sync']} [FileSync] Copying {len(rel_paths)} file(s): "
+                f"{local} → {remote}",
+            )
+            return await self._run_with_files_from(
+                ["copy", local, remote, "--no-traverse"],
+                rel_paths,
+                operation=f"copy {len(rel_paths)} file(s)",
+            )
+
+    async def delete_remote_files(self, local_paths: Iterable[str]) -> SyncResult:
+        """Delete a batch of files from remote in a single rclone run.
+
+        Args:
+            local_paths: Absolute paths of the (deleted) local files
+        """
+        async with self._op_lock:
+            rel_paths = self._relative_paths(local_paths)
+            if not rel_paths:
+                return SyncResult(success=True)
+            remote = f"{self.REMOTE_NAME}:{self.config.remote_root}"
+            LOGGER.debug(
+                f"{ICONS['file_sync']} [FileSync] Deleting {len(rel_paths)} remote file(s)",
+            )
+            return await self._run_with_files_from(
+                ["delete", remote],
+                rel_paths,
+                operation=f"delete {len(rel_paths)} file(s)",
+            )
+
+    async def remote_fingerprint(self) -> Optional[str]:
+        """Digest of the remote listing (path, size, modtime), or None on failure.
+
+        One ``lsf -R`` is far cheaper than a bisync, which lists both sides,
+        takes the bisync lock and rewrites its state files; comparing digests
+        lets an idle poll skip the bisync entirely.
+        """
+        async with self._op_lock:
+            remote = f"{self.REMOTE_NAME}:{self.config.remote_root}"
+            cmd = self._build_cmd(
+                [
+                    "lsf",
+                    remote,
+                    "-R",
+                    "--files-only",
+                    "--format",
+                    "pst",
+                    *self._exclude_args(),
+                ],
+            )
+            result = await self._run_with_retry(
+                cmd,
+                operation="remote listing",
+                max_retries=1,
+            )
+            if not result.success:
+                return None
+            lines = sorted(result.output.splitlines())
+            return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
     def _build_cmd(self, args: List[str]) -> List[str]:
         """Build rclone command with config."""
         return ["rclone", "--config", self._config_path, *args]
@@ -427,7 +547,7 @@ set_modtime = false
                             f"{ICONS['file_sync']} [FileSync] stdout: "
                             f"{truncate_for_log(stdout_str)}",
                         )
-                    return SyncResult(success=True)
+                    return SyncResult(success=True, output=stdout_str)
                 else:
                     last_error = f"Exit code {proc.returncode}: {stderr_str}"
                     LOGGER.error(
@@ -0,0 +1,197 @@
+"""Caches behind running a stored function and its dependencies.
+
+Running a compositional function execs its implementation, and the
+implementation of every bare name in its transitive ``depends_on``, into the
+call's namespace. Each invocation used to look every dependency up with its
+own backend read, walking the graph one name at a time, and then strip,
+parse and compile every source again.
+
+Compiled code depends only on a function's name and implementation, so
+:data:`compiled_functions` keeps it process-wide under a hash of the two. An
+edited implementation hashes to a new key, and the entry it replaced ages
+out of the LRU.
+
+Dependency rows are per manager: :class:`DependencyRowCache` keeps the rows
+one ``FunctionManager`` read, along with the name → ``depends_on`` graph it
+resolves a closure from, so the closure costs one batched read when cold and
+none when warm. The manager clears it whenever it adds, updates, deletes or
+resets the trust of a compositional row. The TTL bounds how long a change
+written by another process can go unseen.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from types import CodeType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .verification.source_labels import register_function_source
+
+#: Compiled functions kept per process.
+COMPILED_CODE_CACHE_SIZE = 2048
+
+#: Seconds a manager trusts dependency rows it read without writing them.
+DEPENDENCY_ROWS_TTL_SECONDS = 30.0
+
+
+def implementation_hash(name: str, implementation: str) -> str:
+    return hashlib.sha256(f"{name}\0{implementation}".encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledFunction:
+    """A stored function ready to exec into a namespace."""
+
+    #: The source that was compiled (``@custom_function`` stripped).
+    source: str
+    code: CodeType
+    #: Names its annotations reference, for placeholder injection.
+    annotation_names: FrozenSet[str]
+
+
+class CompiledCodeCache:
+    """LRU of :class:`CompiledFunction` keyed by implementation hash."""
+
+    def __init__(self, max_entries: int = COMPILED_CODE_CACHE_SIZE) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CompiledFunction] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        name: str,
+        implementation: str,
+        build: Callable[[], CompiledFunction],
+    ) -> CompiledFunction:
+        key = implementation_hash(name, implementation)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if compiled is not None:
+            register_function_source(name, compiled.source)
+            return compiled
+        # Compiling twice on a concurrent miss is harmless; holding the lock
+        # across a compile would serialise every other lookup behind it.
+        compiled = build()
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+compiled_functions = CompiledCodeCache()
+
+
+@dataclass(frozen=True)
+class DependencyNode:
+    depends_on: Tuple[str, ...]
+    #: Venv functions are called through a proxy; their deps are not injected.
+    in_venv: bool
+
+
+class DependencyRowCache:
+    """Compositional rows and the dependency graph one manager has read."""
+
+    def __init__(self, ttl_seconds: float = DEPENDENCY_ROWS_TTL_SECONDS) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._graph: Optional[Dict[str, DependencyNode]] = None
+        self._expires = 0.0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Bumped by every :meth:`clear`; a read started before it is discarded."""
+        with self._lock:
+            return self._generation
+
+    def _expire(self) -> None:
+        if self._expires <= monotonic():
+            self._rows.clear()
+            self._graph = None
+
+    def rows(self, names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Copies of the kept rows for ``names``; absent names are left out."""
+        with self._lock:
+            self._expire()
+            found = {n: self._rows[n] for n in names if n in self._rows}
+        return {n: copy.deepcopy(row) for n, row in found.items()}
+
+    def graph(self) -> Optional[Dict[str, DependencyNode]]:
+        with self._lock:
+            self._expire()
+            return self._graph
+
+    def store(
+        self,
+        generation: int,
+        *,
+        rows: Iterable[Dict[str, Any]] = (),
+        graph: Optional[Dict[str, DependencyNode]] = None,
+    ) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            if not self._rows and self._graph is None:
+                self._expires = monotonic() + self._ttl_seconds
+            self._rows.update(
+                {row["name"]: copy.deepcopy(row) for row in rows if row.get("name")},
+            )
+            if graph is not None:
+                self._graph = graph
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+            self._graph = None
+            self._generation += 1
+
+
+def dependency_closure(
+    names: Iterable[str],
+    graph: Dict[str, DependencyNode],
+) -> List[str]:
+    """Bare names reachable from ``names`` through ``graph``, breadth-first."""
+    seen: Dict[str, None] = {}
+    queue = [n for n in names if n and "." not in n]
+    while queue:
+        name = queue.pop(0)
+        if name in seen:
+            continue
+        seen[name] = None
+        node = graph.get(name)
+        if node is None or node.in_venv:
+            continue
+        queue.extend(d for d in node.depends_on if "." not in d and d not in seen)
+    return list(seen)
+
+
+__all__ = [
+    "COMPILED_CODE_CACHE_SIZE",
+    "DEPENDENCY_ROWS_TTL_SECONDS",
+    "CompiledCodeCache",
+    "CompiledFunction",
+    "DependencyNode",
+    "DependencyRowCache",
+    "compiled_functions",
+    "dependency_closure",
+    "implementation_hash",
+]
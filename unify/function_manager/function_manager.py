@@ -110,6 +110,13 @@ from .verification.ledger import (
 )
 from .verification.policy import derive_verify
 from .verification.source_labels import compile_function_source
+from .function_cache import (
+    CompiledFunction,
+    DependencyNode,
+    DependencyRowCache,
+    compiled_functions,
+    dependency_closure,
+)
 from .verification.tier0 import Tier0Checker, signature_from_source, tier0_boundary
 from .settings import VerificationSettings
 from .base import BaseFunctionManager
@@ -142,6 +149,7 @@ from unify.integrations.function_metadata import (
     provider_function_metadata,
 )
 from unify.integrations.builtins_catalog import list_catalog_tools
+from unify.integrations.catalog_cache import invalidate_integration_catalog
 from unify.integrations.embedding_text import normalize_embedding_text
 from .custom_functions import (
     CustomFunctionSyncPartialFailure,
@@ -2020,6 +2028,9 @@ class FunctionManager(BaseFunctionManager):
         self._custom_functions_synced_sources: set[tuple[str, str]] = set()
         self._destination_context_lock = threading.RLock()
         self._destination_write_scoped = False
+        # Rows and dependency graph read to resolve ``depends_on`` closures;
+        # cleared by every compositional write this manager makes.
+        self._dependency_rows = DependencyRowCache()
 
         # ------------------------------------------------------------------ #
         #  LocalFileManager reference (for VM sync manager access)           #
@@ -3156,6 +3167,7 @@ class FunctionManager(BaseFunctionManager):
             entries=dict(fields),
             overwrite=True,
         )
+        self._forget_dependency_rows()
 
     def record_verification(self, row: VerificationRow) -> None:
         """Append one verdict row to ``Functions/Verifications`` and refold the ledger.
@@ -3234,6 +3246,7 @@ class FunctionManager(BaseFunctionManager):
                 entries=updates,
                 overwrite=True,
             )
+            self._forget_dependency_rows()
             return verify
 
     def _invalidation_fields(self) -> Dict[str, Any]:
@@ -3298,6 +3311,7 @@ class FunctionManager(BaseFunctionManager):
                 entries=fields,
                 overwrite=True,
             )
+            self._forget_dependency_rows()
         return sorted(targets)
 
     def invalidate_trust_for_guidance(self, guidance_id: int) -> List[int]:
@@ -3576,6 +3590,7 @@ class FunctionManager(BaseFunctionManager):
             },
             overwrite=True,
         )
+        self._forget_dependency_rows()
         verify = self.refresh_trust(int(function_id))
         return {
             "outcome": "confirmed",
@@ -3695,6 +3710,7 @@ class FunctionManager(BaseFunctionManager):
             entries={"verification_policy": updated.model_dump(mode="json")},
             overwrite=True,
         )
+        self._forget_dependency_rows()
         verify = self.refresh_trust(int(function_id))
         return {
             "outcome": "raised",
@@ -3823,6 +3839,7 @@ class FunctionManager(BaseFunctionManager):
         """Store per-app hashes for materialized provider-backed tools."""
 
         self._store_hash_map("integration_tool_hash_by_app", hash_by_app)
+        invalidate_integration_catalog()
 
     @staticmethod
     def _compact_function_search_rows(
@@ -3953,6 +3970,7 @@ class FunctionManager(BaseFunctionManager):
                 context=self._primitives_ctx,
                 logs=ids_to_delete,
             )
+            invalidate_integration_catalog()
             # Compositional link-debt updates are best-effort; a successful
             # delete must still report the removed count.
             compositional_ctx = getattr(self, "_compositional_ctx", None)
@@ -4771,6 +4789,7 @@ class FunctionManager(BaseFunctionManager):
             context=self._compositional_ctx,
             logs=[logs[0].id],
         )
+        self._forget_dependency_rows()
         return True
 
     def _update_custom_function(
@@ -4809,6 +4828,7 @@ class FunctionManager(BaseFunctionManager):
             entries=update_data,
             overwrite=True,
         )
+        self._forget_dependency_rows()
         name = update_data.get("name") or log.entries.get("name")
         if name:
             self._invalidate_dependents_of([str(name)])
@@ -4865,6 +4885,7 @@ class FunctionManager(BaseFunctionManager):
             stamp_authoring=True,
             recompute_derived=True,
         )
+        self._forget_dependency_rows()
         # unity_create_logs can return either a dict or a list of Log objects
         if isinstance(result, list) and len(result) > 0:
             log = result[0]
@@ -5493,6 +5514,7 @@ class FunctionManager(BaseFunctionManager):
                     batched=True,
                     recompute_derived=True,
                 )
+                self._forget_dependency_rows()
             except Exception as e:
                 logger.error(
                     f"Failed to batch create function logs: {e}",
@@ -5515,6 +5537,7 @@ class FunctionManager(BaseFunctionManager):
                     ],
                     overwrite=True,
                 )
+                self._forget_dependency_rows()
                 # Content changed under everything that depends on these
                 # names: dependents lose their trust before their next call.
                 self._invalidate_dependents_of(log_id_to_name.values())
@@ -5692,6 +5715,7 @@ class FunctionManager(BaseFunctionManager):
                     batched=True,
                     recompute_derived=True,
                 )
+                self._forget_dependency_rows()
             except Exception as e:
                 logger.error(
                     f"Failed to batch create shell function logs: {e}",
@@ -5714,6 +5738,7 @@ class FunctionManager(BaseFunctionManager):
                     ],
                     overwrite=True,
                 )
+                self._forget_dependency_rows()
             except Exception as e:
                 logger.error(
                     f"Failed to batch update shell function logs: {e}",
@@ -5810,6 +5835,121 @@ class FunctionManager(BaseFunctionManager):
             raise last_exc
         return None
 
+    def _get_function_data_by_names(
+        self,
+        *,
+        names: Iterable[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Retrieve compositional function records by name in one batched read.
+
+        Contexts are read personal-first, as in ``_get_function_data_by_name``;
+        a name found in an earlier context is not asked of later ones.
+        """
+        wanted = list(dict.fromkeys(n for n in names if isinstance(n, str) and n))
+        found: Dict[str, Dict[str, Any]] = {}
+        for context in self._read_compositional_contexts():
+            missing = [n for n in wanted if n not in found]
+            if not missing:
+                break
+            try:
+                logs = unisdk.get_logs(
+                    context=context,
+                    filter=f"name in {json.dumps(missing)}",
+                    limit=len(missing),
+                    exclude_fields=list_private_fields(context),
+                )
+            except _UnifyRequestError as e:
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                if status == 404:
+                    continue
+                raise
+            rows = self._hydrate_verification_fields(
+                [log.entries for log in logs],
+                default_context=context,
+            )
+            for row in rows:
+                name = row.get("name")
+                if isinstance(name, str) and name not in found:
+                    found[name] = row
+        return found
+
+    def _dependency_graph(self) -> Dict[str, DependencyNode]:
+        """Every compositional function's ``depends_on``, from one projected read."""
+        graph = self._dependency_rows.graph()
+        if graph is not None:
+            return graph
+        generation = self._dependency_rows.generation
+        graph = {}
+        for context in self._read_compositional_contexts():
+            try:
+                logs = unisdk.get_logs(
+                    context=context,
+                    from_fields=["name", "depends_on", "venv_id"],
+                )
+            except _UnifyRequestError as e:
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                if status == 404:
+                    continue
+                raise
+            for log in logs:
+                entries = log.entries or {}
+                name = entries.get("name")
+                if not isinstance(name, str) or name in graph:
+                    continue
+                deps = entries.get("depends_on") or []
+                graph[name] = DependencyNode(
+                    depends_on=tuple(d for d in deps if isinstance(d, str) and d),
+                    in_venv=entries.get("venv_id") is not None,
+                )
+        self._dependency_rows.store(generation, graph=graph)
+        return graph
+
+    def _resolve_dependency_rows(
+        self,
+        depends_on: Iterable[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Records for every bare name in the transitive closure of ``depends_on``.
+
+        Rows this manager has already read are reused. The rest of the closure
+        is found on the cached dependency graph and read in one batch, rather
+        than one lookup per name as the walk reaches it.
+        """
+        roots = [d for d in depends_on if isinstance(d, str) and d and "." not in d]
+        if not roots:
+            return {}
+        generation = self._dependency_rows.generation
+        rows: Dict[str, Dict[str, Any]] = {}
+        asked: Set[str] = set()
+        # A name the graph does not know is still asked for: it may have been
+        # written since the graph was read.
+        pending = dependency_closure(roots, self._dependency_graph())
+        while pending:
+            asked.update(pending)
+            rows.update(self._dependency_rows.rows(pending))
+            missing = [n for n in pending if n not in rows]
+            if missing:
+                fetched = self._get_function_data_by_names(names=missing)
+                self._dependency_rows.store(generation, rows=fetched.values())
+                rows.update(fetched)
+            # Rows newer than the graph may depend on names it does not list.
+            pending = list(
+                dict.fromkeys(
+                    dep
+                    for row in rows.values()
+                    if row.get("venv_id") is None
+                    for dep in row.get("depends_on") or []
+                    if isinstance(dep, str)
+                    and dep
+                    and "." not in dep
+                    and dep not in asked
+                ),
+            )
+        return rows
+
+    def _forget_dependency_rows(self) -> None:
+        """Called after every write to a compositional row."""
+        self._dependency_rows.clear()
+
     def _create_in_process_callable(
         self,
         func_data: Dict[str, Any],
@@ -5858,16 +5998,20 @@ class FunctionManager(BaseFunctionManager):
         if not isinstance(implementation, str) or not implementation.strip():
             raise ValueError(f"Function '{func_name}' has no implementation")
 
-        implementation = _strip_custom_function_decorators(implementation)
+        compiled = compiled_functions.get(
+            func_name,
+            implementation,
+            lambda: self._compile_stored_function(func_name, implementation),
+        )
 
         # Ensure user-defined annotation symbols don't cause NameErrors when callers
         # (e.g., CodeActActor) later resolve type hints via typing.get_type_hints().
-        self._inject_forward_ref_annotation_placeholders(
-            implementation,
+        self._inject_annotation_placeholders(
+            compiled.annotation_names,
             namespace=namespace,
         )
 
-        exec(compile_function_source(func_name, implementation), namespace)
+        exec(compiled.code, namespace)
         raw_fn = namespace.get(func_name)
         if not callable(raw_fn):
             raise ValueError(
@@ -5882,6 +6026,15 @@ class FunctionManager(BaseFunctionManager):
             raw_callable=raw_fn,
         )
 
+    @staticmethod
+    def _compile_stored_function(name: str, implementation: str) -> CompiledFunction:
+        source = _strip_custom_function_decorators(implementation)
+        return CompiledFunction(
+            source=source,
+            code=compile_function_source(name, source),
+            annotation_names=frozenset(FunctionManager._annotation_names(source)),
+        )
+
     @staticmethod
     def _inject_forward_ref_annotation_placeholders(
         implementation: str,
@@ -5903,13 +6056,21 @@ class FunctionManager(BaseFunctionManager):
         If the function body actually uses a type (e.g. `Role.ADMIN`), the
         function must still import/define it itself.
         """
+        FunctionManager._inject_annotation_placeholders(
+            FunctionManager._annotation_names(implementation),
+            namespace=namespace,
+        )
+
+    @staticmethod
+    def _annotation_names(implementation: str) -> Set[str]:
+        """Names referenced by the first function's annotations in ``implementation``."""
         try:
             tree = ast.parse(implementation)
         except Exception:
-            return
+            return set()
 
         if not tree.body:
-            return
+            return set()
 
         fn_node: Optional[Union[ast.FunctionDef, ast.AsyncFunctionDef]] = None
         if len(tree.body) == 1 and isinstance(
@@ -5923,7 +6084,7 @@ class FunctionManager(BaseFunctionManager):
                     fn_node = node
                     break
         if fn_node is None:
-            return
+            return set()
 
         ann_exprs: List[ast.AST] = []
         args = fn_node.args
@@ -5962,7 +6123,14 @@ class FunctionManager(BaseFunctionManager):
             for node in ast.walk(expr):
                 if isinstance(node, ast.Name) and node.id:
                     annotation_names.add(node.id)
+        return annotation_names
 
+    @staticmethod
+    def _inject_annotation_placeholders(
+        annotation_names: Iterable[str],
+        *,
+        namespace: Dict[str, Any],
+    ) -> None:
         if not annotation_names:
             return
 
@@ -6060,6 +6228,7 @@ class FunctionManager(BaseFunctionManager):
         if not isinstance(deps, list):
             return
 
+        dep_rows = self._resolve_dependency_rows(d for d in deps if d not in visited)
         q = deque([d for d in deps if isinstance(d, str) and d])
         while q:
             dep_name = q.popleft()
@@ -6088,7 +6257,7 @@ class FunctionManager(BaseFunctionManager):
                 continue
 
             # ── Bare dependency (compositional function) ─────────────────────
-            dep_data = self._get_function_data_by_name(name=dep_name)
+            dep_data = dep_rows.get(dep_name)
             if not dep_data:
                 logger.warning(
                     f"Dependency '{dep_name}' not found for '{func_data.get('name')}', skipping",
@@ -6482,6 +6651,7 @@ class FunctionManager(BaseFunctionManager):
                 },
                 overwrite=True,
             )
+            self._forget_dependency_rows()
 
     def _mark_guidance_stale_for_deleted_functions(
         self,
@@ -6673,6 +6843,7 @@ class FunctionManager(BaseFunctionManager):
                 context=self._compositional_ctx,
                 logs=log_ids_to_delete,
             )
+            self._forget_dependency_rows()
 
         return results
 
@@ -6718,6 +6889,7 @@ class FunctionManager(BaseFunctionManager):
                 entries={"stale_reasons": serialized},
                 overwrite=True,
             )
+            self._forget_dependency_rows()
         return {
             "outcome": "dependencies reconciled",
             "details": {
@@ -7336,6 +7508,7 @@ class FunctionManager(BaseFunctionManager):
             entries={"venv_id": venv_id},
             overwrite=True,
         )
+        self._forget_dependency_rows()
         self.invalidate_trust([int(function_id)])
         return True
 
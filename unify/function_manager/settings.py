@@ -61,6 +61,15 @@ class VerificationSettings(BaseModel):
     max_fixture_bytes: int = 8192
     max_guidance_chars: int = 6000
     unsure_warning_threshold: int = 3
+    #: Verifier LLM calls one run may have in flight at once.
+    max_concurrent_passes: int = 8
+    #: Prompt plus completion tokens one run's verifier passes may spend;
+    #: past it, further passes are UNSURE without a call. ``None`` is unlimited.
+    max_pass_tokens_per_run: Optional[int] = None
+    #: How long a pass waits for others on the same call site (same prefix
+    #: and stable block) to join it in one multi-item request.
+    coalesce_window_ms: int = 20
+    max_coalesced_items: int = 8
 
 
 class FunctionSettings(BaseSettings):
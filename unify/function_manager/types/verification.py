@@ -89,6 +89,12 @@ class Verdict(_FaultRequiredOnFail):
     fault: Optional[Fault] = None
 
 
+class VerdictBatch(BaseModel):
+    """Verdicts for several calls judged in one request, in the order asked."""
+
+    verdicts: List[Verdict]
+
+
 class VerificationPolicy(BaseModel):
     """Librarian-settable overrides. Every knob can only raise the bar."""
 
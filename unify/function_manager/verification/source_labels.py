@@ -38,10 +38,19 @@ def compile_function_source(name: str, source: str) -> CodeType:
     the exact executed lines back from a frame, including sources that were
     rewritten (decorators stripped, steering probes inserted) before compiling.
     """
+    register_function_source(name, source)
+    return compile(source, function_source_filename(name), "exec")
+
+
+def register_function_source(name: str, source: str) -> None:
+    """Make ``source`` the text ``linecache`` serves for ``name``'s label.
+
+    Code compiled earlier and executed again must re-register its text, since
+    another source may have been compiled under the same name in between.
+    """
     filename = function_source_filename(name)
     lines = source.splitlines(keepends=True)
     linecache.cache[filename] = (len(source), None, lines, filename)
-    return compile(source, filename, "exec")
 
 
 def executed_source_lines(name: str) -> Optional[list[str]]:
@@ -52,6 +52,10 @@ from unify.gateway.ingress import (
     IngressTransport,
 )
 from unify.gateway.ingress_inmemory import InMemoryIngressTransport
+from unify.gateway.ingress_keyed import (
+    KeyedEnvelopeDispatcher,
+    envelope_ordering_key,
+)
 from unify.gateway.ingress_pubsub import PubSubIngressTransport
 from unify.gateway.outbound import OutboundTransport
 from unify.gateway.outbound_inmemory import (
@@ -131,6 +135,7 @@ __all__ = [
     "TRANSPORT_KIND_PUBSUB",
     "create_ingress_transport_factory",
     "create_outbound_transport",
+    "envelope_ordering_key",
     "BaseEnvelope",
     "BaseInboundEvent",
     "EmailEnvelope",
@@ -150,6 +155,7 @@ __all__ = [
     "InMemoryIngressTransport",
     "InMemoryOutboundTransport",
     "IngressTransport",
+    "KeyedEnvelopeDispatcher",
     "LocalRuntimeActivator",
     "LocalScheduler",
     "LocalDiskStorage",
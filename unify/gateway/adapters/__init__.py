@@ -5,6 +5,7 @@ from unify.gateway.adapters.internal import router as internal_router
 from unify.gateway.adapters.microsoft import router as microsoft_router
 from unify.gateway.adapters.ms_teams_bot import router as ms_teams_bot_adapter_router
 from unify.gateway.adapters.slack import router as slack_adapter_router
+from unify.gateway.adapters.storage import router as storage_router
 from unify.gateway.adapters.twilio import router as twilio_router
 
 __all__ = [
@@ -13,5 +14,6 @@ __all__ = [
     "microsoft_router",
     "ms_teams_bot_adapter_router",
     "slack_adapter_router",
+    "storage_router",
     "twilio_router",
 ]
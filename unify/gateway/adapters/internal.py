@@ -6,7 +6,7 @@ import json
 import os
 import uuid
 from pathlib import PurePath
-from typing import Any
+from typing import Any, AsyncIterator
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import JSONResponse, Response
@@ -24,6 +24,7 @@ from unify.gateway.common.auth import (
     require_gateway_admin,
 )
 from unify.gateway.context import GatewayContext, get_gateway_context
+from unify.gateway.storage import DEFAULT_CHUNK_SIZE, write_stream
 from unify.settings import SETTINGS
 
 router = APIRouter()
@@ -81,6 +82,12 @@ def _normalize_int_list(value: Any) -> list[int]:
     return [int(item) for item in _optional_list(value)]
 
 
+async def _upload_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+    # Starlette spools large uploads to disk; read them back a chunk at a time.
+    while chunk := await file.read(DEFAULT_CHUNK_SIZE):
+        yield chunk
+
+
 @router.post("/unify/attachment")
 async def unify_attachment_upload(
     request: Request,
@@ -89,17 +96,18 @@ async def unify_attachment_upload(
     context: GatewayContext = Depends(get_gateway_context),
 ) -> dict[str, Any]:
     await require_assistant_ownership(request, assistant_id)
-    content = await file.read()
     filename = _safe_filename(file.filename or "attachment")
     content_type = file.content_type or "application/octet-stream"
     attachment_id = str(uuid.uuid4())
     bucket = _attachments_bucket()
     object_path = f"{assistant_id or 'unknown'}/{attachment_id}_{filename}"
     key = f"{bucket}/{object_path}"
-    stored = await context.storage.write_bytes(
+    stored = await write_stream(
+        context.storage,
         key,
-        content,
+        _upload_chunks(file),
         content_type=content_type,
+        sha256=True,
     )
     url = await context.storage.signed_url(key)
     return {
@@ -111,6 +119,7 @@ async def unify_attachment_upload(
         "gs_url": f"gs://{bucket}/{object_path}",
         "content_type": stored.content_type,
         "size_bytes": stored.size_bytes,
+        "sha256": stored.sha256,
     }
 
 
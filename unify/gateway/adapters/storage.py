@@ -0,0 +1,109 @@
+"""Signed download route for objects in the gateway's local storage.
+
+``LocalDiskStorage.signed_url`` points here when the gateway serves its
+own storage directory. The signature and expiry in the query string are
+the only credential, so the route is mounted without bearer auth, the
+same way a cloud bucket's signed URL works. Bodies are streamed from
+``Storage.open_read`` and a single ``Range`` is honoured, so players can
+seek through a recording and a multi-gigabyte video never sits in memory.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+
+from unify.gateway.context import GatewayContext, get_gateway_context
+from unify.gateway.storage import LocalDiskStorage, StorageError
+
+router = APIRouter()
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Resolve a ``Range`` header to a half-open ``(start, end)`` over ``size``.
+
+    ``None`` means serve the whole object: no header, a malformed one, or a
+    multi-range request (which a server may answer in full). Raises
+    ``ValueError`` for a well-formed range that cannot be satisfied.
+    """
+    if not header:
+        return None
+    match = _RANGE.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes.
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError(header)
+        return max(0, size - length), size
+    start = int(first)
+    end = size if not last else min(int(last) + 1, size)
+    if start >= size or end <= start:
+        raise ValueError(header)
+    return start, end
+
+
+@router.api_route("/storage/local/{key:path}", methods=["GET", "HEAD"])
+async def local_storage_object(
+    key: str,
+    request: Request,
+    expires: int,
+    signature: str,
+    context: GatewayContext = Depends(get_gateway_context),
+) -> Response:
+    storage = context.storage
+    if not isinstance(storage, LocalDiskStorage):
+        raise HTTPException(status_code=404, detail="Not found")
+    if not storage.verify_signed_url(key, expires, signature):
+        raise HTTPException(status_code=403, detail="Invalid or expired signature")
+    try:
+        stored = await storage.stat(key)
+    except StorageError:
+        raise HTTPException(status_code=404, detail="Not found") from None
+
+    size = stored.size_bytes
+    headers = {"Accept-Ranges": "bytes"}
+    try:
+        byte_range = parse_range(request.headers.get("range"), size)
+    except ValueError:
+        return Response(
+            status_code=416,
+            headers={**headers, "Content-Range": f"bytes */{size}"},
+        )
+    start, end = byte_range or (0, size)
+    status_code = 200
+    if byte_range is not None:
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+    headers["Content-Length"] = str(end - start)
+
+    if request.method == "HEAD":
+        return Response(
+            status_code=status_code,
+            headers=headers,
+            media_type=stored.content_type,
+        )
+
+    async def body() -> AsyncIterator[bytes]:
+        async with storage.open_read(key, start=start, end=end) as reader:
+            async for chunk in reader:
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        status_code=status_code,
+        headers=headers,
+        media_type=stored.content_type,
+    )
+
+
+__all__ = ["parse_range", "router"]
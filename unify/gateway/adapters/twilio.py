@@ -29,6 +29,7 @@ from unify.gateway.common.livekit import (
 from unify.gateway.common.twilio import build_twilio_client, build_twilio_wa_client
 from unify.gateway.context import GatewayContext, get_gateway_context
 from unify.gateway.credentials import CredentialNotFoundError
+from unify.gateway.storage import DEFAULT_CHUNK_SIZE, write_stream
 from unify.settings import SETTINGS
 
 router = APIRouter()
@@ -337,15 +338,20 @@ async def _whatsapp_attachments(
                 f"MediaContentType{index}",
                 "application/octet-stream",
             )
-            response = await client.get(media_url, auth=(account_sid, auth_token))
-            response.raise_for_status()
             attachment_id = str(uuid.uuid4())
             key = f"attachments/{assistant_id}/whatsapp/{message_sid or attachment_id}_{index}"
-            stored = await context.storage.write_bytes(
-                key,
-                response.content,
-                content_type=content_type,
-            )
+            async with client.stream(
+                "GET",
+                media_url,
+                auth=(account_sid, auth_token),
+            ) as response:
+                response.raise_for_status()
+                stored = await write_stream(
+                    context.storage,
+                    key,
+                    response.aiter_bytes(DEFAULT_CHUNK_SIZE),
+                    content_type=content_type,
+                )
             attachments.append(
                 {
                     "id": attachment_id,
@@ -74,6 +74,7 @@ from unify.gateway.adapters import (
     microsoft_router,
     ms_teams_bot_adapter_router,
     slack_adapter_router,
+    storage_router,
     twilio_router,
 )
 
@@ -314,6 +315,8 @@ def create_app(
         tags=["ms-teams-bot-adapters"],
     )
     app.include_router(twilio_router, tags=["twilio-adapters"])
+    # Signed local-storage downloads: the URL's signature is the credential.
+    app.include_router(storage_router, tags=["storage"])
 
     # Built-in user-API-key authed channel (auth is enforced inside the route).
     app.include_router(unillm_router, prefix="/unillm")
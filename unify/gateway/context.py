@@ -62,13 +62,21 @@ def create_default_gateway_context() -> GatewayContext:
     )
     # HTTP base where another service serves the gateway storage directory
     # (Orchestra's /v0/storage/local route over the shared compose volume).
+    # Without one the gateway serves signed URLs to it itself.
     storage_public_url = os.environ.get("UNIFY_GATEWAY_STORAGE_PUBLIC_URL", "").strip()
+    public_url_provider = default_public_url_provider()
+    storage = LocalDiskStorage(
+        public_base_url=storage_public_url or None,
+        serve_base_url=public_url_provider.url_for("storage/local"),
+        signing_key=os.environ.get("UNIFY_GATEWAY_STORAGE_SIGNING_KEY", "").strip()
+        or None,
+    )
     return GatewayContext(
         credentials=EnvCredentialStore(),
-        storage=LocalDiskStorage(public_base_url=storage_public_url or None),
+        storage=storage,
         envelope_sink=envelope_sink,
         runtime_activator=LocalRuntimeActivator(),
-        public_url_provider=default_public_url_provider(),
+        public_url_provider=public_url_provider,
         scheduler=LocalScheduler(),
     )
 
@@ -0,0 +1,305 @@
+"""Per-conversation ordered, cross-conversation concurrent envelope dispatch.
+
+``KeyedEnvelopeDispatcher`` sits between any ``IngressTransport`` and the
+``EnvelopeDispatcher`` it would otherwise call directly::
+
+    keyed = KeyedEnvelopeDispatcher(comms.dispatch_envelope_payload)
+    await transport.start(keyed)
+    ...
+    await transport.stop()
+    await keyed.close()
+
+Why
+===
+
+Neither built-in transport gives per-conversation ordering together with
+parallelism across conversations. ``InMemoryIngressTransport.deliver``
+runs the dispatcher inline on the caller, so ordering is whatever the
+callers happen to await. ``PubSubIngressTransport`` submits every
+envelope straight onto the loop and, for call/meet threads, parks a
+Pub/Sub callback thread on ``future.result()`` until dispatch finishes:
+the only ordering tool it has is to serialize, and one slow call can
+hold callback threads that unrelated conversations are waiting on.
+
+This dispatcher is itself an ``EnvelopeDispatcher``. Calling it files the
+envelope under an ordering key and returns as soon as it is queued.
+Envelopes with the same key run strictly one after another in arrival
+order; envelopes with different keys run in parallel, up to
+``max_concurrency`` at once across the whole process. A key's worker
+task exists only while that key has work queued, so a burst over
+thousands of conversations leaves nothing behind once it drains.
+
+Ordering keys
+=============
+
+``envelope_ordering_key`` is the default. Call and meeting lifecycle
+threads (anything containing ``"call"`` or ``"meet"``, the same tokens
+``PubSubIngressTransport`` blocks on) share the single ``"voice"`` key,
+because their events (``call`` -> ``call_answered`` -> ``recording_ready``
+...) do not carry one identifier consistently and must keep today's
+strict ordering. Every other thread is keyed by the thread name plus the
+first conversation identifier its event carries, so two contacts
+messaging at once no longer wait on each other. Pass ``key=`` to
+choose differently.
+
+Acknowledgement
+===============
+
+The wrapped dispatcher receives once-only ``ack``/``nack`` callables and
+may settle the envelope itself, as ``CommsManager`` does. Whatever it
+leaves unsettled is settled when it finishes: ``ack`` if it returned,
+``nack`` if it raised (so an at-least-once transport redelivers).
+Envelopes still queued when the dispatcher is closed without draining
+are nacked.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+from unify.gateway.ingress import AckCallable, EnvelopeDispatcher
+
+_log = logging.getLogger("unify.gateway.ingress")
+
+#: Threads containing any of these tokens share the ``VOICE_ORDERING_KEY``.
+VOICE_THREAD_TOKENS: tuple[str, ...] = ("call", "meet")
+
+#: Ordering key shared by every call and meeting lifecycle envelope.
+VOICE_ORDERING_KEY = "voice"
+
+#: Event fields that identify a conversation, in order of preference.
+CONVERSATION_ID_FIELDS: tuple[str, ...] = (
+    "thread_id",
+    "chat_id",
+    "channel_id",
+    "contact_id",
+    "from_number",
+    "from",
+)
+
+#: Default cap on envelopes being dispatched at once, across all keys.
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+def envelope_ordering_key(payload: dict) -> str:
+    """Default ordering key for a ``{thread, event}`` envelope payload."""
+    thread = str(payload.get("thread", ""))
+    if any(token in thread for token in VOICE_THREAD_TOKENS):
+        return VOICE_ORDERING_KEY
+    event = payload.get("event")
+    if isinstance(event, dict):
+        for field in CONVERSATION_ID_FIELDS:
+            value = event.get(field)
+            if value not in (None, ""):
+                return f"{thread}:{value}"
+    return thread
+
+
+class _Settlement:
+    """Once-only ``ack``/``nack`` for one envelope."""
+
+    __slots__ = ("_ack", "_nack", "settled")
+
+    def __init__(self, ack: AckCallable | None, nack: AckCallable | None) -> None:
+        self._ack = ack
+        self._nack = nack
+        self.settled = False
+
+    def ack(self) -> None:
+        if not self.settled:
+            self.settled = True
+            if self._ack is not None:
+                self._ack()
+
+    def nack(self) -> None:
+        if not self.settled:
+            self.settled = True
+            if self._nack is not None:
+                self._nack()
+
+
+@dataclass
+class _Queued:
+    payload: dict
+    source_topic: str
+    settlement: _Settlement
+
+
+class KeyedEnvelopeDispatcher:
+    """FIFO per ordering key, concurrent across keys, globally capped.
+
+    ``max_pending`` bounds the envelopes accepted but not yet finished;
+    once reached, calls wait for room instead of queueing without limit.
+    ``None`` (the default) leaves the bound to the transport's own flow
+    control.
+    """
+
+    def __init__(
+        self,
+        dispatcher: EnvelopeDispatcher,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_pending: int | None = None,
+        key: Callable[[dict], str] = envelope_ordering_key,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self._dispatcher = dispatcher
+        self._key = key
+        self._max_concurrency = max_concurrency
+        self._max_pending = max_pending
+        # Created lazily so the dispatcher can be built outside a running loop.
+        self._slots: asyncio.Semaphore | None = None
+        self._room: asyncio.Semaphore | None = None
+        self._idle: asyncio.Event | None = None
+        self._queues: dict[str, deque[_Queued]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._pending = 0
+        self._in_flight = 0
+        self._closed = False
+        self.dispatched = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        """Envelopes accepted and not yet finished (queued or running)."""
+        return self._pending
+
+    @property
+    def in_flight(self) -> int:
+        """Envelopes the wrapped dispatcher is running right now."""
+        return self._in_flight
+
+    @property
+    def active_keys(self) -> int:
+        """Ordering keys with work queued or running."""
+        return len(self._workers)
+
+    def _ensure_primitives(self) -> None:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_concurrency)
+            if self._max_pending is not None:
+                self._room = asyncio.Semaphore(self._max_pending)
+            self._idle = asyncio.Event()
+            self._idle.set()
+
+    async def __call__(
+        self,
+        payload: dict,
+        *,
+        source_topic: str = "",
+        ack: AckCallable | None = None,
+        nack: AckCallable | None = None,
+    ) -> None:
+        """Queue ``payload`` behind earlier envelopes with the same key.
+
+        Returns once queued, not once dispatched. Raises ``RuntimeError``
+        after ``close``.
+        """
+        if self._closed:
+            raise RuntimeError("KeyedEnvelopeDispatcher: dispatcher is closed")
+        self._ensure_primitives()
+        key = self._key(payload)
+        if self._room is not None:
+            await self._room.acquire()
+            if self._closed:
+                self._room.release()
+                raise RuntimeError("KeyedEnvelopeDispatcher: dispatcher is closed")
+        self._pending += 1
+        self._idle.clear()
+        self._queues.setdefault(key, deque()).append(
+            _Queued(payload, source_topic, _Settlement(ack, nack)),
+        )
+        if key not in self._workers:
+            self._workers[key] = asyncio.create_task(
+                self._drain_key(key),
+                name=f"ingress-key:{key}",
+            )
+
+    async def _drain_key(self, key: str) -> None:
+        queue = self._queues[key]
+        try:
+            while queue:
+                item = queue[0]
+                async with self._slots:
+                    self._in_flight += 1
+                    try:
+                        await self._dispatch(item)
+                    finally:
+                        self._in_flight -= 1
+                queue.popleft()
+                self._finished()
+        finally:
+            # Reached on normal exhaustion and on cancellation by ``close``;
+            # anything still queued is nacked so the transport redelivers.
+            while queue:
+                queue.popleft().settlement.nack()
+                self._finished()
+            del self._queues[key]
+            del self._workers[key]
+
+    async def _dispatch(self, item: _Queued) -> None:
+        settlement = item.settlement
+        try:
+            await self._dispatcher(
+                item.payload,
+                source_topic=item.source_topic,
+                ack=settlement.ack,
+                nack=settlement.nack,
+            )
+        except Exception as exc:
+            self.failed += 1
+            _log.error(
+                "KeyedEnvelopeDispatcher: dispatcher raised on %r: %s",
+                item.payload.get("thread", ""),
+                exc,
+            )
+            settlement.nack()
+        else:
+            self.dispatched += 1
+            settlement.ack()
+
+    def _finished(self) -> None:
+        self._pending -= 1
+        if self._room is not None:
+            self._room.release()
+        if self._pending == 0:
+            self._idle.set()
+
+    async def drain(self) -> None:
+        """Wait until every accepted envelope has finished."""
+        if self._idle is not None:
+            await self._idle.wait()
+
+    async def close(self, *, drain: bool = True) -> None:
+        """Stop accepting envelopes and wind down.
+
+        With ``drain`` (the default) queued envelopes still run; otherwise
+        running dispatches are cancelled and queued envelopes are nacked.
+        Stop the transport first so nothing arrives in between.
+        Idempotent.
+        """
+        self._closed = True
+        if drain:
+            await self.drain()
+            return
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+__all__ = [
+    "CONVERSATION_ID_FIELDS",
+    "DEFAULT_MAX_CONCURRENCY",
+    "KeyedEnvelopeDispatcher",
+    "VOICE_ORDERING_KEY",
+    "VOICE_THREAD_TOKENS",
+    "envelope_ordering_key",
+]
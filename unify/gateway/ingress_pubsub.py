@@ -21,6 +21,11 @@ matches ``blocking_dispatch_threads`` (default: any thread containing
 the ordering guarantees today's code relies on for voice/meeting
 events.
 
+Started with a ``KeyedEnvelopeDispatcher`` (``unify.gateway.ingress_keyed``)
+as its dispatcher, the call returns once the envelope is queued, so the
+blocking wait is brief and ordering comes from the per-conversation
+queues instead of from parked callback threads.
+
 Topic and subscription naming are the caller's responsibility. The
 hosted Unity convention is::
 
@@ -11,7 +11,24 @@ the Phase B channel migration, which is where call sites actually need
 the GCS backend wired in.
 """
 
-from unify.gateway.storage.base import Storage, StorageError, StorageObject
+from unify.gateway.storage.base import (
+    DEFAULT_CHUNK_SIZE,
+    Storage,
+    StorageError,
+    StorageObject,
+    StorageReader,
+    StorageWriter,
+    write_stream,
+)
 from unify.gateway.storage.local import LocalDiskStorage
 
-__all__ = ["LocalDiskStorage", "Storage", "StorageError", "StorageObject"]
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "LocalDiskStorage",
+    "Storage",
+    "StorageError",
+    "StorageObject",
+    "StorageReader",
+    "StorageWriter",
+    "write_stream",
+]
@@ -3,7 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol, runtime_checkable
+from typing import (
+    AsyncContextManager,
+    AsyncIterable,
+    AsyncIterator,
+    Protocol,
+    runtime_checkable,
+)
+
+#: Bytes a stream moves per backend call. A stream holds about one chunk at a
+#: time, so this bounds its memory whatever the size of the object.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
 
 
 class StorageError(Exception):
@@ -17,6 +27,50 @@ class StorageObject:
     key: str
     size_bytes: int
     content_type: str = "application/octet-stream"
+    #: Hex SHA-256 of the object, when the write that produced it asked for one.
+    sha256: str | None = None
+
+
+class StorageWriter(Protocol):
+    """An object being written in chunks, from ``Storage.open_write``.
+
+    Nothing is visible under the key until the ``async with`` block exits
+    cleanly; an exception inside it discards everything written.
+    """
+
+    key: str
+
+    async def write(self, data: bytes) -> None:
+        """Append ``data`` to the object."""
+
+    @property
+    def bytes_written(self) -> int:
+        """Bytes appended so far."""
+
+    @property
+    def result(self) -> StorageObject | None:
+        """The stored object, once the block has exited cleanly."""
+
+
+class StorageReader(Protocol):
+    """A byte range of a stored object, from ``Storage.open_read``.
+
+    Iterate it for chunks of at most the ``chunk_size`` it was opened with.
+    """
+
+    key: str
+    #: Size of the whole object, not of the range being read.
+    size_bytes: int
+    #: First byte of the range.
+    start: int
+    #: One past the last byte of the range.
+    end: int
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield the range in order, one chunk at a time."""
+
+    async def read(self, size: int = -1) -> bytes:
+        """Return up to ``size`` bytes of what is left of the range (-1: all)."""
 
 
 @runtime_checkable
@@ -27,6 +81,11 @@ class Storage(Protocol):
     a signed-URL accessor for callers that want to hand a download link
     to a third party (Twilio, a browser, etc.) without proxying bytes.
 
+    ``write_bytes``/``read_bytes`` hold the whole object in memory. Voice
+    recordings, video and large document uploads go through
+    ``open_write``/``open_read`` instead, which move one chunk at a time
+    and can read any byte range.
+
     Backends:
 
     * ``LocalDiskStorage`` -- ships in Phase A; stores objects on the
@@ -52,6 +111,40 @@ class Storage(Protocol):
         backend cannot serve the read.
         """
 
+    def open_write(
+        self,
+        key: str,
+        *,
+        content_type: str = "application/octet-stream",
+        sha256: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncContextManager[StorageWriter]:
+        """Write the object under ``key`` in chunks, replacing it on a clean exit.
+
+        With ``sha256=True`` the digest is computed as the bytes go by and
+        reported on the resulting ``StorageObject``.
+        """
+
+    def open_read(
+        self,
+        key: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncContextManager[StorageReader]:
+        """Read bytes ``[start, end)`` of ``key`` in chunks (``end=None``: to the end).
+
+        ``end`` is clamped to the object size. Raises ``StorageError`` on
+        entry if the object does not exist or ``start`` is past its end.
+        """
+
+    async def stat(self, key: str) -> StorageObject:
+        """Describe the object under ``key`` without reading it.
+
+        Raises ``StorageError`` if the object does not exist.
+        """
+
     async def exists(self, key: str) -> bool:
         """Return whether an object is stored under ``key``."""
 
@@ -72,4 +165,31 @@ class Storage(Protocol):
         """
 
 
-__all__ = ["Storage", "StorageError", "StorageObject"]
+async def write_stream(
+    storage: Storage,
+    key: str,
+    chunks: AsyncIterable[bytes],
+    *,
+    content_type: str = "application/octet-stream",
+    sha256: bool = False,
+) -> StorageObject:
+    """Store everything ``chunks`` yields under ``key`` without buffering it."""
+    async with storage.open_write(
+        key,
+        content_type=content_type,
+        sha256=sha256,
+    ) as writer:
+        async for chunk in chunks:
+            await writer.write(chunk)
+    return writer.result
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "Storage",
+    "StorageError",
+    "StorageObject",
+    "StorageReader",
+    "StorageWriter",
+    "write_stream",
+]
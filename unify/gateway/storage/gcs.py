@@ -8,7 +8,15 @@ will move when the Phase B channel migration brings those call sites into
 
 from __future__ import annotations
 
-from unify.gateway.storage.base import Storage, StorageObject
+from typing import AsyncContextManager
+
+from unify.gateway.storage.base import (
+    DEFAULT_CHUNK_SIZE,
+    Storage,
+    StorageObject,
+    StorageReader,
+    StorageWriter,
+)
 
 
 class GcsStorage(Storage):
@@ -37,6 +45,35 @@ class GcsStorage(Storage):
             "GcsStorage is a Phase B deliverable. See unify/gateway/PHASES.md.",
         )
 
+    def open_write(
+        self,
+        key: str,
+        *,
+        content_type: str = "application/octet-stream",
+        sha256: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncContextManager[StorageWriter]:
+        raise NotImplementedError(
+            "GcsStorage is a Phase B deliverable. See unify/gateway/PHASES.md.",
+        )
+
+    def open_read(
+        self,
+        key: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncContextManager[StorageReader]:
+        raise NotImplementedError(
+            "GcsStorage is a Phase B deliverable. See unify/gateway/PHASES.md.",
+        )
+
+    async def stat(self, key: str) -> StorageObject:
+        raise NotImplementedError(
+            "GcsStorage is a Phase B deliverable. See unify/gateway/PHASES.md.",
+        )
+
     async def exists(self, key: str) -> bool:
         raise NotImplementedError(
             "GcsStorage is a Phase B deliverable. See unify/gateway/PHASES.md.",
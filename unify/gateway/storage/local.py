@@ -7,17 +7,50 @@ to a workspace-relative directory (``UNIFY_GATEWAY_STORAGE_DIR``, default
 When a ``public_base_url`` is configured, ``signed_url`` returns
 ``{public_base_url}/{key}`` — the HTTP endpoint where another service
 (Orchestra's local-object route, in the self-host compose stack) serves
-the same directory. Without one, ``signed_url`` falls back to a
-``file://`` URI usable only inside the gateway process.
+the same directory. Otherwise, with a ``serve_base_url``, it returns
+``{serve_base_url}/{key}?expires=...&signature=...``, an HMAC-signed URL
+the gateway's own storage route (``unify.gateway.adapters.storage``)
+serves, byte ranges included. Without either, ``signed_url`` falls back
+to a ``file://`` URI usable only inside the gateway process.
+
+Streams write to a hidden temporary file next to the target and rename it
+into place on commit, so a reader never sees a partial object and an
+abandoned write leaves nothing under its key.
+
+A content type the key does not imply (a WhatsApp media key has no
+extension, for instance) is kept in a hidden ``.<name>.content-type`` file
+beside the object, which is where ``stat`` -- and so the storage route --
+reads it back from.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import hmac
+import mimetypes
 import os
+import secrets
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import IO, AsyncIterator
+from urllib.parse import quote, urlencode
+
+from unify.gateway.storage.base import (
+    DEFAULT_CHUNK_SIZE,
+    Storage,
+    StorageError,
+    StorageObject,
+)
 
-from unify.gateway.storage.base import Storage, StorageError, StorageObject
+#: Suffix of in-progress stream writes; such files are never listed as keys.
+_PARTIAL_SUFFIX = ".partial"
+#: Suffix of the hidden file holding an object's stored content type.
+_CONTENT_TYPE_SUFFIX = ".content-type"
+_DEFAULT_CONTENT_TYPE = "application/octet-stream"
 
 
 def _default_base_dir() -> Path:
@@ -25,6 +58,189 @@ def _default_base_dir() -> Path:
     return Path(raw) if raw else Path.cwd() / ".unity-gateway-storage"
 
 
+def _guess_content_type(key: str) -> str:
+    return mimetypes.guess_type(key)[0] or _DEFAULT_CONTENT_TYPE
+
+
+def _is_partial(path: Path) -> bool:
+    return path.name.startswith(".") and path.name.endswith(_PARTIAL_SUFFIX)
+
+
+def _is_content_type_file(path: Path) -> bool:
+    return path.name.startswith(".") and path.name.endswith(_CONTENT_TYPE_SUFFIX)
+
+
+def _content_type_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}{_CONTENT_TYPE_SUFFIX}")
+
+
+def _record_content_type(path: Path, key: str, content_type: str) -> None:
+    """Keep ``content_type`` beside ``path`` unless the key already implies it.
+
+    The default type says nothing about the bytes, so it is not kept either,
+    and ``stat`` goes on guessing from the key. Called before the object
+    itself is put in place.
+    """
+    sidecar = _content_type_path(path)
+    if content_type in (_DEFAULT_CONTENT_TYPE, _guess_content_type(key)):
+        sidecar.unlink(missing_ok=True)
+        return
+    fd, tmp = tempfile.mkstemp(
+        dir=path.parent,
+        prefix=f"{sidecar.name}.",
+        suffix=_PARTIAL_SUFFIX,
+    )
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        fh.write(content_type)
+    os.replace(tmp, sidecar)
+
+
+def _stored_content_type(path: Path, key: str) -> str:
+    try:
+        recorded = _content_type_path(path).read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        recorded = ""
+    return recorded or _guess_content_type(key)
+
+
+class _LocalWriter:
+    """``StorageWriter`` over a temporary file renamed into place on commit.
+
+    Writes are buffered up to ``chunk_size`` and handed to a worker thread
+    one chunk at a time, hashing on the same thread. The lock keeps a chunk
+    still being written by a cancelled call from racing the cleanup.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        path: Path,
+        *,
+        content_type: str,
+        sha256: bool,
+        chunk_size: int,
+    ) -> None:
+        self.key = key
+        self._path = path
+        self._content_type = content_type
+        self._hash = hashlib.sha256() if sha256 else None
+        self._chunk_size = max(1, chunk_size)
+        self._buffer = bytearray()
+        self._written = 0
+        self._file: IO[bytes] | None = None
+        self._tmp: Path | None = None
+        self._io_lock = threading.Lock()
+        self.result: StorageObject | None = None
+
+    @property
+    def bytes_written(self) -> int:
+        return self._written
+
+    async def _open(self) -> None:
+        def _do_open() -> None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self._path.parent,
+                prefix=f".{self._path.name}.",
+                suffix=_PARTIAL_SUFFIX,
+            )
+            self._file = os.fdopen(fd, "wb")
+            self._tmp = Path(tmp)
+
+        await asyncio.to_thread(_do_open)
+
+    async def write(self, data: bytes) -> None:
+        if self.result is not None or self._file is None:
+            raise StorageError(f"write to a closed stream: {self.key!r}")
+        if not data:
+            return
+        self._buffer += data
+        self._written += len(data)
+        if len(self._buffer) >= self._chunk_size:
+            await self._flush()
+
+    async def _flush(self) -> None:
+        if not self._buffer:
+            return
+        chunk, self._buffer = self._buffer, bytearray()
+
+        def _do_write() -> None:
+            with self._io_lock:
+                if self._hash is not None:
+                    self._hash.update(chunk)
+                self._file.write(chunk)
+
+        await asyncio.to_thread(_do_write)
+
+    async def _commit(self) -> StorageObject:
+        await self._flush()
+
+        def _do_commit() -> None:
+            with self._io_lock:
+                self._file.close()
+                _record_content_type(self._path, self.key, self._content_type)
+                os.replace(self._tmp, self._path)
+
+        await asyncio.to_thread(_do_commit)
+        self.result = StorageObject(
+            key=self.key,
+            size_bytes=self._written,
+            content_type=self._content_type,
+            sha256=self._hash.hexdigest() if self._hash is not None else None,
+        )
+        return self.result
+
+    async def _abort(self) -> None:
+        self._buffer = bytearray()
+        file, tmp = self._file, self._tmp
+        self._file = None
+
+        def _do_abort() -> None:
+            with self._io_lock:
+                if file is not None:
+                    file.close()
+                if tmp is not None:
+                    tmp.unlink(missing_ok=True)
+
+        await asyncio.to_thread(_do_abort)
+
+
+class _LocalReader:
+    """``StorageReader`` over an open file positioned at the range start."""
+
+    def __init__(
+        self,
+        key: str,
+        file: IO[bytes],
+        *,
+        size_bytes: int,
+        start: int,
+        end: int,
+        chunk_size: int,
+    ) -> None:
+        self.key = key
+        self.size_bytes = size_bytes
+        self.start = start
+        self.end = end
+        self._file = file
+        self._pos = start
+        self._chunk_size = max(1, chunk_size)
+
+    async def read(self, size: int = -1) -> bytes:
+        remaining = self.end - self._pos
+        n = remaining if size < 0 else min(size, remaining)
+        if n <= 0:
+            return b""
+        data = await asyncio.to_thread(self._file.read, n)
+        # A file truncated under us ends the range early rather than hanging.
+        self._pos = self.end if not data else self._pos + len(data)
+        return data
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while chunk := await self.read(self._chunk_size):
+            yield chunk
+
+
 class LocalDiskStorage(Storage):
     """Filesystem-backed implementation of ``Storage``.
 
@@ -37,10 +253,18 @@ class LocalDiskStorage(Storage):
         self,
         base_dir: Path | str | None = None,
         public_base_url: str | None = None,
+        *,
+        serve_base_url: str | None = None,
+        signing_key: bytes | str | None = None,
     ) -> None:
         self._base_dir = Path(base_dir) if base_dir is not None else _default_base_dir()
         self._base_dir.mkdir(parents=True, exist_ok=True)
         self._public_base_url = (public_base_url or "").rstrip("/") or None
+        self._serve_base_url = (serve_base_url or "").rstrip("/") or None
+        if isinstance(signing_key, str):
+            signing_key = signing_key.encode("utf-8")
+        # A per-process key only costs outstanding URLs on restart.
+        self._signing_key = signing_key or secrets.token_bytes(32)
 
     @property
     def base_dir(self) -> Path:
@@ -69,6 +293,7 @@ class LocalDiskStorage(Storage):
 
         def _do_write() -> int:
             path.parent.mkdir(parents=True, exist_ok=True)
+            _record_content_type(path, key, content_type)
             path.write_bytes(data)
             return len(data)
 
@@ -81,6 +306,81 @@ class LocalDiskStorage(Storage):
             raise StorageError(f"object not found: {key!r}")
         return await asyncio.to_thread(path.read_bytes)
 
+    @asynccontextmanager
+    async def open_write(
+        self,
+        key: str,
+        *,
+        content_type: str = "application/octet-stream",
+        sha256: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[_LocalWriter]:
+        writer = _LocalWriter(
+            key,
+            self._resolve(key),
+            content_type=content_type,
+            sha256=sha256,
+            chunk_size=chunk_size,
+        )
+        await writer._open()
+        try:
+            yield writer
+            await writer._commit()
+        except BaseException:
+            await writer._abort()
+            raise
+
+    @asynccontextmanager
+    async def open_read(
+        self,
+        key: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[_LocalReader]:
+        path = self._resolve(key)
+
+        def _do_open() -> tuple[IO[bytes], int]:
+            try:
+                file = path.open("rb")
+            except (FileNotFoundError, IsADirectoryError) as exc:
+                raise StorageError(f"object not found: {key!r}") from exc
+            size = os.fstat(file.fileno()).st_size
+            if start < 0 or start > size or (end is not None and end < start):
+                file.close()
+                raise StorageError(
+                    f"range [{start}, {end}) outside {key!r} ({size} bytes)",
+                )
+            file.seek(start)
+            return file, size
+
+        file, size = await asyncio.to_thread(_do_open)
+        try:
+            yield _LocalReader(
+                key,
+                file,
+                size_bytes=size,
+                start=start,
+                end=size if end is None else min(end, size),
+                chunk_size=chunk_size,
+            )
+        finally:
+            await asyncio.to_thread(file.close)
+
+    async def stat(self, key: str) -> StorageObject:
+        path = self._resolve(key)
+
+        def _do_stat() -> tuple[int, str]:
+            size = path.stat().st_size
+            return size, _stored_content_type(path, key)
+
+        try:
+            size, content_type = await asyncio.to_thread(_do_stat)
+        except FileNotFoundError as exc:
+            raise StorageError(f"object not found: {key!r}") from exc
+        return StorageObject(key=key, size_bytes=size, content_type=content_type)
+
     async def exists(self, key: str) -> bool:
         path = self._resolve(key)
         return await asyncio.to_thread(path.is_file)
@@ -94,7 +394,7 @@ class LocalDiskStorage(Storage):
             keys = [
                 str(p.relative_to(base)).replace(os.sep, "/")
                 for p in base.rglob("*")
-                if p.is_file()
+                if p.is_file() and not _is_partial(p) and not _is_content_type_file(p)
             ]
             if prefix:
                 keys = [k for k in keys if k.startswith(prefix)]
@@ -113,7 +413,23 @@ class LocalDiskStorage(Storage):
             raise StorageError(f"object not found: {key!r}")
         if self._public_base_url:
             return f"{self._public_base_url}/{key}"
+        if self._serve_base_url:
+            expires = int(time.time()) + expires_seconds
+            query = urlencode(
+                {"expires": expires, "signature": self._signature(key, expires)},
+            )
+            return f"{self._serve_base_url}/{quote(key)}?{query}"
         return path.resolve().as_uri()
 
+    def _signature(self, key: str, expires: int) -> str:
+        message = f"{key}\n{expires}".encode("utf-8")
+        return hmac.new(self._signing_key, message, hashlib.sha256).hexdigest()
+
+    def verify_signed_url(self, key: str, expires: int, signature: str) -> bool:
+        """Whether ``signature`` is this store's, for ``key``, and unexpired."""
+        if expires < time.time():
+            return False
+        return hmac.compare_digest(signature, self._signature(key, expires))
+
 
 __all__ = ["LocalDiskStorage"]
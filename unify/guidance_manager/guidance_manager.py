@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import FrozenSet, List, Dict, Optional, Any, Tuple
+from typing import FrozenSet, List, Dict, Optional, Any, Sequence, Tuple
 import base64
 import functools
 import inspect
@@ -1180,6 +1180,16 @@ class GuidanceManager(BaseGuidanceManager):
             overwrite=True,
         )
 
+    def _insert_custom_guidance_rows(self, rows: List[Dict[str, Any]]) -> None:
+        unity_create_logs(
+            context=self._ctx,
+            entries=[
+                {k: v for k, v in data.items() if k != "guidance_id"} for data in rows
+            ],
+            stamp_authoring=True,
+            recompute_derived=True,
+        )
+
     def _insert_custom_guidance(self, data: Dict[str, Any]) -> int:
         insert_data = {k: v for k, v in data.items() if k != "guidance_id"}
         result = unity_create_logs(
@@ -1329,7 +1339,7 @@ class _GuidanceSyncAdapter(CustomSyncAdapter):
             filter=managed_rows_filter(self.managed_by),
             exclude_fields=list_private_fields(self._manager._ctx),
         )
-        return [dict(lg.entries or {}) for lg in logs]
+        return [{"_log_id": lg.id, **dict(lg.entries or {})} for lg in logs]
 
     def transform(self, key: str, fields: Dict[str, Any]) -> Dict[str, Any]:
         function_names = fields.pop("function_names", None) or []
@@ -1365,6 +1375,15 @@ class _GuidanceSyncAdapter(CustomSyncAdapter):
     def delete(self, key: str, live_row: Dict[str, Any]) -> None:
         self._manager._delete_custom_guidance_by_key(key, managed_by=self.managed_by)
 
+    def insert_many(self, items: Sequence[Tuple[str, Dict[str, Any]]]) -> None:
+        self._manager._insert_custom_guidance_rows([fields for _, fields in items])
+
+    def delete_many(self, items: Sequence[Tuple[str, Dict[str, Any]]]) -> None:
+        unisdk.delete_logs(
+            context=self._manager._ctx,
+            logs=[live_row["_log_id"] for _, live_row in items],
+        )
+
     def find_adoptable(
         self,
         key: str,
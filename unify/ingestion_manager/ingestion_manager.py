@@ -34,15 +34,19 @@ import re
 import secrets
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from unify.common.context_registry import ContextRegistry, TableContext
 from unify.common.model_to_fields import model_to_fields
 from unify.common.pipeline import (
     CheckpointedIngest,
+    ContextRowsHandle,
     DuplicateLiveAttempt,
     IncompleteIngest,
     InlineRowsHandle,
@@ -52,7 +56,12 @@ from unify.common.pipeline import (
 from unify.common.pipeline.work_queue import PipelineCancelled, RetryWorkItem
 from unify.data_manager.types.ingest import PostIngestConfig
 from unify.ingestion_manager.base import BaseIngestionManager
-from unify.ingestion_manager.policy import choose_tier, next_step, stages_from_events
+from unify.ingestion_manager.policy import (
+    choose_tier,
+    close_stages,
+    fold_stage_events,
+    next_step,
+)
 from unify.ingestion_manager.settings import IngestionSettings
 from unify.ingestion_manager.types.request import (
     EmbedSpec,
@@ -71,6 +80,7 @@ from unify.ingestion_manager.types.run import (
     RetryScope,
     RunState,
     RunStatus,
+    StageProgress,
 )
 
 logger = logging.getLogger(__name__)
@@ -78,6 +88,17 @@ logger = logging.getLogger(__name__)
 RUNS_TABLE = "Ingestion/Runs"
 EVENTS_TABLE = "Ingestion/Events"
 
+#: Runs whose event history is kept folded in memory between status reads.
+#: Past this the least recently read is dropped and, if read again, refolded
+#: from its log -- correct either way, only slower.
+_CURSOR_CACHE_RUNS = 256
+#: Longest a ``wait`` on a run executing here sleeps without re-reading it. The
+#: notification is what ends the wait; this only bounds how long a write made
+#: by some other process can go unnoticed.
+_LOCAL_WAIT_CEILING_S = 5.0
+#: How often a parse stage waiting on its pool looks at the cancel flag.
+_CANCEL_POLL_S = 1.0
+
 
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -119,6 +140,37 @@ def _handle_can_yield(handle: Any) -> bool:
     return True
 
 
+@dataclass
+class _EventCursor:
+    """What this process has already read of one run's event log.
+
+    ``after`` is the highest ``event_id`` seen per events context. Event ids are
+    auto-counted, so everything past the mark is new and a read asks only for
+    that -- rather than paging the whole history on every poll of a run that
+    records a progress event per committed chunk.
+    """
+
+    after: Dict[str, int] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    stages: Dict[str, StageProgress] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def absorb(self, fresh: List[Dict[str, Any]]) -> None:
+        """Fold newly read events into the history and the stage state."""
+        if not fresh:
+            return
+        fresh.sort(key=lambda event: event.get("at") or "")
+        last_at = (self.events[-1].get("at") or "") if self.events else ""
+        self.events.extend(fresh)
+        if (fresh[0].get("at") or "") >= last_at:
+            fold_stage_events(self.stages, fresh)
+            return
+        # A worker's clock put an event before one already folded. Rare, and
+        # the history is in memory, so refolding it in order is cheap.
+        self.events.sort(key=lambda event: event.get("at") or "")
+        self.stages = fold_stage_events({}, self.events)
+
+
 class IngestionManager(BaseIngestionManager):
     """Ingestion over Unify contexts, the shared ingest core and the fleet."""
 
@@ -175,6 +227,14 @@ class IngestionManager(BaseIngestionManager):
         # use rather than at construction so a manager can be built in a process
         # that never ingests without paying for a probe.
         self._fleet_probe: Optional[bool] = None
+        # Per-run read position in the events log, so a status read folds only
+        # what was recorded since the last one.
+        self._cursors: OrderedDict[str, _EventCursor] = OrderedDict()
+        # Bumped per run key by every event or row write made in this process,
+        # and signalled on, so `wait` on a run executing here wakes when the
+        # run changes rather than on a timer.
+        self._changed = threading.Condition(self._lock)
+        self._generation: Dict[str, int] = {}
         logger.debug("IngestionManager initialized")
 
     # ── plumbing ──────────────────────────────────────────────────────────
@@ -267,6 +327,7 @@ class IngestionManager(BaseIngestionManager):
             self._write_table(EVENTS_TABLE, destination),
             [row.model_dump(exclude_none=True)],
         )
+        self._notify(run_key)
 
     def _update_run(
         self,
@@ -275,6 +336,28 @@ class IngestionManager(BaseIngestionManager):
         updates: Dict[str, Any],
     ) -> None:
         self._get_dm().update_rows(context, updates, filter=f"run_key == '{run_key}'")
+        self._notify(run_key)
+
+    def _notify(self, run_key: str) -> None:
+        """Wake any `wait` on *run_key*: something about it was just written."""
+        with self._changed:
+            self._generation[run_key] = self._generation.get(run_key, 0) + 1
+            self._changed.notify_all()
+
+    def _generation_of(self, run_key: str) -> int:
+        with self._changed:
+            return self._generation.get(run_key, 0)
+
+    def _runs_here(self, run_key: str) -> bool:
+        """Whether this process is the one writing *run_key*'s progress.
+
+        True for an inline run this process is executing and for a dispatch it
+        is still staging. Everything else -- a run on the fleet, or one left by
+        another process -- changes without telling this one, so only these
+        can be waited on by notification.
+        """
+        with self._lock:
+            return run_key in self._inline_control or run_key in self._dispatching
 
     # ── submitting ────────────────────────────────────────────────────────
 
@@ -873,9 +956,13 @@ class IngestionManager(BaseIngestionManager):
         """Merge the tables found in *paths* into one queryable context.
 
         Parsing is per file and never raises -- a per-file failure is recorded
-        and the rest proceed. The extracted rows then flow through the shared
-        engine, one work unit per extracted table, so the write half is
-        checkpointed and verified exactly like any other ingestion.
+        and the rest proceed. Files parse concurrently in child processes (see
+        :meth:`_parse_files`), and each file's tables go to the shared engine
+        as soon as that file is parsed, so a folder of spreadsheets writes the
+        first while the rest still parse, and only the files in flight are held
+        in memory. The write half is checkpointed and verified exactly like any
+        other ingestion; checkpoint ids are stable per source table, so the
+        order files finish in does not matter to a resume.
 
         Transport handles come from ``build_table_handles``, the same helper the
         parse worker lowers through, rather than being built from
@@ -891,72 +978,90 @@ class IngestionManager(BaseIngestionManager):
         checkpoint against.
         """
         from unify.common.pipeline.transport import build_table_handles
-        from unify.file_manager.file_parsers.file_parser import FileParser
-        from unify.file_manager.file_parsers.types.contracts import FileParseRequest
 
         destination = request.destination
-        parser = FileParser()
-        work: List[TableWork] = []
         parsed = 0
         tables_seen = 0
+        written = 0
+        rows = 0
+        contexts: List[str] = []
         failures: List[str] = []
         unusable: List[str] = []
 
-        for path in paths:
-            if control["cancel"]:
-                raise PipelineCancelled(f"Run {run_key} cancelled during parse")
-            result = parser.parse(
-                FileParseRequest(logical_path=path, source_local_path=path),
-            )
-            if result.status != "success":
-                failures.append(f"{path}: {result.error or 'parse failed'}")
+        with contextlib.closing(
+            self._parse_files(run_key, paths, control=control),
+        ) as results:
+            for path, result in results:
+                if result.status != "success":
+                    failures.append(f"{path}: {result.error or 'parse failed'}")
+                    self._record_event(
+                        run_key,
+                        destination=destination,
+                        stage="parse",
+                        level="error",
+                        message=f"{path}: {result.error or 'parse failed'}",
+                    )
+                    continue
+                parsed += 1
                 self._record_event(
                     run_key,
                     destination=destination,
                     stage="parse",
-                    level="error",
-                    message=f"{path}: {result.error or 'parse failed'}",
+                    state="running",
+                    done=parsed,
+                    total=len(paths),
+                    message=f"Parsed {path} ({len(result.tables)} table(s)).",
                 )
-                continue
-            parsed += 1
-            self._record_event(
-                run_key,
-                destination=destination,
-                stage="parse",
-                state="running",
-                done=parsed,
-                total=len(paths),
-                message=f"Parsed {path} ({len(result.tables)} table(s)).",
-            )
-            handles = build_table_handles(result, job_id=run_key)
-            for table in result.tables:
-                tables_seen += 1
-                handle = handles.get(table.table_id)
-                declared = table.num_rows
-                if declared is None:
-                    declared = getattr(handle, "row_count", None)
-                if not declared:
-                    # An empty sheet is not a failure; there is simply nothing
-                    # to write for it.
+                handles = build_table_handles(result, job_id=run_key)
+                work: List[TableWork] = []
+                unreadable: List[str] = []
+                for table in result.tables:
+                    tables_seen += 1
+                    handle = handles.get(table.table_id)
+                    declared = table.num_rows
+                    if declared is None:
+                        declared = getattr(handle, "row_count", None)
+                    if not declared:
+                        # An empty sheet is not a failure; there is simply
+                        # nothing to write for it.
+                        continue
+                    if handle is None or not _handle_can_yield(handle):
+                        # The parser counted rows this transport cannot reach,
+                        # so writing what is reachable would be a silent
+                        # under-ingest. The dispatched tier refuses the same
+                        # case for the same reason.
+                        unreadable.append(f"{path}:{table.label or table.table_id}")
+                        continue
+                    work.append(
+                        self._table_work(
+                            # Stable per source table, so a resume of this run
+                            # finds the same checkpoint whatever order parsing
+                            # returned.
+                            table_id=(
+                                f"run-{run_key}-{_safe_id(path)}-{table.table_id}"
+                            ),
+                            label=table.label or path,
+                            handle=handle,
+                            declared=int(declared),
+                            request=request,
+                        ),
+                    )
+                if unreadable:
+                    # None of this file is written: storing its readable
+                    # tables would under-ingest it without reporting it.
+                    unusable.extend(unreadable)
                     continue
-                if handle is None or not _handle_can_yield(handle):
-                    # The parser counted rows this transport cannot reach, so
-                    # writing what is reachable would be a silent under-ingest.
-                    # The dispatched tier refuses the same case for the same
-                    # reason.
-                    unusable.append(f"{path}:{table.label or table.table_id}")
+                if not work:
                     continue
-                work.append(
-                    self._table_work(
-                        # Stable per source table, so a resume of this run finds
-                        # the same checkpoint whatever order parsing returned.
-                        table_id=f"run-{run_key}-{_safe_id(path)}-{table.table_id}",
-                        label=table.label or path,
-                        handle=handle,
-                        declared=int(declared),
-                        request=request,
-                    ),
+                outcome = self._run_engine(
+                    run_key,
+                    work,
+                    request=request,
+                    control=control,
                 )
+                written += len(work)
+                rows += outcome.rows_committed
+                contexts.extend(outcome.contexts)
 
         if not parsed:
             raise RuntimeError(
@@ -965,66 +1070,148 @@ class IngestionManager(BaseIngestionManager):
         if unusable:
             raise RuntimeError(
                 "Parsed tables whose rows this ingestion cannot read: "
-                f"{'; '.join(unusable)}. Nothing was stored, because storing "
-                "the readable part would under-ingest without reporting it.",
+                f"{'; '.join(unusable)}. Nothing from those files was stored, "
+                "because storing the readable part would under-ingest without "
+                "reporting it.",
             )
         if not tables_seen:
             raise RuntimeError(
                 "Parsing found no tables to store. A table target needs tabular "
                 "content; use CollectionTarget to keep these documents whole.",
             )
-        if not work:
+        if not written:
             raise RuntimeError(
                 f"Parsed {tables_seen} table(s) and every one was empty; there "
                 "were no rows to store.",
             )
+        return rows, list(dict.fromkeys(contexts)), parsed
+
+    def _parse_files(
+        self,
+        run_key: str,
+        paths: List[str],
+        *,
+        control: Dict[str, bool],
+    ) -> Iterator[tuple[str, Any]]:
+        """Parse *paths* on a bounded pool, yielding each result as it finishes.
+
+        Parses run in child processes through the parser's isolated path, so
+        a file that exhausts memory takes down its own process rather than this
+        one. At most ``INLINE_PARSE_WORKERS`` files are in flight, and the next
+        is only started once the caller has taken a result, so a slow writer
+        holds parsing back instead of letting finished results pile up.
+
+        Heavy files parse one at a time through a shared lane, and a light file
+        whose child died is retried once through the same lane -- the batch
+        scheduler's rules, for the same reason: the crash may have been the
+        concurrency rather than the file.
+        """
+        from unify.file_manager.file_parsers.file_parser import FileParser
+        from unify.file_manager.file_parsers.types.contracts import FileParseRequest
+        from unify.file_manager.file_parsers.utils.memory_scheduler import (
+            classify_file,
+        )
+        from unify.file_manager.types.config import ParseConfig
 
-        outcome = self._run_engine(run_key, work, request=request, control=control)
-        return outcome.rows_committed, outcome.contexts, parsed
+        parser = FileParser()
+        config = ParseConfig(
+            subprocess_isolation=self._settings.INLINE_PARSE_ISOLATED,
+        )
+        heavy_lane = threading.Lock()
+
+        def parse(path: str) -> Any:
+            request = FileParseRequest(logical_path=path, source_local_path=path)
+            if classify_file(request) == "heavy":
+                with heavy_lane:
+                    return parser.parse_isolated(request, parse_config=config)
+            result = parser.parse_isolated(request, parse_config=config)
+            if parser.is_isolation_crash(result):
+                with heavy_lane:
+                    return parser.parse_isolated(request, parse_config=config)
+            return result
+
+        workers = max(1, min(self._settings.INLINE_PARSE_WORKERS, len(paths)))
+        queued = iter(paths)
+        in_flight: Dict[Any, str] = {}
+        pool = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="ingestion-parse",
+        )
+        try:
+            while True:
+                while len(in_flight) < workers:
+                    path = next(queued, None)
+                    if path is None:
+                        break
+                    in_flight[pool.submit(parse, path)] = path
+                if not in_flight:
+                    return
+                if control["cancel"]:
+                    raise PipelineCancelled(f"Run {run_key} cancelled during parse")
+                finished, _ = wait_for_futures(
+                    in_flight,
+                    timeout=_CANCEL_POLL_S,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in finished:
+                    yield in_flight.pop(future), future.result()
+        finally:
+            # Started parses run out (their children are bounded by the parse
+            # timeout); queued ones never start.
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def _handle_for_table(self, source: Any, *, declared: int) -> Any:
-        """Read a stored table into a handle the engine can stream from.
-
-        Paged by offset because the backend serves at most a page per read, so a
-        single large read would silently return a prefix.
-
-        The rows do end up in memory, unbounded by anything here: every table
-        source runs in process today, because the fleet's unit of work is a
-        staged file and no rows job type exists yet. ``MAX_INLINE_ROWS`` is the
-        boundary such a job type would restore; until then a very large table
-        costs this process memory in exchange for actually executing.
-
-        One consequence worth knowing: a resumed run re-reads the source rather
-        than a frozen copy of it, so if the source has been written to in between,
-        the checkpoint's offset no longer points at the same rows. Freezing it
-        would need the rows staged through the artifact store, which the port's
-        materialise call is not shaped for today.
+        """A handle the engine streams a stored table from, a page at a time.
+
+        Nothing is read here. The engine pulls pages as it writes chunks, each
+        keyed past the last row it saw rather than offset into the table, so a
+        copy of millions of rows holds one page in memory and every page costs
+        the same to read. A resume seeks once to the key of the last committed
+        row and carries on from there.
+
+        The key comes from the source context's schema: its unique key when
+        it has exactly one, else its one auto-counted column. A context keyed
+        on several columns, or on none, has no single ordering to page along
+        and falls back to offset paging; still lazy, only slower the deeper
+        it goes. Pages are read through the DataManager the engine writes
+        with, which is this manager's.
+
+        A resumed run re-reads the source rather than a frozen copy of it, so
+        rows inserted before the resume point in between shift what the
+        checkpoint's count points at. Freezing it would need the rows staged
+        through the artifact store, which the port's materialise call is not
+        shaped for today.
         """
-        dm = self._get_dm()
-        page = self._settings.EVENTS_PAGE_SIZE
-        rows: List[Dict[str, Any]] = []
-        offset = 0
-        while len(rows) < declared:
-            batch = dm.filter(
-                source.context,
-                filter=source.filter,
-                columns=source.columns,
-                limit=min(page, declared - len(rows)),
-                offset=offset,
-            )
-            if not batch:
-                break
-            rows.extend(batch)
-            offset += len(batch)
-            if len(batch) < page:
-                break
-
-        return InlineRowsHandle(
-            rows=rows,
-            columns=list(rows[0].keys()) if rows else list(source.columns or []),
-            row_count=len(rows),
+        return ContextRowsHandle(
+            context=source.context,
+            filter=source.filter,
+            columns=list(source.columns or []),
+            key_column=self._source_key(source.context),
+            page_size=self._settings.EVENTS_PAGE_SIZE,
+            row_count=declared,
         )
 
+    def _source_key(self, context: str) -> Optional[str]:
+        """The single unique column a stored table can be paged along, if any."""
+        try:
+            info = self._get_dm().get_table(context) or {}
+        except Exception:  # noqa: BLE001 -- a missing key only slows paging
+            logger.debug("Could not read the key of %s", context, exc_info=True)
+            return None
+
+        def columns(value: Any) -> List[str]:
+            if isinstance(value, str):
+                return [value]
+            if isinstance(value, (dict, list, tuple)):
+                return [str(name) for name in value]
+            return []
+
+        keys = columns(info.get("unique_keys"))
+        if not keys:
+            # Without declared keys, an auto-counted column is still unique.
+            keys = columns(info.get("auto_counting"))
+        return keys[0] if len(keys) == 1 else None
+
     def _dispatch_guarded(
         self,
         run_key: str,
@@ -1218,7 +1405,7 @@ class IngestionManager(BaseIngestionManager):
             raise ValueError(f"No ingestion run {run_id!r}.")
 
         row = self._fold_fleet_status(row, runs_context)
-        events = self._events_for(row["run_key"])
+        cursor = self._read_events(row["run_key"])
         contexts = row.get("contexts") or []
         parked = int(row.get("parked") or 0)
         state = row.get("state") or "queued"
@@ -1232,7 +1419,7 @@ class IngestionManager(BaseIngestionManager):
             run_id=str(row["run_key"]),
             state=state,  # type: ignore[arg-type]
             executed_as=row.get("executed_as"),
-            stages=stages_from_events(events, run_state=state),
+            stages=close_stages(cursor.stages, run_state=state),
             contexts=contexts,
             rows_written=int(row.get("rows_written") or 0),
             files_processed=int(row.get("files_processed") or 0),
@@ -1355,33 +1542,51 @@ class IngestionManager(BaseIngestionManager):
             )
         return merged
 
-    def _events_for(self, run_key: str) -> List[Dict[str, Any]]:
-        """Read a run's events, paging until they are exhausted.
+    def _read_events(self, run_key: str) -> _EventCursor:
+        """Bring a run's cursor up to date with its events log and return it.
 
-        Paged rather than fetched with a large limit because the backend serves at
-        most a page at a time: asking for more returns a prefix, which would read
-        as the whole history and quietly lose the end of a long run -- the part
-        that says how it finished.
+        Only events past the cursor are read, keyed on ``event_id`` rather than
+        paged by offset, so each read costs what was recorded since the last
+        one. Still paged within that: the backend serves at most a page at a
+        time, and asking for more returns a prefix, which would read as the
+        whole history and quietly lose the end of a long run -- the part that
+        says how it finished.
         """
+        with self._lock:
+            cursor = self._cursors.get(run_key)
+            if cursor is None:
+                cursor = self._cursors[run_key] = _EventCursor()
+            self._cursors.move_to_end(run_key)
+            while len(self._cursors) > _CURSOR_CACHE_RUNS:
+                self._cursors.popitem(last=False)
+
         dm = self._get_dm()
         page = self._settings.EVENTS_PAGE_SIZE
-        events: List[Dict[str, Any]] = []
-        for context in self._read_tables(EVENTS_TABLE):
-            offset = 0
-            while True:
-                batch = dm.filter(
-                    context,
-                    filter=f"run_key == '{run_key}'",
-                    limit=page,
-                    offset=offset,
-                )
-                if not batch:
-                    break
-                events.extend(batch)
-                offset += len(batch)
-                if len(batch) < page:
-                    break
-        return sorted(events, key=lambda event: event.get("at") or "")
+        with cursor.lock:
+            fresh: List[Dict[str, Any]] = []
+            for context in self._read_tables(EVENTS_TABLE):
+                after = cursor.after.get(context, -1)
+                while True:
+                    batch = dm.filter(
+                        context,
+                        filter=f"run_key == '{run_key}' and event_id > {after}",
+                        limit=page,
+                        order_by="event_id",
+                    )
+                    if not batch:
+                        break
+                    fresh.extend(batch)
+                    mark = max(int(event.get("event_id", after)) for event in batch)
+                    if mark <= after:
+                        # Rows without ids cannot advance the mark; reading
+                        # again would return the same page forever.
+                        break
+                    after = mark
+                    if len(batch) < page:
+                        break
+                cursor.after[context] = after
+            cursor.absorb(fresh)
+        return cursor
 
     @functools.wraps(BaseIngestionManager.get_logs, updated=())
     def get_logs(
@@ -1395,10 +1600,12 @@ class IngestionManager(BaseIngestionManager):
         row, _ = self._find_run(run_id)
         if row is None:
             raise ValueError(f"No ingestion run {run_id!r}.")
-        events = self._events_for(row["run_key"])
-        if stage:
-            events = [event for event in events if event.get("stage") == stage]
-        window = events[offset : offset + limit]
+        cursor = self._read_events(row["run_key"])
+        with cursor.lock:
+            events = cursor.events
+            if stage:
+                events = [event for event in events if event.get("stage") == stage]
+            window = events[offset : offset + limit]
         return [
             LogEntry(
                 at=event.get("at") or "",
@@ -1412,17 +1619,39 @@ class IngestionManager(BaseIngestionManager):
     @functools.wraps(BaseIngestionManager.wait, updated=())
     def wait(self, run_id: str, *, timeout_s: Optional[float] = None) -> RunStatus:
         deadline = None if timeout_s is None else time.monotonic() + timeout_s
-        # Backs off to a second so a long run does not spend the wait hammering
-        # the backend, while a short one still returns promptly.
+        # Each generation is taken before the read it guards, so a write that
+        # lands between that read and the wait below still ends the wait.
+        seen = self._generation_of(run_id)
+        status = self.get_status(run_id)
+        run_key = status.run_id
+        if run_key != run_id:
+            seen = self._generation_of(run_key)
+        # Backs off to a second so a long fleet run does not spend the wait
+        # hammering the backend, while a short one still returns promptly.
         interval = 0.2
         while True:
-            status = self.get_status(run_id)
             if status.is_terminal:
                 return status
-            if deadline is not None and time.monotonic() >= deadline:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
                 return status
-            time.sleep(interval)
-            interval = min(interval * 1.5, 1.0)
+            if self._runs_here(run_key):
+                # This process writes every change the run makes, and each
+                # write notifies -- so block until one happens rather than
+                # re-reading a run that has not moved.
+                timeout = _LOCAL_WAIT_CEILING_S
+                if remaining is not None:
+                    timeout = min(timeout, remaining)
+                with self._changed:
+                    self._changed.wait_for(
+                        lambda: self._generation.get(run_key, 0) != seen,
+                        timeout=timeout,
+                    )
+            else:
+                time.sleep(interval if remaining is None else min(interval, remaining))
+                interval = min(interval * 1.5, 1.0)
+            seen = self._generation_of(run_key)
+            status = self.get_status(run_key)
 
     @functools.wraps(BaseIngestionManager.list_runs, updated=())
     def list_runs(
@@ -8,7 +8,7 @@ flow at several call sites.
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional
 
 from unify.ingestion_manager.settings import IngestionSettings
 from unify.ingestion_manager.types.request import IngestionRequest
@@ -154,15 +154,28 @@ def stages_from_events(
     parsing had finished and it was the write that failed. A stage that reached
     its total finished; one that did not ended however the run did.
     """
-    ordered: dict[str, StageProgress] = {}
+    return close_stages(fold_stage_events({}, events), run_state=run_state)
+
+
+def fold_stage_events(
+    stages: Dict[str, StageProgress],
+    events: List[dict],
+) -> Dict[str, StageProgress]:
+    """Fold *events* into *stages* in place and return it.
+
+    The incremental half of :func:`stages_from_events`: a reader that has
+    already folded a run's history keeps the result and folds only the events
+    recorded since, so a status read costs the new events rather than the
+    whole log. Events must arrive in ``at`` order, as they do from the log.
+    """
     for event in events:
         stage = event.get("stage")
         if not stage:
             continue
-        current = ordered.get(stage)
+        current = stages.get(stage)
         if current is None:
             current = StageProgress(stage=stage, state="running")
-            ordered[stage] = current
+            stages[stage] = current
         state = event.get("state")
         if state:
             current.state = state
@@ -174,13 +187,26 @@ def stages_from_events(
             current.total = total
         if event.get("level") == "error" and event.get("message"):
             current.error = event["message"]
+    return stages
+
 
+def close_stages(
+    stages: Dict[str, StageProgress],
+    *,
+    run_state: Optional[str] = None,
+) -> List[StageProgress]:
+    """The stages as a run in *run_state* reports them, leaving *stages* intact.
+
+    Copies rather than edits, because the folded state is kept between reads
+    and a run that is retried after failing must not carry the closing of its
+    previous attempt into the next one.
+    """
+    closed = [progress.model_copy() for progress in stages.values()]
     if run_state in TERMINAL_STATES:
-        for progress in ordered.values():
+        for progress in closed:
             if progress.state not in TERMINAL_STATES:
                 reached_total = (
                     progress.total is not None and progress.done >= progress.total
                 )
                 progress.state = "succeeded" if reached_total else run_state
-
-    return list(ordered.values())
+    return closed
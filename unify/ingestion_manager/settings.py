@@ -65,6 +65,18 @@ class IngestionSettings(BaseSettings):
     # submissions contend with the assistant it shares a process with.
     INLINE_WORKERS: int = 2
 
+    # Files parsed at once when the in-process tier stores files into a table.
+    # Each parse runs in its own child process, and its tables are written as
+    # soon as it finishes, so this bounds both the memory held in parse results
+    # and how far parsing may run ahead of writing. Heavy files (document
+    # formats, very large sources) still parse one at a time regardless.
+    INLINE_PARSE_WORKERS: int = 3
+
+    # Whether those parses get a child process each. Off only where a process
+    # cannot spawn children; the parse then shares this process's memory, which
+    # is the exposure the isolation exists to remove.
+    INLINE_PARSE_ISOLATED: bool = True
+
     # Rows per page when reading runs or events back. The backend caps a single
     # read at 1000, so this is a page size and never a total: reads past it
     # continue by offset rather than truncating, which would silently under-report
@@ -0,0 +1,174 @@
+"""Process-wide cache of the integration tool catalogue the actor calls into.
+
+Each actor session builds its own ``IntegrationPrimitives``, and each used to
+find a tool the slow way: a connections listing to learn the app's backend,
+then a FunctionManager lookup and a ``Functions/Primitives`` read for the one
+row, and ``get_tool_schema`` read the builtins catalogue again for every tool
+it described. Sessions on the same assistant repeated all of it.
+
+The first lookup now reads the connections once and every provider-backed row
+for the connected apps in one paged read; the snapshot serves every session
+in the process until it expires. Concurrent misses share one load rather than
+each starting their own, and an invalidation (a provider tool sync rewriting
+rows) discards loads already in flight as well as what was kept.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+
+from unify.integrations.function_metadata import (
+    integration_backend_id,
+    integration_tool_id,
+)
+
+T = TypeVar("T")
+
+CATALOG_TTL_SECONDS = 120.0
+
+
+@dataclass
+class _Flight:
+    generation: int
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+class _SingleFlightCache(Generic[T]):
+    """Keyed values kept for a TTL; concurrent misses on a key share one load."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, tuple[float, T]] = {}
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._generation = 0
+
+    def peek(self, key: Hashable) -> Optional[T]:
+        """The kept value for ``key`` if it has not expired; never loads."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > monotonic():
+                return entry[1]
+            return None
+
+    def get(self, key: Hashable, load: Callable[[], T]) -> T:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > monotonic():
+                return entry[1]
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight(generation=self._generation)
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        try:
+            flight.value = load()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+                if flight.error is None and flight.generation == self._generation:
+                    self._entries[key] = (
+                        monotonic() + self._ttl_seconds,
+                        flight.value,
+                    )
+            flight.done.set()
+        return flight.value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """Connected apps and their materialized provider-backed tool rows."""
+
+    backends: Dict[str, Optional[str]]
+    rows_by_name: Dict[str, List[Dict[str, Any]]]
+    rows_by_tool_id: Dict[str, Dict[str, Any]]
+
+    @classmethod
+    def build(
+        cls,
+        backends: Dict[str, Optional[str]],
+        rows: List[Dict[str, Any]],
+    ) -> "CatalogSnapshot":
+        rows_by_name: Dict[str, List[Dict[str, Any]]] = {}
+        rows_by_tool_id: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            tool_id = integration_tool_id(row)
+            if not tool_id:
+                continue
+            rows_by_name.setdefault(str(row.get("name")), []).append(row)
+            rows_by_tool_id.setdefault(tool_id, row)
+        return cls(backends, rows_by_name, rows_by_tool_id)
+
+    def tool_row(self, app_slug: str, name: str) -> Optional[Dict[str, Any]]:
+        """The row for ``name`` on the app's connected backend, if one is kept."""
+        preferred = self.backends.get(app_slug)
+        for row in self.rows_by_name.get(name, ()):
+            if not preferred or integration_backend_id(row) == preferred:
+                return row
+        return None
+
+
+class CatalogUnavailable(Exception):
+    """The connections listing failed, so no snapshot could be scoped."""
+
+
+_snapshots: _SingleFlightCache[CatalogSnapshot] = _SingleFlightCache(
+    CATALOG_TTL_SECONDS,
+)
+_catalog_rows: _SingleFlightCache[Optional[Dict[str, Any]]] = _SingleFlightCache(
+    CATALOG_TTL_SECONDS,
+)
+
+
+def catalog_snapshot(
+    key: Hashable,
+    load: Optional[Callable[[], CatalogSnapshot]] = None,
+) -> Optional[CatalogSnapshot]:
+    """The snapshot for one (primitives context, owner scope), loading once.
+
+    Without ``load`` this only returns a snapshot some earlier lookup took.
+    """
+    if load is None:
+        return _snapshots.peek(key)
+    return _snapshots.get(key, load)
+
+
+def catalog_tool_row(
+    tool_id: str,
+    load: Callable[[], Optional[Dict[str, Any]]],
+) -> Optional[Dict[str, Any]]:
+    """One builtins catalogue row by tool id, loading once per TTL."""
+    return _catalog_rows.get(tool_id, load)
+
+
+def invalidate_integration_catalog() -> None:
+    """Drop every snapshot and catalogue row, and any load still in flight."""
+    _snapshots.clear()
+    _catalog_rows.clear()
+
+
+__all__ = [
+    "CATALOG_TTL_SECONDS",
+    "CatalogSnapshot",
+    "CatalogUnavailable",
+    "catalog_snapshot",
+    "catalog_tool_row",
+    "invalidate_integration_catalog",
+]
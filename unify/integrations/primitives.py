@@ -9,6 +9,12 @@ from typing import Any, Optional
 
 from unify.integrations import ops as integration_ops
 from unify.integrations.builtins_catalog import list_catalog_apps, list_catalog_tools
+from unify.integrations.catalog_cache import (
+    CatalogSnapshot,
+    CatalogUnavailable,
+    catalog_snapshot,
+    catalog_tool_row,
+)
 from unify.integrations.function_metadata import (
     integration_backend_id,
     integration_connection_id,
@@ -37,6 +43,25 @@ def _json_list(value: Any) -> list[Any]:
     return parsed if isinstance(parsed, list) else []
 
 
+def _connected_backends(connections: Any) -> dict[str, str | None]:
+    """Backend of each connected app's first live connection, by app slug."""
+    backends: dict[str, str | None] = {}
+    for connection in connections or []:
+        if not isinstance(connection, dict):
+            continue
+        if connection.get("status") != "connected":
+            continue
+        raw_app = connection.get("canonical_app_slug")
+        if not isinstance(raw_app, str):
+            continue
+        backend_id = connection.get("backend_id")
+        backends.setdefault(
+            _normalize_app_slug(raw_app),
+            str(backend_id) if backend_id else None,
+        )
+    return backends
+
+
 def _clean_payload(payload: dict[str, Any]) -> dict[str, Any]:
     return {key: value for key, value in payload.items() if value is not None}
 
@@ -595,23 +620,72 @@ class IntegrationPrimitives:
             return []
 
     def _connected_backend_for_app(self, app_slug: str) -> str | None:
-        normalized = _normalize_app_slug(app_slug)
         connections = integration_ops.list_connections(**self._effective_owner_scope())
         if isinstance(connections, dict) and connections.get("error"):
             return None
-        for connection in connections or []:
-            if not isinstance(connection, dict):
-                continue
-            if connection.get("status") != "connected":
-                continue
-            raw_app = connection.get("canonical_app_slug")
-            if not isinstance(raw_app, str):
-                continue
-            if _normalize_app_slug(raw_app) != normalized:
-                continue
-            backend_id = connection.get("backend_id")
-            return str(backend_id) if backend_id else None
-        return None
+        return _connected_backends(connections).get(_normalize_app_slug(app_slug))
+
+    def _catalog_snapshot(self, *, load: bool = True) -> CatalogSnapshot | None:
+        """The shared snapshot for this owner's primitives, or None if unreadable.
+
+        Every session on the same context and owner scope reads the same
+        snapshot; callers fall back to per-tool reads when there is none.
+        ``load=False`` only reuses a snapshot another lookup already took.
+        """
+        try:
+            import unisdk
+
+            active = unisdk.get_active_context() or {}
+            root = active.get("read") or active.get("write") or ""
+            context = f"{root}/Functions/Primitives" if root else "Functions/Primitives"
+            scope = self._effective_owner_scope()
+            key = (context, json.dumps(scope, sort_keys=True, default=str))
+            if not load:
+                return catalog_snapshot(key)
+            return catalog_snapshot(
+                key,
+                lambda: self._load_catalog_snapshot(context, scope),
+            )
+        except Exception:
+            return None
+
+    @staticmethod
+    def _load_catalog_snapshot(
+        context: str,
+        scope: dict[str, Any],
+    ) -> CatalogSnapshot:
+        """Read the connections, then every connected app's tool rows in one pass."""
+        import unisdk
+
+        connections = integration_ops.list_connections(**scope)
+        if isinstance(connections, dict) and connections.get("error"):
+            raise CatalogUnavailable(connections.get("error"))
+        backends = _connected_backends(connections)
+        rows: list[dict[str, Any]] = []
+        if backends:
+            row_filter = (
+                'metadata["source"] == "provider_backed" '
+                f'and metadata["integration"]["app_slug"] in {json.dumps(sorted(backends))}'
+            )
+            # The server caps one read at 1000 rows; large apps need paging.
+            page_size = 1000
+            offset = 0
+            while True:
+                page = unisdk.get_logs(
+                    context=context,
+                    filter=row_filter,
+                    limit=page_size,
+                    offset=offset,
+                )
+                batch = [dict(row.entries) for row in page or []]
+                rows.extend(batch)
+                if len(batch) < page_size:
+                    break
+                offset += len(batch)
+        return CatalogSnapshot.build(
+            backends,
+            [row for row in rows if is_provider_backed_function(row)],
+        )
 
     def _materialized_tool_rows_for_app(
         self,
@@ -991,8 +1065,16 @@ class IntegrationPrimitives:
             examples, required scopes, activation state, and connection status.
         """
 
-        rows = list_catalog_tools(tool_id=tool_id, limit=1)
-        if not rows:
+        # A schema lookup alone is not worth listing the connections for; it
+        # reuses the snapshot a tool lookup took, else one catalogue row.
+        snapshot = self._catalog_snapshot(load=False)
+        row = snapshot.rows_by_tool_id.get(tool_id) if snapshot else None
+        if row is None:
+            row = catalog_tool_row(
+                tool_id,
+                lambda: next(iter(list_catalog_tools(tool_id=tool_id, limit=1)), None),
+            )
+        if row is None:
             return {
                 "status": "error",
                 "error": {
@@ -1000,7 +1082,6 @@ class IntegrationPrimitives:
                     "message": f"No integration tool catalog row found for {tool_id}.",
                 },
             }
-        row = rows[0]
         metadata = integration_metadata(row)
         return {
             "status": "ok",
@@ -1399,8 +1480,18 @@ class IntegrationPrimitives:
         cached = self._tool_row_cache.get((app_slug, tool_name))
         if cached is not None:
             return cached
-        preferred_backend = self._connected_backend_for_app(app_slug)
         name = f"primitives.integrations.{app_slug}.{tool_name}"
+        snapshot = self._catalog_snapshot()
+        if snapshot is not None:
+            row = snapshot.tool_row(_normalize_app_slug(app_slug), name)
+            if row is not None:
+                self._tool_row_cache[(app_slug, tool_name)] = row
+                return row
+            # Not in the snapshot: a row materialized since it was taken is
+            # still found below, without listing the connections again.
+            preferred_backend = snapshot.backends.get(_normalize_app_slug(app_slug))
+        else:
+            preferred_backend = self._connected_backend_for_app(app_slug)
 
         def _matches_backend(row: dict[str, Any]) -> bool:
             if not preferred_backend:
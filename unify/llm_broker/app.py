@@ -14,10 +14,12 @@ Orchestra, and neither waits on the model.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import binascii
 import logging
 import time
+from collections import OrderedDict
 from typing import Any, AsyncIterator, Optional
 
 import httpx
@@ -25,6 +27,7 @@ from fastapi import APIRouter, FastAPI, Request
 from starlette.responses import JSONResponse, StreamingResponse
 
 from unify.llm_broker.settings import BrokerSettings, load_settings
+from unify.llm_broker.settlement import SettlementBatcher
 from unify.llm_broker.usage import (
     USAGE_TAIL_LIMIT,
     generation_id_from_body,
@@ -51,21 +54,39 @@ class _AuthorizationCache:
     Only successes are remembered. A refusal is always re-asked, so an
     account that has just been suspended or run dry is refused on its next
     call rather than at the end of a cache window.
+
+    Bounded: past ``max_entries`` the least recently used verdict is
+    forgotten, so a broker serving many keys holds a working set rather than
+    every key it has ever seen.
     """
 
-    def __init__(self, ttl_s: float) -> None:
+    def __init__(self, ttl_s: float, max_entries: int = 10_000) -> None:
         self._ttl_s = ttl_s
-        self._entries: dict[tuple[str, str], float] = {}
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
     def is_fresh(self, key: str, model: str) -> bool:
         if self._ttl_s <= 0:
             return False
         expires_at = self._entries.get((key, model))
-        return expires_at is not None and expires_at > time.monotonic()
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._entries[(key, model)]
+            return False
+        self._entries.move_to_end((key, model))
+        return True
 
     def remember(self, key: str, model: str) -> None:
-        if self._ttl_s > 0:
-            self._entries[(key, model)] = time.monotonic() + self._ttl_s
+        if self._ttl_s <= 0:
+            return
+        self._entries[(key, model)] = time.monotonic() + self._ttl_s
+        self._entries.move_to_end((key, model))
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
 
 
 def _caller_key(request: Request) -> Optional[str]:
@@ -140,11 +161,36 @@ class Broker:
 
     def __init__(self, settings: BrokerSettings) -> None:
         self.settings = settings
-        self._auth_cache = _AuthorizationCache(settings.auth_ttl_s)
+        self._auth_cache = _AuthorizationCache(
+            settings.auth_ttl_s,
+            settings.auth_cache_max_entries,
+        )
+        # One Orchestra check per (key, model, assistant) at a time: a burst
+        # of calls arriving together waits on the first one's verdict instead
+        # of each asking.
+        self._auth_inflight: dict[
+            tuple[str, str, Optional[int]],
+            asyncio.Task,
+        ] = {}
         self._provider = httpx.AsyncClient(timeout=_PROVIDER_TIMEOUT)
         self._control = httpx.AsyncClient(timeout=_CONTROL_TIMEOUT)
+        self._settlements: Optional[SettlementBatcher] = None
+        if settings.usage_flush_interval_s > 0:
+            self._settlements = SettlementBatcher(
+                self._deliver_settlement,
+                batch_size=settings.usage_batch_size,
+                interval_s=settings.usage_flush_interval_s,
+                spool_path=settings.usage_spool_path or None,
+            )
+
+    def start(self) -> None:
+        """Begin delivering usage reports, including any replayed from a spool."""
+        if self._settlements is not None:
+            self._settlements.start()
 
     async def aclose(self) -> None:
+        if self._settlements is not None:
+            await self._settlements.aclose()
         await self._provider.aclose()
         await self._control.aclose()
 
@@ -164,8 +210,37 @@ class Broker:
         """
         if self._auth_cache.is_fresh(caller_key, model):
             return None
+        flight_key = (caller_key, model, assistant_id)
+        flight = self._auth_inflight.get(flight_key)
+        if flight is None:
+            flight = asyncio.ensure_future(
+                self._ask_orchestra(
+                    caller_key=caller_key,
+                    model=model,
+                    assistant_id=assistant_id,
+                ),
+            )
+            self._auth_inflight[flight_key] = flight
+            flight.add_done_callback(
+                lambda _: self._auth_inflight.pop(flight_key, None),
+            )
+        # Shielded so one waiter's disconnect does not cancel the check the
+        # rest of the burst is waiting on.
+        refusal = await asyncio.shield(flight)
+        if refusal is None:
+            return None
+        return _refusal(*refusal)
+
+    async def _ask_orchestra(
+        self,
+        *,
+        caller_key: str,
+        model: str,
+        assistant_id: Optional[int],
+    ) -> Optional[tuple[int, str]]:
+        """One authorize round trip: a ``(status, detail)`` refusal, or None."""
         if not self.settings.orchestra_url:
-            return _refusal(503, "LLM broker is not configured (no Orchestra URL).")
+            return 503, "LLM broker is not configured (no Orchestra URL)."
 
         try:
             response = await self._control.post(
@@ -175,22 +250,22 @@ class Broker:
             )
         except httpx.RequestError as exc:
             LOGGER.warning("LLM broker: authorize unreachable: %s", exc)
-            return _refusal(503, "Spending authorization is unavailable; try again.")
+            return 503, "Spending authorization is unavailable; try again."
 
         if response.status_code == 401:
-            return _refusal(401, "Invalid API key.")
+            return 401, "Invalid API key."
         if response.status_code >= 400:
             LOGGER.warning(
                 "LLM broker: authorize failed (%s)",
                 response.status_code,
             )
-            return _refusal(503, "Spending authorization failed; try again.")
+            return 503, "Spending authorization failed; try again."
 
         verdict = response.json()
         if not verdict.get("allowed"):
             # 402 carries the meaning the caller needs: the account, not the
             # request, is why this cannot run.
-            return _refusal(402, verdict.get("reason") or "Spending refused.")
+            return 402, verdict.get("reason") or "Spending refused."
 
         self._auth_cache.remember(caller_key, model)
         return None
@@ -213,6 +288,10 @@ class Broker:
         an unreported call is spend with no ledger row, which is the failure
         this whole design exists to prevent, and it has to be visible in logs
         to be noticed at all.
+
+        With a flush interval configured the report is handed to the
+        settlement batcher, which spools it and delivers it off the caller's
+        path with retries; otherwise it is posted here, once.
         """
         if usage is None:
             LOGGER.warning("LLM broker: no usage to report (model=%s)", model)
@@ -228,6 +307,15 @@ class Broker:
             payload["label"] = label
         if source is not None:
             payload["source"] = source
+        if self._settlements is not None:
+            self._settlements.submit(caller_key, payload)
+            return
+        if not await self._deliver_settlement(caller_key, payload):
+            LOGGER.error("LLM broker: usage NOT recorded (model=%s)", model)
+
+    async def _deliver_settlement(self, caller_key: str, payload: dict) -> bool:
+        """Post one report; False if it is worth sending again later."""
+        model = payload.get("model")
         try:
             response = await self._control.post(
                 self.settings.settle_url,
@@ -235,18 +323,22 @@ class Broker:
                 json=payload,
             )
         except httpx.RequestError as exc:
-            LOGGER.error(
-                "LLM broker: usage NOT recorded (model=%s): %s",
+            LOGGER.warning("LLM broker: settle unreachable (model=%s): %s", model, exc)
+            return False
+        if response.status_code in (408, 429) or response.status_code >= 500:
+            LOGGER.warning(
+                "LLM broker: settle returned %s (model=%s); will retry",
+                response.status_code,
                 model,
-                exc,
             )
-            return
+            return False
         if response.status_code >= 400:
             LOGGER.error(
                 "LLM broker: usage NOT recorded (model=%s): settle returned %s",
                 model,
                 response.status_code,
             )
+        return True
 
     async def relay(
         self,
@@ -465,6 +557,10 @@ def build_app(settings: Optional[BrokerSettings] = None) -> FastAPI:
     app.include_router(build_voice_router(resolved.voice_providers))
     app.include_router(build_proxy_router(proxy))
 
+    @app.on_event("startup")
+    async def _start() -> None:
+        broker.start()
+
     @app.on_event("shutdown")
     async def _close() -> None:
         await broker.aclose()
@@ -7,6 +7,7 @@ in the pod the provider credentials are mounted.
 from __future__ import annotations
 
 import os
+import tempfile
 from dataclasses import dataclass, field
 from typing import Mapping, Optional
 
@@ -23,6 +24,15 @@ from unify.llm_broker.voice import VoiceProvider
 #: than an open tab. Negative verdicts are never reused.
 _DEFAULT_AUTH_TTL_S = 5.0
 
+#: Positive verdicts held at once; the least recently used goes first.
+_DEFAULT_AUTH_CACHE_MAX_ENTRIES = 10_000
+
+#: Usage reports are delivered by a background flush once this many are queued
+#: or this long has passed, whichever comes first. A zero interval settles each
+#: call inline instead.
+_DEFAULT_USAGE_BATCH_SIZE = 50
+_DEFAULT_USAGE_FLUSH_INTERVAL_S = 1.0
+
 _DEFAULT_PORT = 8787
 
 
@@ -46,6 +56,13 @@ class BrokerSettings:
     #: Non-LLM REST providers (Tavily, Recall) reached through the header-swap
     #: proxy. Empty leaves the routes present but refusing.
     credential_proxies: Mapping[str, CredentialProxy] = field(default_factory=dict)
+    auth_cache_max_entries: int = _DEFAULT_AUTH_CACHE_MAX_ENTRIES
+    usage_batch_size: int = _DEFAULT_USAGE_BATCH_SIZE
+    usage_flush_interval_s: float = _DEFAULT_USAGE_FLUSH_INTERVAL_S
+    #: Where queued usage reports survive a restart. Each broker process
+    #: spools beside it in a file named for its pid. Empty keeps them in
+    #: memory only, which loses whatever is queued when the process dies.
+    usage_spool_path: str = ""
 
     @property
     def authorize_url(self) -> str:
@@ -67,6 +84,21 @@ def _float_env(name: str, default: float) -> float:
     return value if value >= 0 else default
 
 
+def _int_env(name: str, default: int) -> int:
+    raw = (os.environ.get(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def _default_spool_path() -> str:
+    return os.path.join(tempfile.gettempdir(), "unify-llm-broker", "usage.jsonl")
+
+
 #: Static shape of each voice provider: where its bytes go and where its
 #: credential sits. The key comes from the sidecar env; everything else is a
 #: property of the provider's protocol, confirmed against the installed plugin.
@@ -163,6 +195,22 @@ def load_settings() -> BrokerSettings:
             "https://api.anthropic.com",
         ),
         auth_ttl_s=_float_env("UNIFY_LLM_BROKER_AUTH_TTL_S", _DEFAULT_AUTH_TTL_S),
+        auth_cache_max_entries=_int_env(
+            "UNIFY_LLM_BROKER_AUTH_CACHE_MAX_ENTRIES",
+            _DEFAULT_AUTH_CACHE_MAX_ENTRIES,
+        ),
+        usage_batch_size=_int_env(
+            "UNIFY_LLM_BROKER_USAGE_BATCH_SIZE",
+            _DEFAULT_USAGE_BATCH_SIZE,
+        ),
+        usage_flush_interval_s=_float_env(
+            "UNIFY_LLM_BROKER_USAGE_FLUSH_INTERVAL_S",
+            _DEFAULT_USAGE_FLUSH_INTERVAL_S,
+        ),
+        usage_spool_path=os.environ.get(
+            "UNIFY_LLM_BROKER_USAGE_SPOOL",
+            _default_spool_path(),
+        ),
         voice_providers=_load_voice_providers(),
         credential_proxies=_load_credential_proxies(),
     )
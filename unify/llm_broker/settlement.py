@@ -0,0 +1,288 @@
+"""Deliver usage reports to Orchestra in batches, at least once.
+
+Settling inline put one Orchestra round trip on the tail of every completion,
+and a settle that failed was logged and gone. Here a report is queued and
+written to a local spool before the caller's stream closes, then delivered by
+a background flush that runs once enough reports are queued or the flush
+interval passes, whichever is first.
+
+Delivery is at-least-once. A report leaves the spool only after Orchestra has
+answered it; a broker killed between that answer and the spool rewrite resends
+it on restart, which is why every report keeps the provider's generation id --
+it is what lets the ledger recognise a replay. A report Orchestra rejects
+outright (a revoked key, a malformed body) is dropped with an error rather than
+retried forever, since resending it cannot change the answer.
+
+Orchestra's settle call is per report and authenticated as the caller, so a
+flush is a set of concurrent posts over the pooled client rather than one
+request; what is batched is when the broker spends its time on them, which is
+off the caller's path and bounded per flush.
+
+Each broker process spools to a file of its own, ``<stem>.<pid><suffix>``
+beside the configured path, so brokers sharing a host never rewrite each
+other's records. On start a broker adopts the spools of brokers that are no
+longer running -- claiming each by renaming it, so only one adopts it -- and
+:meth:`SettlementBatcher.start` delivers what it replayed without waiting
+for new traffic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+#: ``send(caller_key, payload)`` returns True once the report needs no further
+#: delivery (accepted, or permanently rejected) and False to retry it later.
+SendFn = Callable[[str, dict], Awaitable[bool]]
+
+#: Reports held when Orchestra stays unreachable. Past this the oldest are
+#: dropped -- loudly -- rather than letting the sidecar's memory grow without
+#: bound during a long outage.
+_MAX_PENDING = 100_000
+#: Concurrent settle posts per flush.
+_FLUSH_CONCURRENCY = 8
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SettlementBatcher:
+    """Queue of usage reports flushed on size or interval, spooled to disk."""
+
+    def __init__(
+        self,
+        send: SendFn,
+        *,
+        batch_size: int,
+        interval_s: float,
+        spool_path: Optional[str] = None,
+        max_pending: int = _MAX_PENDING,
+    ) -> None:
+        self._send = send
+        self._batch_size = max(1, batch_size)
+        self._interval_s = interval_s
+        self._max_pending = max_pending
+        self._pending: OrderedDict[int, tuple[str, dict]] = OrderedDict()
+        self._next_seq = 0
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._closing = False
+        self._spool_base = Path(spool_path) if spool_path else None
+        self._spool_path = (
+            None
+            if self._spool_base is None
+            else self._spool_base.with_name(
+                f"{self._spool_base.stem}.{os.getpid()}{self._spool_base.suffix}",
+            )
+        )
+        self._spool: Any = None
+        if self._spool_path is not None:
+            self._replay_spool()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    # ------------------------------------------------------------------ #
+    #  Spool                                                             #
+    # ------------------------------------------------------------------ #
+
+    def _replay_spool(self) -> None:
+        """Re-queue whatever previous processes left undelivered."""
+        assert self._spool_path is not None
+        self._spool_path.parent.mkdir(parents=True, exist_ok=True)
+        self._read_spool(self._spool_path)
+        claimed = self._claim_orphan_spools()
+        for claim in claimed:
+            self._read_spool(claim)
+        if self._pending:
+            LOGGER.info(
+                "LLM broker: replaying %d unsettled usage report(s)",
+                len(self._pending),
+            )
+        self._rewrite_spool()
+        # Only once their reports are in this process's spool.
+        for claim in claimed:
+            claim.unlink(missing_ok=True)
+
+    def _read_spool(self, path: Path) -> None:
+        if not path.exists():
+            return
+        with path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                    caller_key, payload = record["key"], record["payload"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    # A torn last line from a crash mid-append.
+                    continue
+                self._queue(caller_key, payload)
+
+    def _claim_orphan_spools(self) -> list[Path]:
+        """Take over the spools of broker processes no longer running."""
+        assert self._spool_base is not None and self._spool_path is not None
+        prefix, suffix = f"{self._spool_base.stem}.", self._spool_base.suffix
+        # The unsuffixed path is what a broker spooled to before spools
+        # were per process.
+        candidates = [self._spool_base]
+        for path in self._spool_base.parent.glob(f"{prefix}*{suffix}"):
+            pid = path.name[len(prefix) : len(path.name) - len(suffix)]
+            if pid.isdigit() and int(pid) != os.getpid() and not _pid_alive(int(pid)):
+                candidates.append(path)
+        claimed = []
+        for orphan in candidates:
+            claim = self._spool_path.with_name(
+                f"{self._spool_path.name}.adopt-{orphan.name}",
+            )
+            try:
+                os.rename(orphan, claim)
+            except FileNotFoundError:
+                # Another broker starting alongside this one claimed it.
+                continue
+            except OSError:
+                LOGGER.exception("LLM broker: could not claim spool %s", orphan)
+                continue
+            claimed.append(claim)
+        return claimed
+
+    def _open_spool(self) -> None:
+        assert self._spool_path is not None
+        # The records carry caller keys, so the file is the sidecar's alone.
+        fd = os.open(
+            self._spool_path,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o600,
+        )
+        self._spool = os.fdopen(fd, "a", encoding="utf-8")
+
+    def _append_to_spool(self, caller_key: str, payload: dict) -> None:
+        if self._spool_path is None:
+            return
+        if self._spool is None:
+            self._open_spool()
+        self._spool.write(json.dumps({"key": caller_key, "payload": payload}) + "\n")
+        self._spool.flush()
+
+    def _rewrite_spool(self) -> None:
+        """Replace the spool with exactly the reports still pending."""
+        if self._spool_path is None:
+            return
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+        tmp = self._spool_path.with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            for caller_key, payload in self._pending.values():
+                fh.write(json.dumps({"key": caller_key, "payload": payload}) + "\n")
+        os.replace(tmp, self._spool_path)
+
+    # ------------------------------------------------------------------ #
+    #  Queue                                                             #
+    # ------------------------------------------------------------------ #
+
+    def _queue(self, caller_key: str, payload: dict) -> None:
+        self._pending[self._next_seq] = (caller_key, payload)
+        self._next_seq += 1
+        while len(self._pending) > self._max_pending:
+            _, (_, dropped) = self._pending.popitem(last=False)
+            LOGGER.error(
+                "LLM broker: usage NOT recorded (model=%s): settle backlog full",
+                dropped.get("model"),
+            )
+
+    def submit(self, caller_key: str, payload: dict) -> None:
+        """Queue one report; it is on disk (if spooling) when this returns."""
+        self._queue(caller_key, payload)
+        self._append_to_spool(caller_key, payload)
+        self._ensure_running()
+        if len(self._pending) >= self._batch_size:
+            self._wake.set()
+
+    def start(self) -> None:
+        """Start background delivery; call from a running event loop.
+
+        Reports replayed from a spool go out on the first flush rather than
+        waiting for the next :meth:`submit` to start the flusher.
+        """
+        self._ensure_running()
+        if self._pending:
+            self._wake.set()
+
+    def _ensure_running(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(
+            self._run(),
+            name="llm-broker-settle",
+        )
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self._interval_s)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                LOGGER.exception("LLM broker: settle flush failed")
+
+    async def flush(self) -> None:
+        """Deliver everything pending now; undelivered reports stay queued."""
+        async with self._flush_lock:
+            batch = list(self._pending.items())
+            if not batch:
+                return
+            gate = asyncio.Semaphore(_FLUSH_CONCURRENCY)
+
+            async def deliver(seq: int, caller_key: str, payload: dict) -> None:
+                async with gate:
+                    try:
+                        done = await self._send(caller_key, payload)
+                    except Exception:
+                        LOGGER.exception("LLM broker: settle send raised")
+                        done = False
+                if done:
+                    self._pending.pop(seq, None)
+
+            await asyncio.gather(*(deliver(seq, k, p) for seq, (k, p) in batch))
+            self._rewrite_spool()
+            if self._pending:
+                LOGGER.warning(
+                    "LLM broker: %d usage report(s) awaiting retry",
+                    len(self._pending),
+                )
+
+    async def aclose(self) -> None:
+        """Stop the background flush and make one last delivery attempt."""
+        self._closing = True
+        if self._task is not None:
+            self._wake.set()
+            try:
+                await self._task
+            except Exception:
+                LOGGER.exception("LLM broker: settle task failed")
+            self._task = None
+        await self.flush()
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
@@ -36,6 +36,7 @@ from ..common.context_store import TableStore
 from ..common.model_to_fields import model_to_fields
 from .types import Secret, SecretMeta
 from .custom_secrets import compute_custom_secrets_hash
+from .vault_cache import CachedSecret, SecretVaultCache
 from .base import BaseSecretManager
 from .prompt_builders import build_ask_prompt, build_update_prompt
 from ..common.filter_utils import normalize_filter_expr
@@ -104,6 +105,9 @@ class SecretManager(BaseSecretManager):
         # read them and bypass the workspace file-access allowlist. The trusted
         # provider proxy reads them via ``get_oauth_token``.
         self._oauth_tokens: dict[str, str] = {}
+        # Name -> value snapshots of each Secrets context, written through by
+        # every mutation below; credential lookups read these, not the backend.
+        self._vaults = SecretVaultCache(SETTINGS.secret.CACHE_TTL_SECONDS)
 
         # Ensure storage/schema exists deterministically (idempotent)
         self._provision_storage()
@@ -250,9 +254,48 @@ class SecretManager(BaseSecretManager):
         except Exception:
             pass
 
+    def _vault(
+        self,
+        context: str,
+        *,
+        refresh: bool = False,
+    ) -> Dict[str, CachedSecret]:
+        """Return one Secrets context's secrets by name from the vault cache.
+
+        A miss (or ``refresh=True``) reads the whole context once; backend
+        errors propagate to the caller.
+        """
+
+        def _load() -> Dict[str, CachedSecret]:
+            rows = unisdk.get_logs(context=context, from_fields=["name", "value"])
+            secrets: Dict[str, CachedSecret] = {}
+            for lg in rows:
+                entries = lg.entries or {}
+                nm = entries.get("name")
+                if isinstance(nm, str) and nm:
+                    secrets[nm] = CachedSecret(
+                        log_id=getattr(lg, "id", None),
+                        value=entries.get("value"),
+                    )
+            return secrets
+
+        return self._vaults.rows(context, _load, refresh=refresh)
+
+    @staticmethod
+    def _created_log_ids(result: Any, count: int) -> List[Optional[int]]:
+        """Row ids of a ``create_logs`` batch, in entry order when reported."""
+        if isinstance(result, dict):
+            ids = list(result.get("log_event_ids") or [])
+        elif isinstance(result, list):
+            ids = [getattr(lg, "id", None) for lg in result]
+        else:
+            ids = []
+        return ids if len(ids) == count else [None] * count
+
     @functools.wraps(BaseSecretManager.clear, updated=())
     def clear(self) -> None:
         unisdk.delete_context(self._ctx)
+        self._vaults.invalidate()
 
         # Force re-provisioning even if previously ensured
         self._ctx = ContextRegistry.refresh(self, SECRETS_TABLE)
@@ -420,7 +463,7 @@ class SecretManager(BaseSecretManager):
         active_allowlist = self._resolve_secret_allowlist()
         sensitive = self._sensitive_oauth_token_names()
 
-        written = 0
+        wanted: Dict[str, str] = {}
         for name, value in secrets_dict.items():
             if name not in active_allowlist:
                 continue
@@ -432,64 +475,133 @@ class SecretManager(BaseSecretManager):
             # still flows to the context/env for scope and freshness checks.
             if name in sensitive:
                 self._oauth_tokens[name] = value
-                written += 1
-                continue
-            try:
-                existing = unisdk.get_logs(
-                    context=self._ctx,
-                    filter=f"name == {name!r}",
-                    limit=1,
-                    return_ids_only=True,
-                )
-                description = "System-managed OAuth credential (auto-synced)"
-                if existing:
-                    unisdk.update_logs(
-                        logs=[existing[0]],
-                        context=self._ctx,
-                        entries={"value": value, "description": description},
-                        overwrite=True,
-                    )
-                else:
-                    unity_log(
-                        context=self._ctx,
-                        name=name,
-                        value=value,
-                        description=description,
-                        new=True,
-                        mutable=True,
-                        stamp_authoring=True,
-                    )
-                self._env_set(name, value)
-                written += 1
-            except Exception:
                 continue
+            wanted[name] = value
+
+        # Stale-cleanup is limited to the OAuth secrets owned by this sync.
+        # Console-pasted integration credentials live in the same local Secrets
+        # context but are not removed based on the admin assistant payload.
+        stale_names = active_allowlist - secrets_dict.keys()
+        for stale_name in stale_names & sensitive:
+            self._oauth_tokens.pop(stale_name, None)
+
+        # Diff the payload against the vault and write only what moved, one
+        # batch per kind of change, instead of a lookup and a write per name.
+        def _diff(current: Dict[str, CachedSecret]) -> tuple[list[str], list[str]]:
+            changed = [
+                name
+                for name, value in wanted.items()
+                if name in current and current[name].value != value
+            ]
+            removed = sorted(n for n in stale_names - sensitive if n in current)
+            return changed, removed
+
+        current = self._vault(self._ctx)
+        changed, removed = _diff(current)
+        if any(current[name].log_id is None for name in changed + removed):
+            # Rows this process created without learning their ids.
+            current = self._vault(self._ctx, refresh=True)
+            changed, removed = _diff(current)
+        created = [name for name in wanted if name not in current]
+
+        description = "System-managed OAuth credential (auto-synced)"
+
+        def update(names: List[str]) -> None:
+            unisdk.update_logs(
+                logs=[current[name].log_id for name in names],
+                context=self._ctx,
+                entries=[
+                    {"value": wanted[name], "description": description}
+                    for name in names
+                ],
+                overwrite=True,
+            )
+            for name in names:
+                self._vaults.put(self._ctx, name, wanted[name])
+
+        def create(names: List[str]) -> None:
+            result = unity_create_logs(
+                context=self._ctx,
+                entries=[
+                    {"name": name, "value": wanted[name], "description": description}
+                    for name in names
+                ],
+                stamp_authoring=True,
+            )
+            for name, log_id in zip(names, self._created_log_ids(result, len(names))):
+                self._vaults.put(self._ctx, name, wanted[name], log_id=log_id)
+
+        def delete(names: List[str]) -> None:
+            unisdk.delete_logs(
+                context=self._ctx,
+                logs=[current[name].log_id for name in names],
+            )
+            for name in names:
+                self._vaults.drop(self._ctx, name)
+
+        written = self._write_secrets(changed, update, action="update")
+        written += self._write_secrets(created, create, action="create")
+        deleted = self._write_secrets(removed, delete, action="delete")
+        # A secret whose write failed keeps its previous value in the env too.
+        failed = set(changed + created) - set(written)
+        exported = {name: value for name, value in wanted.items() if name not in failed}
+        if exported or deleted:
+            self._env_merge_and_write(
+                add_or_update=exported or None,
+                remove_keys=deleted or None,
+            )
 
         logger.info(
-            "[integrations] sync: agent_id=%s orchestra_keys=%d wrote=%d",
+            "[integrations] sync: agent_id=%s orchestra_keys=%d wrote=%d "
+            "unchanged=%d removed=%d failed=%d",
             agent_id,
             len(secrets_dict),
-            written,
+            len(written),
+            len(wanted) - len(changed) - len(created),
+            len(deleted),
+            len(failed) + len(removed) - len(deleted),
         )
 
-        # Stale-cleanup is limited to the OAuth secrets owned by this sync.
-        # Console-pasted integration credentials live in the same local Secrets
-        # context but are not removed based on the admin assistant payload.
-        for stale_name in active_allowlist - secrets_dict.keys():
-            if stale_name in sensitive:
-                self._oauth_tokens.pop(stale_name, None)
-                continue
+    @staticmethod
+    def _write_secrets(
+        names: List[str],
+        write: Callable[[List[str]], None],
+        *,
+        action: str,
+    ) -> List[str]:
+        """Apply ``write`` to ``names`` in one batch; the names it landed for.
+
+        A batch that fails is retried one secret at a time, so a single bad
+        secret costs its own write rather than the whole sync and the steps
+        that follow it.
+        """
+        if not names:
+            return []
+        try:
+            write(names)
+            return list(names)
+        except Exception:
+            logger.warning(
+                "[integrations] sync: batched %s of %d secrets failed; "
+                "retrying one at a time",
+                action,
+                len(names),
+                exc_info=True,
+            )
+        written = []
+        for name in names:
             try:
-                ids = unisdk.get_logs(
-                    context=self._ctx,
-                    filter=f"name == {stale_name!r}",
-                    limit=1,
-                    return_ids_only=True,
-                )
-                if ids:
-                    unisdk.delete_logs(context=self._ctx, logs=ids[0])
-                    self._env_remove(stale_name)
+                write([name])
             except Exception:
+                logger.warning(
+                    "[integrations] sync: %s of secret %s failed",
+                    action,
+                    name,
+                    exc_info=True,
+                )
                 continue
+            written.append(name)
+        return written
 
     def _sync_workspace_file_policy(self) -> None:
         """Mirror the workspace file-access allowlist into the runtime policy store.
@@ -615,16 +727,9 @@ class SecretManager(BaseSecretManager):
 
     def _get_secret_value(self, name: str) -> str | None:
         try:
-            rows = unisdk.get_logs(
-                context=self._ctx,
-                filter=f"name == {name!r}",
-                limit=1,
-                from_fields=["name", "value"],
-            )
-            if rows:
-                value = (rows[0].entries or {}).get("value")
-                if isinstance(value, str) and value:
-                    return value
+            secret = self._vault(self._ctx).get(name)
+            if secret is not None and isinstance(secret.value, str) and secret.value:
+                return secret.value
         except Exception:
             pass
         value = os.environ.get(name)
@@ -651,19 +756,17 @@ class SecretManager(BaseSecretManager):
         writes directly to Orchestra) are available as environment variables
         for code executed via ``os.environ``.
         """
+        # The periodic sync is also when the personal vault snapshot is renewed,
+        # so writes made outside this process land here at the latest.
         try:
-            rows = unisdk.get_logs(context=self._ctx)
+            secrets = self._vault(self._ctx, refresh=True)
         except Exception:
-            rows = []
-        name_to_value: Dict[str, str] = {}
-        for lg in rows:
-            try:
-                nm = (lg.entries or {}).get("name")
-                val = (lg.entries or {}).get("value")
-                if isinstance(nm, str) and nm and isinstance(val, str):
-                    name_to_value[nm] = val
-            except Exception:
-                continue
+            secrets = {}
+        name_to_value: Dict[str, str] = {
+            nm: secret.value
+            for nm, secret in secrets.items()
+            if isinstance(secret.value, str)
+        }
 
         if name_to_value:
             self._env_merge_and_write(add_or_update=name_to_value, remove_keys=None)
@@ -788,25 +891,18 @@ class SecretManager(BaseSecretManager):
         value_to_name: Dict[str, str] = {}
         for context in self._read_secret_contexts():
             try:
-                rows = unisdk.get_logs(
-                    context=context,
-                    from_fields=["name", "value"],
-                )
+                secrets = self._vault(context)
             except Exception:
-                rows = []
+                secrets = {}
 
-            for lg in rows:
-                try:
-                    nm = (lg.entries or {}).get("name")
-                    val = (lg.entries or {}).get("value")
-                    if isinstance(nm, str) and nm and isinstance(val, str) and val:
-                        if val in value_to_name:
-                            if nm < value_to_name[val]:
-                                value_to_name[val] = nm
-                        else:
+            for nm, secret in secrets.items():
+                val = secret.value
+                if isinstance(val, str) and val:
+                    if val in value_to_name:
+                        if nm < value_to_name[val]:
                             value_to_name[val] = nm
-                except Exception:
-                    continue
+                    else:
+                        value_to_name[val] = nm
 
         # Replace longer values first to avoid partial overlaps
         import re
@@ -1049,19 +1145,8 @@ class SecretManager(BaseSecretManager):
             If the credential is not stored in the resolved vault.
         """
         context = self._secret_context_for_destination(destination)
-        rows = unisdk.get_logs(
-            context=context,
-            filter=f"name == {integration!r}",
-            limit=1,
-        )
-        if not rows:
-            resolved_destination = (
-                self._effective_destination(destination) or PERSONAL_DESTINATION
-            )
-            raise KeyError(
-                f"No credential named {integration!r} in {resolved_destination!r}.",
-            )
-        value = (rows[0].entries or {}).get("value")
+        secret = self._vault(context).get(integration)
+        value = secret.value if secret is not None else None
         if not isinstance(value, str):
             resolved_destination = (
                 self._effective_destination(destination) or PERSONAL_DESTINATION
@@ -1278,16 +1363,9 @@ class SecretManager(BaseSecretManager):
         names: set[str] = set()
         for context in self._read_secret_contexts():
             try:
-                rows = unisdk.get_logs(
-                    context=context,
-                    from_fields=["name"],
-                )
+                names.update(self._vault(context))
             except Exception:
-                rows = []
-            for lg in rows:
-                nm = (lg.entries or {}).get("name")
-                if isinstance(nm, str) and nm:
-                    names.add(nm)
+                continue
         return sorted(names)
 
     # --------------------- Tools (mutations) --------------------- #
@@ -1364,13 +1442,14 @@ class SecretManager(BaseSecretManager):
             "value": value,
             "description": description or "",
         }
-        unity_log(
+        created = unity_log(
             context=context,
             **entries,
             new=True,
             mutable=True,
             stamp_authoring=True,
         )
+        self._vaults.put(context, name, value, log_id=getattr(created, "id", None))
 
         try:
             if self._is_personal_context(context):
@@ -1447,6 +1526,8 @@ class SecretManager(BaseSecretManager):
             entries=updates,
             overwrite=True,
         )
+        if value is not None:
+            self._vaults.put(context, name, value, log_id=log_id)
 
         try:
             if value is not None and self._is_personal_context(context):
@@ -1499,6 +1580,7 @@ class SecretManager(BaseSecretManager):
         if len(ids) > 1:
             raise RuntimeError(f"Multiple secrets found with name '{name}'.")
         unisdk.delete_logs(context=context, logs=ids[0])
+        self._vaults.drop(context, name)
         try:
             if self._is_personal_context(context):
                 self._env_remove(name)
@@ -1609,6 +1691,8 @@ class SecretManager(BaseSecretManager):
             entries=update_data,
             overwrite=True,
         )
+        # A custom row may be renamed as well as rotated; re-read the vault.
+        self._vaults.invalidate(self._ctx)
         value = update_data.get("value")
         name = update_data.get("name")
         if value is not None and name and self._is_personal_context(self._ctx):
@@ -1626,6 +1710,7 @@ class SecretManager(BaseSecretManager):
             stamp_authoring=True,
             recompute_derived=True,
         )
+        self._vaults.invalidate(self._ctx)
         name = insert_data.get("name")
         value = insert_data.get("value")
         if name and value and self._is_personal_context(self._ctx):
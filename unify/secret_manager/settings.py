@@ -15,11 +15,14 @@ class SecretSettings(BaseSettings):
         ENABLED: Whether SecretManager is enabled.
         IMPL: Implementation type - "real" or "simulated".
         DOTENV_PATH: Path to the .env file for secret storage.
+        CACHE_TTL_SECONDS: How long a vault read serves credential lookups
+            before the next lookup reads the backend again.
     """
 
     ENABLED: bool = False
     IMPL: str = "real"
     DOTENV_PATH: str = ""
+    CACHE_TTL_SECONDS: float = 30.0
 
     model_config = SettingsConfigDict(
         env_prefix="UNIFY_SECRET_",
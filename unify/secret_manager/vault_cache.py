@@ -0,0 +1,115 @@
+"""
+In-process cache of secret vaults, one snapshot per Secrets context.
+
+Credential lookups used to read the backend on every call, so a tool loop
+resolving a dozen placeholders paid a dozen round trips for values that
+almost never change. A vault is now read whole once and served from memory
+until it is older than the TTL.
+
+The manager writes through: every create, update and delete it makes is
+applied to the snapshot as it lands, so its own writes are visible at once.
+Each write also bumps the vault's version stamp, and a read installs its
+rows only if the stamp has not moved since the read began -- a read that
+raced a write could be carrying the row the write just replaced. Writes made
+elsewhere (the Console, a teammate's assistant) become visible when the
+snapshot expires or when the periodic assistant sync refreshes it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass(frozen=True)
+class CachedSecret:
+    """One stored secret: its row id (when known) and raw value."""
+
+    log_id: Optional[int]
+    value: Any
+
+
+@dataclass
+class _Vault:
+    rows: Dict[str, CachedSecret] = field(default_factory=dict)
+    loaded_at: Optional[float] = None
+    version: int = 0
+
+
+class SecretVaultCache:
+    """Versioned, write-through snapshots of Secrets contexts."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._lock = Lock()
+        self._vaults: Dict[str, _Vault] = {}
+
+    def rows(
+        self,
+        context: str,
+        load: Callable[[], Dict[str, CachedSecret]],
+        *,
+        refresh: bool = False,
+    ) -> Dict[str, CachedSecret]:
+        """Return ``context``'s secrets by name, calling ``load`` when stale.
+
+        ``load`` runs outside the lock and its errors propagate; a failed read
+        leaves the previous snapshot as it was.
+        """
+        with self._lock:
+            vault = self._vaults.setdefault(context, _Vault())
+            if not refresh and self._is_fresh(vault):
+                return dict(vault.rows)
+            version = vault.version
+        rows = load()
+        with self._lock:
+            if vault.version == version:
+                vault.rows = dict(rows)
+                vault.loaded_at = monotonic()
+        return rows
+
+    def put(
+        self,
+        context: str,
+        name: str,
+        value: Any,
+        *,
+        log_id: Optional[int] = None,
+    ) -> None:
+        """Record a write this process made to ``context``."""
+        with self._lock:
+            vault = self._vaults.setdefault(context, _Vault())
+            vault.version += 1
+            if vault.loaded_at is None:
+                return
+            if log_id is None and name in vault.rows:
+                log_id = vault.rows[name].log_id
+            vault.rows[name] = CachedSecret(log_id=log_id, value=value)
+
+    def drop(self, context: str, name: str) -> None:
+        """Record a delete this process made from ``context``."""
+        with self._lock:
+            vault = self._vaults.setdefault(context, _Vault())
+            vault.version += 1
+            vault.rows.pop(name, None)
+
+    def invalidate(self, context: Optional[str] = None) -> None:
+        """Forget one context's snapshot, or every snapshot."""
+        with self._lock:
+            vaults = (
+                self._vaults.values()
+                if context is None
+                else [self._vaults.setdefault(context, _Vault())]
+            )
+            for vault in vaults:
+                vault.version += 1
+                vault.rows = {}
+                vault.loaded_at = None
+
+    def _is_fresh(self, vault: _Vault) -> bool:
+        return (
+            vault.loaded_at is not None
+            and monotonic() - vault.loaded_at < self._ttl_seconds
+        )
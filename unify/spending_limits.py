@@ -23,13 +23,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import os
+import time
 import zoneinfo
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import TYPE_CHECKING, AsyncIterator, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Tuple
 
 from unisdk.async_admin import AsyncSpendClient, SpendRequestError
 
@@ -60,6 +62,13 @@ PAYMENT_GATED_PROVIDERS = frozenset(
 _spend_client: Optional[AsyncSpendClient] = None
 _spend_client_key: Optional[str] = None
 
+#: How long an allowing decision may be reused for the same subject and month.
+LIMIT_DECISION_TTL = 15.0
+#: Remaining headroom (USD) below which every call re-asks Orchestra. Local
+#: spend is only what this process observed, so near a cap the authoritative
+#: number is the only one worth trusting.
+LIMIT_DECISION_NEAR_CAP = 1.0
+
 
 @dataclass(frozen=True)
 class _CallerContext:
@@ -197,6 +206,132 @@ class _LimitCheckResult:
     api_access_allowed: bool = True
 
 
+_DecisionKey = Tuple[str, Optional[str], str, Optional[int], str]
+
+
+@dataclass
+class _CachedDecision:
+    results: List[_LimitCheckResult]
+    headroom: float
+    local_spend_at: float
+    expires_at: float
+
+
+def _headroom(results: List[_LimitCheckResult]) -> float:
+    """Smallest distance to any cap or to an empty wallet, in USD."""
+    headroom = math.inf
+    for result in results:
+        if result.limit_value is not None and result.current_spend is not None:
+            headroom = min(headroom, result.limit_value - result.current_spend)
+        if result.billing_mode != "METERED" and result.credit_balance is not None:
+            headroom = min(headroom, result.credit_balance)
+    return headroom
+
+
+class _LimitDecisionCache:
+    """Recently read limit results per (subject, month), reused while far from caps.
+
+    Only the results of a check that allowed the call are kept, and only
+    when nothing about them failed, so a refusal or an unreadable account is
+    re-asked on the next call exactly as before. Between refreshes the cost
+    this process has since spent (see ``llm_meter.local_spend_total``) is
+    deducted from the headroom that was read; once what is left drops under
+    ``LIMIT_DECISION_NEAR_CAP`` the entry is discarded and Orchestra is asked
+    again. Spend made elsewhere on the same account is not seen locally, which
+    is what the short TTL bounds.
+    """
+
+    def __init__(
+        self,
+        ttl: float = LIMIT_DECISION_TTL,
+        near_cap: float = LIMIT_DECISION_NEAR_CAP,
+    ) -> None:
+        self._ttl = ttl
+        self._near_cap = near_cap
+        self._entries: Dict[_DecisionKey, _CachedDecision] = {}
+
+    def get(self, key: _DecisionKey) -> Optional[List[_LimitCheckResult]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        remaining = entry.headroom - (_local_spend_total() - entry.local_spend_at)
+        if remaining < self._near_cap:
+            del self._entries[key]
+            return None
+        return entry.results
+
+    def store(self, key: _DecisionKey, results: List[_LimitCheckResult]) -> None:
+        headroom = _headroom(results)
+        if headroom < self._near_cap:
+            return
+        # Entries for a past month can never be hit again.
+        month = key[-1]
+        for stale in [k for k in self._entries if k[-1] != month]:
+            del self._entries[stale]
+        self._entries[key] = _CachedDecision(
+            results=results,
+            headroom=headroom,
+            local_spend_at=_local_spend_total(),
+            expires_at=time.monotonic() + self._ttl,
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _local_spend_total() -> float:
+    from unify.common.llm_meter import local_spend_total
+
+    return local_spend_total()
+
+
+def _with_unflushed_spend(
+    results: List[_LimitCheckResult | BaseException],
+    month: str,
+) -> List[_LimitCheckResult | BaseException]:
+    """Add the spend this process has not yet flushed to each capped result.
+
+    Orchestra reads ``Spending/Monthly``, which the LLM event hook writes in
+    summed deltas every few seconds; without this a burst of calls could run
+    past a cap by whatever is still waiting to be flushed.
+    """
+    from unify.events.llm_event_hook import unflushed_spend
+
+    adjusted: List[_LimitCheckResult | BaseException] = []
+    for result in results:
+        if (
+            isinstance(result, BaseException)
+            or result.limit_value is None
+            or result.current_spend is None
+        ):
+            adjusted.append(result)
+            continue
+        if result.limit_type == "assistant":
+            extra = unflushed_spend(month, assistant_id=result.entity_id)
+        elif result.limit_type in ("user", "member"):
+            extra = unflushed_spend(month, user_id=result.entity_id)
+        else:
+            extra = unflushed_spend(month)
+        if extra > 0:
+            spend = result.current_spend + extra
+            result = replace(
+                result,
+                current_spend=spend,
+                exceeded=spend >= result.limit_value,
+            )
+        adjusted.append(result)
+    return adjusted
+
+
+#: Set by :func:`install_limit_check_hook`. The single-tenant runtime checks
+#: one account many times a minute; a multi-tenant host serves unbounded
+#: callers and keeps asking every time.
+_decision_cache: Optional[_LimitDecisionCache] = None
+
+
 # Why a billing gate refused. Callers pick the wording the user sees from
 # this, so a refusal never reaches them as a generic fault they are told to
 # retry — the two causes need opposite advice, and neither clears on a retry.
@@ -583,6 +718,49 @@ def _payment_gated(model: str, *, never_paid: bool) -> bool:
     return _gated_provider_of(model, never_paid=never_paid) is not None
 
 
+async def _run_limit_checks(
+    agent_id: Optional[str],
+    user_id: Optional[str],
+    org_id: Optional[int],
+    month: str,
+) -> List[_LimitCheckResult | BaseException]:
+    """Every limit that applies to this subject, checked in parallel."""
+    checks: List[asyncio.Task] = []
+
+    # The raw-API path (gateway/CLI usage with a bare UNIFY_KEY) carries no
+    # assistant session, but the ``/user/spend`` endpoint resolves the key
+    # owner's wallet server-side, so the balance/cap gates always apply.
+    # Skipping the check when session context is missing would fail open —
+    # exactly the channel free-credit farmers extract through.
+    if agent_id:
+        checks.append(
+            asyncio.create_task(
+                _check_assistant_limit(agent_id, month),
+            ),
+        )
+
+    is_org_context = org_id is not None
+    if is_org_context and user_id:
+        checks.append(
+            asyncio.create_task(
+                _check_member_limit(user_id, org_id, month),
+            ),
+        )
+        checks.append(
+            asyncio.create_task(
+                _check_org_limit(org_id, month),
+            ),
+        )
+    else:
+        checks.append(
+            asyncio.create_task(
+                _check_user_limit(user_id or "api-key-owner", month),
+            ),
+        )
+
+    return await asyncio.gather(*checks, return_exceptions=True)
+
+
 async def check_spending_limits_callback(
     request: "LimitCheckRequest",
 ) -> "LimitCheckResponse":
@@ -628,40 +806,27 @@ async def check_spending_limits_callback(
 
     month = _get_current_month(timezone)
 
-    checks: List[asyncio.Task] = []
-
-    # The raw-API path (gateway/CLI usage with a bare UNIFY_KEY) carries no
-    # assistant session, but the ``/user/spend`` endpoint resolves the key
-    # owner's wallet server-side, so the balance/cap gates always apply.
-    # Skipping the check when session context is missing would fail open —
-    # exactly the channel free-credit farmers extract through.
-    if agent_id:
-        checks.append(
-            asyncio.create_task(
-                _check_assistant_limit(agent_id, month),
-            ),
+    # Reuse a recent allowing read for this subject while it is still far
+    # from every cap. Never inside a caller context: that path fails closed
+    # and serves a different wallet on every request.
+    decision_key: Optional[_DecisionKey] = None
+    cached_results: Optional[List[_LimitCheckResult]] = None
+    if _decision_cache is not None and caller is None:
+        decision_key = (
+            api_key,
+            str(agent_id) if agent_id else None,
+            user_id,
+            org_id,
+            month,
         )
+        cached_results = _decision_cache.get(decision_key)
 
-    is_org_context = org_id is not None
-    if is_org_context and user_id:
-        checks.append(
-            asyncio.create_task(
-                _check_member_limit(user_id, org_id, month),
-            ),
-        )
-        checks.append(
-            asyncio.create_task(
-                _check_org_limit(org_id, month),
-            ),
-        )
+    if cached_results is not None:
+        results = cached_results
     else:
-        checks.append(
-            asyncio.create_task(
-                _check_user_limit(user_id or "api-key-owner", month),
-            ),
-        )
-
-    results = await asyncio.gather(*checks, return_exceptions=True)
+        results = await _run_limit_checks(agent_id, user_id, org_id, month)
+        if caller is None:
+            results = _with_unflushed_spend(results, month)
 
     def _to_limit_type(type_str: Optional[str]) -> Optional[LimitType]:
         if type_str is None:
@@ -792,6 +957,8 @@ async def check_spending_limits_callback(
             ),
         )
 
+    if decision_key is not None and cached_results is None and not check_failed:
+        _decision_cache.store(decision_key, results)
     return LimitCheckResponse(allowed=True)
 
 
@@ -812,9 +979,16 @@ def install_limit_check_hook() -> None:
         logger.debug("Limit check hook not installed: no API key")
         return
 
+    global _decision_cache
     try:
         import unillm
 
+        from unify.common.llm_meter import install_run_metering
+
+        # The decision cache deducts locally observed spend, which the
+        # metering listener is what observes.
+        install_run_metering()
+        _decision_cache = _LimitDecisionCache()
         unillm.set_limit_check_hook(check_spending_limits_callback)
         logger.debug("Limit check hook installed")
     except ImportError:
@@ -854,6 +1028,8 @@ def install_multi_tenant_limit_check_hook() -> None:
 
 def uninstall_limit_check_hook() -> None:
     """Uninstall the spending limit check hook from UniLLM."""
+    global _decision_cache
+    _decision_cache = None
     try:
         import unillm
 
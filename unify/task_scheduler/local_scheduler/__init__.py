@@ -11,6 +11,9 @@ Public surface:
 - :class:`ActivationMaterializer` — the Protocol every scheduler implements.
 - :class:`LocalActivationScheduler` — the in-process, asyncio-timer
   implementation used by local installs.
+- :class:`LocalOfflineDispatcher` — starts offline runs as subprocesses,
+  from an :class:`OfflineWorkerPool` of pre-booted runners when one is
+  configured.
 - :class:`NoopMaterializer` — a do-nothing implementation used in hosted
   mode where Communication owns materialisation.
 - :func:`build_materializer` — selects the right implementation based on
@@ -24,11 +27,13 @@ from .materializer import (
 )
 from .offline_dispatcher import LocalOfflineDispatcher
 from .scheduler import LocalActivationScheduler
+from .worker_pool import OfflineWorkerPool
 
 __all__ = [
     "ActivationMaterializer",
     "LocalActivationScheduler",
     "LocalOfflineDispatcher",
     "NoopMaterializer",
+    "OfflineWorkerPool",
     "build_materializer",
 ]
@@ -5,6 +5,11 @@ subprocesses fired by the in-process execution scheduler (or by an explicit
 REST trigger). This is the local analogue of the hosted lane, where each
 offline run executes as a dedicated one-shot Kubernetes Job; both consume the
 same env contract from ``offline_runner_contract``.
+
+With ``SETTINGS.task.OFFLINE_WORKER_POOL_SIZE`` above zero, runs for the
+active assistant go to an :class:`OfflineWorkerPool` of pre-booted runners
+instead, and fall back to a cold subprocess whenever the pool cannot supply
+a worker.
 """
 
 from __future__ import annotations
@@ -13,13 +18,16 @@ import asyncio
 import logging
 import os
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
+from unify.settings import SETTINGS
 from unify.task_scheduler.offline_runner_contract import (
     build_offline_run_key,
     build_offline_runner_env,
 )
 
+from .worker_pool import OfflineWorkerPool, WorkerBootError
+
 if TYPE_CHECKING:
     from unify.task_scheduler.machine_state import TaskExecutionSnapshot
 
@@ -29,21 +37,116 @@ LOGGER = logging.getLogger(__name__)
 class LocalOfflineDispatcher:
     """Spawn ``unify.task_scheduler.offline_runner`` as a child subprocess."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, pool_size: Optional[int] = None) -> None:
         self._inflight: set[asyncio.Task] = set()
+        self._pool_size = (
+            SETTINGS.task.OFFLINE_WORKER_POOL_SIZE if pool_size is None else pool_size
+        )
+        self._pool: Optional[OfflineWorkerPool] = None
 
     async def dispatch(
         self,
         snap: "TaskExecutionSnapshot",
         *,
         wake: str = "scheduled",
-    ) -> asyncio.subprocess.Process:
-        """Spawn the offline runner subprocess and return the Process handle."""
+    ) -> Optional[asyncio.subprocess.Process]:
+        """Start one offline run.
+
+        Returns the Process handle of a cold offline runner subprocess, or
+        ``None`` when the run was handed to the pre-booted worker pool.
+        """
 
         env = _build_local_offline_runner_env(
             snap,
             wake=wake,
         )
+        pool = self._pool_for(str(snap.assistant_id or ""))
+        if pool is not None:
+            LOGGER.info(
+                "LocalOfflineDispatcher handing task_id=%s to a pre-booted "
+                "worker (wake=%s, run_key=%s)",
+                snap.task_id,
+                wake,
+                snap.run_key,
+            )
+            self._track(self._run_pooled(pool, env, snap, wake))
+            return None
+        return await self._spawn(env, snap, wake)
+
+    def _pool_for(self, assistant_id: str) -> Optional[OfflineWorkerPool]:
+        """The warm pool serving ``assistant_id``, if one may serve it."""
+
+        if self._pool_size <= 0 or not assistant_id:
+            return None
+        if self._pool is None:
+            self._pool = OfflineWorkerPool(
+                assistant_id,
+                size=self._pool_size,
+                max_runs=SETTINGS.task.OFFLINE_WORKER_MAX_RUNS,
+                max_rss_growth_bytes=(
+                    SETTINGS.task.OFFLINE_WORKER_MAX_RSS_GROWTH_MB * 1024 * 1024
+                ),
+            )
+        if self._pool.assistant_id != assistant_id or self._pool.broken:
+            return None
+        return self._pool
+
+    async def _run_pooled(
+        self,
+        pool: OfflineWorkerPool,
+        env: dict[str, str],
+        snap: "TaskExecutionSnapshot",
+        wake: str,
+    ) -> None:
+        """Run on a pre-booted worker; spawn cold if none could start it."""
+
+        try:
+            exit_code = await pool.run(str(snap.run_key or ""), env)
+        except WorkerBootError as exc:
+            LOGGER.warning(
+                "LocalOfflineDispatcher falling back to a cold offline_runner "
+                "for task_id=%s (run_key=%s): %s",
+                snap.task_id,
+                snap.run_key,
+                exc,
+            )
+            await self._spawn(env, snap, wake)
+            return
+        except Exception:
+            LOGGER.exception(
+                "LocalOfflineDispatcher pre-booted worker failed "
+                "(task_id=%s, wake=%s, run_key=%s)",
+                snap.task_id,
+                wake,
+                snap.run_key,
+            )
+            return
+        if exit_code == 0:
+            LOGGER.info(
+                "LocalOfflineDispatcher pre-booted worker completed "
+                "(task_id=%s, wake=%s, run_key=%s)",
+                snap.task_id,
+                wake,
+                snap.run_key,
+            )
+        else:
+            LOGGER.warning(
+                "LocalOfflineDispatcher pre-booted worker run exited with code "
+                "%s (task_id=%s, wake=%s, run_key=%s)",
+                exit_code,
+                snap.task_id,
+                wake,
+                snap.run_key,
+            )
+
+    async def _spawn(
+        self,
+        env: dict[str, str],
+        snap: "TaskExecutionSnapshot",
+        wake: str,
+    ) -> asyncio.subprocess.Process:
+        """Spawn a cold offline runner subprocess and watch it."""
+
         merged_env = {**os.environ, **env}
         merged_env.setdefault("PYTHONUNBUFFERED", "1")
 
@@ -64,11 +167,14 @@ class LocalOfflineDispatcher:
             stderr=asyncio.subprocess.PIPE,
         )
 
-        watcher = asyncio.create_task(self._watch(process, snap, wake))
-        self._inflight.add(watcher)
-        watcher.add_done_callback(self._inflight.discard)
+        self._track(self._watch(process, snap, wake))
         return process
 
+    def _track(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
     async def _watch(
         self,
         process: asyncio.subprocess.Process,
@@ -100,12 +206,22 @@ class LocalOfflineDispatcher:
             )
 
     async def stop(self) -> None:
-        """Cancel all in-flight watcher tasks. Does not kill subprocesses."""
+        """Cancel all in-flight watcher tasks and retire idle pooled workers.
+
+        Does not kill subprocesses: a run in progress, cold or pooled, is
+        left to finish.
+        """
 
+        if self._pool is not None:
+            # Closed first, so cancelled pooled runs do not boot replacements.
+            self._pool.close()
         for task in list(self._inflight):
             task.cancel()
         await asyncio.gather(*self._inflight, return_exceptions=True)
         self._inflight.clear()
+        if self._pool is not None:
+            await self._pool.stop()
+            self._pool = None
 
 
 def _truncate(payload: bytes | None, *, limit: int = 2000) -> str:
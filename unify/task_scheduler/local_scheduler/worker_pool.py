@@ -0,0 +1,438 @@
+"""Warm pool of pre-booted offline runners for local installs.
+
+A cold ``offline_runner`` subprocess pays the whole assistant substrate boot
+before it takes its first action, and a burst of due tasks pays it once per
+task. The pool keeps up to ``size`` ``unify.task_scheduler.offline_worker``
+processes booted for one assistant and hands each run's env to an idle one
+(see that module for the wire protocol).
+
+- **Admission:** at most ``size`` runs execute at once; further runs wait
+  in arrival order for a worker to come free.
+- **Recycling:** a worker is retired after ``max_runs`` runs, or once its
+  RSS has grown ``max_rss_growth_bytes`` past what it held when it became
+  ready, and a fresh one boots behind it. A worker that dies mid-run fails
+  only that run and is replaced the same way; one found dead while idle is
+  replaced before it is handed a run.
+- **Fallback:** a worker that cannot boot, that exits before the run it
+  was handed starts, or that ends the run without starting it (it refused
+  the run, or could not load its config) surfaces as
+  :class:`WorkerBootError`; the dispatcher then spawns a cold runner for
+  that run. After repeated boot failures the
+  pool reports itself broken and the dispatcher stops offering it runs.
+- **Latency:** every run records how long it waited for a worker and how
+  long dispatch took to reach its first action; :meth:`OfflineWorkerPool.stats`
+  summarises both.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+import psutil
+
+LOGGER = logging.getLogger(__name__)
+
+#: Command a worker is started with.
+WORKER_COMMAND: tuple[str, ...] = (
+    sys.executable,
+    "-m",
+    "unify.task_scheduler.offline_worker",
+)
+
+#: Seconds a worker may take to report ``ready``.
+WORKER_BOOT_TIMEOUT_SECONDS = 300.0
+
+#: Seconds a retired worker gets to exit after its stdin closes.
+WORKER_EXIT_GRACE_SECONDS = 10.0
+
+#: Consecutive boot failures after which the pool is considered broken.
+MAX_CONSECUTIVE_BOOT_FAILURES = 3
+
+#: Run timings kept for :meth:`OfflineWorkerPool.stats`.
+RUN_TIMINGS_KEPT = 256
+
+
+class WorkerBootError(RuntimeError):
+    """No pre-booted worker could be provided for a run."""
+
+
+class WorkerDiedError(RuntimeError):
+    """A worker exited before reporting the end of its run."""
+
+
+class _RunNotStarted(RuntimeError):
+    """A worker reported a run done without having started it."""
+
+
+@dataclass(frozen=True)
+class RunTiming:
+    run_key: str
+    #: Time spent waiting for a free worker.
+    queued_ms: float
+    #: Dispatch to the worker reporting that the run started executing.
+    first_action_ms: float
+    exit_code: Optional[int]
+
+
+class _Worker:
+    """One worker subprocess and the protocol events it has sent."""
+
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self.process = process
+        self.runs = 0
+        self.baseline_rss = 0
+        self.ready: asyncio.Future[dict] = _future()
+        self._started: Optional[asyncio.Future[None]] = None
+        self._done: Optional[asyncio.Future[int]] = None
+        self._reader = asyncio.create_task(self._read())
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None and not self._reader.done()
+
+    async def _read(self) -> None:
+        stdout = self.process.stdout
+        assert stdout is not None
+        while line := await stdout.readline():
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            event = message.get("event")
+            if event == "ready":
+                _resolve(self.ready, message)
+            elif event == "started" and self._started is not None:
+                _resolve(self._started, None)
+            elif event == "done" and self._done is not None:
+                code = int(message.get("code", 1))
+                if self._started is not None and not self._started.done():
+                    self._started.set_exception(
+                        _RunNotStarted(
+                            f"offline worker {self.pid} ended the run without "
+                            f"starting it (exit code {code})",
+                        ),
+                    )
+                _resolve(self._done, code)
+        died = WorkerDiedError(f"offline worker {self.pid} exited")
+        for future in (self.ready, self._started, self._done):
+            if future is not None and not future.done():
+                future.set_exception(died)
+
+    async def run(self, run_id: str, env: dict[str, str]) -> tuple[float, int]:
+        """Run one task; returns (ms to first action, exit code)."""
+        self._started, self._done = _future(), _future()
+        self.runs += 1
+        sent = time.perf_counter()
+        stdin = self.process.stdin
+        assert stdin is not None
+        try:
+            stdin.write((json.dumps({"run": run_id, "env": env}) + "\n").encode())
+            await stdin.drain()
+            await asyncio.shield(self._started)
+        except (BrokenPipeError, ConnectionResetError, WorkerDiedError) as exc:
+            # Nothing of the run executed, so a cold runner can still take it.
+            raise WorkerBootError(
+                f"offline worker {self.pid} exited before starting the run",
+            ) from exc
+        except _RunNotStarted as exc:
+            # The worker is still serving; only this run goes cold.
+            raise WorkerBootError(str(exc)) from exc
+        first_action_ms = (time.perf_counter() - sent) * 1000
+        return first_action_ms, await asyncio.shield(self._done)
+
+    def rss(self) -> int:
+        try:
+            return psutil.Process(self.pid).memory_info().rss
+        except psutil.Error:
+            return 0
+
+    def detach(self) -> None:
+        """Let the worker finish what it is running, then exit."""
+        if self.process.stdin is not None and not self.process.stdin.is_closing():
+            self.process.stdin.close()
+
+    async def close(self, grace: float = WORKER_EXIT_GRACE_SECONDS) -> None:
+        """Close stdin so the worker exits; kill it if it does not."""
+        self.detach()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=grace)
+        except asyncio.TimeoutError:
+            if self.process.returncode is None:
+                self.process.kill()
+            await self.process.wait()
+        self._reader.cancel()
+        await asyncio.gather(self._reader, return_exceptions=True)
+
+
+def _future() -> asyncio.Future:
+    future = asyncio.get_running_loop().create_future()
+    # A worker's events may fail a future nobody is waiting on yet.
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    return future
+
+
+def _resolve(future: asyncio.Future, value: Any) -> None:
+    if not future.done():
+        future.set_result(value)
+
+
+def _percentile(values: Sequence[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class OfflineWorkerPool:
+    """Pre-booted offline runners for one assistant."""
+
+    def __init__(
+        self,
+        assistant_id: str,
+        *,
+        size: int,
+        max_runs: int,
+        max_rss_growth_bytes: int,
+        env: Optional[dict[str, str]] = None,
+        command: Sequence[str] = WORKER_COMMAND,
+        boot_timeout: float = WORKER_BOOT_TIMEOUT_SECONDS,
+    ) -> None:
+        if size < 1:
+            raise ValueError("OfflineWorkerPool size must be at least 1")
+        self.assistant_id = assistant_id
+        self.size = size
+        self.max_runs = max_runs
+        self.max_rss_growth_bytes = max_rss_growth_bytes
+        self._env = env
+        self._command = tuple(command)
+        self._boot_timeout = boot_timeout
+        self._admission = asyncio.Semaphore(size)
+        # Booted workers, or None for a boot that failed.
+        self._idle: asyncio.Queue[Optional[_Worker]] = asyncio.Queue()
+        self._busy: set[_Worker] = set()
+        self._background: set[asyncio.Task] = set()
+        self._run_ids = itertools.count(1)
+        self._boot_failures = 0
+        self._started = False
+        self._closed = False
+        self.workers_booted = 0
+        self.workers_recycled = 0
+        self.timings: deque[RunTiming] = deque(maxlen=RUN_TIMINGS_KEPT)
+
+    @property
+    def broken(self) -> bool:
+        return self._boot_failures >= MAX_CONSECUTIVE_BOOT_FAILURES
+
+    def start(self) -> None:
+        """Begin booting the pool's workers in the background."""
+        if self._started:
+            return
+        self._started = True
+        for _ in range(self.size):
+            self._boot_in_background()
+
+    async def run(self, run_key: str, env: dict[str, str]) -> int:
+        """Run one task on a pre-booted worker and return its exit code.
+
+        Raises :class:`WorkerBootError` when no worker could be booted for
+        the run or the worker exited before the run started, and
+        :class:`WorkerDiedError` when it exited after the run started but
+        before it ended.
+        """
+        if self._closed:
+            raise WorkerBootError("OfflineWorkerPool is stopped")
+        self.start()
+        queued = time.perf_counter()
+        async with self._admission:
+            worker = await self._next_idle()
+            queued_ms = (time.perf_counter() - queued) * 1000
+            if worker is None:
+                if not self._closed:
+                    self._boot_in_background()
+                raise WorkerBootError("offline worker failed to boot")
+            self._busy.add(worker)
+            exit_code: Optional[int] = None
+            first_action_ms = float("nan")
+            try:
+                first_action_ms, exit_code = await worker.run(
+                    str(next(self._run_ids)),
+                    env,
+                )
+                return exit_code
+            except asyncio.CancelledError:
+                # Like a cold runner, the run outlives whoever awaited it:
+                # the worker finishes it and then exits on EOF.
+                self._busy.discard(worker)
+                worker.detach()
+                if not self._closed:
+                    self._boot_in_background()
+                raise
+            finally:
+                if worker in self._busy:
+                    self._busy.discard(worker)
+                    self._record(run_key, queued_ms, first_action_ms, exit_code)
+                    self._release(worker, died=not worker.alive)
+
+    async def _next_idle(self) -> Optional[_Worker]:
+        """The next idle worker, replacing any that died while idle."""
+        while True:
+            worker = await self._idle.get()
+            if worker is None or worker.alive:
+                return worker
+            LOGGER.info("OfflineWorkerPool worker %s exited while idle", worker.pid)
+            self.workers_recycled += 1
+            self._spawn_background(worker.close(grace=0))
+            if self._closed:
+                return None
+            self._boot_in_background()
+
+    def _record(
+        self,
+        run_key: str,
+        queued_ms: float,
+        first_action_ms: float,
+        exit_code: Optional[int],
+    ) -> None:
+        timing = RunTiming(run_key, queued_ms, first_action_ms, exit_code)
+        self.timings.append(timing)
+        LOGGER.info(
+            "OfflineWorkerPool run %s: queued %.1fms, first action after "
+            "%.1fms, exit code %s",
+            run_key,
+            queued_ms,
+            first_action_ms,
+            exit_code,
+        )
+
+    def _release(self, worker: _Worker, *, died: bool) -> None:
+        if self._closed:
+            self._spawn_background(worker.close())
+            return
+        if died or worker.process.returncode is not None:
+            reason = "exited"
+        elif worker.runs >= self.max_runs:
+            reason = f"served {worker.runs} runs"
+        elif (grown := worker.rss() - worker.baseline_rss) > self.max_rss_growth_bytes:
+            reason = f"grew {grown // (1024 * 1024)}MB"
+        else:
+            self._idle.put_nowait(worker)
+            return
+        LOGGER.info("OfflineWorkerPool recycling worker %s (%s)", worker.pid, reason)
+        self.workers_recycled += 1
+        self._spawn_background(worker.close())
+        self._boot_in_background()
+
+    def _boot_in_background(self) -> None:
+        self._spawn_background(self._boot())
+
+    def _spawn_background(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _boot(self) -> None:
+        env = {**(os.environ if self._env is None else self._env)}
+        env["ASSISTANT_ID"] = self.assistant_id
+        env.setdefault("PYTHONUNBUFFERED", "1")
+        worker: Optional[_Worker] = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._command,
+                env=env,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=None,
+            )
+            worker = _Worker(process)
+            ready = await asyncio.wait_for(
+                asyncio.shield(worker.ready),
+                timeout=self._boot_timeout,
+            )
+        except Exception:
+            LOGGER.exception("OfflineWorkerPool failed to boot a worker")
+            self._boot_failures += 1
+            if worker is not None:
+                await worker.close(grace=0)
+            self._idle.put_nowait(None)
+            return
+        self._boot_failures = 0
+        worker.baseline_rss = worker.rss()
+        self.workers_booted += 1
+        LOGGER.info(
+            "OfflineWorkerPool worker %s ready after %sms",
+            worker.pid,
+            ready.get("boot_ms"),
+        )
+        if self._closed:
+            await worker.close()
+            return
+        self._idle.put_nowait(worker)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters and dispatch-to-first-action percentiles of recent runs."""
+        first_action = [
+            t.first_action_ms for t in self.timings if t.exit_code is not None
+        ]
+        queued = [t.queued_ms for t in self.timings]
+        summary: dict[str, Any] = {
+            "runs": len(self.timings),
+            "workers_booted": self.workers_booted,
+            "workers_recycled": self.workers_recycled,
+            "idle": self._idle.qsize(),
+            "busy": len(self._busy),
+        }
+        if first_action:
+            summary["first_action_ms"] = {
+                "p50": statistics.median(first_action),
+                "p95": _percentile(first_action, 0.95),
+                "max": max(first_action),
+            }
+        if queued:
+            summary["queued_ms"] = {
+                "p50": statistics.median(queued),
+                "p95": _percentile(queued, 0.95),
+                "max": max(queued),
+            }
+        return summary
+
+    def close(self) -> None:
+        """Refuse new runs and stop replacing workers.
+
+        Called before in-flight runs are cancelled, so their cancellation
+        does not boot workers that :meth:`stop` would then wait for.
+        """
+        self._closed = True
+
+    async def stop(self) -> None:
+        """Retire idle workers and wait for booting ones.
+
+        Runs still executing finish, and their workers exit after them.
+        """
+        self.close()
+        closing = []
+        while not self._idle.empty():
+            worker = self._idle.get_nowait()
+            if worker is not None:
+                closing.append(worker.close())
+        await asyncio.gather(*closing, return_exceptions=True)
+        await asyncio.gather(*list(self._background), return_exceptions=True)
+
+
+__all__ = [
+    "OfflineWorkerPool",
+    "RunTiming",
+    "WorkerBootError",
+    "WorkerDiedError",
+]
@@ -695,6 +695,19 @@ async def _execute_offline_task(config: OfflineTaskConfig) -> Any:
     _ensure_desktop_env_for_resources(config)
     SESSION_DETAILS.populate_from_env()
     _bootstrap_offline_runtime()
+    return await _execute_task_lane(config)
+
+
+async def _execute_booted_offline_task(config: OfflineTaskConfig) -> Any:
+    """Execute one offline task in a process whose substrate is already up."""
+
+    _ensure_desktop_env_for_resources(config)
+    return await _execute_task_lane(config)
+
+
+async def _execute_task_lane(config: OfflineTaskConfig) -> Any:
+    """Route one run to the provider-event or scheduler-managed lane."""
+
     if config.wake is Wake.provider_event:
         dispatch = _load_provider_event_dispatch_from_env()
         return await _execute_provider_event_offline_task(config, dispatch)
@@ -711,6 +724,16 @@ def main() -> int:
 
     config = _load_config_from_env()
     _install_sigterm_handler(config)
+    return asyncio.run(_run_offline_task(config))
+
+
+async def _run_offline_task(config: OfflineTaskConfig, *, booted: bool = False) -> int:
+    """Run one offline task and persist its final run state; returns the exit code.
+
+    ``booted`` is set by a pre-booted worker
+    (``unify.task_scheduler.offline_worker``) whose substrate is already up.
+    """
+
     LOGGER.info(
         "Starting offline task runner for task %s (function_id=%s, run_key=%s)",
         config.task_id,
@@ -718,7 +741,10 @@ def main() -> int:
         config.run_key,
     )
     try:
-        asyncio.run(_execute_offline_task(config))
+        if booted:
+            await _execute_booted_offline_task(config)
+        else:
+            await _execute_offline_task(config)
     except StaleActivationSuperseded as exc:
         # The definition's schedule moved after this activation was
         # projected (re-arm on a concurrent run start, manual re-arm,
@@ -0,0 +1,121 @@
+"""Pre-booted offline task runner for the local warm pool.
+
+``offline_runner`` boots the assistant substrate for the one task its env
+describes and exits. On a local install that boot (workspace, unify.init,
+EventBus, eager managers, deployment reconcile, Secrets→env hydrate,
+embedding warm-up) is most of a short task's wall time. A worker boots it
+once and then runs tasks handed to it by
+:class:`unify.task_scheduler.local_scheduler.worker_pool.OfflineWorkerPool`,
+one at a time, until its stdin closes.
+
+Protocol: newline-delimited JSON. The pool writes ``{"run": id, "env":
+{...}}`` to stdin, where ``env`` is the task env ``offline_runner`` would
+have been started with. The worker answers on its original stdout with
+``ready`` once booted, ``started`` when a run begins executing, and
+``done`` with the run's exit code. A run it refuses, or whose config it
+cannot load, gets ``done`` without ``started``, and the pool hands that run
+to a cold runner. Anything else the process prints goes to stderr, so stray
+output cannot corrupt the protocol.
+
+Each run applies its task env on top of the worker's live environment and
+restores the keys it set once it ends, so one run's task env does not leak
+into the next while values the worker set since booting (secrets synced
+into the environment, for one) are kept. Everything else a run leaves
+behind in the process is bounded by the pool recycling its workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+from typing import IO, Any
+
+from unify.logger import LOGGER
+from unify.session_details import SESSION_DETAILS
+from unify.task_scheduler import offline_runner
+
+#: Exit code reported for a run this worker refused without running it.
+REFUSED_EXIT_CODE = 2
+
+
+def _send(out: IO[str], event: str, **fields: Any) -> None:
+    out.write(json.dumps({"event": event, **fields}) + "\n")
+    out.flush()
+
+
+async def _read_line() -> bytes:
+    return await asyncio.get_running_loop().run_in_executor(
+        None,
+        sys.stdin.buffer.readline,
+    )
+
+
+async def _run_one(request: dict[str, Any], assistant_id: str | None, out) -> int:
+    run_id = request.get("run")
+    env = {str(k): str(v) for k, v in (request.get("env") or {}).items()}
+    if env.get("ASSISTANT_ID") != assistant_id:
+        LOGGER.error(
+            "Offline worker for assistant %s refused a run for assistant %s",
+            assistant_id,
+            env.get("ASSISTANT_ID"),
+        )
+        return REFUSED_EXIT_CODE
+    replaced = {key: os.environ.get(key) for key in env}
+    os.environ.update(env)
+    try:
+        config = offline_runner._load_config_from_env()
+        offline_runner._install_sigterm_handler(config)
+        _send(out, "started", run=run_id)
+        return await offline_runner._run_offline_task(config, booted=True)
+    finally:
+        # An idle worker has no run to terminalize on SIGTERM.
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        for key, value in replaced.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+async def _serve(out: IO[str]) -> None:
+    started = time.perf_counter()
+    SESSION_DETAILS.populate_from_env()
+    offline_runner._bootstrap_offline_runtime()
+    assistant_id = os.environ.get("ASSISTANT_ID")
+    _send(
+        out,
+        "ready",
+        pid=os.getpid(),
+        boot_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
+    while line := await _read_line():
+        try:
+            request = json.loads(line)
+        except ValueError:
+            LOGGER.error("Offline worker ignored a malformed request: %r", line[:200])
+            continue
+        try:
+            code = await _run_one(request, assistant_id, out)
+        except Exception:
+            LOGGER.exception(
+                "Offline worker failed to start run %s", request.get("run")
+            )
+            code = 1
+        _send(out, "done", run=request.get("run"), code=code)
+
+
+def main() -> int:
+    # Keep the original stdout for the protocol; everything else to stderr.
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    asyncio.run(_serve(out))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
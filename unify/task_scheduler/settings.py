@@ -71,6 +71,17 @@ class TaskSettings(BaseSettings):
             after boot (e.g. immediately after the user asks the agent to
             schedule something). Ignored when LOCAL_SCHEDULER_ENABLED is
             False. Default 60 seconds.
+        OFFLINE_WORKER_POOL_SIZE: Pre-booted ``offline_worker`` processes the
+            local offline dispatcher keeps for the assistant, so a scheduled
+            offline run starts without booting the assistant substrate. Each
+            warm worker holds a full substrate in memory, so the pool is
+            opt-in; 0 (the default) spawns one cold ``offline_runner`` per
+            run.
+        OFFLINE_WORKER_MAX_RUNS: Runs a pooled worker serves before it is
+            replaced by a fresh one.
+        OFFLINE_WORKER_MAX_RSS_GROWTH_MB: Growth in a pooled worker's resident
+            memory, past what it held once booted, after which it is
+            replaced at the end of its current run.
     """
 
     IMPL: str = "real"
@@ -80,6 +91,9 @@ class TaskSettings(BaseSettings):
     LOCAL_SCHEDULER_ENABLED: bool = _derive_local_scheduler_default()
     LOCAL_SCHEDULER_POLL_INTERVAL_SECONDS: float = 60.0
     PROVIDER_EVENT_DISPATCH_REQUEST_TTL_SECONDS: int = 300
+    OFFLINE_WORKER_POOL_SIZE: int = 0
+    OFFLINE_WORKER_MAX_RUNS: int = 20
+    OFFLINE_WORKER_MAX_RSS_GROWTH_MB: int = 512
 
     model_config = SettingsConfigDict(
         env_prefix="UNIFY_TASK_",
@@ -15,7 +15,9 @@ from typing import (
     Dict,
     List,
     Literal,
+    Mapping,
     Optional,
+    Sequence,
     Tuple,
     Type,
     Union,
@@ -2025,30 +2027,85 @@ class TaskScheduler(BaseTaskScheduler):
         )
         store = self._store_for_task_context(tasks_context)
         rows = store.get_rows(filter=managed_rows_filter(managed_by), limit=1000)
-        planted: List[Dict[str, Any]] = []
+        planted = [
+            task
+            for task in (self._planted_task(row.entries or {}) for row in rows)
+            if task is not None
+        ]
+        return sorted(planted, key=lambda task: task["task_id"])
+
+    def list_custom_tasks_by_source(
+        self,
+        *,
+        managed_by: Sequence[str],
+        destination: str | None = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """:meth:`list_custom_tasks` for several sources in one read.
+
+        Every source asked about has an entry, empty when it planted
+        nothing. The deployment source also owns rows written before
+        provenance existed, which no ``in`` filter can select, so it is
+        answered by its own read.
+        """
+        sources = list(dict.fromkeys(str(source) for source in managed_by))
+        planted: Dict[str, List[Dict[str, Any]]] = {source: [] for source in sources}
+        if MANAGED_BY_DEPLOYMENT in planted:
+            planted[MANAGED_BY_DEPLOYMENT] = self.list_custom_tasks(
+                managed_by=MANAGED_BY_DEPLOYMENT,
+                destination=destination,
+            )
+        scoped = [source for source in sources if source != MANAGED_BY_DEPLOYMENT]
+        if not scoped:
+            return planted
+
+        tasks_context, _meta_context, _is_personal = self._sync_destination_contexts(
+            destination,
+        )
+        store = self._store_for_task_context(tasks_context)
+        listed = ", ".join(f"'{source}'" for source in scoped)
+        # Paged to the end: backend reads stop at 1000 rows, and callers
+        # build the set of still-referenced functions from this listing,
+        # so a truncated read would let them delete functions in use.
+        rows: List[Any] = []
+        page_size = 1000
+        while True:
+            page = store.get_rows(
+                filter=f"custom_hash != None and managed_by in [{listed}]",
+                offset=len(rows),
+                limit=page_size,
+            )
+            rows.extend(page)
+            if len(page) < page_size:
+                break
         for row in rows:
             entries = dict(row.entries or {})
-            task_id = entries.get("task_id")
-            if task_id is None:
-                continue
-            entrypoint = entries.get("entrypoint")
-            planted.append(
-                {
-                    "task_id": int(task_id),
-                    "name": entries.get("name", ""),
-                    # False while the source holds them on a missing
-                    # connection: the definition exists and nothing will
-                    # start it, an explicit run included.
-                    "enabled": entries.get("enabled") is not False,
-                    # The function this definition runs, when it has one.
-                    # Reported because it is the only record of which
-                    # functions a source's tasks reference -- an uninstall
-                    # reads it to find what its own runs distilled, which
-                    # no bundle source lists.
-                    "entrypoint": None if entrypoint is None else int(entrypoint),
-                },
-            )
-        return sorted(planted, key=lambda task: task["task_id"])
+            task = self._planted_task(entries)
+            source = entries.get("managed_by")
+            if task is not None and source in planted:
+                planted[source].append(task)
+        for tasks in planted.values():
+            tasks.sort(key=lambda task: task["task_id"])
+        return planted
+
+    @staticmethod
+    def _planted_task(entries: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        task_id = entries.get("task_id")
+        if task_id is None:
+            return None
+        entrypoint = entries.get("entrypoint")
+        return {
+            "task_id": int(task_id),
+            "name": entries.get("name", ""),
+            # False while the source holds them on a missing connection: the
+            # definition exists and nothing will start it, an explicit run
+            # included.
+            "enabled": entries.get("enabled") is not False,
+            # The function this definition runs, when it has one. Reported
+            # because it is the only record of which functions a source's
+            # tasks reference -- an uninstall reads it to find what its own
+            # runs distilled, which no bundle source lists.
+            "entrypoint": None if entrypoint is None else int(entrypoint),
+        }
 
     def set_custom_tasks_enabled(
         self,
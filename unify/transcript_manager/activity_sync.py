@@ -1,10 +1,16 @@
 """Fire-and-forget activity sync from transcripts to orchestra.
 
-The transcript hook calls :func:`touch_assistant_activity` after every
+The transcript hook calls :func:`schedule_activity_touch` after every
 ``log_messages`` invocation so orchestra's inactivity-followup routine
 sees fresh ``last_correspondence_at`` and clears any pending
 ``last_followup_sent_at`` (allowing the next silence to re-arm a
-re-engagement follow-up).
+re-engagement follow-up). Touches are debounced on one background worker:
+a burst of writes (an import, a busy thread) costs one
+:func:`touch_assistant_activity` POST per assistant and thread id per
+window instead of a thread and a POST per call. What is still pending at
+shutdown is sent by :func:`flush_activity_touches`, called from the
+conversation manager's shutdown and registered with :mod:`atexit` for
+short-lived processes such as offline runners.
 
 The brain-driven opt-out helpers
 :func:`opt_out_of_inactivity_followups_via_orchestra` and
@@ -24,8 +30,11 @@ Endpoints (assistant-scoped; authenticated with the assistant's own UNIFY_KEY):
 
 from __future__ import annotations
 
+import atexit
 import logging
-from typing import Optional
+import threading
+import time
+from typing import Optional, Set, Tuple
 
 from ..settings import SETTINGS
 
@@ -107,6 +116,115 @@ def touch_assistant_activity(
         return False
 
 
+#: How long a scheduled touch waits for others to join it.
+TOUCH_DEBOUNCE_SECONDS = 2.0
+
+#: How long process exit waits for pending touches to be sent.
+TOUCH_EXIT_FLUSH_TIMEOUT_SECONDS = 10.0
+
+
+class _ActivityToucher:
+    """One daemon thread that sends the touches scheduled in each window.
+
+    Touches are keyed by (assistant id, thread id): a check-in reply's
+    thread id tells orchestra not to re-arm cadence, so it is never folded
+    into a plain touch or vice versa.
+    """
+
+    def __init__(self, debounce_s: float) -> None:
+        self.debounce_s = debounce_s
+        self._cond = threading.Condition()
+        self._pending: Set[Tuple[int | str, Optional[str]]] = set()
+        self._sending = False
+        self._flushers = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, assistant_id: int | str, thread_id: Optional[str]) -> None:
+        with self._cond:
+            self._pending.add((assistant_id, thread_id))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    daemon=True,
+                    name="touch_assistant_activity",
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send what is pending without waiting out the window; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flushers += 1
+            self._cond.notify_all()
+            try:
+                while self._pending or self._sending:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self._flushers -= 1
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                # Let the rest of the burst arrive before sending.
+                send_at = time.monotonic() + self.debounce_s
+                while not self._flushers:
+                    remaining = send_at - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch, self._pending = self._pending, set()
+                self._sending = True
+            try:
+                for assistant_id, thread_id in sorted(batch, key=str):
+                    touch_assistant_activity(assistant_id, thread_id=thread_id)
+            finally:
+                with self._cond:
+                    self._sending = False
+                    self._cond.notify_all()
+
+
+_toucher = _ActivityToucher(TOUCH_DEBOUNCE_SECONDS)
+
+
+def schedule_activity_touch(
+    assistant_id: int | str | None,
+    *,
+    thread_id: str | None = None,
+) -> None:
+    """Queue a :func:`touch_assistant_activity` on the debounced worker.
+
+    Returns immediately. Touches for the same assistant and thread id that
+    arrive within ``TOUCH_DEBOUNCE_SECONDS`` of each other are sent once.
+    """
+    if assistant_id is None:
+        return
+    _toucher.schedule(assistant_id, str(thread_id) if thread_id else None)
+
+
+def flush_activity_touches(timeout: Optional[float] = None) -> bool:
+    """Send pending touches without waiting out the window; False on timeout."""
+    return _toucher.flush(timeout)
+
+
+def _flush_activity_touches_at_exit() -> None:
+    # The worker is a daemon thread: without this, a process that exits
+    # inside the debounce window drops its last touches.
+    if not flush_activity_touches(timeout=TOUCH_EXIT_FLUSH_TIMEOUT_SECONDS):
+        _log.warning("Activity touches still pending at exit were not sent")
+
+
+atexit.register(_flush_activity_touches_at_exit)
+
+
 def _post_followup_admin_action(
     assistant_id: int | str | None,
     action_path: str,
@@ -13,8 +13,13 @@ from ..common.authorship import (
 )
 from ..common.colleague_cache import ColleagueNameCache
 from ..common.embed_utils import ensure_vector_column
-from ..common.log_utils import log as unity_log, _inject_private_fields
+from ..common.log_utils import (
+    create_logs as unity_create_logs,
+    log as unity_log,
+    _inject_private_fields,
+)
 from ..contact_manager.base import BaseContactManager
+from ..logger import LOGGER
 from ..manager_registry import ManagerRegistry
 from .types.message import Message, UNASSIGNED
 from .types.exchange import Exchange
@@ -76,6 +81,8 @@ from ..common.tool_outcome import ToolErrorException, ToolOutcome
 
 TRANSCRIPTS_TABLE = "Transcripts"
 EXCHANGES_TABLE = "Exchanges"
+# Rows per multi-row create on the synchronous ``log_messages`` path.
+_SYNC_CREATE_BATCH_SIZE = 500
 
 
 class TranscriptManager(BaseTranscriptManager):
@@ -619,30 +626,20 @@ class TranscriptManager(BaseTranscriptManager):
 
         created_messages: List[Message] = []
 
-        for entries, _orig_msg in zip(msg_entries, normalised_messages):
-            # Ensure correct creation order by performing contact creation *before*
-            # the logger call (already satisfied above).  Now we can log safely.
-            if synchronous:
-                # Sync path: block until backend responds, get assigned IDs
-                log = unity_log(
-                    context=transcripts_context,
-                    **entries,
-                    new=True,
-                    mutable=True,
-                    stamp_authoring=True,
-                )
-
-                # Build a Message directly from the POST response
-                persisted_payload = {
-                    k: log.entries.get(k) for k in Message.model_fields.keys()
-                }
-                # Remove any None values for id fields so the validator can apply sentinel if needed
-                if persisted_payload.get("message_id") is None:
-                    persisted_payload.pop("message_id", None)
-                if persisted_payload.get("exchange_id") is None:
-                    persisted_payload.pop("exchange_id", None)
+        # Sync path: block until the backend responds with assigned IDs. The
+        # whole batch goes out in multi-row creates rather than one request
+        # per message; rows come back in the order they were sent.
+        persisted_messages = (
+            self._create_messages_batched(transcripts_context, msg_entries)
+            if synchronous
+            else []
+        )
 
-                created_msg = Message(**persisted_payload)
+        for index, (entries, _orig_msg) in enumerate(
+            zip(msg_entries, normalised_messages),
+        ):
+            if synchronous:
+                created_msg = persisted_messages[index]
             else:
                 # Async path: fire-and-forget, don't block on network I/O
                 # Inject private fields (same as sync path via unity_log)
@@ -709,7 +706,7 @@ class TranscriptManager(BaseTranscriptManager):
             try:
                 from .activity_sync import (
                     publish_comms_activity,
-                    touch_assistant_activity,
+                    schedule_activity_touch,
                 )
                 from unify.session_details import SESSION_DETAILS
 
@@ -721,15 +718,9 @@ class TranscriptManager(BaseTranscriptManager):
                         if isinstance(meta, dict) and meta.get("thread_id"):
                             touch_thread_id = meta.get("thread_id")
                             break
-                    threading.Thread(
-                        target=touch_assistant_activity,
-                        kwargs={
-                            "assistant_id": agent_id,
-                            "thread_id": touch_thread_id,
-                        },
-                        daemon=True,
-                        name="touch_assistant_activity",
-                    ).start()
+                    # Coalesced with other writes in the debounce window
+                    # rather than a thread and a POST per call.
+                    schedule_activity_touch(agent_id, thread_id=touch_thread_id)
                     # Surface non-unify comms (email/SMS/WhatsApp/…) to Console so
                     # the call-window avatar can adopt its "working" pose.
                     for _msg in created_messages:
@@ -809,6 +800,117 @@ class TranscriptManager(BaseTranscriptManager):
                     return None
         return None
 
+    def _create_messages_batched(
+        self,
+        context: str,
+        msg_entries: List[Dict[str, Any]],
+    ) -> List[Message]:
+        """Persist ``msg_entries`` in multi-row creates; return them as Messages.
+
+        Each chunk of up to ``_SYNC_CREATE_BATCH_SIZE`` rows is one request,
+        and the returned rows are mapped back to messages by position; see
+        :meth:`_persisted_rows` for the response shapes understood.
+        """
+        created: List[Message] = []
+        for start in range(0, len(msg_entries), _SYNC_CREATE_BATCH_SIZE):
+            chunk = msg_entries[start : start + _SYNC_CREATE_BATCH_SIZE]
+            response = unity_create_logs(
+                context=context,
+                entries=chunk,
+                mutable=True,
+                batched=True,
+                stamp_authoring=True,
+            )
+            for row in self._persisted_rows(context, chunk, response):
+                # Build a Message directly from the POST response
+                persisted_payload = {k: row.get(k) for k in Message.model_fields.keys()}
+                if persisted_payload.get("exchange_id") is None:
+                    persisted_payload.pop("exchange_id", None)
+                created.append(Message(**persisted_payload))
+        return created
+
+    @staticmethod
+    def _persisted_rows(
+        context: str,
+        chunk: List[Dict[str, Any]],
+        response: Any,
+    ) -> List[Dict[str, Any]]:
+        """The stored rows a batched create answered with, in the order sent.
+
+        Handles the shapes ``create_logs`` returns: the logs themselves
+        (bare or under ``"logs"``), the assigned ``row_ids``, or the
+        ``log_event_ids`` to read the rows back by. A shape is used only if
+        it accounts for every row of ``chunk`` with its ``message_id``; a
+        short or id-less one falls through to the next, ending with a read
+        back by ``log_event_ids``. If none does, the rows are stored but
+        cannot be attributed, which is raised as one error rather than
+        handed back as messages carrying sentinel ids.
+        """
+
+        def entries_of(log: Any) -> Dict[str, Any]:
+            return dict(log.entries if hasattr(log, "entries") else log or {})
+
+        def identified(rows: List[Dict[str, Any]]) -> int:
+            return sum(row.get("message_id") not in (None, UNASSIGNED) for row in rows)
+
+        def complete(rows: List[Dict[str, Any]]) -> bool:
+            return len(rows) == len(chunk) == identified(rows)
+
+        if isinstance(response, list):
+            response = {"logs": response}
+        if not isinstance(response, dict):
+            response = {}
+
+        logs = response.get("logs")
+        rows = [entries_of(log) for log in logs] if isinstance(logs, list) else []
+        if complete(rows):
+            return rows
+        found = identified(rows)
+
+        row_ids = response.get("row_ids")
+        if isinstance(row_ids, dict):
+            row_ids = row_ids.get("message_id", next(iter(row_ids.values()), None))
+        if isinstance(row_ids, list) and len(row_ids) == len(chunk):
+            rows = [
+                {**entries, "message_id": message_id}
+                for entries, message_id in zip(chunk, row_ids)
+            ]
+            if complete(rows):
+                return rows
+
+        log_ids = response.get("log_event_ids") or response.get("log_ids")
+        if isinstance(log_ids, list) and len(log_ids) == len(chunk):
+            fetched = unisdk.get_logs(
+                context=context,
+                from_ids=log_ids,
+                return_ids_only=False,
+            )
+            if isinstance(fetched, dict):
+                fetched = fetched.get("logs") or []
+            by_id = {log.id: entries_of(log) for log in fetched}
+            rows = [by_id[log_id] for log_id in log_ids if log_id in by_id]
+            if complete(rows):
+                return rows
+
+        found = max(
+            found,
+            len(row_ids) if isinstance(row_ids, list) else 0,
+            len(log_ids) if isinstance(log_ids, list) else 0,
+        )
+        LOGGER.error(
+            "Batched transcript create in %r identified %d rows for %d messages: "
+            "response keys %s",
+            context,
+            found,
+            len(chunk),
+            sorted(response),
+        )
+        raise RuntimeError(
+            f"Batched transcript create identified {found} rows for "
+            f"{len(chunk)} messages in {context!r}. The messages were sent and "
+            "may be stored; do not resend them without checking.",
+        )
+
     def _fallback_async_log_create(self, state: dict[str, Any]) -> None:
         """Synchronously persist a row if the async logger dropped it."""
 
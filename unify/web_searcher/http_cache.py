@@ -0,0 +1,549 @@
+"""Local response caches for URL fetches and web-provider calls.
+
+Two independent caches live here:
+
+- :class:`HttpResponseCache` -- a private HTTP cache for
+  :func:`~unify.web_searcher.url_fetch.fetch_to_directory`. Bodies are stored
+  content-addressed (``blobs/<sha256>``) so the same bytes behind several URLs
+  are kept once; per-URL metadata lives in a small SQLite file. Freshness and
+  age follow RFC 9111 (sections 4.2.1-4.2.3), stale entries are revalidated
+  with ``If-None-Match`` / ``If-Modified-Since``, and total stored bytes are
+  held under a budget by evicting least-recently-used entries.
+- :class:`ProviderResultCache` -- an in-memory TTL cache for Tavily
+  search/extract/crawl/map results keyed by the normalized request parameters.
+
+As a private cache ``s-maxage`` and ``public``/``private`` are ignored, and
+``Vary`` is honoured only as far as ``Vary: *`` making a response
+unstorable: every fetch sends the same request headers, so any other ``Vary``
+selects the same variant.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# RFC 9111 4.2.2: a heuristic lifetime of 10% of the time since Last-Modified
+# is typical; cap it so a very old document is not trusted for months.
+HEURISTIC_FRACTION = 0.1
+HEURISTIC_MAX_SECONDS = 24 * 3600.0
+
+# Status codes RFC 9110 defines as heuristically cacheable. Only complete
+# 200 bodies are useful to a download, so that is all this cache stores.
+_STORABLE_STATUS = frozenset({200})
+
+
+def default_cache_dir() -> Path:
+    """Return the on-disk location of the shared HTTP response cache."""
+    from unify.settings import SETTINGS
+
+    explicit = SETTINGS.web.HTTP_CACHE_DIR.strip()
+    if explicit:
+        return Path(explicit).expanduser()
+    cache_root = Path(
+        os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"),
+    )
+    return cache_root / "unify" / "http_cache"
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of ``url`` for cache keys.
+
+    Lower-cases scheme and host, drops default ports and the fragment (which
+    never reaches the server), and gives an empty path a ``/``.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    port = parts.port
+    if port is not None and (scheme, port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{port}"
+    return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+
+# --------------------------------------------------------------------------- #
+# RFC 9111 freshness
+# --------------------------------------------------------------------------- #
+
+
+def parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """Parse a ``Cache-Control`` header into ``{directive: argument-or-None}``."""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, sep, arg = part.partition("=")
+        directives[name.strip().lower()] = arg.strip().strip('"') if sep else None
+    return directives
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def _seconds(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(0.0, float(int(value))) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def is_storable(status: int, headers: Mapping[str, str]) -> bool:
+    """Whether a response may be stored (RFC 9111 section 3)."""
+    if status not in _STORABLE_STATUS:
+        return False
+    cc = parse_cache_control(_header(headers, "cache-control") or "")
+    if "no-store" in cc:
+        return False
+    if (_header(headers, "vary") or "").strip() == "*":
+        return False
+    return True
+
+
+def freshness_lifetime(headers: Mapping[str, str]) -> float:
+    """Freshness lifetime in seconds (RFC 9111 section 4.2.1)."""
+    cc = parse_cache_control(_header(headers, "cache-control") or "")
+    max_age = _seconds(cc.get("max-age")) if "max-age" in cc else None
+    if max_age is not None:
+        return max_age
+    expires = _header(headers, "expires")
+    if expires is not None:
+        expires_at = _http_date(expires)
+        date = _http_date(_header(headers, "date"))
+        # An invalid Expires (e.g. "0") means already expired.
+        if expires_at is None or date is None:
+            return 0.0
+        return max(0.0, expires_at - date)
+    last_modified = _http_date(_header(headers, "last-modified"))
+    date = _http_date(_header(headers, "date"))
+    if last_modified is not None and date is not None and date > last_modified:
+        return min((date - last_modified) * HEURISTIC_FRACTION, HEURISTIC_MAX_SECONDS)
+    return 0.0
+
+
+def current_age(
+    headers: Mapping[str, str],
+    request_time: float,
+    response_time: float,
+    now: float,
+) -> float:
+    """Current age of a stored response in seconds (RFC 9111 section 4.2.3)."""
+    age_value = _seconds(_header(headers, "age")) or 0.0
+    date_value = _http_date(_header(headers, "date"))
+    apparent_age = max(0.0, response_time - date_value) if date_value else 0.0
+    response_delay = max(0.0, response_time - request_time)
+    corrected_initial_age = max(apparent_age, age_value + response_delay)
+    return corrected_initial_age + max(0.0, now - response_time)
+
+
+def is_fresh(
+    headers: Mapping[str, str],
+    request_time: float,
+    response_time: float,
+    now: Optional[float] = None,
+) -> bool:
+    """Whether a stored response may be served without revalidation."""
+    cc = parse_cache_control(_header(headers, "cache-control") or "")
+    if "no-cache" in cc:
+        return False
+    now = time.time() if now is None else now
+    return freshness_lifetime(headers) > current_age(
+        headers,
+        request_time,
+        response_time,
+        now,
+    )
+
+
+# --------------------------------------------------------------------------- #
+# HTTP response cache
+# --------------------------------------------------------------------------- #
+
+# Headers that describe the representation rather than the message; a 304
+# only updates the rest (RFC 9111 section 4.3.4).
+_REPRESENTATION_HEADERS = frozenset(
+    {"content-length", "content-encoding", "content-type", "content-range"},
+)
+_KEPT_HEADERS = frozenset(
+    {
+        "age",
+        "cache-control",
+        "content-disposition",
+        "content-type",
+        "date",
+        "etag",
+        "expires",
+        "last-modified",
+        "vary",
+    },
+)
+
+
+def _kept(headers: Mapping[str, str]) -> Dict[str, str]:
+    return {k.lower(): v for k, v in headers.items() if k.lower() in _KEPT_HEADERS}
+
+
+@dataclass
+class CachedResponse:
+    """A stored response: metadata plus the path of its body blob."""
+
+    url: str
+    body_path: Path
+    size: int
+    headers: Dict[str, str]
+    request_time: float
+    response_time: float
+
+    @property
+    def fresh(self) -> bool:
+        return is_fresh(self.headers, self.request_time, self.response_time)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Validators to send when revalidating this entry."""
+        out: Dict[str, str] = {}
+        if self.headers.get("etag"):
+            out["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            out["If-Modified-Since"] = self.headers["last-modified"]
+        return out
+
+
+class BodyWriter:
+    """Streams a response body into the cache while hashing it."""
+
+    def __init__(self, cache: "HttpResponseCache", max_entry_bytes: int):
+        self._cache = cache
+        self._max = max_entry_bytes
+        fd, name = tempfile.mkstemp(dir=cache.blob_dir, prefix=".partial-")
+        self._file = os.fdopen(fd, "wb")
+        self.path = Path(name)
+        self._digest = hashlib.sha256()
+        self.size = 0
+        self.overflowed = False
+
+    def write(self, chunk: bytes) -> None:
+        if self.overflowed:
+            return
+        self.size += len(chunk)
+        if self.size > self._max:
+            # Too large to be worth a slot in the budget; stop buffering.
+            self.overflowed = True
+            self.abort()
+            return
+        self._digest.update(chunk)
+        self._file.write(chunk)
+
+    def abort(self) -> None:
+        try:
+            self._file.close()
+        finally:
+            self.path.unlink(missing_ok=True)
+
+    def finish(self) -> Tuple[str, Path]:
+        self._file.close()
+        return self._digest.hexdigest(), self.path
+
+
+class HttpResponseCache:
+    """Content-addressed private HTTP cache with a total byte budget."""
+
+    def __init__(self, root: str | Path, *, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.blob_dir = self.root / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.root / "index.sqlite"),
+            timeout=30.0,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " url TEXT PRIMARY KEY, blob TEXT NOT NULL, size INTEGER NOT NULL,"
+            " headers TEXT NOT NULL, request_time REAL NOT NULL,"
+            " response_time REAL NOT NULL, last_access REAL NOT NULL)",
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_access ON entries(last_access)",
+        )
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Return the stored response for ``url`` (fresh or not), if any."""
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blob, size, headers, request_time, response_time"
+                " FROM entries WHERE url = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            blob, size, headers, request_time, response_time = row
+            body_path = self._blob_path(blob)
+            if not body_path.exists():
+                self._conn.execute("DELETE FROM entries WHERE url = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE url = ?",
+                (time.time(), key),
+            )
+        return CachedResponse(
+            url=url,
+            body_path=body_path,
+            size=size,
+            headers=json.loads(headers),
+            request_time=request_time,
+            response_time=response_time,
+        )
+
+    def writer(self) -> BodyWriter:
+        """Start buffering a body; pass it to :meth:`store` once complete."""
+        return BodyWriter(self, max_entry_bytes=max(1, self.max_bytes // 2))
+
+    def store(
+        self,
+        url: str,
+        writer: BodyWriter,
+        headers: Mapping[str, str],
+        request_time: float,
+        response_time: float,
+    ) -> Optional[CachedResponse]:
+        """Commit a fully written body under ``url``; None if it was not kept."""
+        if writer.overflowed:
+            return None
+        digest, partial = writer.finish()
+        blob = self._blob_path(digest)
+        if blob.exists():
+            partial.unlink(missing_ok=True)
+        else:
+            os.replace(partial, blob)
+        kept = _kept(headers)
+        key = normalize_url(url)
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT blob FROM entries WHERE url = ?",
+                (key,),
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries"
+                " (url, blob, size, headers, request_time, response_time, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    digest,
+                    writer.size,
+                    json.dumps(kept),
+                    request_time,
+                    response_time,
+                    time.time(),
+                ),
+            )
+            if previous is not None and previous[0] != digest:
+                self._drop_blob_if_unreferenced(previous[0])
+            self._evict_locked()
+        return self.lookup(url)
+
+    def freshen(
+        self,
+        entry: CachedResponse,
+        headers: Mapping[str, str],
+        request_time: float,
+        response_time: float,
+    ) -> CachedResponse:
+        """Apply a 304's headers to ``entry`` (RFC 9111 section 4.3.4)."""
+        merged = dict(entry.headers)
+        for name, value in _kept(headers).items():
+            if name not in _REPRESENTATION_HEADERS:
+                merged[name] = value
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET headers = ?, request_time = ?, response_time = ?,"
+                " last_access = ? WHERE url = ?",
+                (
+                    json.dumps(merged),
+                    request_time,
+                    response_time,
+                    time.time(),
+                    normalize_url(entry.url),
+                ),
+            )
+        entry.headers = merged
+        entry.request_time = request_time
+        entry.response_time = response_time
+        return entry
+
+    def _drop_blob_if_unreferenced(self, digest: str) -> bool:
+        still_used = self._conn.execute(
+            "SELECT 1 FROM entries WHERE blob = ? LIMIT 1",
+            (digest,),
+        ).fetchone()
+        if still_used is not None:
+            return False
+        self._blob_path(digest).unlink(missing_ok=True)
+        return True
+
+    def total_bytes(self) -> int:
+        """Bytes held by distinct stored bodies."""
+        with self._lock:
+            return self._total_bytes_locked()
+
+    def _total_bytes_locked(self) -> int:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM"
+            " (SELECT blob, MAX(size) AS size FROM entries GROUP BY blob)",
+        ).fetchone()
+        return int(row[0])
+
+    def _evict_locked(self) -> None:
+        total = self._total_bytes_locked()
+        if total <= self.max_bytes:
+            return
+        for url, blob, size in self._conn.execute(
+            "SELECT url, blob, size FROM entries ORDER BY last_access",
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            if self._drop_blob_if_unreferenced(blob):
+                total -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            shutil.rmtree(self.blob_dir, ignore_errors=True)
+            self.blob_dir.mkdir(parents=True, exist_ok=True)
+
+
+_DEFAULT_HTTP_CACHE: Optional[HttpResponseCache] = None
+_DEFAULT_HTTP_CACHE_LOCK = threading.Lock()
+
+
+def default_http_cache() -> Optional[HttpResponseCache]:
+    """Process-wide response cache, or None when disabled by settings."""
+    global _DEFAULT_HTTP_CACHE
+    from unify.settings import SETTINGS
+
+    if SETTINGS.web.HTTP_CACHE_MAX_BYTES <= 0:
+        return None
+    with _DEFAULT_HTTP_CACHE_LOCK:
+        if _DEFAULT_HTTP_CACHE is None:
+            _DEFAULT_HTTP_CACHE = HttpResponseCache(
+                default_cache_dir(),
+                max_bytes=SETTINGS.web.HTTP_CACHE_MAX_BYTES,
+            )
+        return _DEFAULT_HTTP_CACHE
+
+
+# --------------------------------------------------------------------------- #
+# Provider result cache
+# --------------------------------------------------------------------------- #
+
+
+_URL_PARAMS = frozenset({"url", "urls", "start_url"})
+
+
+def _normalize_param(name: str, value: Any) -> Any:
+    if isinstance(value, str):
+        if name in _URL_PARAMS:
+            return normalize_url(value)
+        return " ".join(value.split())
+    if isinstance(value, (list, tuple)):
+        items = [_normalize_param(name, v) for v in value]
+        if name == "urls":
+            return sorted(set(items))
+        return items
+    return value
+
+
+def normalize_params(op: str, params: Mapping[str, Any]) -> str:
+    """Stable cache key for a provider call.
+
+    Whitespace in free text is collapsed, URLs are canonicalized, a URL list is
+    treated as a set, and ``None`` arguments (provider defaults) are dropped so
+    an explicit ``None`` and an omitted argument share a key.
+    """
+    normalized = {
+        name: _normalize_param(
+            name,
+            [value] if name == "urls" and isinstance(value, str) else value,
+        )
+        for name, value in params.items()
+        if value is not None
+    }
+    return json.dumps([op, normalized], sort_keys=True, default=str)
+
+
+class ProviderResultCache:
+    """Thread-safe LRU of provider results with a per-entry TTL."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int = 512):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_call(
+        self,
+        op: str,
+        params: Mapping[str, Any],
+        call: Callable[[], Any],
+    ) -> Any:
+        """Return the cached result for ``(op, params)`` or compute and store it.
+
+        Exceptions from ``call`` propagate and nothing is stored.
+        """
+        if self.ttl_seconds <= 0:
+            return call()
+        key = normalize_params(op, params)
+        now = time.monotonic()
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None and hit[0] > now:
+                self._entries.move_to_end(key)
+                return hit[1]
+        result = call()
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -15,11 +15,19 @@ class WebSettings(BaseSettings):
         ENABLED: Whether WebSearcher is enabled.
         IMPL: Implementation type - "real" or "simulated".
         TAVILY_API_KEY: API key for Tavily web search service.
+        HTTP_CACHE_DIR: Directory for the URL-fetch response cache
+            (default ``$XDG_CACHE_HOME/unify/http_cache``).
+        HTTP_CACHE_MAX_BYTES: Byte budget of the response cache; 0 disables it.
+        RESULT_CACHE_TTL_SECONDS: How long a search/extract/crawl/map result
+            is reused for identical parameters; 0 disables it.
     """
 
     ENABLED: bool = False
     IMPL: str = "real"
     TAVILY_API_KEY: str = ""
+    HTTP_CACHE_DIR: str = ""
+    HTTP_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    RESULT_CACHE_TTL_SECONDS: float = 300.0
 
     model_config = SettingsConfigDict(
         env_prefix="UNIFY_WEB_",
@@ -20,16 +20,21 @@ somewhere public, does not run forever, and does not write without bound.
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import logging
 import re
+import shutil
 import socket
+import time
 from pathlib import Path
 from typing import Iterable
 from urllib.parse import urlparse, unquote
 
 import httpx
 
+from .http_cache import CachedResponse, HttpResponseCache, is_storable
+
 logger = logging.getLogger(__name__)
 
 ALLOWED_SCHEMES = frozenset({"http", "https"})
@@ -120,12 +125,19 @@ async def fetch_to_directory(
     *,
     max_bytes: int = DEFAULT_MAX_BYTES,
     timeout_s: float = DEFAULT_TIMEOUT_S,
+    cache: HttpResponseCache | None = None,
 ) -> Path:
     """Download *url* into *dest_dir* and return the path written.
 
     Redirects are followed manually so each hop can be validated; the client is
     told not to follow them itself, since a client-followed redirect is a
     request that was never checked.
+
+    With a *cache*, a fresh stored response for a hop is copied out without any
+    request, a stale one is revalidated with a conditional GET (a 304 copies the
+    stored body), and a storable 200 is kept for next time. Only responses that
+    were fetched through the checks above are ever stored, so serving one skips
+    no validation that would have applied to it.
     """
     destination = Path(dest_dir)
     destination.mkdir(parents=True, exist_ok=True)
@@ -136,8 +148,19 @@ async def fetch_to_directory(
         follow_redirects=False,
     ) as client:
         for _hop in range(MAX_REDIRECTS + 1):
+            cached = cache.lookup(current) if cache is not None else None
+            if cached is not None and cached.size > max_bytes:
+                cached = None
+            if cached is not None and cached.fresh:
+                return await _copy_cached(url, current, cached, destination)
+
             assert_fetchable(current)
-            async with client.stream("GET", current) as response:
+            request_time = time.time()
+            headers = cached.conditional_headers() if cached is not None else {}
+            async with client.stream("GET", current, headers=headers) as response:
+                if response.status_code == 304 and cached is not None:
+                    cache.freshen(cached, response.headers, request_time, time.time())
+                    return await _copy_cached(url, current, cached, destination)
                 if response.is_redirect:
                     location = response.headers.get("location")
                     if not location:
@@ -159,22 +182,64 @@ async def fetch_to_directory(
                     current,
                     response.headers.get("content-disposition", ""),
                 )
+                body = (
+                    cache.writer()
+                    if cache is not None
+                    and is_storable(response.status_code, response.headers)
+                    else None
+                )
                 written = 0
-                with target.open("wb") as sink:
-                    async for chunk in response.aiter_bytes():
-                        written += len(chunk)
-                        if written > max_bytes:
-                            sink.close()
-                            target.unlink(missing_ok=True)
-                            # A server can under-declare or omit its length, so
-                            # the ceiling is enforced against what actually
-                            # arrives rather than what was announced.
-                            raise FetchRejected(
-                                f"The download exceeded the {max_bytes}-byte "
-                                "limit and was discarded.",
-                            )
-                        sink.write(chunk)
+                try:
+                    with target.open("wb") as sink:
+                        async for chunk in response.aiter_bytes():
+                            written += len(chunk)
+                            if written > max_bytes:
+                                sink.close()
+                                target.unlink(missing_ok=True)
+                                # A server can under-declare or omit its length,
+                                # so the ceiling is enforced against what
+                                # actually arrives rather than what was
+                                # announced.
+                                raise FetchRejected(
+                                    f"The download exceeded the {max_bytes}-byte "
+                                    "limit and was discarded.",
+                                )
+                            sink.write(chunk)
+                            if body is not None:
+                                body.write(chunk)
+                except BaseException:
+                    if body is not None:
+                        body.abort()
+                    raise
+                if body is not None:
+                    cache.store(
+                        current,
+                        body,
+                        response.headers,
+                        request_time,
+                        time.time(),
+                    )
                 logger.info("[url-fetch] %s -> %s (%d bytes)", url, target, written)
                 return target
 
     raise FetchRejected(f"Gave up after {MAX_REDIRECTS} redirects.")
+
+
+async def _copy_cached(
+    url: str,
+    current: str,
+    cached: CachedResponse,
+    destination: Path,
+) -> Path:
+    target = destination / filename_for(
+        current,
+        cached.headers.get("content-disposition", ""),
+    )
+    await asyncio.to_thread(shutil.copyfile, cached.body_path, target)
+    logger.info(
+        "[url-fetch] %s -> %s (%d bytes, from cache)",
+        url,
+        target,
+        cached.size,
+    )
+    return target
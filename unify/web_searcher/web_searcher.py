@@ -173,10 +173,17 @@ class WebSearcher(BaseWebSearcher):
             self._last_crawls: Dict[str, Any] = {}
         if not hasattr(self, "_last_maps"):
             self._last_maps: Dict[str, Any] = {}
+        if not hasattr(self, "_result_cache"):
+            from unify.web_searcher.http_cache import ProviderResultCache
+
+            self._result_cache = ProviderResultCache(
+                ttl_seconds=SETTINGS.web.RESULT_CACHE_TTL_SECONDS,
+            )
 
     @functools.wraps(BaseWebSearcher.fetch, updated=())
     async def fetch(self, url: str) -> str:
         from unify.file_manager.settings import get_local_root
+        from unify.web_searcher.http_cache import default_http_cache
         from unify.web_searcher.url_fetch import fetch_to_directory
 
         # Fetched bytes land in their own directory rather than loose in the
@@ -186,6 +193,7 @@ class WebSearcher(BaseWebSearcher):
         target = await fetch_to_directory(
             url,
             Path(get_local_root()) / "Downloads",
+            cache=default_http_cache(),
         )
         return str(target)
 
@@ -195,6 +203,7 @@ class WebSearcher(BaseWebSearcher):
         self._last_extractions = {}
         self._last_crawls = {}
         self._last_maps = {}
+        self._result_cache.clear()
 
     # ------------------------------------------------------------------ #
     #  Tavily tools                                                      #
@@ -244,7 +253,7 @@ class WebSearcher(BaseWebSearcher):
             except ValueError:
                 pass
 
-        response = self.tavily_client.search(
+        params = dict(
             query=query,
             max_results=max_results,
             start_date=start_date,
@@ -252,6 +261,11 @@ class WebSearcher(BaseWebSearcher):
             include_images=include_images,
             include_answer=True,
         )
+        response = self._result_cache.get_or_call(
+            "search",
+            params,
+            lambda: self.tavily_client.search(**params),
+        )
         return {
             "answer": response.get("answer", ""),
             "results": response.get("results", []),
@@ -281,7 +295,12 @@ class WebSearcher(BaseWebSearcher):
             - "results": Successful extractions with cleaned content/metadata.
             - "failed_results": Any URLs that could not be extracted.
         """
-        response = self.tavily_client.extract(urls=urls, include_images=include_images)
+        params = dict(urls=urls, include_images=include_images)
+        response = self._result_cache.get_or_call(
+            "extract",
+            params,
+            lambda: self.tavily_client.extract(**params),
+        )
         return {
             "results": response.get("results", []),
             "failed_results": response.get("failed_results", []),
@@ -322,7 +341,7 @@ class WebSearcher(BaseWebSearcher):
             - "base_url": Normalised base host for the crawl session.
             - "results": List of discovered pages and associated content.
         """
-        response = self.tavily_client.crawl(
+        params = dict(
             url=start_url,
             instructions=instructions,
             max_depth=max_depth,
@@ -330,6 +349,11 @@ class WebSearcher(BaseWebSearcher):
             limit=limit,
             include_images=include_images,
         )
+        response = self._result_cache.get_or_call(
+            "crawl",
+            params,
+            lambda: self.tavily_client.crawl(**params),
+        )
         return {
             "base_url": response.get("base_url"),
             "results": response.get("results", []),
@@ -370,7 +394,7 @@ class WebSearcher(BaseWebSearcher):
             - "base_url": Normalised base host when applicable.
             - "results": List of mapped items/pages relevant to the query.
         """
-        response = self.tavily_client.map(
+        params = dict(
             url=url,
             instructions=instructions,
             max_depth=max_depth,
@@ -378,6 +402,11 @@ class WebSearcher(BaseWebSearcher):
             limit=limit,
             include_images=include_images,
         )
+        response = self._result_cache.get_or_call(
+            "map",
+            params,
+            lambda: self.tavily_client.map(**params),
+        )
         return {
             "base_url": response.get("base_url"),
             "results": response.get("results", []),
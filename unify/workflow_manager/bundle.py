@@ -10,7 +10,7 @@ syncs, not a second reconcile mechanism.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Mapping
+from typing import Any, Callable, Dict, Mapping, Sequence
 
 from unify.common.custom_sync import MANAGED_BY_DEPLOYMENT
 
@@ -96,6 +96,12 @@ class Surface:
     resolves to. Called with ``managed_by`` and ``destination``. ``None``
     for surfaces whose rows are only ever read where they live."""
 
+    bulk_lister: Callable[..., Any] | None = None
+    """Reports several sources' planted rows in one read, keyed by source.
+    Called with a sequence of ``managed_by`` values and ``destination``.
+    Where absent, :meth:`planted_by_source` asks ``lister`` once per
+    source — correct, but one backend read per installed workflow."""
+
     def arm(self, *, managed_by: str, enabled: bool, destination: str | None) -> Any:
         if self.armer is None:
             return None
@@ -110,6 +116,22 @@ class Surface:
             return None
         return self.lister(managed_by=managed_by, destination=destination)
 
+    def planted_by_source(
+        self,
+        *,
+        managed_by: Sequence[str],
+        destination: str | None,
+    ) -> Dict[str, Any]:
+        if self.bulk_lister is not None:
+            return dict(
+                self.bulk_lister(managed_by=list(managed_by), destination=destination)
+                or {},
+            )
+        return {
+            source: self.planted(managed_by=source, destination=destination)
+            for source in managed_by
+        }
+
     def sync(
         self,
         source: Mapping[str, Dict[str, Any]],
@@ -351,6 +373,7 @@ class SurfaceRegistry:
         shared: bool = False,
         armer: Callable[..., Any] | None = None,
         lister: Callable[..., Any] | None = None,
+        bulk_lister: Callable[..., Any] | None = None,
     ) -> None:
         if not source_scoped:
             raise UnscopedSurfaceError(name)
@@ -361,6 +384,7 @@ class SurfaceRegistry:
             shared=shared,
             armer=armer,
             lister=lister,
+            bulk_lister=bulk_lister,
         )
 
     def get(self, name: str) -> Surface:
@@ -31,9 +31,10 @@ is not a requirement at all: it belongs in the bundle's ``capabilities``.
 Deliberately no read of the gallery catalogue. Knowing whether a slug is
 *offered* would only distinguish a connectable app from a non-connectable
 capability, which the ``capabilities`` field already does — and a resolver is
-constructed per call, so that read would cost one full catalogue scan per bundle
-per listing. Catching a slug the gallery does not offer is an authoring-time
-check, and it lives in the authoring rule and the CI gate.
+constructed for every install and every listing window, so that read would
+cost one full catalogue scan each time. Catching a slug the gallery does not
+offer is an authoring-time check, and it lives in the authoring rule and the
+CI gate.
 
 Each authority is read at most once per instance and is best-effort: one that
 cannot be reached is silent rather than a denial, because holding a workflow's
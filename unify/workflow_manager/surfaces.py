@@ -131,6 +131,13 @@ def register_default_surfaces(
             if name == "tasks" and task_scheduler is not None
             else None
         )
+        # And answers it for every installed workflow in one read, which is
+        # what keeps a gallery listing from costing a read per workflow.
+        bulk_lister = (
+            task_scheduler.list_custom_tasks_by_source
+            if name == "tasks" and task_scheduler is not None
+            else None
+        )
         registry.register(
             name,
             getattr(manager, spec.method),
@@ -139,5 +146,6 @@ def register_default_surfaces(
             shared=spec.shared,
             armer=armer,
             lister=lister,
+            bulk_lister=bulk_lister,
         )
     return registry
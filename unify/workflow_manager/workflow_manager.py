@@ -19,9 +19,11 @@ import functools
 import json
 import logging
 import threading
+import time
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 import unisdk
 
@@ -58,6 +60,31 @@ _REQUEST_BATCH = 25
 """Requests drained per pass. A bound, not a queue depth: whatever is left
 is picked up by the next wake, and the sweep runs on every boot."""
 
+LISTING_TTL_SECONDS = 30.0
+"""How long a listing may reuse its connection and planted-job reads.
+
+Every write this manager makes drops them at once, and so does a connect
+event; the bound only covers changes made somewhere else — a connection
+revoked in the provider's own settings, an install by another executor —
+which a gallery reload then shows within one window."""
+
+
+@dataclass
+class _ListingSnapshot:
+    """The reads one listing shares across every bundle it describes.
+
+    One resolver answers every bundle's requirements, so the keyset,
+    connection list and manifests are read once per listing rather than
+    twice per bundle; planted jobs are read once per destination for every
+    installed slug at that destination together.
+    """
+
+    resolver: RequirementResolver = field(default_factory=RequirementResolver)
+    jobs: Dict[Optional[str], Dict[str, List[Dict[str, Any]]]] = field(
+        default_factory=dict,
+    )
+    taken_at: float = field(default_factory=time.monotonic)
+
 
 def _now() -> str:
     """Second-precision UTC stamp, the format lease timestamps parse from."""
@@ -180,6 +207,7 @@ class WorkflowManager(BaseWorkflowManager):
         self._surfaces = SurfaceRegistry()
         self._catalogue: Dict[str, WorkflowBundle] = {}
         self._lock = threading.RLock()
+        self._listing: Optional[_ListingSnapshot] = None
 
     # ------------------------------------------------------------------ #
     # Wiring                                                             #
@@ -204,6 +232,7 @@ class WorkflowManager(BaseWorkflowManager):
             )
         with self._lock:
             self._catalogue[bundle.slug] = bundle
+        self.invalidate_listing()
 
     def available_bundles(self) -> List[WorkflowBundle]:
         with self._lock:
@@ -337,26 +366,30 @@ class WorkflowManager(BaseWorkflowManager):
         """
 
         payload = strip_authoring_assistant_id(record.to_post_json())
-        if existing:
-            logs = unisdk.get_logs(
-                context=context,
-                filter=f"slug == '{record.slug}'",
-                limit=1,
-            )
-            if logs:
-                payload.pop("workflow_id", None)
-                unisdk.update_logs(
+        try:
+            if existing:
+                logs = unisdk.get_logs(
                     context=context,
-                    logs=[logs[0].id],
-                    entries=payload,
-                    overwrite=True,
+                    filter=f"slug == '{record.slug}'",
+                    limit=1,
                 )
-                return record
-        unity_create_logs(
-            context=context,
-            entries=[payload],
-            stamp_authoring=True,
-        )
+                if logs:
+                    payload.pop("workflow_id", None)
+                    unisdk.update_logs(
+                        context=context,
+                        logs=[logs[0].id],
+                        entries=payload,
+                        overwrite=True,
+                    )
+                    return record
+            unity_create_logs(
+                context=context,
+                entries=[payload],
+                stamp_authoring=True,
+            )
+        finally:
+            # After the write: a listing taken during it re-reads the old row.
+            self.invalidate_listing()
         return record.model_copy(
             update={"workflow_id": self._assigned_workflow_id(record, context=context)},
         )
@@ -429,12 +462,17 @@ class WorkflowManager(BaseWorkflowManager):
         from ..function_manager.function_manager import delete_functions
 
         try:
-            still_used: set = set()
-            for bundle in self._installed_bundles(context):
-                still_used |= self._distilled_entrypoints(
-                    bundle.slug,
-                    destination=destination,
-                )
+            remaining = [bundle.slug for bundle in self._installed_bundles(context)]
+            planted = self._planted_jobs_by_slug(remaining, destination=destination)
+            if set(planted) != set(remaining):
+                # An unanswered read is not "nothing references it".
+                return []
+            still_used = {
+                job["entrypoint"]
+                for jobs in planted.values()
+                for job in jobs
+                if job.get("entrypoint") is not None
+            }
             orphaned = {
                 function_id
                 for function_id in candidates - still_used
@@ -462,15 +500,18 @@ class WorkflowManager(BaseWorkflowManager):
         return bool(function_managed_by(function_id))
 
     def _delete_installation(self, slug: str, *, context: str) -> bool:
-        logs = unisdk.get_logs(
-            context=context,
-            filter=f"slug == '{slug}'",
-            limit=1,
-        )
-        if not logs:
-            return False
-        unisdk.delete_logs(context=context, logs=[logs[0].id])
-        return True
+        try:
+            logs = unisdk.get_logs(
+                context=context,
+                filter=f"slug == '{slug}'",
+                limit=1,
+            )
+            if not logs:
+                return False
+            unisdk.delete_logs(context=context, logs=[logs[0].id])
+            return True
+        finally:
+            self.invalidate_listing()
 
     # ------------------------------------------------------------------ #
     # Fan-out                                                            #
@@ -627,22 +668,84 @@ class WorkflowManager(BaseWorkflowManager):
     # ------------------------------------------------------------------ #
     # Requirements                                                       #
     # ------------------------------------------------------------------ #
-    def _unmet_requirements(self, bundle: WorkflowBundle) -> List[Dict[str, Any]]:
+    def _unmet_requirements(
+        self,
+        bundle: WorkflowBundle,
+        *,
+        resolver: Optional[RequirementResolver] = None,
+    ) -> List[Dict[str, Any]]:
         """Declared integrations not currently connected, as report dicts.
 
         Resolution spans every kind of app the gallery offers — see
         :mod:`unify.workflow_manager.requirements`. Secret *names* and
         presence travel through here; values never do.
+
+        Without a *resolver* every authority is read afresh, which is what
+        arming wants: whether a job may fire is never decided on a read
+        some earlier listing made.
         """
         if not bundle.requirements:
             return []
-        return RequirementResolver().unmet(bundle.requirements)
+        return (resolver or RequirementResolver()).unmet(bundle.requirements)
 
-    def _requirements_report(self, bundle: WorkflowBundle) -> List[Dict[str, Any]]:
+    def _requirements_report(
+        self,
+        bundle: WorkflowBundle,
+        *,
+        resolver: Optional[RequirementResolver] = None,
+    ) -> List[Dict[str, Any]]:
         """Every declared requirement with its current connection state."""
         if not bundle.requirements:
             return []
-        return RequirementResolver().report(bundle.requirements)
+        return (resolver or RequirementResolver()).report(bundle.requirements)
+
+    @staticmethod
+    def _unmet_in(report: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [entry for entry in report if not entry.get("connected")]
+
+    # ------------------------------------------------------------------ #
+    # Listing snapshot                                                   #
+    # ------------------------------------------------------------------ #
+    def invalidate_listing(self) -> None:
+        """Drop the connection and planted-job reads listings share.
+
+        Called after every write this manager makes, once the write has
+        landed, and by whatever learns of a connection change, so the next
+        listing reads afresh.
+        """
+        self._listing = None
+
+    def _listing_snapshot(self) -> _ListingSnapshot:
+        with self._lock:
+            snapshot = self._listing
+            if (
+                snapshot is None
+                or time.monotonic() - snapshot.taken_at > LISTING_TTL_SECONDS
+            ):
+                snapshot = self._listing = _ListingSnapshot()
+            return snapshot
+
+    def _listed_jobs(
+        self,
+        snapshot: _ListingSnapshot,
+        slugs: Iterable[str],
+        *,
+        destination: Optional[str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Planted jobs for *slugs* at *destination*, read together.
+
+        Only slugs the snapshot has not seen at this destination are read,
+        so an install another executor made shows up without dropping what
+        is already known.
+        """
+        with self._lock:
+            known = snapshot.jobs.setdefault(destination, {})
+            missing = [slug for slug in slugs if slug not in known]
+        if missing:
+            fetched = self._planted_jobs_by_slug(missing, destination=destination)
+            with self._lock:
+                known.update(fetched)
+        return known
 
     def _arm_workflow_tasks(
         self,
@@ -675,6 +778,8 @@ class WorkflowManager(BaseWorkflowManager):
                 bundle.slug,
             )
             return []
+        finally:
+            self.invalidate_listing()
 
     def _planted_jobs(
         self,
@@ -709,6 +814,30 @@ class WorkflowManager(BaseWorkflowManager):
             logger.debug("Could not read planted tasks for %r", slug, exc_info=True)
             return []
 
+    def _planted_jobs_by_slug(
+        self,
+        slugs: List[str],
+        *,
+        destination: Optional[str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """:meth:`_planted_jobs` for several workflows in one surface read.
+
+        Best-effort in the same way: a surface that cannot answer reports
+        no jobs for any of them, and the answer is not kept, so the next
+        listing asks again.
+        """
+        if not slugs or "tasks" not in self._surfaces:
+            return {slug: [] for slug in slugs}
+        try:
+            planted = self._surfaces.get("tasks").planted_by_source(
+                managed_by=slugs,
+                destination=destination,
+            )
+        except Exception:
+            logger.debug("Could not read planted tasks for %r", slugs, exc_info=True)
+            return {}
+        return {slug: list(planted.get(slug) or []) for slug in slugs}
+
     @staticmethod
     def _derived_status(
         stored_status: Optional[str],
@@ -768,6 +897,15 @@ class WorkflowManager(BaseWorkflowManager):
         by_slug = {
             slug: self._preferred_installation(rows) for slug, rows in grouped.items()
         }
+        snapshot = self._listing_snapshot()
+        by_destination: Dict[Optional[str], List[str]] = {}
+        for slug, row in by_slug.items():
+            destination = self._normalized_destination(row.get("destination"))
+            by_destination.setdefault(destination, []).append(slug)
+        jobs = {
+            destination: self._listed_jobs(snapshot, slugs, destination=destination)
+            for destination, slugs in by_destination.items()
+        }
         entries: List[Dict[str, Any]] = []
 
         for bundle in self.available_bundles():
@@ -777,6 +915,10 @@ class WorkflowManager(BaseWorkflowManager):
                 continue
             if installed is False and is_installed:
                 continue
+            requirements = self._requirements_report(
+                bundle,
+                resolver=snapshot.resolver,
+            )
             entry = {
                 "slug": bundle.slug,
                 "name": bundle.name,
@@ -785,7 +927,7 @@ class WorkflowManager(BaseWorkflowManager):
                 "category": bundle.category,
                 "icon_id": bundle.icon_id,
                 "capabilities": list(bundle.capabilities),
-                "requirements": self._requirements_report(bundle),
+                "requirements": requirements,
                 "surfaces": bundle.surface_names(),
                 "installed": is_installed,
             }
@@ -795,7 +937,7 @@ class WorkflowManager(BaseWorkflowManager):
                         "installed_version": row.get("version", ""),
                         "status": self._derived_status(
                             row.get("status"),
-                            self._unmet_requirements(bundle),
+                            self._unmet_in(requirements),
                         ),
                         "params": json.loads(row.get("params") or "{}"),
                         # Which installation this describes, and every root it
@@ -806,12 +948,9 @@ class WorkflowManager(BaseWorkflowManager):
                         "installed_at": self._destinations_of(grouped[bundle.slug]),
                         # The tasks it planted, so "run it now" resolves to a
                         # task id instead of a search.
-                        "jobs": self._planted_jobs(
-                            bundle.slug,
-                            destination=self._normalized_destination(
-                                row.get("destination"),
-                            ),
-                        ),
+                        "jobs": jobs[
+                            self._normalized_destination(row.get("destination"))
+                        ].get(bundle.slug, []),
                     },
                 )
             entries.append(entry)
@@ -1569,6 +1708,12 @@ class WorkflowManager(BaseWorkflowManager):
         if bundle is None and row is None:
             return {"found": False, "slug": slug}
 
+        snapshot = self._listing_snapshot()
+        requirements = (
+            self._requirements_report(bundle, resolver=snapshot.resolver)
+            if bundle
+            else []
+        )
         entry: Dict[str, Any] = {"found": True, "slug": slug}
         if bundle:
             entry.update(
@@ -1580,7 +1725,7 @@ class WorkflowManager(BaseWorkflowManager):
                     "category": bundle.category,
                     "icon_id": bundle.icon_id,
                     "capabilities": list(bundle.capabilities),
-                    "requirements": self._requirements_report(bundle),
+                    "requirements": requirements,
                     "surfaces": bundle.surface_names(),
                     "params_schema": bundle.params_schema,
                     "entries_per_surface": {
@@ -1595,18 +1740,19 @@ class WorkflowManager(BaseWorkflowManager):
                     "installed_version": row.get("version", ""),
                     "status": self._derived_status(
                         row.get("status"),
-                        self._unmet_requirements(bundle) if bundle else [],
+                        self._unmet_in(requirements),
                     ),
                     "params": json.loads(row.get("params") or "{}"),
                     "installed_surfaces": json.loads(row.get("surfaces") or "[]"),
                     "destination": row.get("destination", "personal"),
                     "installed_at": self._destinations_of(rows),
-                    "jobs": self._planted_jobs(
-                        slug,
+                    "jobs": self._listed_jobs(
+                        snapshot,
+                        [slug],
                         destination=self._normalized_destination(
                             row.get("destination"),
                         ),
-                    ),
+                    ).get(slug, []),
                 },
             )
             if bundle is None: